@@ -3,7 +3,7 @@ from .environment import InternalEnvironmentEndpoint
 from .feature_flags import InternalFeatureFlagsEndpoint
 from .mail import InternalMailEndpoint
 from .packages import InternalPackagesEndpoint
-from .rpc import InternalRpcServiceEndpoint
+from .rpc import InternalRpcBatchEndpoint, InternalRpcServiceEndpoint
 from .warnings import InternalWarningsEndpoint
 
 __all__ = (
@@ -12,6 +12,7 @@ __all__ = (
     "InternalFeatureFlagsEndpoint",
     "InternalMailEndpoint",
     "InternalPackagesEndpoint",
+    "InternalRpcBatchEndpoint",
     "InternalRpcServiceEndpoint",
     "InternalWarningsEndpoint",
 )
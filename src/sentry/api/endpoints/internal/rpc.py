@@ -1,3 +1,5 @@
+from typing import Any
+
 import pydantic
 import sentry_sdk
 from rest_framework import status
@@ -24,8 +26,45 @@ from sentry.viewer_context import (
 )
 
 
-@internal_all_silo_endpoint
-class InternalRpcServiceEndpoint(Endpoint):
+def _parse_auth_context(arguments: dict[str, Any]) -> AuthenticationContext:
+    auth_context = AuthenticationContext()
+    if auth_context_json := arguments.get("auth_context"):
+        try:
+            # Note -- generally, this is NOT set, but only in cases where an RPC needs to invoke code
+            # that depends on the `env.request.user` object.  In that case, the authentication context
+            # includes an authenticated user that will be injected into the global request context
+            # for compatibility.  Notably, this authentication context is *trusted* as the request comes
+            # from within the privileged RPC channel.
+            auth_context = AuthenticationContext.parse_obj(auth_context_json)
+        except pydantic.ValidationError as e:
+            sentry_sdk.capture_exception()
+            raise ParseError from e
+    return auth_context
+
+
+def _parse_viewer_context(request: Request) -> ViewerContext:
+    meta = request.data.get("meta") or {}
+    vc_data = meta.get("viewer_context")
+    vc = ViewerContext()
+    if vc_data:
+        try:
+            vc = ViewerContext.deserialize(vc_data)
+        except Exception as e:
+            sentry_sdk.capture_exception()
+            raise ParseError from e
+
+    # Observe what the caller actually sent, not the empty default we fall back to.
+    # `vc` is always non-None (defaulted to ViewerContext()), so observing inside
+    # the scope below would always see actor_type=unknown and never trigger the
+    # missing-VC signal.
+    observe_viewer_context_propagation(
+        "rpc_inbound",
+        ctx=vc if vc_data else None,
+    )
+    return vc
+
+
+class _InternalRpcEndpoint(Endpoint):
     publish_status = {
         "POST": ApiPublishStatus.PRIVATE,
     }
@@ -41,6 +80,9 @@ class InternalRpcServiceEndpoint(Endpoint):
             return True
         return False
 
+
+@internal_all_silo_endpoint
+class InternalRpcServiceEndpoint(_InternalRpcEndpoint):
     def post(self, request: Request, service_name: str, method_name: str) -> Response:
         sentry_sdk.set_tag("rpc_method", f"{service_name}.{method_name}")
         sentry_sdk.set_attribute("rpc_method", f"{service_name}.{method_name}")
@@ -54,37 +96,8 @@ class InternalRpcServiceEndpoint(Endpoint):
         if not isinstance(arguments, dict):
             raise ParseError
 
-        auth_context = AuthenticationContext()
-        if auth_context_json := arguments.get("auth_context"):
-            try:
-                # Note -- generally, this is NOT set, but only in cases where an RPC needs to invoke code
-                # that depends on the `env.request.user` object.  In that case, the authentication context
-                # includes an authenticated user that will be injected into the global request context
-                # for compatibility.  Notably, this authentication context is *trusted* as the request comes
-                # from within the privileged RPC channel.
-                auth_context = AuthenticationContext.parse_obj(auth_context_json)
-            except pydantic.ValidationError as e:
-                sentry_sdk.capture_exception()
-                raise ParseError from e
-
-        meta = request.data.get("meta") or {}
-        vc_data = meta.get("viewer_context")
-        vc = ViewerContext()
-        if vc_data:
-            try:
-                vc = ViewerContext.deserialize(vc_data)
-            except Exception as e:
-                sentry_sdk.capture_exception()
-                raise ParseError from e
-
-        # Observe what the caller actually sent, not the empty default we fall back to.
-        # `vc` is always non-None (defaulted to ViewerContext()), so observing inside
-        # the scope below would always see actor_type=unknown and never trigger the
-        # missing-VC signal.
-        observe_viewer_context_propagation(
-            "rpc_inbound",
-            ctx=vc if vc_data else None,
-        )
+        auth_context = _parse_auth_context(arguments)
+        vc = _parse_viewer_context(request)
 
         try:
             with viewer_context_scope(vc), auth_context.applied_to_request(request):
@@ -109,3 +122,68 @@ class InternalRpcServiceEndpoint(Endpoint):
             sentry_sdk.capture_exception()
             raise ValidationError from e
         return Response(data=result)
+
+
+@internal_all_silo_endpoint
+class InternalRpcBatchEndpoint(_InternalRpcEndpoint):
+    """
+    Runs several RPC method calls sent in a single request, in order.
+
+    Each call gets its own entry in `results`: either its return value under `value`, or, if it
+    failed, the status code (and for validation errors, the detail and code) the single call
+    endpoint would have responded with under `error`. A failed call doesn't stop the calls after it.
+    """
+
+    def post(self, request: Request) -> Response:
+        if not self._is_authorized(request):
+            raise PermissionDenied
+
+        calls = request.data.get("calls")
+        if not isinstance(calls, list):
+            raise ParseError
+        for call in calls:
+            if not (
+                isinstance(call, dict)
+                and isinstance(call.get("service"), str)
+                and isinstance(call.get("method"), str)
+                and isinstance(call.get("args"), dict)
+            ):
+                raise ParseError
+
+        vc = _parse_viewer_context(request)
+        with viewer_context_scope(vc):
+            results = [
+                self._dispatch_call(request, call["service"], call["method"], call["args"])
+                for call in calls
+            ]
+        return Response(data={"meta": {}, "results": results})
+
+    def _dispatch_call(
+        self, request: Request, service_name: str, method_name: str, arguments: dict[str, Any]
+    ) -> dict[str, Any]:
+        try:
+            auth_context = _parse_auth_context(arguments)
+            with auth_context.applied_to_request(request):
+                return dispatch_to_local_service(service_name, method_name, arguments)
+        except RpcValidationException as e:
+            return {
+                "error": {
+                    "status": status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    "detail": e.detail,
+                    "code": e.code,
+                }
+            }
+        except RpcResolutionException:
+            sentry_sdk.capture_exception()
+            return {"error": {"status": status.HTTP_404_NOT_FOUND}}
+        except (ParseError, SerializableFunctionValueException):
+            sentry_sdk.capture_exception()
+            return {"error": {"status": status.HTTP_400_BAD_REQUEST}}
+        except Exception as e:
+            # Produce more detailed log
+            if in_test_environment():
+                raise Exception(
+                    f"Problem processing batched rpc call {service_name}/{method_name}"
+                ) from e
+            sentry_sdk.capture_exception()
+            return {"error": {"status": status.HTTP_500_INTERNAL_SERVER_ERROR}}
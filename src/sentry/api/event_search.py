@@ -1979,6 +1979,28 @@ default_config = SearchConfig(
 )
 
 
+# Parse trees only depend on the query string, while visiting them also depends
+# on the config, params and the current time (relative dates), so only the trees
+# are cached. Very long queries are rare and not worth keeping around.
+PARSE_TREE_CACHE_SIZE = 1024
+PARSE_TREE_CACHE_MAX_QUERY_LENGTH = 2048
+
+
+@functools.lru_cache(maxsize=PARSE_TREE_CACHE_SIZE)
+def _parse_search_tree_cached(query: str) -> Node:
+    return event_search_grammar.parse(query)
+
+
+def parse_search_tree(query: str) -> Node:
+    """
+    Parse a query with the event search grammar. Trees are cached, and must
+    not be mutated.
+    """
+    if len(query) > PARSE_TREE_CACHE_MAX_QUERY_LENGTH:
+        return event_search_grammar.parse(query)
+    return _parse_search_tree_cached(query)
+
+
 @overload
 def parse_search_query(
     query: str,
@@ -2013,7 +2035,7 @@ def parse_search_query(
         config = default_config
 
     try:
-        tree = event_search_grammar.parse(query)
+        tree = parse_search_tree(query)
     except IncompleteParseError as e:
         idx = e.column()
         prefix = query[max(0, idx - 5) : idx]
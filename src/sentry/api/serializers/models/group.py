@@ -15,6 +15,7 @@ from django.db.models import Min, prefetch_related_objects
 from sentry import tagstore
 from sentry.api.serializers import Serializer, register, serialize
 from sentry.api.serializers.models.actor import ActorSerializer, ActorSerializerResponse
+from sentry.api.serializers.prefetch import SerializerPrefetch, run_prefetches
 from sentry.constants import LOG_LEVELS
 from sentry.eventtypes import EventTypeStr
 from sentry.integrations.mixins.issues import IssueBasicIntegration
@@ -292,59 +293,11 @@ class GroupSerializerBase(Serializer, ABC):
         # making unnecessary queries.
         prefetch_related_objects(item_list, "project__organization")
 
-        if user.is_authenticated and item_list:
-            bookmarks = set(
-                GroupBookmark.objects.filter(user_id=user.id, group__in=item_list).values_list(
-                    "group_id", flat=True
-                )
-            )
-            seen_groups = dict(
-                GroupSeen.objects.filter(user_id=user.id, group__in=item_list).values_list(
-                    "group_id", "last_seen"
-                )
-            )
-            subscriptions = self._get_subscriptions(item_list, user)
-        else:
-            bookmarks = set()
-            seen_groups = {}
-            subscriptions = defaultdict(lambda: (False, False, None))
-
-        resolved_assignees = self._serialize_assignees(item_list)
-
-        ignore_items = {g.group_id: g for g in GroupSnooze.objects.filter(group__in=item_list)}
-
-        release_resolutions, commit_resolutions = self._resolve_resolutions(item_list, user)
-
-        user_ids = {
-            user_id
-            for user_id in itertools.chain(
-                (r[-1] for r in release_resolutions.values()),
-                (r.actor_id for r in ignore_items.values()),
-            )
-            if user_id is not None
-        }
-        if user_ids:
-            serialized_users = user_service.serialize_many(
-                filter={"user_ids": user_ids, "is_active": True},
-                as_user=serialize_generic_user(user),
-            )
-            # `serialize_many` may omit user_ids that are inactive or missing in
-            # the control silo; key by the returned id rather than zipping so
-            # drifted users don't silently misalign with the request ordering.
-            actors = {int(u["id"]): u for u in serialized_users}
-        else:
-            actors = {}
-
-        share_ids = dict(
-            GroupShare.objects.filter(group__in=item_list).values_list("group_id", "uuid")
-        )
-
-        seen_stats = self._get_seen_stats(item_list, user)
-
-        organization_id_list = list({item.project.organization_id for item in item_list})
         # if no groups, then we can't proceed but this seems to be a valid use case
         if not item_list:
             return {}
+
+        organization_id_list = list({item.project.organization_id for item in item_list})
         if len(organization_id_list) > 1:
             # this should never happen but if it does we should know about it
             logger.warning(
@@ -356,22 +309,66 @@ class GroupSerializerBase(Serializer, ABC):
         # should only have 1 org at this point
         organization_id = organization_id_list[0]
 
-        annotations_by_group_id: MutableMapping[int, list[Any]] = defaultdict(list)
-        for annotations_by_group in itertools.chain.from_iterable(
+        prefetched = run_prefetches(
+            type(self).__name__,
             [
-                self._resolve_integration_annotations(organization_id, item_list),
-                [self._resolve_external_issue_annotations(item_list)],
-            ]
-        ):
-            merge_list_dictionaries(annotations_by_group_id, annotations_by_group)
-
-        snuba_stats = self._get_group_snuba_stats(item_list, seen_stats)
-
-        derived_data_by_group_id = (
-            get_bulk_group_derived_data({item.id for item in item_list})
-            if self._expand("derivedData")
-            else {}
+                SerializerPrefetch("seen_stats", lambda: self._get_seen_stats(item_list, user)),
+                SerializerPrefetch(
+                    "snuba_stats",
+                    lambda seen_stats: self._get_group_snuba_stats(item_list, seen_stats),
+                    depends_on=("seen_stats",),
+                ),
+                SerializerPrefetch("user_state", lambda: self._get_user_state(item_list, user)),
+                SerializerPrefetch(
+                    "resolved_assignees", lambda: self._serialize_assignees(item_list)
+                ),
+                SerializerPrefetch(
+                    "ignore_items",
+                    lambda: {
+                        g.group_id: g for g in GroupSnooze.objects.filter(group__in=item_list)
+                    },
+                ),
+                SerializerPrefetch(
+                    "resolutions", lambda: self._resolve_resolutions(item_list, user)
+                ),
+                SerializerPrefetch(
+                    "actors",
+                    lambda resolutions, ignore_items: self._get_actors(
+                        resolutions[0], ignore_items, user
+                    ),
+                    depends_on=("resolutions", "ignore_items"),
+                ),
+                SerializerPrefetch(
+                    "share_ids",
+                    lambda: dict(
+                        GroupShare.objects.filter(group__in=item_list).values_list(
+                            "group_id", "uuid"
+                        )
+                    ),
+                ),
+                SerializerPrefetch(
+                    "annotations", lambda: self._get_annotations(organization_id, item_list)
+                ),
+                SerializerPrefetch(
+                    "derived_data",
+                    lambda: (
+                        get_bulk_group_derived_data({item.id for item in item_list})
+                        if self._expand("derivedData")
+                        else {}
+                    ),
+                ),
+            ],
         )
+        seen_stats = prefetched["seen_stats"]
+        snuba_stats = prefetched["snuba_stats"]
+        bookmarks, seen_groups, subscriptions = prefetched["user_state"]
+        resolved_assignees = prefetched["resolved_assignees"]
+        ignore_items = prefetched["ignore_items"]
+        release_resolutions, commit_resolutions = prefetched["resolutions"]
+        actors = prefetched["actors"]
+        share_ids = prefetched["share_ids"]
+        annotations_by_group_id = prefetched["annotations"]
+        derived_data_by_group_id = prefetched["derived_data"]
 
         result = {}
         for item in item_list:
@@ -549,6 +546,68 @@ class GroupSerializerBase(Serializer, ABC):
             status_label = "unresolved"
         return status_details, status_label
 
+    def _get_user_state(
+        self, item_list: Sequence[Group], user: User | RpcUser | AnonymousUser
+    ) -> tuple[set[int], dict[int, datetime], Mapping[int, tuple[bool, bool, Any]]]:
+        """
+        Returns the ids of the groups the user bookmarked, when the user last saw each group, and
+        the user's subscription to each group.
+        """
+        if not user.is_authenticated:
+            return set(), {}, defaultdict(lambda: (False, False, None))
+
+        bookmarks = set(
+            GroupBookmark.objects.filter(user_id=user.id, group__in=item_list).values_list(
+                "group_id", flat=True
+            )
+        )
+        seen_groups = dict(
+            GroupSeen.objects.filter(user_id=user.id, group__in=item_list).values_list(
+                "group_id", "last_seen"
+            )
+        )
+        subscriptions = self._get_subscriptions(item_list, user)
+        return bookmarks, seen_groups, subscriptions
+
+    @staticmethod
+    def _get_actors(
+        release_resolutions: Mapping[int, Sequence[Any]],
+        ignore_items: Mapping[int, GroupSnooze],
+        user: User | RpcUser | AnonymousUser,
+    ) -> dict[int, Any]:
+        user_ids = {
+            user_id
+            for user_id in itertools.chain(
+                (r[-1] for r in release_resolutions.values()),
+                (r.actor_id for r in ignore_items.values()),
+            )
+            if user_id is not None
+        }
+        if not user_ids:
+            return {}
+
+        serialized_users = user_service.serialize_many(
+            filter={"user_ids": user_ids, "is_active": True},
+            as_user=serialize_generic_user(user),
+        )
+        # `serialize_many` may omit user_ids that are inactive or missing in
+        # the control silo; key by the returned id rather than zipping so
+        # drifted users don't silently misalign with the request ordering.
+        return {int(u["id"]): u for u in serialized_users}
+
+    def _get_annotations(
+        self, organization_id: int, item_list: Sequence[Group]
+    ) -> MutableMapping[int, list[Any]]:
+        annotations_by_group_id: MutableMapping[int, list[Any]] = defaultdict(list)
+        for annotations_by_group in itertools.chain.from_iterable(
+            [
+                self._resolve_integration_annotations(organization_id, item_list),
+                [self._resolve_external_issue_annotations(item_list)],
+            ]
+        ):
+            merge_list_dictionaries(annotations_by_group_id, annotations_by_group)
+        return annotations_by_group_id
+
     def _get_seen_stats(self, item_list: Sequence[Group], user) -> Mapping[Group, SeenStats] | None:
         """
         Returns a dictionary keyed by item that includes:
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from sentry.utils import metrics
+from sentry.utils.tracing import start_span
+
+
+@dataclass(frozen=True)
+class SerializerPrefetch:
+    """
+    One of the lookups a serializer's `get_attrs` needs to make.
+
+    :param name: Identifies the lookup, both to prefetches depending on it and in metrics.
+    :param fetch: Does the lookup. It's called with the results of the prefetches named in
+        `depends_on` as keyword arguments.
+    :param depends_on: Names of the prefetches whose results `fetch` needs.
+    """
+
+    name: str
+    fetch: Callable[..., Any]
+    depends_on: tuple[str, ...] = field(default=())
+
+
+def _run_prefetch(
+    serializer_name: str, prefetch: SerializerPrefetch, results: Mapping[str, Any]
+) -> Any:
+    with (
+        start_span(op="serialize.prefetch", name=f"{serializer_name}.{prefetch.name}"),
+        metrics.timer(
+            "api.serializers.prefetch",
+            tags={"serializer": serializer_name, "prefetch": prefetch.name},
+            sample_rate=0.01,
+        ),
+    ):
+        return prefetch.fetch(**{name: results[name] for name in prefetch.depends_on})
+
+
+def run_prefetches(
+    serializer_name: str, prefetches: Sequence[SerializerPrefetch]
+) -> dict[str, Any]:
+    """
+    Run all of the given prefetches, each one once its dependencies are done, and return their
+    results keyed by name.
+
+    Prefetches run in the order they're given, as soon as their dependencies allow, and every
+    one of them is timed on its own.
+    """
+    names = {prefetch.name for prefetch in prefetches}
+    if len(names) != len(prefetches):
+        raise ValueError(f"{serializer_name} declares the same prefetch more than once")
+    for prefetch in prefetches:
+        missing = set(prefetch.depends_on) - names
+        if missing:
+            raise ValueError(f"{serializer_name}.{prefetch.name} depends on unknown {missing}")
+
+    results: dict[str, Any] = {}
+    pending = list(prefetches)
+    while pending:
+        ready = next((p for p in pending if all(n in results for n in p.depends_on)), None)
+        if ready is None:
+            raise ValueError(f"{serializer_name} has circular prefetch dependencies")
+        pending.remove(ready)
+        results[ready.name] = _run_prefetch(serializer_name, ready, results)
+    return results
@@ -759,6 +759,7 @@ from .endpoints.internal import (
     InternalFeatureFlagsEndpoint,
     InternalMailEndpoint,
     InternalPackagesEndpoint,
+    InternalRpcBatchEndpoint,
     InternalRpcServiceEndpoint,
     InternalWarningsEndpoint,
 )
@@ -3746,6 +3747,11 @@ INTERNAL_URLS = [
         InternalIntegrationProxyEndpoint.as_view(),
         name="sentry-api-0-internal-integration-proxy",
     ),
+    re_path(
+        r"^rpc/batch/$",
+        InternalRpcBatchEndpoint.as_view(),
+        name="sentry-api-0-rpc-batch",
+    ),
     re_path(
         r"^rpc/(?P<service_name>\w+)/(?P<method_name>\w+)/$",
         InternalRpcServiceEndpoint.as_view(),
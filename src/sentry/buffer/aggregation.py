@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from sentry.db import models
+from sentry.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AggregatedIncr:
+    """
+    All increments for one buffer key received within an aggregation window.
+    Counters are summed up, `extra` values are last-write-wins and
+    `signal_only` is set as soon as any increment asked for it, which is what
+    the individual `incr` calls would have left behind in Redis.
+    """
+
+    key: str
+    model: type[models.Model]
+    filters: dict[str, Any]
+    columns: dict[str, int] = field(default_factory=dict)
+    extra: dict[str, Any] = field(default_factory=dict)
+    signal_only: bool = False
+    count: int = 0
+    flush_attempts: int = 0
+
+    def merge(
+        self, columns: dict[str, int], extra: dict[str, Any] | None, signal_only: bool | None
+    ) -> None:
+        for column, amount in columns.items():
+            self.columns[column] = self.columns.get(column, 0) + amount
+        if extra:
+            self.extra.update(extra)
+        if signal_only is True:
+            self.signal_only = True
+        self.count += 1
+
+
+# Number of flushes an increment is kept around for when writing it fails.
+MAX_FLUSH_ATTEMPTS = 3
+
+_aggregators: weakref.WeakSet[IncrAggregator] = weakref.WeakSet()
+
+
+def _flush_all() -> None:
+    for aggregator in list(_aggregators):
+        aggregator.flush()
+
+
+def _reset_all() -> None:
+    # Pending increments belong to the parent, which flushes them itself.
+    for aggregator in list(_aggregators):
+        aggregator._reset()
+
+
+# Registered once for all aggregators, so that aggregators which are no
+# longer used can be garbage collected.
+atexit.register(_flush_all)
+os.register_at_fork(after_in_child=_reset_all)
+
+
+class IncrAggregator:
+    """
+    Collects buffer increments in-process and merges increments for the same
+    key, so that hot keys cost one write per window instead of one per call.
+
+    Pending increments are handed to `flush_func` at the latest `max_latency`
+    seconds after the first increment of a window, as soon as `max_keys`
+    distinct keys are pending, and when the interpreter exits. `flush_func`
+    returns the increments it could not write, or raises if it wrote none of
+    them. Those are merged into the next window and dropped after
+    `MAX_FLUSH_ATTEMPTS` failed flushes.
+
+    Increments are lost if the process dies without running `atexit`
+    handlers, e.g. on `os._exit`, SIGKILL or an OOM kill. At most
+    `max_latency` seconds and `max_keys` keys worth of increments are pending
+    at any time, which bounds that loss.
+    """
+
+    def __init__(
+        self,
+        flush_func: Callable[[list[AggregatedIncr]], list[AggregatedIncr]],
+        max_latency: float,
+        max_keys: int,
+    ) -> None:
+        assert max_latency > 0
+        assert max_keys > 0
+        self.flush_func = flush_func
+        self.max_latency = max_latency
+        self.max_keys = max_keys
+        self._reset()
+        _aggregators.add(self)
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: dict[str, AggregatedIncr] = {}
+        self._timer: threading.Timer | None = None
+
+    def _start_timer(self) -> None:
+        # Must be called with the lock held.
+        if self._timer is None:
+            self._timer = threading.Timer(self.max_latency, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def add(
+        self,
+        key: str,
+        model: type[models.Model],
+        columns: dict[str, int],
+        filters: dict[str, Any],
+        extra: dict[str, Any] | None = None,
+        signal_only: bool | None = None,
+    ) -> None:
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = AggregatedIncr(key, model, filters)
+            pending.merge(columns, extra, signal_only)
+
+            self._start_timer()
+
+            should_flush = len(self._pending) >= self.max_keys
+
+        if should_flush:
+            self.flush()
+
+    def get_pending_columns(self, key: str, columns: list[str]) -> dict[str, int]:
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                return {}
+            return {col: pending.columns[col] for col in columns if col in pending.columns}
+
+    def flush(self) -> None:
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending = {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if not pending:
+            return
+
+        metrics.distribution("buffer.aggregator.flush.keys", len(pending))
+        metrics.distribution(
+            "buffer.aggregator.flush.increments", sum(incr.count for incr in pending)
+        )
+        try:
+            failed = self.flush_func(pending)
+        except Exception:
+            # Flushes mostly run on the timer thread where there is no caller
+            # to hand the error to.
+            logger.exception("buffer.aggregator.flush-failed")
+            failed = pending
+
+        if failed:
+            metrics.incr("buffer.aggregator.flush.failed", amount=len(failed))
+            self._requeue(failed)
+
+    def _requeue(self, failed: list[AggregatedIncr]) -> None:
+        with self._lock:
+            for incr in failed:
+                incr.flush_attempts += 1
+                if incr.flush_attempts >= MAX_FLUSH_ATTEMPTS:
+                    metrics.incr("buffer.aggregator.dropped", amount=incr.count)
+                    logger.error("buffer.aggregator.dropped", extra={"key": incr.key})
+                    continue
+
+                pending = self._pending.get(incr.key)
+                if pending is not None:
+                    # Increments received since take precedence for `extra`.
+                    incr.merge(pending.columns, pending.extra, pending.signal_only)
+                    incr.count += pending.count - 1
+                self._pending[incr.key] = incr
+
+            if self._pending:
+                self._start_timer()
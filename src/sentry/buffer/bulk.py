@@ -0,0 +1,154 @@
+"""
+Apply many buffered increments to the database with a single statement.
+
+Buffer flushes used to update one row per query. Rows which only differ by
+their values share a statement here instead::
+
+    UPDATE <table> AS t
+    SET <counter> = t.<counter> + v.<counter>, <extra> = v.<extra>, ...
+    FROM (VALUES (%s, %s, %s), ...) AS v(id, <counter>, <extra>, ...)
+    WHERE t.id = v.id
+    RETURNING t.id
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from django.db import connections, router
+from django.utils import timezone
+
+from sentry.db import models
+from sentry.db.models.fields.bounded import BoundedIntegerField, BoundedPositiveIntegerField
+
+# 32-bit counters which are capped instead of overflowing
+_BOUNDED_FIELDS = (BoundedIntegerField, BoundedPositiveIntegerField)
+
+
+@dataclass
+class BulkIncr:
+    pk: int
+    columns: dict[str, int]
+    extra: dict[str, Any]
+
+
+def get_filter_pk(filters: dict[str, Any]) -> int | None:
+    """
+    The primary key of the single row selected by `filters`, if they select a
+    row by `id` or `pk` and nothing else.
+    """
+    if len(filters) != 1:
+        return None
+    pk = filters.get("pk", filters.get("id"))
+    return pk if isinstance(pk, int) else None
+
+
+def can_bulk_update(
+    model: type[models.Model],
+    columns: dict[str, int],
+    filters: dict[str, Any],
+    extra: dict[str, Any] | None,
+    signal_only: bool | None,
+) -> bool:
+    """
+    Whether an increment only updates concrete fields of a single row which
+    is selected by its primary key (see `get_filter_pk`).
+    """
+    if signal_only or get_filter_pk(filters) is None:
+        return False
+    if extra and columns.keys() & extra.keys():
+        return False
+    field_names = {field.name for field in model._meta.concrete_fields}
+    return all(name in field_names for name in (*columns, *(extra or ())))
+
+
+def bulk_update(model: type[models.Model], incrs: Sequence[BulkIncr]) -> set[int]:
+    """
+    Apply all increments with one `UPDATE ... FROM (VALUES ...)` per distinct
+    set of columns, and return the primary keys of the rows which exist.
+
+    Counters of bounded integer fields are capped at their maximum instead of
+    failing the whole statement. Rows are passed to every statement ordered by
+    primary key.
+    """
+    statements: dict[tuple[tuple[str, ...], tuple[str, ...]], list[BulkIncr]] = {}
+    # Concurrent flushes lock rows in the same order, so they cannot deadlock.
+    for incr in sorted(incrs, key=lambda incr: incr.pk):
+        signature = (tuple(sorted(incr.columns)), tuple(sorted(incr.extra)))
+        statements.setdefault(signature, []).append(incr)
+
+    using = router.db_for_write(model)
+    updated: set[int] = set()
+    for (columns, extra), statement_incrs in statements.items():
+        updated.update(_bulk_update(model, using, columns, extra, statement_incrs))
+    return updated
+
+
+def _bulk_update(
+    model: type[models.Model],
+    using: str,
+    columns: tuple[str, ...],
+    extra: tuple[str, ...],
+    incrs: Sequence[BulkIncr],
+) -> list[int]:
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    meta = model._meta
+
+    # Mirror `sentry.db.models.query.update`, which bumps `auto_now` fields
+    # unless they are set explicitly.
+    now = timezone.now()
+    auto_now = tuple(
+        field.name
+        for field in meta.concrete_fields
+        if getattr(field, "auto_now", False) and field.name not in extra
+    )
+    extra_fields = [meta.get_field(name) for name in (*extra, *auto_now)]
+    column_fields = [meta.get_field(name) for name in columns]
+
+    assignments = []
+    for field in column_fields:
+        value = f"t.{qn(field.column)}::bigint + v.{qn(field.column)}"
+        if isinstance(field, _BOUNDED_FIELDS):
+            value = f"LEAST({value}, {field.MAX_VALUE})"
+        assignments.append(f"{qn(field.column)} = {value}")
+    for field in extra_fields:
+        assignments.append(f"{qn(field.column)} = v.{qn(field.column)}")
+
+    # Every placeholder is cast, so that Postgres does not have to infer the
+    # types of the VALUES list from its first row.
+    row_placeholder = "({})".format(
+        ", ".join(
+            [f"%s::{meta.pk.rel_db_type(connection)}"]
+            + ["%s::bigint"] * len(column_fields)
+            + [f"%s::{field.db_type(connection)}" for field in extra_fields]
+        )
+    )
+    params: list[Any] = []
+    for incr in incrs:
+        params.append(incr.pk)
+        params.extend(incr.columns[name] for name in columns)
+        params.extend(
+            field.get_db_prep_value(incr.extra[field.name], connection)
+            for field in extra_fields[: len(extra)]
+        )
+        params.extend(
+            field.get_db_prep_value(now, connection) for field in extra_fields[len(extra) :]
+        )
+
+    value_columns = ", ".join(
+        qn(field.column) for field in [meta.pk, *column_fields, *extra_fields]
+    )
+    sql = f"""
+        UPDATE {qn(meta.db_table)} AS t
+        SET {", ".join(assignments)}
+        FROM (VALUES {", ".join([row_placeholder] * len(incrs))}) AS v({value_columns})
+        WHERE t.{qn(meta.pk.column)} = v.{qn(meta.pk.column)}
+        RETURNING t.{qn(meta.pk.column)}
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
@@ -9,11 +9,17 @@ from time import time
 from typing import Any, TypeVar
 
 import rb
+from django.db.models.signals import post_save
 from django.utils.encoding import force_bytes, force_str
+from redis.exceptions import NoScriptError
 from sentry_redis_tools.clients import RedisCluster
 
+from sentry import options
+from sentry.buffer.aggregation import AggregatedIncr, IncrAggregator
 from sentry.buffer.base import Buffer, BufferField
+from sentry.buffer.bulk import BulkIncr, bulk_update, can_bulk_update, get_filter_pk
 from sentry.db import models
+from sentry.signals import buffer_incr_complete
 from sentry.tasks.process_buffer import process_incr
 from sentry.utils import json, metrics
 from sentry.utils.hashlib import md5_text
@@ -23,11 +29,14 @@ from sentry.utils.redis import (
     get_dynamic_cluster_from_options,
     is_instance_rb_cluster,
     is_instance_redis_cluster,
+    load_redis_script,
     validate_dynamic_cluster,
 )
 
 logger = logging.getLogger(__name__)
 
+incr_script = load_redis_script("buffer/incr.lua")
+
 T = TypeVar("T", str, bytes)
 # Debounce our JSON validation a bit in order to not cause too much additional
 # load everywhere
@@ -205,16 +214,40 @@ class PendingBuffer:
 
 
 class RedisBuffer(Buffer):
+    """
+    :param incr_batch_size: Number of pending keys handed to a single
+        `process_incr` task.
+    :param incr_max_latency: If set, increments are pre-aggregated in-process
+        for at most this many seconds and written with one scripted call per
+        key, in one round-trip per shard.
+    :param incr_max_keys: Number of distinct pending keys which triggers an
+        early flush of the pre-aggregated increments.
+    """
+
     key_expire = 60 * 60  # 1 hour
     pending_key = "b:p"
 
-    def __init__(self, incr_batch_size: int = 2, **options: object):
+    def __init__(
+        self,
+        incr_batch_size: int = 2,
+        incr_max_latency: float = 0,
+        incr_max_keys: int = 1000,
+        **options: object,
+    ):
         self.is_redis_cluster, self.cluster, options = get_dynamic_cluster_from_options(
             "SENTRY_BUFFER_OPTIONS", options
         )
         self.incr_batch_size = incr_batch_size
         assert self.incr_batch_size > 0
 
+        self.aggregator: IncrAggregator | None = None
+        if incr_max_latency > 0:
+            self.aggregator = IncrAggregator(
+                self._flush_aggregated_incrs,
+                max_latency=incr_max_latency,
+                max_keys=incr_max_keys,
+            )
+
     def validate(self) -> None:
         validate_dynamic_cluster(self.is_redis_cluster, self.cluster)
 
@@ -348,8 +381,11 @@ class RedisBuffer(Buffer):
             pipe.hget(key, f"i+{col}")
         results = pipe.execute()
 
+        pending = self.aggregator.get_pending_columns(key, columns) if self.aggregator else {}
+
         return {
-            col: (int(results[i]) if results[i] is not None else 0) for i, col in enumerate(columns)
+            col: (int(results[i]) if results[i] is not None else 0) + pending.get(col, 0)
+            for i, col in enumerate(columns)
         }
 
     def get_redis_connection(self, key: str, transaction: bool = True) -> Pipeline:
@@ -381,30 +417,34 @@ class RedisBuffer(Buffer):
         - Add hashmap key to pending flushes
         """
         key = make_key(model, filters)
+        _validate_json_roundtrip(filters, model)
+        if extra:
+            # Group tries to serialize 'score', so we'd need some kind of processing
+            # hook here
+            # e.g. "update score if last_seen or times_seen is changed"
+            _validate_json_roundtrip(extra, model)
+
+        if self.aggregator is not None:
+            self.aggregator.add(key, model, columns, filters, extra, signal_only)
+            metrics.incr(
+                "buffer.incr",
+                skip_internal=True,
+                tags={"module": model.__module__, "model": model.__name__},
+            )
+            return
+
         # We can't use conn.map() due to wanting to support multiple pending
         # keys (one per Redis partition)
         pipe = self.get_redis_connection(key, transaction=(not self.is_redis_cluster))
         pipe.hsetnx(key, "m", f"{model.__module__}.{model.__name__}")
-        _validate_json_roundtrip(filters, model)
-
-        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
-            pipe.hsetnx(key, "f", json.dumps(self._dump_values(filters)))
-        else:
-            pipe.hsetnx(key, "f", pickle.dumps(filters, protocol=5))
+        pipe.hsetnx(key, "f", self._serialize_filters(filters))
 
         for column, amount in columns.items():
             pipe.hincrby(key, "i+" + column, amount)
 
         if extra:
-            # Group tries to serialize 'score', so we'd need some kind of processing
-            # hook here
-            # e.g. "update score if last_seen or times_seen is changed"
-            _validate_json_roundtrip(extra, model)
             for column, value in extra.items():
-                if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
-                    pipe.hset(key, "e+" + column, json.dumps(self._dump_value(value)))
-                else:
-                    pipe.hset(key, "e+" + column, pickle.dumps(value, protocol=5))
+                pipe.hset(key, "e+" + column, self._serialize_extra_value(value))
 
         if signal_only is True:
             pipe.hset(key, "s", "1")
@@ -419,6 +459,119 @@ class RedisBuffer(Buffer):
             tags={"module": model.__module__, "model": model.__name__},
         )
 
+    def _serialize_filters(self, filters: dict[str, BufferField]) -> str | bytes:
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            return json.dumps(self._dump_values(filters))
+        else:
+            return pickle.dumps(filters, protocol=5)
+
+    def _serialize_extra_value(self, value: Any) -> str | bytes:
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            return json.dumps(self._dump_value(value))
+        else:
+            return pickle.dumps(value, protocol=5)
+
+    def _flush_aggregated_incrs(self, incrs: list[AggregatedIncr]) -> list[AggregatedIncr]:
+        """
+        Write pre-aggregated increments with one `buffer/incr.lua` call per
+        key, and one pipeline (i.e. one round-trip) per shard. Returns the
+        increments that could not be written.
+        """
+        incrs_by_key = {incr.key: incr for incr in incrs}
+        failed: list[AggregatedIncr] = []
+        for client, keys in self._group_keys_by_client(list(incrs_by_key)):
+            client_incrs = [incrs_by_key[key] for key in keys]
+            try:
+                failed.extend(self._write_aggregated_incrs(client, client_incrs))
+            except Exception:
+                # One unavailable shard must not fail the increments of the
+                # others.
+                logger.exception("buffer.aggregated-incr-failed")
+                failed.extend(client_incrs)
+        return failed
+
+    def _group_keys_by_client(self, keys: list[str]) -> list[tuple[Any, list[str]]]:
+        """
+        Split up buffer keys by the client that can pipeline commands for
+        them, i.e. by host for rb. The cluster client splits up pipelines by
+        node by itself.
+        """
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            return [(self.cluster, keys)]
+        elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
+            router = self.cluster.get_router()
+            keys_by_host: dict[int, list[str]] = {}
+            for key in keys:
+                keys_by_host.setdefault(router.get_host_for_key(key), []).append(key)
+            return [
+                (self.cluster.get_local_client(host_id), host_keys)
+                for host_id, host_keys in keys_by_host.items()
+            ]
+        else:
+            raise AssertionError("unreachable")
+
+    def _write_aggregated_incrs(
+        self, client: Any, incrs: list[AggregatedIncr]
+    ) -> list[AggregatedIncr]:
+        results = dict(
+            zip([incr.key for incr in incrs], self._pipeline_aggregated_incrs(client, incrs))
+        )
+        missing_script = [incr for incr in incrs if isinstance(results[incr.key], NoScriptError)]
+        if missing_script:
+            # The script cache of a node was flushed or the node restarted.
+            # Load the script once and retry only the calls that did not run.
+            client.script_load(incr_script.script)
+            results.update(
+                zip(
+                    [incr.key for incr in missing_script],
+                    self._pipeline_aggregated_incrs(client, missing_script),
+                )
+            )
+
+        failed = [incr for incr in incrs if isinstance(results[incr.key], Exception)]
+        if failed:
+            logger.error(
+                "buffer.aggregated-incr-failed",
+                extra={"keys": len(failed), "error": str(results[failed[0].key])},
+            )
+        return failed
+
+    def _pipeline_aggregated_incrs(self, client: Any, incrs: list[AggregatedIncr]) -> list[Any]:
+        """
+        Run `buffer/incr.lua` for every increment in one pipeline, by its SHA
+        so that the script body is not sent along. Returns the result of every
+        call, errors included.
+        """
+        with client.pipeline(transaction=False) as pipe:
+            for incr in incrs:
+                incr_args: list[Any] = []
+                for column, amount in incr.columns.items():
+                    incr_args.extend(("i+" + column, amount))
+                for column, value in incr.extra.items():
+                    incr_args.extend(("e+" + column, self._serialize_extra_value(value)))
+
+                pipe.execute_command(
+                    "EVALSHA",
+                    incr_script.sha,
+                    1,
+                    incr.key,
+                    self.key_expire,
+                    f"{incr.model.__module__}.{incr.model.__name__}",
+                    self._serialize_filters(incr.filters),
+                    "1" if incr.signal_only else "0",
+                    len(incr.columns),
+                    *incr_args,
+                )
+            pipe.zadd(self.pending_key, {incr.key: time() for incr in incrs})
+            results = pipe.execute(raise_on_error=False)
+
+        if isinstance(results[-1], Exception):
+            # The increments were written, retrying them would count them
+            # twice. The keys are marked pending again by their next
+            # increment.
+            logger.error("buffer.aggregated-incr-pending-failed", exc_info=results[-1])
+        return results[:-1]
+
     def process_pending(self) -> None:
         client = get_cluster_routing_client(self.cluster, self.is_redis_cluster)
         lock_key = self._lock_key(client, self.pending_key, ex=60)
@@ -431,10 +584,16 @@ class RedisBuffer(Buffer):
 
         try:
             keycount = 0
+            oldest: float | None = None
             if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
-                keys: list[str] = self.cluster.zrange(self.pending_key, 0, -1)
-                keycount += len(keys)
-
+                pending: list[tuple[str, float]] = self.cluster.zrange(
+                    self.pending_key, 0, -1, withscores=True
+                )
+                keycount += len(pending)
+                if pending:
+                    oldest = pending[0][1]
+
+                keys = [key for key, _ in pending]
                 for key in keys:
                     model_key = self._extract_model_from_key(key=key)
                     pending_buffer = pending_buffers_router.get_pending_buffer(model_key=model_key)
@@ -450,13 +609,16 @@ class RedisBuffer(Buffer):
 
             elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
                 with self.cluster.all() as conn:
-                    results = conn.zrange(self.pending_key, 0, -1)
+                    results = conn.zrange(self.pending_key, 0, -1, withscores=True)
 
                 with self.cluster.all() as conn:
-                    for host_id, keysb in results.value.items():
-                        if not keysb:
+                    for host_id, pendingb in results.value.items():
+                        if not pendingb:
                             continue
-                        keycount += len(keysb)
+                        keycount += len(pendingb)
+                        if oldest is None or pendingb[0][1] < oldest:
+                            oldest = pendingb[0][1]
+                        keysb = [keyb for keyb, _ in pendingb]
                         for keyb in keysb:
                             key = keyb.decode("utf-8")
                             model_key = self._extract_model_from_key(key=key)
@@ -485,6 +647,10 @@ class RedisBuffer(Buffer):
                     )
 
             metrics.distribution("buffer.pending-size", keycount)
+            if oldest is not None:
+                # Pending keys are scored by the time of their latest incr,
+                # so this is a lower bound for how far flushing lags behind.
+                metrics.distribution("buffer.pending-age", time() - oldest, unit="second")
         finally:
             client.delete(lock_key)
 
@@ -499,8 +665,11 @@ class RedisBuffer(Buffer):
             batch_keys = [key]
 
         if batch_keys is not None:
-            for key in batch_keys:
-                self._process_single_incr(key)
+            if len(batch_keys) > 1 and options.get("buffer.process-batched"):
+                self._process_batch(batch_keys)
+            else:
+                for key in batch_keys:
+                    self._process_single_incr(key)
 
     def _base_process(
         self,
@@ -527,39 +696,231 @@ class RedisBuffer(Buffer):
             pipe.delete(key)
             values = pipe.execute()[0]
 
-            # XXX(python3): In python2 this isn't as important since redis will
-            # return string tyes (be it, byte strings), but in py3 we get bytes
-            # back, and really we just want to deal with keys as strings.
-            values = {force_str(k): v for k, v in values.items()}
-
             if not values:
                 metrics.incr("buffer.revoked", tags={"reason": "empty"}, skip_internal=False)
                 logger.debug("buffer.revoked.empty", extra={"redis_key": key})
                 return
 
-            model = import_string(force_str(values.pop("m")))
-
-            if values["f"].startswith(b"{" if not self.is_redis_cluster else "{"):
-                filters = self._load_values(json.loads(force_str(values.pop("f"))))
-            else:
-                # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
-                filters = pickle.loads(force_bytes(values.pop("f")))
-
-            incr_values = {}
-            extra_values = {}
-            signal_only = None
-            for k, v in values.items():
-                if k.startswith("i+"):
-                    incr_values[k[2:]] = int(v)
-                elif k.startswith("e+"):
-                    if v.startswith(b"[" if not self.is_redis_cluster else "["):
-                        extra_values[k[2:]] = self._load_value(json.loads(force_str(v)))
-                    else:
-                        # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
-                        extra_values[k[2:]] = pickle.loads(force_bytes(v))
-                elif k == "s":
-                    signal_only = bool(int(v))  # Should be 1 if set
-
-            self._base_process(model, incr_values, filters, extra_values, signal_only)
+            self._base_process(*self._load_buffer(values))
         finally:
             client.delete(lock_key)
+
+    def _load_buffer(
+        self, values: dict[Any, Any]
+    ) -> tuple[type[models.Model], dict[str, int], dict[str, Any], dict[str, Any], bool | None]:
+        """
+        Load the contents of a buffer hash into the arguments of `process`.
+        """
+        # XXX(python3): In python2 this isn't as important since redis will
+        # return string tyes (be it, byte strings), but in py3 we get bytes
+        # back, and really we just want to deal with keys as strings.
+        values = {force_str(k): v for k, v in values.items()}
+
+        model = import_string(force_str(values.pop("m")))
+
+        if values["f"].startswith(b"{" if not self.is_redis_cluster else "{"):
+            filters = self._load_values(json.loads(force_str(values.pop("f"))))
+        else:
+            # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
+            filters = pickle.loads(force_bytes(values.pop("f")))
+
+        incr_values = {}
+        extra_values = {}
+        signal_only = None
+        for k, v in values.items():
+            if k.startswith("i+"):
+                incr_values[k[2:]] = int(v)
+            elif k.startswith("e+"):
+                if v.startswith(b"[" if not self.is_redis_cluster else "["):
+                    extra_values[k[2:]] = self._load_value(json.loads(force_str(v)))
+                else:
+                    # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
+                    extra_values[k[2:]] = pickle.loads(force_bytes(v))
+            elif k == "s":
+                signal_only = bool(int(v))  # Should be 1 if set
+
+        return model, incr_values, filters, extra_values, signal_only
+
+    def _lock_keys(self, client: Any, keys: list[str], ex: int) -> list[str]:
+        """
+        Lock many keys at once, and return the keys which could be locked.
+        """
+        lock_keys = [self._make_lock_key(key) for key in keys]
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            with client.pipeline(transaction=False) as pipe:
+                for lock_key in lock_keys:
+                    pipe.set(lock_key, "1", nx=True, ex=ex)
+                results = pipe.execute()
+        else:
+            with client.map() as conn:
+                promises = [conn.set(lock_key, "1", nx=True, ex=ex) for lock_key in lock_keys]
+            results = [promise.value for promise in promises]
+        return [key for key, locked in zip(keys, results) if locked]
+
+    def _unlock_keys(self, client: Any, keys: list[str]) -> None:
+        # A multi-key DEL is not allowed across slots in cluster mode.
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            with client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.delete(self._make_lock_key(key))
+                pipe.execute()
+        else:
+            with client.map() as conn:
+                for key in keys:
+                    conn.delete(self._make_lock_key(key))
+
+    def _process_batch(self, batch_keys: list[str]) -> None:
+        """
+        Process many keys with one round-trip per shard for reading them, and
+        one `UPDATE` per model for the rows that can be updated in bulk. All
+        other increments go through the regular `process`.
+
+        Keys are processed independently of each other. The values of a key
+        whose write fails are put back into the buffer, to be retried with
+        the next flush.
+        """
+        client = get_cluster_routing_client(self.cluster, self.is_redis_cluster)
+        keys = self._lock_keys(client, batch_keys, ex=10)
+        if len(keys) < len(batch_keys):
+            metrics.incr(
+                "buffer.revoked",
+                amount=len(batch_keys) - len(keys),
+                tags={"reason": "locked"},
+                skip_internal=False,
+            )
+        if not keys:
+            return
+
+        try:
+            buffers: dict[str, dict[Any, Any]] = {}
+            for key_client, client_keys in self._group_keys_by_client(keys):
+                with key_client.pipeline(transaction=False) as pipe:
+                    for key in client_keys:
+                        pipe.hgetall(key)
+                        pipe.zrem(self.pending_key, key)
+                        pipe.delete(key)
+                    results = pipe.execute()
+                buffers.update(zip(client_keys, results[::3]))
+
+            failed: list[str] = []
+            bulk_incrs: dict[type[models.Model], list[tuple[str, BulkIncr, dict[str, Any]]]] = {}
+            for key in keys:
+                values = buffers[key]
+                if not values:
+                    metrics.incr("buffer.revoked", tags={"reason": "empty"}, skip_internal=False)
+                    logger.debug("buffer.revoked.empty", extra={"redis_key": key})
+                    continue
+
+                try:
+                    model, columns, filters, extra, signal_only = self._load_buffer(values)
+                except Exception:
+                    # Retrying cannot fix a value that cannot be loaded.
+                    metrics.incr("buffer.revoked", tags={"reason": "invalid"}, skip_internal=False)
+                    logger.exception("buffer.revoked.invalid", extra={"redis_key": key})
+                    continue
+
+                pk = get_filter_pk(filters)
+                if pk is not None and can_bulk_update(model, columns, filters, extra, signal_only):
+                    bulk_incrs.setdefault(model, []).append(
+                        (key, BulkIncr(pk, columns, extra), filters)
+                    )
+                elif not self._try_base_process(key, model, columns, filters, extra, signal_only):
+                    failed.append(key)
+
+            for model, model_incrs in bulk_incrs.items():
+                failed.extend(self._bulk_process(model, model_incrs))
+
+            if failed:
+                metrics.incr("buffer.process-failed", amount=len(failed), skip_internal=False)
+                self._restore_buffers({key: buffers[key] for key in failed})
+        finally:
+            self._unlock_keys(client, keys)
+
+    def _try_base_process(
+        self,
+        key: str,
+        model: type[models.Model],
+        columns: dict[str, int],
+        filters: dict[str, Any],
+        extra: dict[str, Any] | None = None,
+        signal_only: bool | None = None,
+    ) -> bool:
+        try:
+            self._base_process(model, columns, filters, extra, signal_only)
+        except Exception:
+            logger.exception("buffer.process-failed", extra={"redis_key": key})
+            return False
+        return True
+
+    def _restore_buffers(self, buffers: dict[str, dict[Any, Any]]) -> None:
+        """
+        Put the values read from buffer keys back. Counters are added to
+        whatever was buffered in the meantime, all other fields only fill in
+        what is missing, so that newer `extra` values win.
+        """
+        for key_client, client_keys in self._group_keys_by_client(list(buffers)):
+            with key_client.pipeline(transaction=False) as pipe:
+                for key in client_keys:
+                    for field, value in buffers[key].items():
+                        field = force_str(field)
+                        if field.startswith("i+"):
+                            pipe.hincrby(key, field, int(value))
+                        else:
+                            pipe.hsetnx(key, field, value)
+                    pipe.expire(key, self.key_expire)
+                    pipe.zadd(self.pending_key, {key: time()})
+                pipe.execute()
+
+    def _bulk_process(
+        self, model: type[models.Model], incrs: list[tuple[str, BulkIncr, dict[str, Any]]]
+    ) -> list[str]:
+        """
+        Apply the increments of one model with `bulk_update`, and return the
+        keys whose increments could not be applied.
+        """
+        from sentry.models.group import Group
+
+        try:
+            with metrics.timer("buffer.bulk_update", tags={"model": model.__name__}):
+                updated = bulk_update(model, [incr for _, incr, _ in incrs])
+        except Exception:
+            # Fall back to one update per row, so that a single bad row does
+            # not fail the others.
+            logger.exception("buffer.bulk_update-failed", extra={"model": model.__name__})
+            return [
+                key
+                for key, incr, filters in incrs
+                if not self._try_base_process(key, model, incr.columns, filters, incr.extra)
+            ]
+        metrics.distribution("buffer.bulk_update.rows", len(incrs), tags={"model": model.__name__})
+
+        # Like `process`, which only sends `post_save` for groups through
+        # `Group.update`, refreshing the group cache.
+        if model is Group and updated:
+            update_fields = {incr.pk: [*incr.columns, *incr.extra] for _, incr, _ in incrs}
+            for instance in model.objects.filter(pk__in=updated):
+                post_save.send_robust(
+                    sender=model,
+                    instance=instance,
+                    created=False,
+                    update_fields=update_fields[instance.pk],
+                )
+
+        failed = []
+        for key, incr, filters in incrs:
+            if incr.pk not in updated and model is not Group:
+                # The row does not exist yet, `create_or_update` creates it.
+                if not self._try_base_process(key, model, incr.columns, filters, incr.extra):
+                    failed.append(key)
+                continue
+
+            # Deleted groups are skipped, just like `process` does.
+            buffer_incr_complete.send_robust(
+                model=model,
+                columns=incr.columns,
+                filters=filters,
+                extra=incr.extra,
+                created=False,
+                sender=model,
+            )
+        return failed
@@ -1736,6 +1736,12 @@ SENTRY_DEFAULT_MAX_EVENTS_PER_MINUTE = "90%"
 SENTRY_SNUBA = os.environ.get("SNUBA", "http://127.0.0.1:1218")
 SENTRY_SNUBA_TIMEOUT = 30
 SENTRY_SNUBA_CACHE_TTL_SECONDS = 60
+# Connections kept open to Snuba, and queries of bulk requests run concurrently,
+# per process.
+SENTRY_SNUBA_POOL_SIZE = 10
+# Maximum number of concurrent Snuba queries by referrer, across all processes.
+# Queries above the limit fail with `RateLimitExceeded` instead of being sent.
+SENTRY_SNUBA_REFERRER_CONCURRENCY_LIMITS: dict[str, int] = {}
 
 # Node storage backend
 SENTRY_NODESTORE = "sentry.services.nodestore.django.DjangoNodeStorage"
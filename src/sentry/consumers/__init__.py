@@ -222,8 +222,20 @@ def ingest_events_options() -> list[click.Option]:
         `--reprocess-only-events-not-in-nodestore`: *only* events whose payload is missing from `nodestore` are processed.
         This works similarly to `--reprocess-only-stuck-events`, but can be used to reprocess events that were stuck
         in redis, but then purged.
+
+        `--mode`: `batched` collects micro-batches of messages per partition (bounded by
+        `--max-batch-size` and `--max-batch-time-ms`) and processes them together, sharing
+        cache round-trips across the batch. Attachment consumers always run in `single` mode.
     """
     options = multiprocessing_options(default_max_batch_size=100)
+    options.append(
+        click.Option(
+            ["--mode", "mode"],
+            type=click.Choice(["single", "batched"]),
+            default="single",
+            help="Process messages one at a time, or in micro-batches per partition.",
+        )
+    )
     options.append(
         click.Option(
             ["--reprocess-only-stuck-events", "reprocess_only_stuck_events"],
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, TypedDict
 
 from sentry.conf.server import DEFAULT_GROUPING_CONFIG
+from sentry.grouping import variant_cache
 from sentry.grouping.component import ContributingComponent, RootGroupingComponent
 from sentry.grouping.context import GroupingContext
 from sentry.grouping.enhancer import (
@@ -354,6 +355,20 @@ def _get_variants_from_strategies(
     return variants
 
 
+def _get_cached_variants_from_strategies(
+    event: BaseEvent, context: GroupingContext
+) -> dict[str, ComponentVariant]:
+    if not variant_cache.is_enabled():
+        return _get_variants_from_strategies(event, context)
+
+    cache_key = variant_cache.get_cache_key(event, context)
+    variants = variant_cache.get_cached_variants(cache_key, event, context)
+    if variants is None:
+        variants = _get_variants_from_strategies(event, context)
+        variant_cache.cache_variants(cache_key, event, context, variants)
+    return variants
+
+
 # This is called by the Event model in get_grouping_variants()
 def get_grouping_variants_for_event(
     event: BaseEvent, config: StrategyConfiguration | None = None
@@ -407,7 +422,7 @@ def get_grouping_variants_for_event(
 
     # Run all of the event-data-based grouping strategies. Any which apply will create grouping
     # components, which will then be grouped into variants by variant type (system, app, default).
-    strategy_component_variants: dict[str, ComponentVariant] = _get_variants_from_strategies(
+    strategy_component_variants: dict[str, ComponentVariant] = _get_cached_variants_from_strategies(
         event, context
     )
 
@@ -3,15 +3,24 @@
 
 from __future__ import annotations
 
+import copy
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
 from django.core.cache import cache
 
 from sentry import options
+from sentry.utils.local_cache import OptionSizedCache
 
 if TYPE_CHECKING:
     from sentry.models.grouphash import GroupHash
 
+LOCAL_GROUPHASH_CACHE_EXPIRY_SECONDS = 5
+
+_local_cache: OptionSizedCache[str, Any] = OptionSizedCache(
+    "grouping.ingest_grouphash_local_cache_size", ttl=LOCAL_GROUPHASH_CACHE_EXPIRY_SECONDS
+)
+
 
 def get_grouphash_existence_cache_key(hash_value: str, project_id: int) -> str:
     return f"secondary_grouphash_existence:{project_id}:{hash_value}"
@@ -21,6 +30,35 @@ def get_grouphash_object_cache_key(hash_value: str, project_id: int) -> str:
     return f"grouphash_with_assigned_group:{project_id}:{hash_value}"
 
 
+def get_from_local_grouphash_cache(cache_key: str) -> Any | None:
+    """
+    Get a grouphash existence boolean or a copy of a `GroupHash` object from the process-local
+    cache tier, or None if it's not there (or the local tier is disabled).
+    """
+    with _local_cache.locked() as local_cache:
+        value = local_cache.get(cache_key) if local_cache is not None else None
+
+    # Hand out a copy, the same way the shared cache hands out a freshly unpickled object
+    return copy.copy(value)
+
+
+def set_in_local_grouphash_cache(cache_key: str, value: Any) -> None:
+    with _local_cache.locked() as local_cache:
+        if local_cache is not None:
+            local_cache[cache_key] = copy.copy(value)
+
+
+def invalidate_local_grouphash_cache(cache_keys: Iterable[str]) -> None:
+    with _local_cache.locked() as local_cache:
+        if local_cache is not None:
+            for cache_key in cache_keys:
+                local_cache.pop(cache_key, None)
+
+
+def clear_local_grouphash_cache() -> None:
+    _local_cache.clear()
+
+
 def invalidate_grouphash_cache_on_save(instance: GroupHash, **kwargs: Any) -> None:
     # TODO: `GroupHash.project` is nullable for some reason, even though it's never ever null. If we
     # fix that, we can remove this check.
@@ -35,6 +73,7 @@ def invalidate_grouphash_cache_on_save(instance: GroupHash, **kwargs: Any) -> No
         return
 
     cache_key = get_grouphash_object_cache_key(instance.hash, instance.project.id)
+    invalidate_local_grouphash_cache([cache_key])
     try:
         cache.delete(cache_key)
     except Exception:
@@ -54,6 +93,7 @@ def invalidate_grouphash_caches_on_delete(instance: GroupHash, **kwargs: Any) ->
 
     object_cache_key = get_grouphash_object_cache_key(instance.hash, instance.project.id)
     existence_cache_key = get_grouphash_existence_cache_key(instance.hash, instance.project.id)
+    invalidate_local_grouphash_cache([object_cache_key, existence_cache_key])
 
     try:
         cache.delete_many([object_cache_key, existence_cache_key])
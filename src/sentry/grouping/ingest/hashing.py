@@ -3,7 +3,7 @@ from __future__ import annotations
 import copy
 import logging
 from collections.abc import Iterable, Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import sentry_sdk
 from django.core.cache import cache
@@ -20,8 +20,10 @@ from sentry.grouping.api import (
     load_grouping_config,
 )
 from sentry.grouping.ingest.caching import (
+    get_from_local_grouphash_cache,
     get_grouphash_existence_cache_key,
     get_grouphash_object_cache_key,
+    set_in_local_grouphash_cache,
 )
 from sentry.grouping.ingest.config import is_in_transition
 from sentry.grouping.ingest.grouphash_metadata import (
@@ -188,6 +190,69 @@ def find_grouphash_with_group(
     return winning_grouphash
 
 
+def _get_cached_grouphash_value(cache_key: str, metrics_tags: MutableTags) -> Any | None:
+    """
+    Look for the given key first in the process-local grouphash cache and then in the shared cache,
+    returning None if it's in neither. Shared cache hits are copied into the local cache.
+    """
+    value = get_from_local_grouphash_cache(cache_key)
+    if value is not None:
+        metrics_tags["cache_result"] = "local_hit"
+        return value
+
+    value = cache.get(cache_key)
+    got_cache_hit = value is not None
+    metrics_tags["cache_result"] = "hit" if got_cache_hit else "miss"
+
+    if got_cache_hit:
+        set_in_local_grouphash_cache(cache_key, value)
+
+    return value
+
+
+def _get_many_cached_grouphash_values(cache_keys: Sequence[str]) -> dict[str, Any]:
+    """
+    Bulk version of `_get_cached_grouphash_value`, which checks the shared cache for all local
+    cache misses in a single call. Keys found in neither cache are left out of the result.
+    """
+    values = {}
+
+    for cache_key in cache_keys:
+        value = get_from_local_grouphash_cache(cache_key)
+        if value is not None:
+            values[cache_key] = value
+
+    shared_cache_keys = [cache_key for cache_key in cache_keys if cache_key not in values]
+    if shared_cache_keys:
+        for cache_key, value in cache.get_many(shared_cache_keys).items():
+            if value is not None:
+                set_in_local_grouphash_cache(cache_key, value)
+                values[cache_key] = value
+
+    metrics.incr(
+        "grouping.get_or_create_grouphashes.bulk_cache_lookup",
+        amount=len(values),
+        tags={"cache_result": "hit"},
+    )
+    metrics.incr(
+        "grouping.get_or_create_grouphashes.bulk_cache_lookup",
+        amount=len(cache_keys) - len(values),
+        tags={"cache_result": "miss"},
+    )
+
+    return values
+
+
+def _set_cached_grouphash_values(values: dict[str, Any]) -> None:
+    if not values:
+        return
+
+    for cache_key, value in values.items():
+        set_in_local_grouphash_cache(cache_key, value)
+
+    cache.set_many(values, GROUPHASH_CACHE_EXPIRY_SECONDS)
+
+
 def _grouphash_exists_for_hash_value(hash_value: str, project: Project, use_caching: bool) -> bool:
     """
     Check whether a given hash value has a corresponding `GroupHash` record in the database.
@@ -200,11 +265,9 @@ def _grouphash_exists_for_hash_value(hash_value: str, project: Project, use_cach
         cache_key = get_grouphash_existence_cache_key(hash_value, project.id)
 
         if use_caching:
-            grouphash_exists = cache.get(cache_key)
-            got_cache_hit = grouphash_exists is not None
-            metrics_tags["cache_result"] = "hit" if got_cache_hit else "miss"
+            grouphash_exists = _get_cached_grouphash_value(cache_key, metrics_tags)
 
-            if got_cache_hit:
+            if grouphash_exists is not None:
                 metrics_tags["grouphash_exists"] = grouphash_exists
                 return grouphash_exists
 
@@ -217,10 +280,58 @@ def _grouphash_exists_for_hash_value(hash_value: str, project: Project, use_cach
             metrics_tags["cache_set"] = True
 
             cache.set(cache_key, grouphash_exists, GROUPHASH_CACHE_EXPIRY_SECONDS)
+            set_in_local_grouphash_cache(cache_key, grouphash_exists)
 
         return grouphash_exists
 
 
+def _filter_to_existing_hash_values(
+    hash_values: Sequence[str], project: Project, use_caching: bool
+) -> list[str]:
+    """
+    Bulk version of `_grouphash_exists_for_hash_value`, which filters the given hashes down to the
+    ones with a corresponding `GroupHash` record, checking the database for all of the hashes the
+    caches can't answer for in a single query.
+    """
+    with metrics.timer(
+        "grouping.get_or_create_grouphashes.bulk_check_secondary_hash_existence"
+    ) as metrics_tags:
+        metrics_tags["hash_count"] = len(hash_values)
+        existence_by_hash: dict[str, bool] = {}
+        cache_keys = {
+            hash_value: get_grouphash_existence_cache_key(hash_value, project.id)
+            for hash_value in hash_values
+        }
+
+        if use_caching:
+            cached_values = _get_many_cached_grouphash_values(list(cache_keys.values()))
+            for hash_value, cache_key in cache_keys.items():
+                if cache_key in cached_values:
+                    existence_by_hash[hash_value] = cached_values[cache_key]
+
+        uncached_hash_values = [
+            hash_value for hash_value in hash_values if hash_value not in existence_by_hash
+        ]
+        if uncached_hash_values:
+            existing_hash_values = set(
+                GroupHash.objects.filter(
+                    project=project, hash__in=uncached_hash_values
+                ).values_list("hash", flat=True)
+            )
+            for hash_value in uncached_hash_values:
+                existence_by_hash[hash_value] = hash_value in existing_hash_values
+
+            if use_caching:
+                _set_cached_grouphash_values(
+                    {
+                        cache_keys[hash_value]: existence_by_hash[hash_value]
+                        for hash_value in uncached_hash_values
+                    }
+                )
+
+        return [hash_value for hash_value in hash_values if existence_by_hash[hash_value]]
+
+
 def _get_or_create_single_grouphash(
     hash_value: str, project: Project, use_caching: bool
 ) -> tuple[GroupHash, bool]:
@@ -237,11 +348,9 @@ def _get_or_create_single_grouphash(
         cache_key = get_grouphash_object_cache_key(hash_value, project.id)
 
         if use_caching:
-            grouphash = cache.get(cache_key)
-            got_cache_hit = grouphash is not None
-            metrics_tags["cache_result"] = "hit" if got_cache_hit else "miss"
+            grouphash = _get_cached_grouphash_value(cache_key, metrics_tags)
 
-            if got_cache_hit:
+            if grouphash is not None:
                 return (grouphash, False)
 
         grouphash, created = GroupHash.objects.get_or_create(project=project, hash=hash_value)
@@ -253,10 +362,60 @@ def _get_or_create_single_grouphash(
             metrics_tags["cache_set"] = True
 
             cache.set(cache_key, grouphash, GROUPHASH_CACHE_EXPIRY_SECONDS)
+            set_in_local_grouphash_cache(cache_key, grouphash)
 
         return (grouphash, created)
 
 
+def _get_existing_grouphashes(
+    hash_values: Sequence[str], project: Project, use_caching: bool
+) -> dict[str, GroupHash]:
+    """
+    Retrieve the `GroupHash` records which already exist for the given hashes, keyed by hash value,
+    checking the database for all of the hashes the caches can't answer for in a single query.
+    Hashes without a record are left out of the result, for `_get_or_create_single_grouphash` to
+    create.
+
+    As with `_get_or_create_single_grouphash`, only grouphashes with an assigned group are cached.
+    """
+    with metrics.timer(
+        "grouping.get_or_create_grouphashes.bulk_get_existing_grouphashes"
+    ) as metrics_tags:
+        metrics_tags["hash_count"] = len(hash_values)
+        grouphashes: dict[str, GroupHash] = {}
+        cache_keys = {
+            hash_value: get_grouphash_object_cache_key(hash_value, project.id)
+            for hash_value in hash_values
+        }
+
+        if use_caching:
+            cached_values = _get_many_cached_grouphash_values(list(cache_keys.values()))
+            for hash_value, cache_key in cache_keys.items():
+                if cache_key in cached_values:
+                    grouphashes[hash_value] = cached_values[cache_key]
+
+        uncached_hash_values = [
+            hash_value for hash_value in hash_values if hash_value not in grouphashes
+        ]
+        if uncached_hash_values:
+            for grouphash in GroupHash.objects.filter(
+                project=project, hash__in=uncached_hash_values
+            ):
+                grouphashes[grouphash.hash] = grouphash
+
+            if use_caching:
+                _set_cached_grouphash_values(
+                    {
+                        cache_keys[hash_value]: grouphashes[hash_value]
+                        for hash_value in uncached_hash_values
+                        if hash_value in grouphashes
+                        and grouphashes[hash_value].group_id is not None
+                    }
+                )
+
+        return grouphashes
+
+
 def get_or_create_grouphashes(
     event: Event,
     project: Project,
@@ -267,19 +426,33 @@ def get_or_create_grouphashes(
     is_secondary = grouping_config_id == project.get_option("sentry:secondary_grouping_config")
     use_caching = options.get("grouping.use_ingest_grouphash_caching")
     grouphashes: list[GroupHash] = []
+    hashes = list(hashes)
+    # When there's more than one hash, look them all up at once, rather than making a round trip to
+    # the cache and the database for each of them
+    use_bulk_lookups = len(hashes) > 1 and options.get("grouping.ingest_grouphash_bulk_lookups")
 
     if is_secondary:
         # The only utility of secondary hashes is to link new primary hashes to an existing group
         # via an existing grouphash. Secondary hashes which are new are therefore of no value, so
         # filter them out before creating grouphash records.
-        hashes = [
-            hash_value
-            for hash_value in hashes
-            if _grouphash_exists_for_hash_value(hash_value, project, use_caching)
-        ]
+        if use_bulk_lookups:
+            hashes = _filter_to_existing_hash_values(hashes, project, use_caching)
+        else:
+            hashes = [
+                hash_value
+                for hash_value in hashes
+                if _grouphash_exists_for_hash_value(hash_value, project, use_caching)
+            ]
+
+    existing_grouphashes = (
+        _get_existing_grouphashes(hashes, project, use_caching) if use_bulk_lookups else {}
+    )
 
     for hash_value in hashes:
-        grouphash, created = _get_or_create_single_grouphash(hash_value, project, use_caching)
+        if hash_value in existing_grouphashes:
+            grouphash, created = existing_grouphashes[hash_value], False
+        else:
+            grouphash, created = _get_or_create_single_grouphash(hash_value, project, use_caching)
 
         if options.get("grouping.grouphash_metadata.ingestion_writes_enabled"):
             try:
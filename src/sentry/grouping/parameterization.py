@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import logging
 import re
 from collections import Counter, OrderedDict, defaultdict
@@ -566,9 +567,22 @@ DEFAULT_PARAMETERIZATION_REGEXES = [
 ]
 
 
+@dataclasses.dataclass(frozen=True)
+class ParameterizationResult:
+    parameterized: str
+    # Number of replacements made, by `ParameterizationRegex.name`
+    replacement_counts: tuple[tuple[str, int], ...]
+    # `ParameterizationRegex.name` of every match the replacement callback declined to replace
+    false_positive_keys: tuple[str, ...]
+
+
 class Parameterizer:
     # Inputs longer than this are not parameterized, as a defense against ReDoS
     MAX_INPUT_LENGTH = 8192
+    # The same messages show up over and over, so the results for the most recently seen ones are
+    # cached. Longer inputs are rarely repeated verbatim and aren't worth the memory.
+    CACHE_SIZE = 4096
+    MAX_CACHED_INPUT_LENGTH = 1024
 
     def __init__(
         self,
@@ -627,6 +641,12 @@ class Parameterizer:
             (name, re.compile(rf"(?x){pattern}")) for name, pattern in patterns_by_name.items()
         )
 
+        # Per instance, since results depend on the regexes
+        self._parameterize_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(self._parameterize)
+
+    def clear_cache(self) -> None:
+        self._parameterize_cached.cache_clear()
+
     def parameterize(self, input_str: str) -> str:
         """
         Replace all regex matches in the input string with placeholder strings, using the regexes
@@ -639,7 +659,28 @@ class Parameterizer:
             metrics.incr("grouping.parameterization_skipped_long_input")
             return input_str
 
+        if len(input_str) > self.MAX_CACHED_INPUT_LENGTH:
+            result = self._parameterize(input_str)
+        else:
+            result = self._parameterize_cached(input_str)
+
+        # Metrics are emitted for cached results as well, so that they keep reflecting the messages
+        # we see rather than only the distinct ones
+        for regex_key in result.false_positive_keys:
+            # Track the number of false positive matches, and what pattern produced them. We can
+            # compare this to the same key's `grouping.value_parameterized` metric below to see how
+            # often our maybe-matches pan out to be actual matches.
+            metrics.incr("grouping.parameterization_false_positive", tags={"key": regex_key})
+
+        for regex_key, count in result.replacement_counts:
+            # Track the kinds of replacements being made
+            metrics.incr("grouping.value_parameterized", amount=count, tags={"key": regex_key})
+
+        return result.parameterized
+
+    def _parameterize(self, input_str: str) -> ParameterizationResult:
         replacement_counts: defaultdict[str, int] = defaultdict(int)
+        false_positive_keys: list[str] = []
         # Track whether any regex matches don't lead to a replacement
         found_false_positive = False
         # Flag allowing us to only count false positives during the main parameterization, not the
@@ -660,11 +701,11 @@ class Parameterizer:
             # one named group to match, so its name will automatically be the only/last matched
             # group name. Thus `lastgroup` should give us the group name in either case.
             matched_key = match.lastgroup
-            orig_value = match.groupdict().get(
-                matched_key or ""  # Empty string for mypy appeasment
-            )
+            if not matched_key:  # Insurance - shouldn't happen IRL
+                return ""
 
-            if not matched_key or not orig_value:  # Insurance - shouldn't happen IRL
+            orig_value = match.group(matched_key)
+            if not orig_value:  # Insurance - shouldn't happen IRL
                 return ""
 
             replacement_callback = self.replacement_functions.get(matched_key)
@@ -682,12 +723,7 @@ class Parameterizer:
                 # This is only true during the main combo-regex parameterization, not during
                 # fallback, so that we don't double-count these occurrences
                 if emit_false_positive_metric:
-                    # Track the number of false positive matches, and what pattern produced them. We
-                    # can compare this to the same key's `grouping.value_parameterized` metric below
-                    # to see how often our maybe-matches pan out to be actual matches.
-                    metrics.incr(
-                        "grouping.parameterization_false_positive", tags={"key": matched_key}
-                    )
+                    false_positive_keys.append(matched_key)
                     # TODO: Remove this once we have enough sample data
                     _log_example_data(
                         "ip_false_positive", extra={"input_str": input_str, "value": orig_value}
@@ -721,11 +757,11 @@ class Parameterizer:
 
             metric_tags["changed"] = parameterized != input_str
 
-        for regex_key, count in replacement_counts.items():
-            # Track the kinds of replacements being made
-            metrics.incr("grouping.value_parameterized", amount=count, tags={"key": regex_key})
-
-        return parameterized
+        return ParameterizationResult(
+            parameterized=parameterized,
+            replacement_counts=tuple(replacement_counts.items()),
+            false_positive_keys=tuple(false_positive_keys),
+        )
 
 
 parameterizer = Parameterizer(use_experimental_regexes=False)
@@ -0,0 +1,171 @@
+"""
+Process-local cache of the variants produced by the grouping strategies.
+
+Error storms caused by a single bug send the same exception with the same stacktrace over and
+over, and running the strategies (including the enhancement rules) is the most expensive part of
+grouping them. The strategies only look at the interfaces they handle, the platform, the SDK
+version, the grouping config and the message parameterizer in use, so the variants are cached by
+a digest of exactly those. Frame fields which never affect grouping, like local variables, are left
+out of the digest so that events which only differ in those share an entry.
+
+The size of the cache is controlled by `grouping.strategy_variants_cache_size`, and setting it to
+0 disables it.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sentry import options
+from sentry.grouping.component import BaseGroupingComponent
+from sentry.grouping.variants import ComponentVariant
+from sentry.utils import json, metrics
+from sentry.utils.local_cache import OptionSizedCache
+from sentry.utils.safe import get_path
+
+if TYPE_CHECKING:
+    from sentry.grouping.context import GroupingContext
+    from sentry.services.eventstore.models import BaseEvent
+
+# Frame fields which are specific to a single event and not used by any grouping strategy or
+# enhancement rule.
+IGNORED_FRAME_FIELDS = frozenset(("vars", "pre_context", "post_context"))
+
+# Event data the strategies write back to the event, which has to be restored on a cache hit.
+EVENT_DATA_UPDATES = ("main_exception_id",)
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class CachedVariants:
+    variants: dict[str, ComponentVariant]
+    event_data_updates: dict[str, Any]
+
+
+_cache: OptionSizedCache[str, CachedVariants] = OptionSizedCache(
+    "grouping.strategy_variants_cache_size"
+)
+
+
+def is_enabled() -> bool:
+    return options.get("grouping.strategy_variants_cache_size") > 0
+
+
+def clear() -> None:
+    _cache.clear()
+
+
+def _strip_event_specific_data(data: Any) -> Any:
+    if isinstance(data, Mapping):
+        return {
+            key: (
+                [
+                    {k: v for k, v in frame.items() if k not in IGNORED_FRAME_FIELDS}
+                    if isinstance(frame, Mapping)
+                    else frame
+                    for frame in value
+                ]
+                if key == "frames" and isinstance(value, list)
+                else _strip_event_specific_data(value)
+            )
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [_strip_event_specific_data(value) for value in data]
+    return data
+
+
+def get_cache_key(event: BaseEvent, context: GroupingContext) -> str:
+    config = context.config
+    interface_names = sorted({strategy.interface_name for strategy in config.iter_strategies()})
+    key_data = [
+        config.id,
+        config.enhancements.base64_string,
+        context.parameterizer.is_experimental,
+        event.platform,
+        get_path(event.data, "sdk", "version"),
+        [event.data.get(name, None) for name in EVENT_DATA_UPDATES],
+        [_strip_event_specific_data(event.data.get(name)) for name in interface_names],
+    ]
+    return hashlib.sha256(json.dumps(key_data).encode("utf-8")).hexdigest()
+
+
+def _copy_variants(
+    variants: Mapping[str, ComponentVariant], context: GroupingContext
+) -> dict[str, ComponentVariant]:
+    """
+    Copy the variants along with their component trees, which get updated after the fact (see
+    `get_grouping_variants_for_event`). Strings and the strategy config are shared.
+    """
+    copies: dict[int, BaseGroupingComponent[Any]] = {}
+
+    def copy_component(component: BaseGroupingComponent[Any]) -> BaseGroupingComponent[Any]:
+        if id(component) in copies:
+            return copies[id(component)]
+
+        component_copy = copy.copy(component)
+        component_copy.values = [
+            copy_component(value) if isinstance(value, BaseGroupingComponent) else value
+            for value in component.values
+        ]
+        copies[id(component)] = component_copy
+        return component_copy
+
+    variants_copy = {}
+    for variant_name, variant in variants.items():
+        variant_copy = copy.copy(variant)
+        variant_copy.root_component = copy_component(variant.root_component)  # type: ignore[assignment]
+        if variant.contributing_component is not None:
+            variant_copy.contributing_component = copies[id(variant.contributing_component)]  # type: ignore[assignment]
+        variant_copy.config = context.config
+        variants_copy[variant_name] = variant_copy
+    return variants_copy
+
+
+def get_cached_variants(
+    cache_key: str, event: BaseEvent, context: GroupingContext
+) -> dict[str, ComponentVariant] | None:
+    """
+    Return a copy of the cached variants for the given key, if any, and apply the updates the
+    strategies made to the event data when they were computed.
+    """
+    with _cache.locked() as cache:
+        cached = cache.get(cache_key) if cache is not None else None
+
+    metrics.incr(
+        "grouping.strategy_variants_cache.lookup",
+        tags={"result": "hit" if cached is not None else "miss"},
+    )
+    if cached is None:
+        return None
+
+    for key, value in cached.event_data_updates.items():
+        event.data[key] = value
+    return _copy_variants(cached.variants, context)
+
+
+def cache_variants(
+    cache_key: str,
+    event: BaseEvent,
+    context: GroupingContext,
+    variants: Mapping[str, ComponentVariant],
+) -> None:
+    """
+    Cache a copy of freshly computed variants, which can then be handed out and updated without
+    affecting the cache.
+    """
+    event_data_updates = {
+        key: value
+        for key in EVENT_DATA_UPDATES
+        if (value := event.data.get(key, _MISSING)) is not _MISSING
+    }
+    cached = CachedVariants(_copy_variants(variants, context), event_data_updates)
+
+    with _cache.locked() as cache:
+        if cache is not None:
+            cache[cache_key] = cached
@@ -4,13 +4,16 @@ import abc
 import contextlib
 import datetime
 import threading
-from collections.abc import Generator, Iterable, Mapping
+from collections import defaultdict
+from collections.abc import Generator, Iterable, Mapping, Sequence
+from functools import reduce
+from operator import or_
 from typing import Any, Self
 
 import psycopg2.errors
 from django import db
 from django.db import DatabaseError, OperationalError, connections, models, router, transaction
-from django.db.models import Count, Max, Min
+from django.db.models import Count, Max, Min, Q
 from django.db.models.functions import Now
 from django.db.transaction import Atomic
 from django.utils import timezone
@@ -33,7 +36,12 @@ from sentry.db.postgres.transactions import (
     in_test_assert_no_transaction,
 )
 from sentry.hybridcloud.outbox.category import OutboxCategory, OutboxScope
-from sentry.hybridcloud.outbox.signals import process_cell_outbox, process_control_outbox
+from sentry.hybridcloud.outbox.signals import (
+    process_cell_outbox,
+    process_cell_outbox_bulk,
+    process_control_outbox,
+    process_control_outbox_bulk,
+)
 from sentry.hybridcloud.rpc import CELL_NAME_LENGTH
 from sentry.silo.base import SiloMode
 from sentry.silo.safety import unguarded_write
@@ -147,6 +155,52 @@ class OutboxBase(Model):
             else:
                 raise
 
+    @classmethod
+    def prepare_next_from_shards(cls, rows: Sequence[Mapping[str, Any]]) -> list[Self]:
+        """
+        Claim many of the shards returned by `find_scheduled_shards` at once, rescheduling them the
+        same way `prepare_next_from_shard` does for one.
+
+        Shards whose first message is locked (by another drain, or a synchronous flush) are
+        skipped rather than waited on. The claimed shards' first messages are returned in the
+        order the shards were given in.
+        """
+        if not rows:
+            return []
+
+        using = router.db_for_write(cls)
+        with transaction.atomic(using=using, savepoint=False):
+            first_ids = [
+                row["first_id"]
+                for row in cls.objects.filter(reduce(or_, [Q(**row) for row in rows]))
+                .values(*cls.sharding_columns)
+                .annotate(first_id=Min("id"))
+                .order_by()
+            ]
+            claimed = list(
+                cls.objects.filter(id__in=first_ids).select_for_update(skip_locked=True)
+            )
+
+            # See prepare_next_from_shard for why rescheduling the shards is enough to claim them.
+            now = timezone.now()
+            shards_by_schedule: dict[datetime.datetime, list[Q]] = defaultdict(list)
+            for outbox in claimed:
+                shards_by_schedule[outbox.next_schedule(now)].append(
+                    Q(**outbox.key_from(cls.sharding_columns))
+                )
+            for scheduled_for, shard_filters in shards_by_schedule.items():
+                cls.objects.filter(reduce(or_, shard_filters)).update(
+                    scheduled_for=scheduled_for, scheduled_from=now
+                )
+
+        order = {tuple(row[k] for k in cls.sharding_columns): i for i, row in enumerate(rows)}
+        return sorted(
+            claimed,
+            key=lambda outbox: order[
+                tuple(getattr(outbox, k) for k in cls.sharding_columns)
+            ],
+        )
+
     def key_from(self, attrs: Iterable[str]) -> Mapping[str, Any]:
         return {k: _ensure_not_null(k, getattr(self, k)) for k in attrs}
 
@@ -315,31 +369,152 @@ class OutboxBase(Model):
                     try:
                         coalesced.send_signal()
                     except Exception as e:
-                        category_number = coalesced.category
-                        category_name = OutboxCategory(category_number).name
-                        error_message = (
-                            f"Could not flush shard category={category_number} ({category_name})"
-                        )
-
-                        if in_test_environment():
-                            orig_error = f"{type(e).__name__}: {e}"
-                            error_message += (
-                                "\n\nNOTE: This error is the last in a chain. If you are seeing "
-                                + "this while running tests, your real problem is likely the error "
-                                + "causing this flush error:"
-                                + f"\n\n\t{orig_error}\n\n"
-                                + "Scroll up to that error for details."
-                            )
-
-                        raise OutboxFlushError(error_message, coalesced) from e
+                        raise self._flush_error(coalesced, e) from e
 
                 return True
         return False
 
+    @staticmethod
+    def _flush_error(coalesced: OutboxBase, e: Exception) -> OutboxFlushError:
+        category_number = coalesced.category
+        category_name = OutboxCategory(category_number).name
+        error_message = f"Could not flush shard category={category_number} ({category_name})"
+
+        if in_test_environment():
+            orig_error = f"{type(e).__name__}: {e}"
+            error_message += (
+                "\n\nNOTE: This error is the last in a chain. If you are seeing "
+                + "this while running tests, your real problem is likely the error "
+                + "causing this flush error:"
+                + f"\n\n\t{orig_error}\n\n"
+                + "Scroll up to that error for details."
+            )
+
+        return OutboxFlushError(error_message, coalesced)
+
+    def should_process_in_bulk(self) -> bool:
+        return (
+            options.get("hybridcloud.outbox.bulk_batch_size") > 1
+            and self.has_bulk_receivers()
+            and not self.should_skip_shard()
+        )
+
+    def process_bulk(
+        self, latest_shard_row: OutboxBase | None, is_synchronous_flush: bool
+    ) -> bool:
+        """
+        Like `process`, but for all of the messages at the head of the shard that share this
+        message's category (up to `hybridcloud.outbox.bulk_batch_size` of them). They're coalesced
+        by object the same way and handed to the category's bulk receivers in a single call.
+        """
+        batch_size = options.get("hybridcloud.outbox.bulk_batch_size")
+        object_identifiers: dict[int, None] = {}
+        for category, object_identifier in (
+            self.selected_messages_in_shard(latest_shard_row=latest_shard_row)
+            .order_by("id")
+            .values_list("category", "object_identifier")[:batch_size]
+        ):
+            if category != self.category:
+                break
+            object_identifiers[object_identifier] = None
+
+        coalesced_filter = dict(
+            self.key_from(self.sharding_columns),
+            category=self.category,
+            object_identifier__in=list(object_identifiers),
+        )
+        groups = list(
+            self.objects.filter(**coalesced_filter)
+            .values("object_identifier")
+            .annotate(
+                last_id=Max("id"),
+                first_date_added=Min("date_added"),
+                first_scheduled_from=Min("scheduled_from"),
+            )
+            .order_by()
+        )
+        last_ids = {group["object_identifier"]: group["last_id"] for group in groups}
+        coalesced_by_object = {
+            message.object_identifier: message
+            for message in self.objects.filter(id__in=last_ids.values())
+        }
+        coalesced = [
+            coalesced_by_object[object_identifier]
+            for object_identifier in object_identifiers
+            if object_identifier in coalesced_by_object
+        ]
+        if not coalesced:
+            return False
+
+        first_date_added = min(group["first_date_added"] for group in groups)
+        first_scheduled_from = min(group["first_scheduled_from"] for group in groups)
+
+        tags: dict[str, int | str] = {
+            "category": OutboxCategory(self.category).name,
+            "synchronous": int(is_synchronous_flush),
+        }
+        metrics.timing(
+            "outbox.coalesced_net_queue_time",
+            datetime.datetime.now(tz=datetime.UTC).timestamp() - first_date_added.timestamp(),
+            tags=tags,
+        )
+        metrics.distribution("outbox.bulk_size", len(coalesced), tags=tags)
+
+        with (
+            metrics.timer("outbox.send_bulk_signal.duration", tags=tags),
+            start_span(op="outbox.process_bulk", name="outbox.process_bulk") as span,
+        ):
+            self._set_span_data_for_coalesced_message(span=span, message=coalesced[0])
+            set_span_data(span, "outbox_bulk_size", len(coalesced))
+            try:
+                self.send_bulk_signal(coalesced)
+            except Exception as e:
+                raise self._flush_error(coalesced[0], e) from e
+
+        # Delete the same way process_coalesced does, with the coalesced messages going last
+        deleted_count = 0
+        while True:
+            batch = self.objects.filter(**coalesced_filter).values_list(
+                "id", "object_identifier"
+            )[:50]
+            delete_ids = [
+                item_id
+                for item_id, object_identifier in batch
+                if item_id < last_ids[object_identifier]
+            ]
+            if not len(delete_ids):
+                break
+            self.objects.filter(id__in=delete_ids).delete()
+            deleted_count += len(delete_ids)
+
+        self.objects.filter(id__in=[message.id for message in coalesced]).delete()
+        deleted_count += len(coalesced)
+
+        metrics.incr("outbox.processed", deleted_count, tags=tags)
+        metrics.timing(
+            "outbox.processing_lag",
+            datetime.datetime.now(tz=datetime.UTC).timestamp() - first_scheduled_from.timestamp(),
+            tags=tags,
+        )
+        metrics.timing(
+            "outbox.coalesced_net_processing_time",
+            datetime.datetime.now(tz=datetime.UTC).timestamp() - first_date_added.timestamp(),
+            tags=tags,
+        )
+        return True
+
     @abc.abstractmethod
     def send_signal(self) -> None:
         pass
 
+    @abc.abstractmethod
+    def has_bulk_receivers(self) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def send_bulk_signal(self, messages: Sequence[OutboxBase]) -> None:
+        pass
+
     def drain_shard(
         self, flush_all: bool = False, _test_processing_barrier: threading.Barrier | None = None
     ) -> None:
@@ -367,7 +542,12 @@ class OutboxBase(Model):
                     if _test_processing_barrier:
                         _test_processing_barrier.wait()
 
-                    processed = shard_row.process(is_synchronous_flush=not flush_all)
+                    if shard_row.should_process_in_bulk():
+                        processed = shard_row.process_bulk(
+                            latest_shard_row, is_synchronous_flush=not flush_all
+                        )
+                    else:
+                        processed = shard_row.process(is_synchronous_flush=not flush_all)
 
                     if _test_processing_barrier:
                         _test_processing_barrier.wait()
@@ -414,6 +594,27 @@ class OutboxBase(Model):
     def get_total_outbox_count(cls) -> int:
         return cls.objects.count()
 
+    @classmethod
+    def get_scheduled_shard_count(cls) -> int:
+        """The number of shards with messages that are due to be processed."""
+        return (
+            cls.objects.filter(scheduled_for__lte=timezone.now())
+            .values(*cls.sharding_columns)
+            .distinct()
+            .count()
+        )
+
+    @classmethod
+    def get_oldest_message_age(cls) -> datetime.timedelta | None:
+        """
+        How long the oldest message still in the outbox has been waiting, or None if the outbox
+        is empty.
+        """
+        oldest = cls.objects.order_by("id").values_list("date_added", flat=True).first()
+        if oldest is None:
+            return None
+        return timezone.now() - oldest
+
 
 # Outboxes bound from cell silo -> control silo
 class CellOutboxBase(OutboxBase):
@@ -426,6 +627,17 @@ class CellOutboxBase(OutboxBase):
             shard_scope=self.shard_scope,
         )
 
+    def has_bulk_receivers(self) -> bool:
+        return process_cell_outbox_bulk.has_listeners(sender=OutboxCategory(self.category))
+
+    def send_bulk_signal(self, messages: Sequence[OutboxBase]) -> None:
+        process_cell_outbox_bulk.send(
+            sender=OutboxCategory(self.category),
+            payloads={message.object_identifier: message.payload for message in messages},
+            shard_identifier=self.shard_identifier,
+            shard_scope=self.shard_scope,
+        )
+
     sharding_columns = ("shard_scope", "shard_identifier")
     coalesced_columns = ("shard_scope", "shard_identifier", "category", "object_identifier")
 
@@ -485,6 +697,18 @@ class ControlOutboxBase(OutboxBase):
             scheduled_for=self.scheduled_for,
         )
 
+    def has_bulk_receivers(self) -> bool:
+        return process_control_outbox_bulk.has_listeners(sender=OutboxCategory(self.category))
+
+    def send_bulk_signal(self, messages: Sequence[OutboxBase]) -> None:
+        process_control_outbox_bulk.send(
+            sender=OutboxCategory(self.category),
+            payloads={message.object_identifier: message.payload for message in messages},
+            cell_name=self.cell_name,
+            shard_identifier=self.shard_identifier,
+            shard_scope=self.shard_scope,
+        )
+
     class Meta:
         abstract = True
 
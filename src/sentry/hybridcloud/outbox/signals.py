@@ -2,3 +2,10 @@ from django.dispatch import Signal
 
 process_cell_outbox = Signal()  # ["payload", "object_identifier"]
 process_control_outbox = Signal()  # ["payload", "cell_name", "object_identifier"]
+
+# Categories with receivers for these have many of their coalesced messages (all from the same
+# shard) handled in one call instead of through the per message signals above, while the
+# `hybridcloud.outbox.bulk_batch_size` option is set. `payloads` maps each object identifier to
+# its payload, in the order the messages would otherwise have been processed in.
+process_cell_outbox_bulk = Signal()  # ["payloads", "shard_identifier"]
+process_control_outbox_bulk = Signal()  # ["payloads", "cell_name", "shard_identifier"]
@@ -11,12 +11,23 @@ from sentry.hybridcloud.models.cacheversion import (
 )
 from sentry.hybridcloud.rpc.caching.service import CellCachingService, ControlCachingService
 from sentry.silo.base import SiloMode
+from sentry.utils import metrics
+from sentry.utils.local_cache import OptionSizedCache
 
 _V = TypeVar("_V")
 
 # Implementation uses generators so that testing concurrent read after writer properties is much easier.
 # In practice all generators are synchronously consumed, except for tests.
 
+# Values read from (or written to) the shared cache are also kept in a process-local cache under
+# the same versioned keys. Versions are still read on every lookup, so the local copies are never
+# staler than the shared ones.
+LOCAL_CACHE_TTL = 60
+
+_local_cache: OptionSizedCache[str, str] = OptionSizedCache(
+    "hybridcloud.caching.local-cache-size", ttl=LOCAL_CACHE_TTL
+)
+
 
 def _consume_generator(g: Generator[None, None, _V]) -> _V:
     while True:
@@ -31,7 +42,10 @@ def _set_cache(
 ) -> Generator[None, None, bool]:
     if timeout is None:
         timeout = DEFAULT_TIMEOUT
-    result = cache.add(_versioned_key(key, version), value, timeout=timeout)
+    versioned_key = _versioned_key(key, version)
+    result = cache.add(versioned_key, value, timeout=timeout)
+    if result and value is not None:
+        _set_local({versioned_key: value})
     yield
     return result
 
@@ -54,12 +68,43 @@ def _delete_cache(key: str, mode: SiloMode) -> Generator[None, None, int]:
     return version
 
 
-def _get_cache(keys: list[str], mode: SiloMode) -> Generator[None, None, Mapping[str, str | int]]:
-    versions = {cv.key: cv.version for cv in _version_model(mode).objects.filter(key__in=keys)}
+def _set_local(values: Mapping[str, str]) -> None:
+    with _local_cache.locked() as local_cache:
+        if local_cache is not None:
+            local_cache.update(values)
+
+
+def _clear_local_cache() -> None:
+    _local_cache.clear()
+
+
+def _get_cache(
+    keys: list[str], mode: SiloMode, base_key: str | None = None
+) -> Generator[None, None, Mapping[str, str | int]]:
+    versions = dict(
+        _version_model(mode).objects.filter(key__in=keys).values_list("key", "version")
+    )
     yield
 
     versioned_keys = [_versioned_key(key, versions.get(key, 0)) for key in keys]
-    existing = cache.get_many(versioned_keys)
+    existing: dict[str, str] = {}
+    with _local_cache.locked() as local_cache:
+        if local_cache is not None:
+            for versioned_key in versioned_keys:
+                value = local_cache.get(versioned_key)
+                if value is not None:
+                    existing[versioned_key] = value
+
+    if local_cache is not None:
+        tags = {"base_key": base_key or "unknown"}
+        metrics.incr("hybridcloud.caching.local.hit", len(existing), tags=tags)
+        metrics.incr("hybridcloud.caching.local.miss", len(keys) - len(existing), tags=tags)
+
+    missing = [versioned_key for versioned_key in versioned_keys if versioned_key not in existing]
+    if missing:
+        fetched = cache.get_many(missing)
+        _set_local({k: value for k, value in fetched.items() if isinstance(value, str)})
+        existing.update(fetched)
     yield
     result: dict[str, str | int] = {}
     for k, versioned_key in zip(keys, versioned_keys):
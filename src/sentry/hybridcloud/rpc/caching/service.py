@@ -110,7 +110,9 @@ class SiloCacheBackedCallable(Generic[_R]):
         from .impl import _consume_generator, _get_cache
 
         key = self.key_from(object_id)
-        values = _consume_generator(_get_cache([key], self.silo_mode))
+        values = _consume_generator(
+            _get_cache([key], self.silo_mode, base_key=self.base_key)
+        )
         return _consume_generator(self.resolve_from(object_id, values))
 
 
@@ -190,7 +192,9 @@ class SiloCacheBackedListCallable(Generic[_R]):
         from .impl import _consume_generator, _get_cache
 
         key = self.key_from(object_id)
-        values = _consume_generator(_get_cache([key], self.silo_mode))
+        values = _consume_generator(
+            _get_cache([key], self.silo_mode, base_key=self.base_key)
+        )
         return _consume_generator(self.resolve_from(object_id, values))
 
 
@@ -239,7 +243,9 @@ class SiloCacheManyBackedCallable(Generic[_R]):
         from .impl import _consume_generator, _delete_cache, _get_cache, _set_cache
 
         keys = {i: self.key_from(i) for i in ids}
-        cache_values = _consume_generator(_get_cache(list(keys.values()), self.silo_mode))
+        cache_values = _consume_generator(
+            _get_cache(list(keys.values()), self.silo_mode, base_key=self.base_key)
+        )
 
         # Mapping between object_id and cache versions
         missing: dict[int, int] = {}
@@ -17,6 +17,8 @@ from collections.abc import (
     MutableMapping,
     Sequence,
 )
+from collections import defaultdict
+from concurrent.futures import Future
 from contextlib import contextmanager
 from dataclasses import dataclass
 from threading import local
@@ -35,6 +37,7 @@ from sentry.hybridcloud.rpc.sig import SerializableFunctionSignature
 from sentry.silo.base import SiloMode, SingleProcessSiloModeState
 from sentry.types.cell import Cell, CellMappingNotFound
 from sentry.utils import json, metrics
+from sentry.utils.concurrent import ContextPropagatingThreadPoolExecutor
 from sentry.utils.env import in_test_environment
 from sentry.utils.tracing import start_span
 from sentry.viewer_context import get_viewer_context
@@ -496,6 +499,75 @@ def dispatch_remote_call(
     return remote_silo_call.dispatch(use_test_client)
 
 
+def _get_silo_address(cell: Cell | None, service_name: str, method_name: str | None) -> str:
+    if cell is None:
+        if not settings.SENTRY_CONTROL_ADDRESS:
+            raise RpcServiceSetupException(
+                service_name, method_name, "Control silo address is not configured"
+            )
+        return settings.SENTRY_CONTROL_ADDRESS
+    else:
+        if not cell.address:
+            raise RpcServiceSetupException(
+                service_name,
+                method_name,
+                f"Address for cell {cell.name!r} is not configured",
+            )
+        return cell.address
+
+
+def _encode_request(path: str, payload: Mapping[str, Any]) -> tuple[dict[str, str], bytes]:
+    """Build the signed headers and body for a request to `path` carrying `payload`."""
+    vc = get_viewer_context()
+    meta: dict[str, Any] = {}
+    if vc is not None:
+        meta["viewer_context"] = vc.serialize()
+
+    request_body = {
+        "meta": meta,
+        **payload,
+    }
+
+    origin = settings.SENTRY_LOCAL_CELL
+    if not origin:
+        origin = SiloMode.get_current_mode().name
+
+    data = json.dumps(request_body).encode(_RPC_CONTENT_CHARSET)
+    signature = generate_request_signature(path, data)
+    headers = {
+        "Content-Type": f"application/json; charset={_RPC_CONTENT_CHARSET}",
+        "Authorization": f"Rpcsignature {signature}",
+        "User-Agent": f"sentry-rpc/from-{origin}",
+    }
+    return headers, data
+
+
+def _fire_test_request(
+    cell: Cell | None, path: str, headers: Mapping[str, str], data: bytes
+) -> Any:
+    from django.test import Client
+
+    from sentry.db.postgres.transactions import in_test_assert_no_transaction
+
+    in_test_assert_no_transaction(
+        f"remote service method to {path} called inside transaction!  Move service calls to outside of transactions."
+    )
+
+    if cell:
+        target_mode = SiloMode.CELL
+    else:
+        target_mode = SiloMode.CONTROL
+
+    with (
+        SingleProcessSiloModeState.exit(),
+        SingleProcessSiloModeState.enter(target_mode, cell),
+    ):
+        extra: Mapping[str, Any] = {
+            f"HTTP_{k.replace('-', '_').upper()}": v for k, v in headers.items()
+        }
+        return Client().post(path, data, headers["Content-Type"], **extra)
+
+
 def _create_request_session(retry_count: int) -> requests.Session:
     retry_adapter = HTTPAdapter(
         max_retries=Retry(
@@ -540,20 +612,7 @@ class _RemoteSiloCall:
 
     @property
     def address(self) -> str:
-        if self.cell is None:
-            if not settings.SENTRY_CONTROL_ADDRESS:
-                raise RpcServiceSetupException(
-                    self.service_name, self.method_name, "Control silo address is not configured"
-                )
-            return settings.SENTRY_CONTROL_ADDRESS
-        else:
-            if not self.cell.address:
-                raise RpcServiceSetupException(
-                    self.service_name,
-                    self.method_name,
-                    f"Address for cell {self.cell.name!r} is not configured",
-                )
-            return self.cell.address
+        return _get_silo_address(self.cell, self.service_name, self.method_name)
 
     @property
     def path(self) -> str:
@@ -576,7 +635,7 @@ class _RemoteSiloCall:
             **additional_tags,
         )
 
-    def get_method_retry_count(self) -> int:
+    def get_method_retry_override(self) -> int | None:
         retry_key = f"{self.service_name}.{self.method_name}"
         try:
             retry_counts_map = options.get("hybridcloud.rpc.method_retry_overrides")
@@ -590,6 +649,12 @@ class _RemoteSiloCall:
             # value set for the override is invalid
             sentry_sdk.capture_exception()
 
+        return None
+
+    def get_method_retry_count(self) -> int:
+        retry_count = self.get_method_retry_override()
+        if retry_count is not None:
+            return retry_count
         return options.get("hybridcloud.rpc.retries")
 
     def get_method_timeout(self) -> float:
@@ -610,27 +675,7 @@ class _RemoteSiloCall:
         return settings.RPC_TIMEOUT
 
     def _send_to_remote_silo(self, use_test_client: bool) -> Any:
-        vc = get_viewer_context()
-        meta: dict[str, Any] = {}
-        if vc is not None:
-            meta["viewer_context"] = vc.serialize()
-
-        request_body = {
-            "meta": meta,
-            "args": self.serial_arguments,
-        }
-
-        origin = settings.SENTRY_LOCAL_CELL
-        if not origin:
-            origin = SiloMode.get_current_mode().name
-
-        data = json.dumps(request_body).encode(_RPC_CONTENT_CHARSET)
-        signature = generate_request_signature(self.path, data)
-        headers = {
-            "Content-Type": f"application/json; charset={_RPC_CONTENT_CHARSET}",
-            "Authorization": f"Rpcsignature {signature}",
-            "User-Agent": f"sentry-rpc/from-{origin}",
-        }
+        headers, data = _encode_request(self.path, {"args": self.serial_arguments})
 
         with self._open_request_context():
             self._check_disabled()
@@ -708,28 +753,24 @@ class _RemoteSiloCall:
             raise self._remote_exception("Invalid service request")
         raise self._remote_exception(f"Service unavailable ({response.status_code} status)")
 
-    def _fire_test_request(self, headers: Mapping[str, str], data: bytes) -> Any:
-        from django.test import Client
-
-        from sentry.db.postgres.transactions import in_test_assert_no_transaction
-
-        in_test_assert_no_transaction(
-            f"remote service method to {self.path} called inside transaction!  Move service calls to outside of transactions."
-        )
-
-        if self.cell:
-            target_mode = SiloMode.CELL
-        else:
-            target_mode = SiloMode.CONTROL
+    def _exception_from_batch_error(self, error: Mapping[str, Any]) -> RpcException:
+        """The exception for a failed call in a batch, like `_raise_from_response_status_error`"""
+        status_code = error.get("status")
+        if status_code == 422:
+            return RpcValidationException(
+                detail=error["detail"],
+                code=error["code"],
+                service_name=self.service_name,
+                method_name=self.method_name,
+            )
+        if status_code == 403:
+            return self._remote_exception("Unauthorized service access")
+        if status_code == 400:
+            return self._remote_exception("Invalid service request")
+        return self._remote_exception(f"Service unavailable ({status_code} status)")
 
-        with (
-            SingleProcessSiloModeState.exit(),
-            SingleProcessSiloModeState.enter(target_mode, self.cell),
-        ):
-            extra: Mapping[str, Any] = {
-                f"HTTP_{k.replace('-', '_').upper()}": v for k, v in headers.items()
-            }
-            return Client().post(self.path, data, headers["Content-Type"], **extra)
+    def _fire_test_request(self, headers: Mapping[str, str], data: bytes) -> Any:
+        return _fire_test_request(self.cell, self.path, headers, data)
 
     def _fire_request(self, headers: MutableMapping[str, str], data: bytes) -> requests.Response:
         retry_count = self.get_method_retry_count()
@@ -766,6 +807,235 @@ class _RemoteSiloCall:
                 raise RpcDisabledException(f"RPC {service_method} disabled")
 
 
+@dataclass(frozen=True)
+class _RemoteSiloBatchCall:
+    """Sends several calls bound for the same silo in a single request to the batch endpoint."""
+
+    cell: Cell | None
+    calls: Sequence[_RemoteSiloCall]
+
+    @property
+    def path(self) -> str:
+        return django.urls.reverse("sentry-api-0-rpc-batch")
+
+    def _metrics_tags(self, **additional_tags: str | int) -> Mapping[str, str | int | None]:
+        return dict(
+            rpc_destination_region=self.cell.name if self.cell else "control",
+            **additional_tags,
+        )
+
+    def dispatch(self, use_test_client: bool = False) -> list[Any | RpcException]:
+        """
+        Return each call's deserialized return value, or the exception it would have raised had
+        it been made on its own.
+        """
+        entries = self._send_to_remote_silo(use_test_client)
+        if len(entries) != len(self.calls):
+            raise RpcResponseException(
+                "batch", None, f"Expected {len(self.calls)} results, got {len(entries)}"
+            )
+
+        results: list[Any | RpcException] = []
+        for call, entry in zip(self.calls, entries):
+            if "error" in entry:
+                results.append(call._exception_from_batch_error(entry["error"]))
+            else:
+                service, _ = _look_up_service_method(call.service_name, call.method_name)
+                results.append(service.deserialize_rpc_response(call.method_name, entry["value"]))
+        return results
+
+    def _send_to_remote_silo(self, use_test_client: bool) -> list[Mapping[str, Any]]:
+        path = self.path
+        headers, data = _encode_request(
+            path,
+            {
+                "calls": [
+                    {
+                        "service": call.service_name,
+                        "method": call.method_name,
+                        "args": call.serial_arguments,
+                    }
+                    for call in self.calls
+                ]
+            },
+        )
+
+        timer = metrics.timer("hybrid_cloud.dispatch_rpc_batch.duration", tags=self._metrics_tags())
+        span = start_span(
+            op="hybrid_cloud.dispatch_rpc_batch",
+            name=f"rpc batch of {len(self.calls)} calls",
+        )
+        with span, timer:
+            metrics.distribution(
+                "hybrid_cloud.dispatch_rpc_batch.calls", len(self.calls), tags=self._metrics_tags()
+            )
+            if use_test_client:
+                response = _fire_test_request(self.cell, path, headers, data)
+            else:
+                response = self._fire_request(path, headers, data)
+            metrics.incr(
+                "hybrid_cloud.dispatch_rpc_batch.response_code",
+                tags=self._metrics_tags(status=response.status_code),
+            )
+            if response.status_code != 200:
+                raise RpcRemoteException(
+                    "batch", None, f"Service unavailable ({response.status_code} status)"
+                )
+            return response.json()["results"]
+
+    def _fire_request(
+        self, path: str, headers: Mapping[str, str], data: bytes
+    ) -> requests.Response:
+        # A retry resends every call in the batch, which is only safe if every one of them has
+        # opted into retries through `hybridcloud.rpc.method_retry_overrides`.
+        retry_overrides = [
+            override
+            for call in self.calls
+            if (override := call.get_method_retry_override()) is not None
+        ]
+        retry_count = min(retry_overrides) if len(retry_overrides) == len(self.calls) else 0
+        timeout = max(call.get_method_timeout() for call in self.calls)
+        http = _get_connection(retry_count)
+
+        url = _get_silo_address(self.cell, "batch", None) + path
+        try:
+            return http.post(url, headers=headers, data=data, timeout=timeout)
+        except requests.exceptions.ConnectionError as e:
+            metrics.incr(
+                "hybrid_cloud.dispatch_rpc_batch.failure",
+                tags=self._metrics_tags(kind="connectionerror"),
+            )
+            raise RpcRemoteException("batch", None, "RPC Connection failed") from e
+        except requests.exceptions.RetryError as e:
+            metrics.incr(
+                "hybrid_cloud.dispatch_rpc_batch.failure",
+                tags=self._metrics_tags(kind="retryerror"),
+            )
+            raise RpcRemoteException("batch", None, "RPC failed, max retries reached.") from e
+        except requests.exceptions.Timeout as e:
+            metrics.incr(
+                "hybrid_cloud.dispatch_rpc_batch.failure",
+                tags=self._metrics_tags(kind="timeout"),
+            )
+            raise RpcRemoteException("batch", None, f"Timeout of {timeout} exceeded") from e
+
+
+class RpcBatch:
+    """
+    Collects RPC method calls so that the remote ones bound for the same silo are sent in a
+    single request, with the requests for different silos sent concurrently.
+
+        batch = RpcBatch()
+        futures = [
+            batch.add(organization_service, "get_organization_by_id", id=org_id)
+            for org_id in org_ids
+        ]
+        batch.dispatch()
+        [future.result() for future in futures]
+
+    Calls to services that run locally in this silo are just made in place. So are all calls while
+    the `hybridcloud.rpc.batching` option is off, one request each.
+    """
+
+    def __init__(self, use_test_client: bool | None = None) -> None:
+        self.use_test_client = in_test_environment() if use_test_client is None else use_test_client
+        self._pending: list[tuple[RpcService, str, dict[str, Any], Future[Any]]] = []
+
+    def add(self, service: RpcService, method_name: str, **kwargs: Any) -> Future[Any]:
+        """Queue up a call to `service.method_name(**kwargs)`, to be made by `dispatch`."""
+        future: Future[Any] = Future()
+        self._pending.append((service, method_name, kwargs, future))
+        return future
+
+    def dispatch(self) -> None:
+        """Make all of the queued calls, setting their futures' results."""
+        pending, self._pending = self._pending, []
+        batch_remote_calls = options.get("hybridcloud.rpc.batching")
+        current_mode = SiloMode.get_current_mode()
+
+        remote_calls: dict[str | None, list[tuple[_RemoteSiloCall, Future[Any]]]] = defaultdict(
+            list
+        )
+        cells: dict[str | None, Cell | None] = {}
+        for service, method_name, kwargs, future in pending:
+            if (
+                not batch_remote_calls
+                or current_mode == SiloMode.MONOLITH
+                or current_mode == service.local_mode
+            ):
+                self._call_in_place(future, getattr(service, method_name), kwargs)
+                continue
+
+            try:
+                call = self._prepare_remote_call(service, method_name, kwargs)
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            if call is None:
+                # Cell resolution found nothing, and the method returns None in that case
+                future.set_result(None)
+                continue
+
+            cell_name = call.cell.name if call.cell else None
+            cells[cell_name] = call.cell
+            remote_calls[cell_name].append((call, future))
+
+        batches = [(cells[cell_name], calls) for cell_name, calls in remote_calls.items()]
+        if len(batches) > 1 and not self.use_test_client:
+            with ContextPropagatingThreadPoolExecutor(max_workers=len(batches)) as executor:
+                for _ in executor.map(lambda batch: self._send_batch(*batch), batches):
+                    pass
+        else:
+            for cell, calls in batches:
+                self._send_batch(cell, calls)
+
+    @staticmethod
+    def _call_in_place(
+        future: Future[Any], method: Callable[..., Any], kwargs: ArgumentDict
+    ) -> None:
+        try:
+            future.set_result(method(**kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+    @staticmethod
+    def _prepare_remote_call(
+        service: RpcService, method_name: str, kwargs: ArgumentDict
+    ) -> _RemoteSiloCall | None:
+        delegating_service, _ = _look_up_service_method(service.key, method_name)
+        signature = delegating_service._signatures[method_name]
+
+        cell = None
+        if service.local_mode == SiloMode.CELL:
+            result = signature.resolve_to_cell(kwargs)
+            if result.is_early_halt:
+                return None
+            cell = result.cell
+
+        serial_arguments = signature.serialize_arguments(kwargs)
+        call = _RemoteSiloCall(cell, service.key, method_name, serial_arguments)
+        call._check_disabled()
+        return call
+
+    def _send_batch(
+        self, cell: Cell | None, calls: Sequence[tuple[_RemoteSiloCall, Future[Any]]]
+    ) -> None:
+        try:
+            results = _RemoteSiloBatchCall(cell, [call for call, _ in calls]).dispatch(
+                self.use_test_client
+            )
+        except Exception as e:
+            for _, future in calls:
+                future.set_exception(e)
+            return
+
+        for (_, future), result in zip(calls, results):
+            if isinstance(result, RpcException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
 class RpcDisabledException(Exception):
     """Indicates that an RPC method has been disabled and a request has not been made."""
 
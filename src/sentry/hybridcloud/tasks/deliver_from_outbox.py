@@ -6,9 +6,11 @@ from typing import Any
 
 import sentry_sdk
 from django.conf import settings
+from django.db import connections
 from django.db.models import Max, Min
 from taskbroker_client.task import Task
 
+from sentry import options
 from sentry.hybridcloud.models.outbox import (
     CellOutboxBase,
     ControlOutboxBase,
@@ -20,7 +22,9 @@ from sentry.silo.base import SiloMode
 from sentry.tasks.base import instrumented_task
 from sentry.taskworker.namespaces import hybridcloud_control_tasks, hybridcloud_tasks
 from sentry.utils import metrics
+from sentry.utils.concurrent import ContextPropagatingThreadPoolExecutor
 from sentry.utils.env import in_test_environment
+from sentry.utils.iterators import chunked
 
 
 @instrumented_task(
@@ -65,6 +69,9 @@ def enqueue_outbox_jobs(
 # non coalesced work.
 CONCURRENCY = 5
 
+# How many shards the parallel drain claims at a time, see process_outbox_batch_in_parallel.
+CLAIM_BATCH_SIZE = 100
+
 
 def schedule_batch(
     silo_mode: SiloMode,
@@ -144,6 +151,20 @@ def schedule_outbox_model(
         tags=metrics_tags,
         sample_rate=1.0,
     )
+
+    metrics.gauge(
+        "deliver_from_outbox.scheduled_shard_count",
+        value=outbox_model.get_scheduled_shard_count(),
+        tags=metrics_tags,
+        sample_rate=1.0,
+    )
+    oldest_message_age = outbox_model.get_oldest_message_age()
+    metrics.gauge(
+        "deliver_from_outbox.oldest_message_age",
+        value=oldest_message_age.total_seconds() if oldest_message_age else 0.0,
+        tags=metrics_tags,
+        sample_rate=1.0,
+    )
     return scheduled_count
 
 
@@ -198,6 +219,12 @@ def drain_outbox_shards_control(
 def process_outbox_batch(
     outbox_identifier_hi: int, outbox_identifier_low: int, outbox_model: type[OutboxBase]
 ) -> int:
+    worker_threads = options.get("hybridcloud.outbox.drain_worker_threads")
+    if worker_threads > 0:
+        return process_outbox_batch_in_parallel(
+            outbox_identifier_hi, outbox_identifier_low, outbox_model, worker_threads
+        )
+
     processed_count: int = 0
     for shard_attributes in outbox_model.find_scheduled_shards(
         outbox_identifier_low, outbox_identifier_hi
@@ -206,25 +233,72 @@ def process_outbox_batch(
         if not shard_outbox:
             continue
 
-        try:
-            processed_count += 1
-            shard_outbox.drain_shard(flush_all=True)
-        except Exception as e:
-            with sentry_sdk.isolation_scope() as scope:
-                if isinstance(e, OutboxFlushError):
-                    scope.set_tag("outbox.category", e.outbox.category)
-                    scope.set_tag("outbox.shard_scope", e.outbox.shard_scope)
-                    scope.set_context(
-                        "outbox",
-                        {
-                            "shard_identifier": e.outbox.shard_identifier,
-                            "object_identifier": e.outbox.object_identifier,
-                            "payload": e.outbox.payload,
-                        },
-                    )
-                sentry_sdk.capture_exception(e)
-                # In production, it's ok to just continue processing forward, but in tests we aim to surface
-                # problems aggressively.
-                if in_test_environment():
-                    raise
+        processed_count += 1
+        _drain_claimed_shard(shard_outbox)
+    return processed_count
+
+
+def process_outbox_batch_in_parallel(
+    outbox_identifier_hi: int,
+    outbox_identifier_low: int,
+    outbox_model: type[OutboxBase],
+    worker_threads: int,
+) -> int:
+    """
+    Like process_outbox_batch, but claims the scheduled shards many at a time and drains the
+    claimed shards on a pool of `worker_threads` threads. Shards never share messages, so they
+    can be drained in any order, and each worker only ever holds locks on its own shard.
+    """
+    processed_count: int = 0
+    metrics_tags = dict(outbox_name=outbox_model._meta.label)
+    with ContextPropagatingThreadPoolExecutor(
+        max_workers=worker_threads, thread_name_prefix="outbox-drain"
+    ) as executor:
+        for shards in chunked(
+            outbox_model.find_scheduled_shards(outbox_identifier_low, outbox_identifier_hi),
+            CLAIM_BATCH_SIZE,
+        ):
+            claimed = outbox_model.prepare_next_from_shards(shards)
+            metrics.distribution(
+                "deliver_from_outbox.claimed_shards", len(claimed), tags=metrics_tags
+            )
+            metrics.incr(
+                "deliver_from_outbox.skipped_shards", len(shards) - len(claimed), tags=metrics_tags
+            )
+            processed_count += len(claimed)
+            # Consume the results so that errors raised in tests surface here
+            for _ in executor.map(_drain_claimed_shard_in_thread, claimed):
+                pass
     return processed_count
+
+
+def _drain_claimed_shard_in_thread(shard_outbox: OutboxBase) -> None:
+    try:
+        _drain_claimed_shard(shard_outbox)
+    finally:
+        # Connections are per thread, and nothing else closes the ones worker threads open
+        for connection in connections.all(initialized_only=True):
+            connection.close()
+
+
+def _drain_claimed_shard(shard_outbox: OutboxBase) -> None:
+    try:
+        shard_outbox.drain_shard(flush_all=True)
+    except Exception as e:
+        with sentry_sdk.isolation_scope() as scope:
+            if isinstance(e, OutboxFlushError):
+                scope.set_tag("outbox.category", e.outbox.category)
+                scope.set_tag("outbox.shard_scope", e.outbox.shard_scope)
+                scope.set_context(
+                    "outbox",
+                    {
+                        "shard_identifier": e.outbox.shard_identifier,
+                        "object_identifier": e.outbox.object_identifier,
+                        "payload": e.outbox.payload,
+                    },
+                )
+            sentry_sdk.capture_exception(e)
+            # In production, it's ok to just continue processing forward, but in tests we aim to surface
+            # problems aggressively.
+            if in_test_environment():
+                raise
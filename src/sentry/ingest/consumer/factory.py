@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Callable, Mapping
 from functools import partial
-from typing import NamedTuple, TypeVar
+from typing import Literal, NamedTuple, TypeVar, cast
 
 from arroyo.backends.kafka.consumer import KafkaPayload
+from arroyo.dlq import InvalidMessage
 from arroyo.processing.strategies import (
     CommitOffsets,
     FilterStep,
+    MessageRejected,
     ProcessingStrategy,
     ProcessingStrategyFactory,
     RunTask,
 )
+from arroyo.processing.strategies.batching import BatchStep
 from arroyo.types import Commit, FilteredPayload, Message, Partition
 
 from sentry.ingest.types import ConsumerType
@@ -19,7 +23,9 @@ from sentry.processing.backpressure.arroyo import HealthChecker, create_backpres
 from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessing
 
 from .attachment_event import decode_and_process_chunks, process_attachments_and_events
-from .simple_event import process_simple_event_message
+from .simple_event import process_simple_event_message, process_simple_event_messages
+
+IngestMode = Literal["single", "batched"]
 
 
 class MultiProcessConfig(NamedTuple):
@@ -58,6 +64,108 @@ def maybe_multiprocess_step(
         )
 
 
+class RaiseInvalidMessages(ProcessingStrategy[FilteredPayload | list[tuple[Partition, int]]]):
+    """
+    Sends the messages a batch reported as invalid to the DLQ, one per call
+    to `poll`, before forwarding the batch to the next step.
+
+    Arroyo only routes a message to the DLQ when the strategy raises
+    `InvalidMessage` for it, and only one can be raised at a time. Holding
+    back the batch until all of them have been raised makes sure none of its
+    offsets are committed before every invalid message has been handled.
+    """
+
+    def __init__(self, next_step: ProcessingStrategy[FilteredPayload | None]) -> None:
+        self.__next_step = next_step
+        self.__closed = False
+        self.__message: Message[FilteredPayload | None] | None = None
+        self.__invalid: deque[tuple[Partition, int]] = deque()
+
+    def poll(self) -> None:
+        self.__next_step.poll()
+
+        if self.__invalid:
+            partition, offset = self.__invalid.popleft()
+            raise InvalidMessage(partition, offset)
+
+        if self.__message is not None:
+            message, self.__message = self.__message, None
+            self.__next_step.submit(message)
+
+    def submit(self, message: Message[FilteredPayload | list[tuple[Partition, int]]]) -> None:
+        assert not self.__closed
+
+        if self.__message is not None:
+            raise MessageRejected()
+
+        if isinstance(message.payload, FilteredPayload):
+            self.__next_step.submit(cast(Message[FilteredPayload], message))
+            return
+
+        self.__invalid.extend(message.payload)
+        self.__message = message.replace(None)
+
+    def close(self) -> None:
+        self.__closed = True
+
+    def terminate(self) -> None:
+        self.__closed = True
+        self.__next_step.terminate()
+
+    def join(self, timeout: float | None = None) -> None:
+        # A batch whose invalid messages have not all been raised yet is not
+        # committed. It is consumed again after the rebalance and the events
+        # that were already handed off are skipped by the deduplication check.
+        if self.__message is not None and not self.__invalid:
+            self.__next_step.submit(self.__message)
+            self.__message = None
+        self.__next_step.close()
+        self.__next_step.join(timeout)
+
+
+def create_simple_event_step(
+    mode: IngestMode,
+    mp: MultiProcessConfig | None,
+    next_step: ProcessingStrategy[FilteredPayload | None],
+    pool: MultiprocessingPool | None,
+    max_batch_size: int,
+    max_batch_time: int,
+    consumer_type: str,
+    reprocess_only_stuck_events: bool,
+    reprocess_only_events_not_in_nodestore: bool,
+) -> ProcessingStrategy[KafkaPayload]:
+    """
+    Returns the step processing "simple" event messages.
+
+    In `batched` mode, messages are collected into micro-batches per
+    partition first, so that round-trips which can be shared across events
+    are only paid once per batch. Messages of a batch that fail are sent to
+    the DLQ by `RaiseInvalidMessages`.
+    """
+    if mode == "batched":
+        batch_function = partial(
+            process_simple_event_messages,
+            consumer_type=consumer_type,
+            reprocess_only_stuck_events=reprocess_only_stuck_events,
+            reprocess_only_events_not_in_nodestore=reprocess_only_events_not_in_nodestore,
+        )
+        return BatchStep(
+            max_batch_size=max_batch_size,
+            max_batch_time=max_batch_time,
+            next_step=maybe_multiprocess_step(
+                mp, batch_function, RaiseInvalidMessages(next_step), pool
+            ),
+        )
+
+    event_function = partial(
+        process_simple_event_message,
+        consumer_type=consumer_type,
+        reprocess_only_stuck_events=reprocess_only_stuck_events,
+        reprocess_only_events_not_in_nodestore=reprocess_only_events_not_in_nodestore,
+    )
+    return maybe_multiprocess_step(mp, event_function, next_step, pool)
+
+
 def maybe_backpressure_step(
     health_checker: HealthChecker,
     next_step: ProcessingStrategy[FilteredPayload | TOutput],
@@ -87,12 +195,16 @@ class IngestStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         max_batch_time: int,
         input_block_size: int | None,
         output_block_size: int | None,
+        mode: IngestMode = "single",
     ):
         if reprocess_only_stuck_events and reprocess_only_events_not_in_nodestore:
             raise ValueError(
                 "`reprocess_only_stuck_events` and `reprocess_only_events_not_in_nodestore` "
                 "are mutually exclusive"
             )
+        self.mode = mode
+        self.max_batch_size = max_batch_size
+        self.max_batch_time = max_batch_time
         self.consumer_type = consumer_type
         self.is_attachment_topic = consumer_type == ConsumerType.Attachments
         self.reprocess_only_stuck_events = reprocess_only_stuck_events
@@ -125,13 +237,17 @@ class IngestStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         final_step = CommitOffsets(commit)
 
         if not self.is_attachment_topic:
-            event_function = partial(
-                process_simple_event_message,
+            next_step = create_simple_event_step(
+                self.mode,
+                mp,
+                final_step,
+                self._pool,
+                max_batch_size=self.max_batch_size,
+                max_batch_time=self.max_batch_time,
                 consumer_type=self.consumer_type,
                 reprocess_only_stuck_events=self.reprocess_only_stuck_events,
                 reprocess_only_events_not_in_nodestore=self.reprocess_only_events_not_in_nodestore,
             )
-            next_step = maybe_multiprocess_step(mp, event_function, final_step, self._pool)
             return maybe_backpressure_step(
                 health_checker=self.health_checker,
                 next_step=next_step,
@@ -211,12 +327,16 @@ class IngestTransactionsStrategyFactory(ProcessingStrategyFactory[KafkaPayload])
         max_batch_time: int,
         input_block_size: int | None,
         output_block_size: int | None,
+        mode: IngestMode = "single",
     ):
         if reprocess_only_stuck_events and reprocess_only_events_not_in_nodestore:
             raise ValueError(
                 "`reprocess_only_stuck_events` and `reprocess_only_events_not_in_nodestore` "
                 "are mutually exclusive"
             )
+        self.mode = mode
+        self.max_batch_size = max_batch_size
+        self.max_batch_time = max_batch_time
         self.consumer_type = ConsumerType.Transactions
         self.reprocess_only_stuck_events = reprocess_only_stuck_events
         self.reprocess_only_events_not_in_nodestore = reprocess_only_events_not_in_nodestore
@@ -241,13 +361,17 @@ class IngestTransactionsStrategyFactory(ProcessingStrategyFactory[KafkaPayload])
 
         final_step = CommitOffsets(commit)
 
-        event_function = partial(
-            process_simple_event_message,
+        next_step = create_simple_event_step(
+            self.mode,
+            mp,
+            final_step,
+            self._pool,
+            max_batch_size=self.max_batch_size,
+            max_batch_time=self.max_batch_time,
             consumer_type=self.consumer_type,
             reprocess_only_stuck_events=self.reprocess_only_stuck_events,
             reprocess_only_events_not_in_nodestore=self.reprocess_only_events_not_in_nodestore,
         )
-        next_step = maybe_multiprocess_step(mp, event_function, final_step, self._pool)
         return maybe_backpressure_step(
             health_checker=self.health_checker,
             next_step=next_step,
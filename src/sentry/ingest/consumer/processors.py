@@ -1,7 +1,7 @@
 import functools
 import logging
 import os
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Mapping, MutableMapping, Sequence
 from typing import Any
 
 import orjson
@@ -84,9 +84,15 @@ def process_event(
     reprocess_only_events_not_in_nodestore: bool = False,
     inline_save_event: bool = False,
     inline_save_event_transaction: bool = False,
+    is_duplicate: bool | None = None,
+    processed_deduplication_keys: set[str] | None = None,
 ) -> None:
     """
     Perform some initial filtering and deserialize the message payload.
+
+    `is_duplicate` and `processed_deduplication_keys` are used by
+    `process_events` to perform the deduplication cache lookup once for a
+    whole batch and to detect duplicates within the batch.
     """
     payload = message["payload"]
     start_time = float(message["start_time"])
@@ -115,14 +121,15 @@ def process_event(
     # keeping it around because it does provide some protection against
     # reprocessing good events if a single consumer is in a restart loop.
     with start_span(op="deduplication_check", name="deduplication_check"):
-        deduplication_key = f"ev:{project_id}:{event_id}"
+        deduplication_key = _get_deduplication_key(project_id, event_id)
 
-        try:
-            cached_value = cache.get(deduplication_key)
-        except Exception as exc:
-            raise Retriable(exc)
+        if is_duplicate is None:
+            try:
+                is_duplicate = cache.get(deduplication_key) is not None
+            except Exception as exc:
+                raise Retriable(exc)
 
-        if cached_value is not None:
+        if is_duplicate:
             logger.warning(
                 "pre-process-forwarder detected a duplicated event with id:%s for project:%s.",
                 event_id,
@@ -308,6 +315,8 @@ def process_event(
         # remember for an 1 hour that we saved this event (deduplication protection)
         with start_span(op="cache.set", name="cache.set"):
             cache.set(deduplication_key, "", CACHE_TIMEOUT)
+        if processed_deduplication_keys is not None:
+            processed_deduplication_keys.add(deduplication_key)
 
         # emit event_accepted once everything is done
         with start_span(op="event_accepted.send_robust", name="event_accepted.send_robust"):
@@ -320,6 +329,75 @@ def process_event(
         raise Retriable(exc)
 
 
+def _get_deduplication_key(project_id: int, event_id: str) -> str:
+    return f"ev:{project_id}:{event_id}"
+
+
+@trace_func(name="ingest_consumer.process_events")
+@metrics.wraps("ingest_consumer.process_events")
+def process_events(
+    consumer_type: str,
+    messages: Sequence[tuple[IngestMessage, Project]],
+    reprocess_only_stuck_events: bool = False,
+    reprocess_only_events_not_in_nodestore: bool = False,
+) -> list[int]:
+    """
+    Process a micro-batch of messages from a single partition.
+
+    Every message goes through `process_event`, but the deduplication check
+    is read with a single cache round-trip for the whole batch. The
+    deduplication marker of a message is written as soon as it has been
+    handed off, so retrying a batch that failed halfway does not process the
+    first messages again.
+
+    Returns the indexes of the messages that failed with a non-retriable
+    error, so that the caller can route them to the DLQ. A retriable error
+    fails the whole batch.
+    """
+    deduplication_keys = [
+        _get_deduplication_key(int(message["project_id"]), message["event_id"])
+        for message, _ in messages
+    ]
+
+    with start_span(op="deduplication_check", name="deduplication_check"):
+        try:
+            seen = cache.get_many(deduplication_keys)
+        except Exception as exc:
+            raise Retriable(exc)
+
+    metrics.distribution(
+        "ingest_consumer.process_events.batch_size",
+        len(messages),
+        tags={"consumer": consumer_type},
+    )
+
+    invalid: list[int] = []
+    processed_deduplication_keys: set[str] = set()
+    for index, ((message, project), deduplication_key) in enumerate(
+        zip(messages, deduplication_keys)
+    ):
+        try:
+            process_event(
+                consumer_type,
+                message,
+                project,
+                reprocess_only_stuck_events=reprocess_only_stuck_events,
+                reprocess_only_events_not_in_nodestore=reprocess_only_events_not_in_nodestore,
+                # Duplicates within the same batch are skipped just like
+                # duplicates across batches.
+                is_duplicate=deduplication_key in seen
+                or deduplication_key in processed_deduplication_keys,
+                processed_deduplication_keys=processed_deduplication_keys,
+            )
+        except Retriable:
+            raise
+        except Exception:
+            logger.exception("ingest_consumer.invalid_message")
+            invalid.append(index)
+
+    return invalid
+
+
 @trace_func(name="ingest_consumer.process_attachment_chunk")
 @metrics.wraps("ingest_consumer.process_attachment_chunk")
 def process_attachment_chunk(message: IngestMessage) -> None:
@@ -3,7 +3,8 @@ import logging
 import msgpack
 from arroyo.backends.kafka.consumer import KafkaPayload
 from arroyo.dlq import InvalidMessage
-from arroyo.types import BrokerValue, Message
+from arroyo.processing.strategies.batching import ValuesBatch
+from arroyo.types import BrokerValue, Message, Partition
 from taskbroker_client.retry import Retry
 
 from sentry import options
@@ -14,7 +15,7 @@ from sentry.tasks.base import instrumented_task
 from sentry.taskworker.namespaces import ingest_events_raw_tasks
 from sentry.utils import metrics
 
-from .processors import IngestMessage, Retriable, process_event
+from .processors import IngestMessage, Retriable, process_event, process_events
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +84,75 @@ def process_simple_event_message(
         raise InvalidMessage(raw_value.partition, raw_value.offset) from exc
 
 
+def process_simple_event_messages(
+    raw_messages: Message[ValuesBatch[KafkaPayload]],
+    consumer_type: str,
+    reprocess_only_stuck_events: bool,
+    reprocess_only_events_not_in_nodestore: bool,
+) -> list[tuple[Partition, int]]:
+    """
+    Processes a batch of Kafka Messages containing "simple" Event payloads.
+
+    This does the same as `process_simple_event_message`, but fetches all
+    projects of the batch with a single cache lookup and hands the whole batch
+    to `process_events`, which shares the deduplication round-trip.
+
+    Messages that cannot be decoded or processed do not hold up the rest of
+    the batch. Their partition and offset are returned instead, and
+    `RaiseInvalidMessages` sends every one of them to the DLQ before the
+    offsets of the batch are committed.
+    """
+    decoded: list[tuple[BrokerValue[KafkaPayload], IngestMessage, int]] = []
+    invalid: list[tuple[Partition, int]] = []
+
+    for raw_message in raw_messages.payload:
+        assert isinstance(raw_message, BrokerValue)
+        raw_payload = raw_message.payload.value
+        metrics.distribution(
+            "ingest_consumer.payload_size",
+            len(raw_payload),
+            tags={"consumer": consumer_type},
+            unit="byte",
+        )
+
+        try:
+            message: IngestMessage = msgpack.unpackb(raw_payload, use_list=False)
+
+            message_type = message["type"]
+            if message_type != "event":
+                raise ValueError(f"Unsupported message type: {message_type}")
+
+            decoded.append((raw_message, message, message["project_id"]))
+        except Exception:
+            logger.exception("ingest_consumer.invalid_message")
+            invalid.append((raw_message.partition, raw_message.offset))
+
+    with metrics.timer("ingest_consumer.fetch_project"):
+        projects = {
+            project.id: project
+            for project in Project.objects.get_many_from_cache(
+                {project_id for _, _, project_id in decoded}
+            )
+        }
+
+    to_process = [
+        (raw_message, message, projects[project_id])
+        for raw_message, message, project_id in decoded
+        if project_id in projects
+    ]
+    failed = process_events(
+        consumer_type,
+        [(message, project) for _, message, project in to_process],
+        reprocess_only_stuck_events=reprocess_only_stuck_events,
+        reprocess_only_events_not_in_nodestore=reprocess_only_events_not_in_nodestore,
+    )
+    for index in failed:
+        raw_message = to_process[index][0]
+        invalid.append((raw_message.partition, raw_message.offset))
+
+    return sorted(invalid, key=lambda partition_offset: partition_offset[1])
+
+
 @instrumented_task(
     name="sentry.ingest.consumer.simple_event.process_event_from_kafka",
     namespace=ingest_events_raw_tasks,
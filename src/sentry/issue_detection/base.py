@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import random
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 from datetime import timedelta
 from enum import Enum
 from typing import Any, ClassVar
@@ -93,6 +94,13 @@ class PerformanceDetector(ABC):
 
     settings_key: ClassVar[DetectorType]
 
+    def span_op_prefixes(self) -> Collection[str] | None:
+        """
+        The prefixes of the span ops this detector looks at, or `None` if it has to see every
+        span. Spans whose op does not start with any of them are not passed to `visit_span`.
+        """
+        return None
+
     @abstractmethod
     def visit_span(self, span: Span) -> None:
         raise NotImplementedError
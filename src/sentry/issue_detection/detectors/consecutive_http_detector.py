@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Collection
 from typing import Any
 
 from sentry.issue_detection.base import DetectorType, PerformanceDetector
@@ -55,6 +56,9 @@ class ConsecutiveHTTPSpanDetector(PerformanceDetector):
     def is_event_eligible(cls, event: dict[str, Any], project: Project | None = None) -> bool:
         return not is_event_from_browser_javascript_sdk(event)
 
+    def span_op_prefixes(self) -> Collection[str] | None:
+        return ("http.client",)
+
     def visit_span(self, span: Span) -> None:
         span_id = span.get("span_id", None)
         if not span_id or not self._is_eligible_http_span(span):
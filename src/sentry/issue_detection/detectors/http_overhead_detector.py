@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
+from collections.abc import Collection
 from dataclasses import dataclass
 from typing import Any
 
@@ -62,6 +63,9 @@ class HTTPOverheadDetector(PerformanceDetector):
 
         self.location_to_indicators: dict[str, list[list[ProblemIndicator]]] = defaultdict(list)
 
+    def span_op_prefixes(self) -> Collection[str] | None:
+        return ("http.client",)
+
     def visit_span(self, span: Span) -> None:
         span_data = span.get("data", {})
         if not self._is_span_eligible(span) or not span_data:
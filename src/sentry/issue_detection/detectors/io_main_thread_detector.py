@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import logging
 from collections import defaultdict
+from collections.abc import Collection
 from typing import Any
 
 from symbolic.proguard import ProguardMapper
@@ -52,6 +53,9 @@ class BaseIOMainThreadDetector(PerformanceDetector):
         self.mapper: ProguardMapper | None = None
         self.parent_to_blocked_span: dict[str, list[Span]] = defaultdict(list)
 
+    def span_op_prefixes(self) -> Collection[str] | None:
+        return (self.SPAN_PREFIX,)
+
     def visit_span(self, span: Span) -> None:
         if self._is_io_on_main_thread(span) and span.get("op", "").lower().startswith(
             self.SPAN_PREFIX
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Collection
 from datetime import timedelta
 from typing import Any
 
@@ -42,6 +43,9 @@ class LargeHTTPPayloadDetector(PerformanceDetector):
             if path.strip()
         ]
 
+    def span_op_prefixes(self) -> Collection[str] | None:
+        return ("http",)
+
     def visit_span(self, span: Span) -> None:
         if not self._is_span_eligible(span):
             return
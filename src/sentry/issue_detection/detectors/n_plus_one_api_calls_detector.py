@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import os
 from collections import defaultdict
+from collections.abc import Collection
 from datetime import timedelta
 from typing import Any
 
@@ -51,6 +52,9 @@ class NPlusOneAPICallsDetector(PerformanceDetector):
         # TODO: Only store the span IDs and timestamps instead of entire span objects
         self.spans: list[Span] = []
 
+    def span_op_prefixes(self) -> Collection[str] | None:
+        return self.settings.get("allowed_span_ops", [])
+
     def visit_span(self, span: Span) -> None:
         if not self._is_span_eligible(span):
             return
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Collection
 from typing import Any
 
 from sentry.issue_detection.base import DetectorType, PerformanceDetector
@@ -45,6 +46,9 @@ class QueryInjectionDetector(PerformanceDetector):
             if not isinstance(query_value, (str, int, float, bool)) and query_value is not None:
                 self.potential_unsafe_inputs.append(query_pair)
 
+    def span_op_prefixes(self) -> Collection[str] | None:
+        return ("db",)
+
     def visit_span(self, span: Span) -> None:
         if not self._is_span_eligible(span):
             return
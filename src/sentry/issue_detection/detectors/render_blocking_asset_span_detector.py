@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Collection, Mapping
 from datetime import timedelta
 from typing import Any
 
@@ -52,6 +52,9 @@ class RenderBlockingAssetSpanDetector(PerformanceDetector):
     def is_creation_allowed(self) -> bool:
         return self.settings["detection_enabled"]
 
+    def span_op_prefixes(self) -> Collection[str] | None:
+        return ("resource.link", "resource.script")
+
     def visit_span(self, span: Span) -> None:
         if not self.fcp:
             return
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from collections.abc import Collection
 from datetime import timedelta
 
 from sentry.issues.grouptype import PerformanceSlowDBQueryGroupType
@@ -31,6 +32,10 @@ class SlowDBQueryDetector(PerformanceDetector):
     type = DetectorType.SLOW_DB_QUERY
     settings_key = DetectorType.SLOW_DB_QUERY
 
+    def span_op_prefixes(self) -> Collection[str] | None:
+        # No allowed ops means all of them, see `find_span_prefix`
+        return tuple(self.settings.get("allowed_span_ops", [])) or None
+
     def visit_span(self, span: Span) -> None:
         settings_for_span = self.settings_for_span(span)
         if not settings_for_span:
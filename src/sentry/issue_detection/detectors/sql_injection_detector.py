@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import re
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from typing import Any
 
 from sentry.issue_detection.base import DetectorType, PerformanceDetector
@@ -137,6 +137,9 @@ class SQLInjectionDetector(PerformanceDetector):
 
         self.request_parameters = valid_parameters
 
+    def span_op_prefixes(self) -> Collection[str] | None:
+        return ("db",)
+
     def visit_span(self, span: Span) -> None:
         if not self._is_span_eligible(span) or not self.request_parameters:
             return
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Collection
 from typing import Any
 
 from sentry.issues.grouptype import PerformanceUncompressedAssetsGroupType
@@ -42,6 +43,9 @@ class UncompressedAssetSpanDetector(PerformanceDetector):
 
         self.any_compression = False
 
+    def span_op_prefixes(self) -> Collection[str] | None:
+        return self.settings.get("allowed_span_ops", [])
+
     def visit_span(self, span: Span) -> None:
         op = span.get("op", None)
         description = span.get("description", "")
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 import random
-from collections.abc import Sequence
+from collections.abc import Generator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import Any
@@ -726,20 +727,17 @@ def _detect_performance_problems(
             if detector_class.is_detection_allowed_for_system()
         ]
 
-    for detector in detectors:
-        with start_span(op="function", name=f"run_detector_on_data.{detector.type.value}"):
-            try:
-                run_detector_on_data(detector, data)
-            except Exception:
-                logger.exception(
-                    f"Error running issue detector `{detector.__class__.__name__}`",
-                    extra={
-                        "project_id": project.id,
-                        "org_id": organization.id,
-                        "event_id": event_id,
-                        "standalone": standalone,
-                    },
-                )
+    with start_span(op="function", name="run_detectors_on_data"):
+        run_detectors_on_data(
+            detectors,
+            data,
+            error_extra={
+                "project_id": project.id,
+                "org_id": organization.id,
+                "event_id": event_id,
+                "standalone": standalone,
+            },
+        )
 
     with start_span(op="function", name="report_metrics_for_detectors"):
         # Metrics reporting only for detection, not created issues.
@@ -775,14 +773,86 @@ def _detect_performance_problems(
 
 
 def run_detector_on_data(detector: PerformanceDetector, data: dict[str, Any]) -> None:
-    if not detector.is_event_eligible(data):
-        return
+    run_detectors_on_data([detector], data)
 
-    spans = data.get("spans", [])
-    for span in spans:
-        detector.visit_span(span)
 
-    detector.on_complete()
+def run_detectors_on_data(
+    detectors: Sequence[PerformanceDetector],
+    data: dict[str, Any],
+    error_extra: dict[str, Any] | None = None,
+) -> None:
+    """
+    Walk the spans of the event once, passing every span to the eligible detectors which look at
+    its op (see `PerformanceDetector.span_op_prefixes`), and complete them afterwards.
+
+    If `error_extra` is given, a failing detector is logged with it and skipped for the rest of
+    the event instead of raising.
+    """
+    failed: set[PerformanceDetector] = set()
+
+    eligible: list[PerformanceDetector] = []
+    op_prefixes: list[tuple[str, ...] | None] = []
+    for detector in detectors:
+        with _detector_errors(detector, failed, error_extra):
+            if detector.is_event_eligible(data):
+                prefixes = detector.span_op_prefixes()
+                op_prefixes.append(None if prefixes is None else tuple(prefixes))
+                eligible.append(detector)
+
+    # Events are dominated by a handful of distinct ops, so the detectors for
+    # every op are only resolved once.
+    detectors_by_op: dict[str, list[PerformanceDetector]] = {}
+    for span in data.get("spans", []):
+        op = span.get("op")
+        if isinstance(op, str):
+            visitors = detectors_by_op.get(op)
+            if visitors is None:
+                lowered = op.lower()
+                visitors = detectors_by_op[op] = [
+                    detector
+                    for detector, prefixes in zip(eligible, op_prefixes)
+                    if prefixes is None or op.startswith(prefixes) or lowered.startswith(prefixes)
+                ]
+        else:
+            visitors = eligible
+
+        for detector in visitors:
+            if detector in failed:
+                continue
+            # Not using `_detector_errors` here, as this runs for every span.
+            try:
+                detector.visit_span(span)
+            except Exception:
+                if error_extra is None:
+                    raise
+                failed.add(detector)
+                logger.exception(
+                    f"Error running issue detector `{detector.__class__.__name__}`",
+                    extra=error_extra,
+                )
+
+    for detector in eligible:
+        if detector not in failed:
+            with _detector_errors(detector, failed, error_extra):
+                detector.on_complete()
+
+
+@contextmanager
+def _detector_errors(
+    detector: PerformanceDetector,
+    failed: set[PerformanceDetector],
+    error_extra: dict[str, Any] | None,
+) -> Generator[None]:
+    try:
+        yield
+    except Exception:
+        if error_extra is None:
+            raise
+        failed.add(detector)
+        logger.exception(
+            f"Error running issue detector `{detector.__class__.__name__}`",
+            extra=error_extra,
+        )
 
 
 def build_tree(spans: Sequence[dict[str, Any]]) -> tuple[dict[str, Any], str | None]:
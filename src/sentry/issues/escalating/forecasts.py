@@ -36,21 +36,23 @@ def save_forecast_per_group(
     """
     time = datetime.now()
     group_dict = {group.id: group for group in until_escalating_groups}
+    escalating_group_forecasts = []
     for group_id, group_count in group_counts.items():
         group = group_dict.get(group_id)
         if group:
             forecasts = generate_issue_forecast(group_count, time, standard_version)
             forecasts_list = [forecast["forecasted_value"] for forecast in forecasts]
 
-            escalating_group_forecast = EscalatingGroupForecast(
-                group.project.id, group_id, forecasts_list, time
+            escalating_group_forecasts.append(
+                EscalatingGroupForecast(group.project.id, group_id, forecasts_list, time)
             )
-            escalating_group_forecast.save()
 
             logger.info(
                 "save_forecast_per_group",
                 extra={"group_id": group_id, "group_counts": group_count},
             )
+    if escalating_group_forecasts:
+        EscalatingGroupForecast.save_many(escalating_group_forecasts)
     try:
         analytics.record(IssueForecastSaved(num_groups=len(group_counts.keys())))
     except Exception as e:
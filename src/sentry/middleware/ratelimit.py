@@ -235,8 +235,20 @@ class RatelimitMiddleware:
                         )
                 rate_limit_key = getattr(request, "rate_limit_key", None)
                 rate_limit_uid = getattr(request, "rate_limit_uid", None)
-                if rate_limit_key is not None and rate_limit_uid is not None:
-                    finish_request(rate_limit_key, rate_limit_uid)
+                # Only give the concurrent request slot back if one was actually taken, which saves
+                # a roundtrip for endpoints without a concurrent limit and for limited requests
+                if (
+                    rate_limit_key is not None
+                    and rate_limit_uid is not None
+                    and rate_limit_metadata is not None
+                    and rate_limit_metadata.rate_limit_type == RateLimitType.NOT_LIMITED
+                    and rate_limit_metadata.concurrent_requests is not None
+                ):
+                    finish_request(
+                        rate_limit_key,
+                        rate_limit_uid,
+                        combined=rate_limit_metadata.combined_limiter,
+                    )
             except Exception:
                 logging.exception("COULD NOT POPULATE RATE LIMIT HEADERS")
             return response
@@ -23,6 +23,7 @@ from sentry.grouping.ingest.caching import (
     get_grouphash_object_cache_key,
     invalidate_grouphash_cache_on_save,
     invalidate_grouphash_caches_on_delete,
+    invalidate_local_grouphash_cache,
 )
 from sentry.types.grouphash_metadata import has_fingerprint_data
 from sentry.utils import json
@@ -50,6 +51,7 @@ class GroupHashQuerySet(BaseQuerySet):
                 )
             )
         ]
+        invalidate_local_grouphash_cache(cache_keys)
 
         try:
             cache.delete_many(cache_keys)
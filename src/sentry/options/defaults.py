@@ -300,6 +300,15 @@ register(
     flags=FLAG_ALLOW_EMPTY | FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Check the fixed window and concurrent API rate limits with a single Redis script rather than one
+# roundtrip each. The combined limiter keeps its own counters, so flipping this starts them over.
+register(
+    "api.rate-limit.combined-limiter",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # POST rate limit for ProjectTransferEndpoint, overridable via automator.
 register(
     "api.project-transfer.rate-limit-overrides",
@@ -884,6 +893,38 @@ register(
     default=0.20,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+
+# Snuba query result cache (only used for queries with `use_cache=True`)
+#
+# Cache TTL in seconds by referrer, `SENTRY_SNUBA_CACHE_TTL_SECONDS` otherwise.
+register(
+    "snuba.query-cache.referrer-ttls",
+    type=Dict,
+    default={},
+    flags=FLAG_ALLOW_EMPTY | FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Seconds an expired result is still served while a single caller refreshes it.
+register(
+    "snuba.query-cache.stale-ttl",
+    default=0,
+    type=Int,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Seconds to wait for an identical query which is already running before
+# running it again. 0 disables coalescing.
+register(
+    "snuba.query-cache.wait-timeout",
+    default=0.0,
+    type=Float,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Upper bound for how long a crashed caller blocks coalesced queries.
+register(
+    "snuba.query-cache.lock-ttl",
+    default=30,
+    type=Int,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "snuba.search.recommended.agent-weight",
     default=0.20,
@@ -2486,6 +2527,39 @@ register(
     default={},
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Send the remote calls collected by an `RpcBatch` to each silo in a single request (which needs
+# every silo to be serving the batch endpoint), rather than one request per call.
+register(
+    "hybridcloud.rpc.batching",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# How many hybrid cloud cache values (see `back_with_silo_cache`) each process keeps its own copy
+# of, saving the shared cache read when the same record is looked up again. 0 disables it.
+register(
+    "hybridcloud.caching.local-cache-size",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# How many threads each outbox drain task drains its claimed shards on. 0 keeps claiming and
+# draining shards one at a time.
+register(
+    "hybridcloud.outbox.drain_worker_threads",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# The most outbox messages of one category at the head of a shard that are handed to the
+# category's bulk receivers (see process_cell_outbox_bulk) at once. 0 or 1 disables them, so all
+# messages go to the per message receivers.
+register(
+    "hybridcloud.outbox.bulk_batch_size",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "hybridcloud.apigateway.use_pooling.rate",
     default=0.0,
@@ -2557,6 +2631,63 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Write nodes in the indexed, per-section compressed format instead of the
+# legacy newline-separated format. Both formats are always readable.
+register(
+    "nodestore.write-indexed-format",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Process-local cache tier in front of the shared nodestore cache. The tier
+# is disabled while `max-bytes` is 0. Missing nodes are cached for
+# `negative-ttl` seconds, which should stay short as nodes may be written by
+# other processes at any time.
+register(
+    "nodestore.process-cache.max-bytes",
+    default=0,
+    type=Int,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "nodestore.process-cache.max-items",
+    default=10_000,
+    type=Int,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "nodestore.process-cache.ttl",
+    default=60,
+    type=Int,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "nodestore.process-cache.negative-ttl",
+    default=5,
+    type=Int,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Process batches of pending buffer keys with one Redis round-trip per shard
+# and one multi-row UPDATE per model, instead of key by key.
+register(
+    "buffer.process-batched",
+    default=False,
+    type=Bool,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Number of threads per process serving the single-item requests when a
+# nodestore backend without native batching serves a multi-item operation
+# (`get_multi`, `set_subkeys_multi`, `delete_multi`). 1 keeps those operations
+# serial.
+register(
+    "nodestore.multi-max-concurrency",
+    default=1,
+    type=Int,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # === Backpressure related runtime options ===
 
 # Enables monitoring of services for backpressure management.
@@ -3131,6 +3262,34 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Whether to look up all of an event's grouphashes in a single query (and a single shared cache call)
+# when it has more than one hash, rather than one hash at a time.
+register(
+    "grouping.ingest_grouphash_bulk_lookups",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Number of entries to keep in the process-local tier in front of the grouphash caches above, which
+# saves the round trip to the shared cache for hashes seen over and over again. Entries only live
+# for a few seconds, since other processes can't invalidate them. 0 disables the local tier.
+register(
+    "grouping.ingest_grouphash_local_cache_size",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Number of strategy results (grouping variants) to keep in a process-local cache, keyed by a digest
+# of the event data the strategies look at. See `sentry.grouping.variant_cache`. 0 disables it.
+register(
+    "grouping.strategy_variants_cache_size",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 
 # SPAN BUFFER
 # Span buffer killswitch
@@ -3227,6 +3386,17 @@ register(
     default=0,
     flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Flusher processes without anything to flush help out with the shard of
+# another process which is furthest behind, if that shard's oldest ready
+# segment is at least this many seconds past its deadline. Requires
+# `spans.buffer.flusher.flush-lock-ttl`. If set to 0, processes only flush
+# their own shards.
+register(
+    "spans.buffer.flusher.assist-lag-seconds",
+    type=Int,
+    default=0,
+    flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
+)
 # Compression level for spans buffer segments. Default -1 disables compression, 0-22 for zstd levels
 register(
     "spans.buffer.compression.level",
@@ -3257,6 +3427,14 @@ register(
     default=100,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Group spans into subsegments with the columnar assembler in
+# `sentry.spans.segment_assembler`, which resolves parents in linear time
+# regardless of the order spans arrive in.
+register(
+    "spans.buffer.columnar-grouping",
+    default=False,
+    flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "spans.buffer.evalsha-cumulative-logger-enabled",
     default=False,
@@ -3499,6 +3677,24 @@ register(
     default=50,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# How many projects with small delayed workflow buffers to process in a single task, sharing Snuba
+# queries and nodestore fetches between them. 1 processes every project in its own task. Capped at
+# `MAX_PROJECTS_PER_TASK` in `sentry.workflow_engine.tasks.delayed_workflows`.
+register(
+    "workflow_engine.schedule.projects_per_task",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Number of DataConditionGroups whose conditions each process keeps in memory for workflow
+# evaluation, saving a shared cache round trip per event. Entries only live for a few seconds,
+# since other processes can't invalidate them. 0 disables the cache.
+register(
+    "workflow_engine.condition_plan_cache_size",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "workflow_engine.evaluation_log_sample_rate",
     type=Float,
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from time import time
+
+from django.conf import settings
+
+from sentry.exceptions import InvalidConfiguration
+from sentry.ratelimits.base import RateLimiter
+from sentry.ratelimits.concurrent import DEFAULT_MAX_TTL_SECONDS, ConcurrentLimitInfo
+from sentry.ratelimits.redis import _bucket_start_time, _time_bucket
+from sentry.utils import redis
+from sentry.utils.hashlib import md5_text
+
+logger = logging.getLogger(__name__)
+
+rate_limit_info = redis.load_redis_script("ratelimits/api_combined_limiter.lua")
+
+
+@dataclass
+class CombinedLimitInfo:
+    window_limited: bool
+    current: int
+    reset_time: int
+    # None if the concurrent limit wasn't checked, either because there is none or because the
+    # fixed window limit was already hit
+    concurrent: ConcurrentLimitInfo | None
+
+
+class CombinedRateLimiter:
+    """
+    Checks an API request against both its fixed window rate limit and its concurrent rate limit
+    in a single Redis roundtrip, rather than going through `RedisRateLimiter` and
+    `ConcurrentRateLimiter` one after the other.
+
+    The keys are not shared with either of those, since both keys a request touches need to live
+    on the same cluster node.
+    """
+
+    def __init__(self, max_tll_seconds: int = DEFAULT_MAX_TTL_SECONDS) -> None:
+        cluster_key = settings.SENTRY_RATE_LIMIT_REDIS_CLUSTER
+        self.client = redis.redis_clusters.get(cluster_key)
+        self.max_ttl_seconds = max_tll_seconds
+
+    def validate(self) -> None:
+        try:
+            self.client.ping()
+            self.client.connection_pool.disconnect()
+        except Exception as e:
+            raise InvalidConfiguration(str(e))
+
+    def _hash_tag(self, key: str) -> str:
+        return f"{{{md5_text(key).hexdigest()}}}"
+
+    def window_key(self, key: str, window: int, request_time: float) -> str:
+        return f"rl:{self._hash_tag(key)}:{_time_bucket(request_time, window)}"
+
+    def concurrent_key(self, key: str) -> str:
+        return f"concurrent_limit:{self._hash_tag(key)}"
+
+    def start_request(
+        self,
+        key: str,
+        limit: int,
+        window: int,
+        concurrent_limit: int | None,
+        request_uid: str,
+    ) -> CombinedLimitInfo:
+        """
+        Count the request against the fixed window and, unless that limit was hit, try to take
+        one of the concurrent request slots for it.
+        """
+        if window == 0:
+            window = RateLimiter.window
+
+        request_time = time()
+        expiration = window - int(request_time % window)
+        reset_time = _bucket_start_time(_time_bucket(request_time, window) + 1, window)
+
+        try:
+            current, current_executions, request_allowed = rate_limit_info(
+                [self.window_key(key, window, request_time), self.concurrent_key(key)],
+                [
+                    limit,
+                    expiration,
+                    concurrent_limit if concurrent_limit is not None else -1,
+                    request_uid,
+                    request_time,
+                    self.max_ttl_seconds,
+                ],
+                self.client,
+            )
+        except Exception:
+            # Fail open, the same way both of the separate limiters do
+            logger.exception(
+                "Could not start request", dict(key=key, limit=limit, request_uid=request_uid)
+            )
+            return CombinedLimitInfo(
+                window_limited=False,
+                current=0,
+                reset_time=reset_time,
+                concurrent=(
+                    ConcurrentLimitInfo(concurrent_limit, -1, False)
+                    if concurrent_limit is not None
+                    else None
+                ),
+            )
+
+        current = int(current)
+        window_limited = current > limit
+        concurrent = None
+        if concurrent_limit is not None and not window_limited:
+            concurrent = ConcurrentLimitInfo(
+                concurrent_limit, int(current_executions), not bool(request_allowed)
+            )
+        return CombinedLimitInfo(window_limited, current, reset_time, concurrent)
+
+    def finish_request(self, key: str, request_uid: str) -> None:
+        try:
+            self.client.zrem(self.concurrent_key(key), request_uid)
+        except Exception:
+            logger.exception("Could not finish request", dict(key=key, request_uid=request_uid))
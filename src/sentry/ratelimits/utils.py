@@ -8,8 +8,9 @@ from django.conf import settings
 from django.http.request import HttpRequest
 from rest_framework.response import Response
 
-from sentry import features
+from sentry import features, options
 from sentry.auth.services.auth import AuthenticatedToken
+from sentry.ratelimits.combined import CombinedRateLimiter
 from sentry.ratelimits.concurrent import ConcurrentRateLimiter
 from sentry.ratelimits.config import DEFAULT_RATE_LIMIT_CONFIG, RateLimitConfig
 from sentry.types.ratelimit import RateLimit, RateLimitCategory, RateLimitMeta, RateLimitType
@@ -38,6 +39,7 @@ DEFAULT_CONFIG = {
 }
 
 _CONCURRENT_RATE_LIMITER = ConcurrentRateLimiter()
+_COMBINED_RATE_LIMITER = CombinedRateLimiter()
 
 
 def concurrent_limiter() -> ConcurrentRateLimiter:
@@ -47,6 +49,13 @@ def concurrent_limiter() -> ConcurrentRateLimiter:
     return _CONCURRENT_RATE_LIMITER
 
 
+def combined_limiter() -> CombinedRateLimiter:
+    global _COMBINED_RATE_LIMITER
+    if not _COMBINED_RATE_LIMITER:
+        _COMBINED_RATE_LIMITER = CombinedRateLimiter()
+    return _COMBINED_RATE_LIMITER
+
+
 def get_rate_limit_key(
     view_func: EndpointFunction,
     request: HttpRequest,
@@ -183,10 +192,11 @@ def get_rate_limit_value(
 def above_rate_limit_check(
     key: str, rate_limit: RateLimit, request_uid: str, group: str
 ) -> RateLimitMeta:
-    # TODO: This is not as performant as it could be. The roundtrip betwwen the server and redis
-    # is doubled because the fixd window limit and concurrent limit are two separate things with different
-    # paths. Ideally there is just one lua script that does both and just says what kind of limit was hit
-    # (if any)
+    if options.get("api.rate-limit.combined-limiter"):
+        return _above_combined_rate_limit_check(key, rate_limit, request_uid, group)
+
+    # The roundtrip between the server and redis is doubled here because the fixed window limit
+    # and concurrent limit are two separate things with different paths.
     rate_limit_type = RateLimitType.NOT_LIMITED
     window_limited, current, reset_time = ratelimiter.is_limited_with_value(
         key, limit=rate_limit.limit, window=rate_limit.window
@@ -219,8 +229,46 @@ def above_rate_limit_check(
     )
 
 
-def finish_request(key: str, request_uid: str) -> None:
-    concurrent_limiter().finish_request(key, request_uid)
+def _above_combined_rate_limit_check(
+    key: str, rate_limit: RateLimit, request_uid: str, group: str
+) -> RateLimitMeta:
+    """Same as `above_rate_limit_check`, but checks both limits in one roundtrip"""
+    limit_info = combined_limiter().start_request(
+        key, rate_limit.limit, rate_limit.window, rate_limit.concurrent_limit, request_uid
+    )
+
+    rate_limit_type = RateLimitType.NOT_LIMITED
+    concurrent_requests = None
+    if limit_info.window_limited:
+        rate_limit_type = RateLimitType.FIXED_WINDOW
+    elif limit_info.concurrent is not None:
+        if limit_info.concurrent.limit_exceeded:
+            rate_limit_type = RateLimitType.CONCURRENT
+        concurrent_requests = limit_info.concurrent.current_executions
+
+    return RateLimitMeta(
+        rate_limit_type=rate_limit_type,
+        current=limit_info.current,
+        limit=rate_limit.limit,
+        window=rate_limit.window,
+        group=group,
+        reset_time=limit_info.reset_time,
+        remaining=rate_limit.limit - limit_info.current if not limit_info.window_limited else 0,
+        concurrent_limit=rate_limit.concurrent_limit,
+        concurrent_requests=concurrent_requests,
+        combined_limiter=True,
+    )
+
+
+def finish_request(key: str, request_uid: str, combined: bool = False) -> None:
+    """
+    Give back the concurrent request slot taken by `above_rate_limit_check`, with the same limiter
+    that took it (see `RateLimitMeta.combined_limiter`).
+    """
+    if combined:
+        combined_limiter().finish_request(key, request_uid)
+    else:
+        concurrent_limiter().finish_request(key, request_uid)
 
 
 def for_organization_member_invite(
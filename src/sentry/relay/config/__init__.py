@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 import uuid
-from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import Callable, Generator, Iterable, Mapping, MutableMapping, Sequence
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import Any, Literal, TypedDict
 
@@ -190,7 +191,9 @@ def get_quotas(project: Project, keys: Iterable[ProjectKey] | None = None) -> li
 
 
 def get_project_config(
-    project: Project, project_keys: Iterable[ProjectKey] | None = None
+    project: Project,
+    project_keys: Iterable[ProjectKey] | None = None,
+    section_cache: ConfigSectionCache | None = None,
 ) -> ProjectConfig:
     """Constructs the ProjectConfig information.
     :param project: The project to load configuration for. Ensure that
@@ -200,6 +203,8 @@ def get_project_config(
         no project keys are provided it is assumed that the config does not
         need to contain auth information (this is the case when used in
         python's StoreView)
+    :param section_cache: Reuses the organization and project sections of
+        configs built before with the same cache.
     :return: a ProjectConfig object for the given project
     """
     with sentry_sdk.isolation_scope() as scope:
@@ -209,7 +214,9 @@ def get_project_config(
             start_span(name="get_project_config", transaction=True),
             metrics.timer("relay.config.get_project_config.duration"),
         ):
-            return _get_project_config(project, project_keys=project_keys)
+            return _get_project_config(
+                project, project_keys=project_keys, section_cache=section_cache
+            )
 
 
 def get_dynamic_sampling_config(timeout: TimeChecker, project: Project) -> Mapping[str, Any] | None:
@@ -798,65 +805,133 @@ def _get_default_browser_performance_profiles(
     ]
 
 
-def _get_project_config(
-    project: Project, project_keys: Iterable[ProjectKey] | None = None
-) -> ProjectConfig:
-    if project.status != ObjectStatus.ACTIVE:
-        return ProjectConfig(project, disabled=True)
+class ConfigSectionCache:
+    """
+    Memoizes config sections which are shared by several configs built in one
+    go, e.g. by all keys of a project, or by all projects of an organization
+    on an organization-wide invalidation.
 
-    public_keys = get_public_key_configs(project_keys=project_keys)
+    Sections are never invalidated, so a cache must only be used for configs
+    which are built at the same time.
+    """
 
-    with start_span(op="get_public_config", name="get_public_config"):
-        now = datetime.now(timezone.utc)
-        cfg = {
-            "disabled": False,
-            "slug": project.slug,
-            "lastFetch": now,
-            "lastChange": now,
-            "rev": uuid.uuid4().hex,
-            "publicKeys": public_keys,
-            "config": {
-                "allowedDomains": list(get_origins(project)),
-                "trustedRelays": [
-                    r["public_key"]
-                    for r in project.organization.get_option("sentry:trusted-relays", [])
-                    if r
-                ],
-                "piiConfig": get_pii_config(project),
-                "datascrubbingSettings": get_datascrubbing_settings(project),
-            },
-            "organizationId": project.organization_id,
-            "projectId": project.id,  # XXX: Unused by Relay, required by Python store
+    def __init__(self) -> None:
+        self._sections: dict[tuple[str, int], MutableMapping[str, Any]] = {}
+
+    def get(
+        self,
+        scope: Literal["organization", "project"],
+        scope_id: int,
+        builder: Callable[[], MutableMapping[str, Any]],
+    ) -> MutableMapping[str, Any]:
+        key = (scope, scope_id)
+        if key in self._sections:
+            metrics.incr("relay.config.sections", tags={"scope": scope, "action": "reused"})
+        else:
+            metrics.incr("relay.config.sections", tags={"scope": scope, "action": "computed"})
+            self._sections[key] = builder()
+        return self._sections[key]
+
+
+@contextmanager
+def _section(name: str) -> Generator[None]:
+    with (
+        start_span(op=name, name=name),
+        metrics.timer("relay.config.section.duration", tags={"section": name}),
+    ):
+        yield
+
+
+def _get_organization_sections(organization: Organization) -> MutableMapping[str, Any]:
+    """
+    Config entries which only depend on the organization.
+    """
+    config: MutableMapping[str, Any] = {}
+
+    with _section("get_trusted_relays"):
+        config["trustedRelays"] = [
+            r["public_key"] for r in organization.get_option("sentry:trusted-relays", []) if r
+        ]
+
+        # Only write trustedRelaySettings when non-default; Relay's normalize_project_config
+        # strips it when verifySignature is "disabled", treating absent and disabled as equivalent.
+        verify_signature = organization.get_option(
+            "sentry:ingest-through-trusted-relays-only",
+            INGEST_THROUGH_TRUSTED_RELAYS_ONLY_DEFAULT,
+        )
+        if verify_signature != INGEST_THROUGH_TRUSTED_RELAYS_ONLY_DEFAULT:
+            config["trustedRelaySettings"] = {"verifySignature": verify_signature}
+
+    with _section("get_performance_score_profiles"):
+        performance_score_profiles = [
+            *_get_desktop_browser_performance_profiles(organization),
+            *_get_mobile_browser_performance_profiles(organization),
+            *_get_default_browser_performance_profiles(organization),
+        ]
+        if performance_score_profiles:
+            config["performanceScore"] = {"profiles": performance_score_profiles}
+
+    with _section("get_event_retention"):
+        event_retention = quotas.backend.get_event_retention(organization)
+        if event_retention is not None:
+            config["eventRetention"] = event_retention
+    with _section("get_downsampled_event_retention"):
+        downsampled_event_retention = quotas.backend.get_downsampled_event_retention(organization)
+        if downsampled_event_retention is not None:
+            config["downsampledEventRetention"] = downsampled_event_retention
+    with _section("get_retentions"):
+        retentions = quotas.backend.get_retentions(organization)
+        # Iterate the mapping (not the backend's dict) so that wire-name
+        # collisions resolve deterministically: the last mapping wins.
+        retentions_config = {
+            name: retentions[c].to_object()
+            for c, name in RETENTIONS_CONFIG_MAPPING.items()
+            if c in retentions
         }
+        if retentions_config:
+            config["retentions"] = retentions_config
 
-    config = cfg["config"]
+    with _section("get_trimming_configs"):
+        trimming_configs = quotas.backend.get_trimming_configs(organization)
+        if trimming_configs:
+            config["trimming"] = trimming_configs
+
+    return config
 
-    # Only write trustedRelaySettings when non-default; Relay's normalize_project_config
-    # strips it when verifySignature is "disabled", treating absent and disabled as equivalent.
-    verify_signature = project.organization.get_option(
-        "sentry:ingest-through-trusted-relays-only",
-        INGEST_THROUGH_TRUSTED_RELAYS_ONLY_DEFAULT,
-    )
-    if verify_signature != INGEST_THROUGH_TRUSTED_RELAYS_ONLY_DEFAULT:
-        config["trustedRelaySettings"] = {"verifySignature": verify_signature}
 
-    with start_span(op="get_exposed_features", name="get_exposed_features"):
+def _get_project_sections(project: Project) -> MutableMapping[str, Any]:
+    """
+    Config entries which depend on the project, but not on its keys.
+    """
+    config: MutableMapping[str, Any] = {}
+
+    with _section("get_public_config"):
+        config["allowedDomains"] = list(get_origins(project))
+        config["piiConfig"] = get_pii_config(project)
+        config["datascrubbingSettings"] = get_datascrubbing_settings(project)
+
+    with _section("get_exposed_features"):
         if exposed_features := get_exposed_features(project):
             config["features"] = exposed_features
 
     # NOTE: Omitting dynamicSampling because of a failure increases the number
     # of events forwarded by Relay, because dynamic sampling will stop filtering
     # anything.
-    add_experimental_config(config, "sampling", get_dynamic_sampling_config, project)
-
-    # Rules to replace high cardinality transaction names
-    if not features.has("projects:transaction-name-clustering-disabled", project):
-        add_experimental_config(config, "txNameRules", get_transaction_names_config, project)
-
-    # Mark the project as ready if it has seen >= 10 clusterer runs.
-    # This prevents projects from prematurely marking all URL transactions as sanitized.
-    if get_clusterer_meta(ClustererNamespace.TRANSACTIONS, project)["runs"] >= MIN_CLUSTERER_RUNS:
-        config["txNameReady"] = True
+    with _section("get_dynamic_sampling_config"):
+        add_experimental_config(config, "sampling", get_dynamic_sampling_config, project)
+
+    with _section("get_transaction_names_config"):
+        # Rules to replace high cardinality transaction names
+        if not features.has("projects:transaction-name-clustering-disabled", project):
+            add_experimental_config(config, "txNameRules", get_transaction_names_config, project)
+
+        # Mark the project as ready if it has seen >= 10 clusterer runs.
+        # This prevents projects from prematurely marking all URL transactions as sanitized.
+        if (
+            get_clusterer_meta(ClustererNamespace.TRANSACTIONS, project)["runs"]
+            >= MIN_CLUSTERER_RUNS
+        ):
+            config["txNameReady"] = True
 
     config["breakdownsV2"] = project.get_option("sentry:breakdowns")
 
@@ -868,55 +943,57 @@ def _get_project_config(
         ),
     }
 
-    performance_score_profiles = [
-        *_get_desktop_browser_performance_profiles(project.organization),
-        *_get_mobile_browser_performance_profiles(project.organization),
-        *_get_default_browser_performance_profiles(project.organization),
-    ]
-    if performance_score_profiles:
-        config["performanceScore"] = {"profiles": performance_score_profiles}
-
-    with start_span(op="get_filter_settings", name="get_filter_settings"):
+    with _section("get_filter_settings"):
         if filter_settings := get_filter_settings(project):
             config["filterSettings"] = filter_settings
-    with start_span(
-        op="get_grouping_config_dict_for_project", name="get_grouping_config_dict_for_project"
-    ):
+    with _section("get_grouping_config_dict_for_project"):
         grouping_config = get_grouping_config_dict_for_project(project)
         if grouping_config is not None:
             config["groupingConfig"] = grouping_config
-    with start_span(op="get_event_retention", name="get_event_retention"):
-        event_retention = quotas.backend.get_event_retention(project.organization)
-        if event_retention is not None:
-            config["eventRetention"] = event_retention
-    with start_span(op="get_downsampled_event_retention", name="get_downsampled_event_retention"):
-        downsampled_event_retention = quotas.backend.get_downsampled_event_retention(
-            project.organization
-        )
-        if downsampled_event_retention is not None:
-            config["downsampledEventRetention"] = downsampled_event_retention
-    with start_span(op="get_retentions", name="get_retentions"):
-        retentions = quotas.backend.get_retentions(project.organization)
-        # Iterate the mapping (not the backend's dict) so that wire-name
-        # collisions resolve deterministically: the last mapping wins.
-        retentions_config = {
-            name: retentions[c].to_object()
-            for c, name in RETENTIONS_CONFIG_MAPPING.items()
-            if c in retentions
-        }
-        if retentions_config:
-            config["retentions"] = retentions_config
 
-    with start_span(op="get_trimming_configs", name="get_trimming_configs"):
-        trimming_configs = quotas.backend.get_trimming_configs(project.organization)
-        if trimming_configs:
-            config["trimming"] = trimming_configs
+    return config
+
+
+def _get_project_config(
+    project: Project,
+    project_keys: Iterable[ProjectKey] | None = None,
+    section_cache: ConfigSectionCache | None = None,
+) -> ProjectConfig:
+    if project.status != ObjectStatus.ACTIVE:
+        return ProjectConfig(project, disabled=True)
+
+    if section_cache is None:
+        section_cache = ConfigSectionCache()
+
+    public_keys = get_public_key_configs(project_keys=project_keys)
 
-    with start_span(op="get_all_quotas", name="get_all_quotas"):
+    # Sections are shared between configs, and must not be modified.
+    config: MutableMapping[str, Any] = {
+        **section_cache.get(
+            "organization",
+            project.organization_id,
+            lambda: _get_organization_sections(project.organization),
+        ),
+        **section_cache.get("project", project.id, lambda: _get_project_sections(project)),
+    }
+
+    with _section("get_all_quotas"):
         if quotas_config := get_quotas(project, keys=project_keys):
             config["quotas"] = quotas_config
 
-    return ProjectConfig(project, **cfg)
+    now = datetime.now(timezone.utc)
+    return ProjectConfig(
+        project,
+        disabled=False,
+        slug=project.slug,
+        lastFetch=now,
+        lastChange=now,
+        rev=uuid.uuid4().hex,
+        publicKeys=public_keys,
+        config=config,
+        organizationId=project.organization_id,
+        projectId=project.id,  # XXX: Unused by Relay, required by Python store
+    )
 
 
 class _ConfigBase:
@@ -0,0 +1,34 @@
+-- Apply a pre-aggregated increment to a single buffer hash.
+--
+-- KEYS[1]: the buffer hash, as built by `make_key`
+-- ARGV[1]: TTL of the buffer hash in seconds
+-- ARGV[2]: model path, stored under "m" if not set yet
+-- ARGV[3]: serialized filters, stored under "f" if not set yet
+-- ARGV[4]: "1" to flag the hash as signal only
+-- ARGV[5]: number of counter columns N
+-- ARGV[6 .. 5 + 2 * N]: pairs of counter field and amount for HINCRBY
+-- remaining ARGV: pairs of extra field and serialized value for HSET
+assert(#KEYS == 1, "provide exactly one buffer key")
+
+local key = KEYS[1]
+local num_incrs = tonumber(ARGV[5])
+
+redis.call("HSETNX", key, "m", ARGV[2])
+redis.call("HSETNX", key, "f", ARGV[3])
+
+local i = 6
+for _ = 1, num_incrs do
+    redis.call("HINCRBY", key, ARGV[i], ARGV[i + 1])
+    i = i + 2
+end
+
+while i < #ARGV do
+    redis.call("HSET", key, ARGV[i], ARGV[i + 1])
+    i = i + 2
+end
+
+if ARGV[4] == "1" then
+    redis.call("HSET", key, "s", "1")
+end
+
+redis.call("EXPIRE", key, ARGV[1])
@@ -0,0 +1,50 @@
+-- Does the work of both the fixed window rate limiter (`RedisRateLimiter.is_limited_with_value`)
+-- and the concurrent rate limiter (api_limiter.lua) for an API request in a single roundtrip.
+--
+-- The fixed window counter is always incremented. The concurrent limit is only checked (and a
+-- slot only taken) if the fixed window limit was not hit, since the request is rejected anyway
+-- if it was. Both keys need to share a hash tag so they end up on the same cluster node.
+--
+-- Input:
+-- keys:
+--  window_key, concurrent_key
+-- args:
+--  limit, window_expiration, concurrent_limit (negative if there is none), request_uid,
+--  current_time, max_tll_seconds
+--
+-- Output:
+-- current (the fixed window count, including this request),
+-- current_executions (including this request if it was allowed, -1 if the concurrent limit
+-- was not checked), request_allowed (1 or 0, only meaningful if the concurrent limit was checked)
+local window_key = KEYS[1]
+local concurrent_key = KEYS[2]
+
+local limit = tonumber(ARGV[1])
+local window_expiration = tonumber(ARGV[2])
+local concurrent_limit = tonumber(ARGV[3])
+local request_uid = ARGV[4]
+local cur_time = tonumber(ARGV[5])
+local max_tll_seconds = tonumber(ARGV[6])
+
+local current = redis.call("incr", window_key)
+redis.call("expire", window_key, window_expiration)
+
+if current > limit or concurrent_limit < 0 then
+  return { current, -1, 1 }
+end
+
+-- From here on this is the same as api_limiter.lua, see there for details
+redis.call("zremrangebyscore", concurrent_key, "-inf", cur_time - max_tll_seconds)
+local current_executions = redis.call("zcard", concurrent_key)
+local allowed = current_executions < concurrent_limit
+
+local key_ttl_seconds = 86400
+
+if allowed then
+  redis.call("zadd", concurrent_key, cur_time, request_uid)
+  redis.call("expire", concurrent_key, key_ttl_seconds)
+  current_executions = current_executions + 1
+  return { current, current_executions, 1 }
+end
+
+return { current, current_executions, 0 }
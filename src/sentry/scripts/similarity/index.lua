@@ -611,27 +611,54 @@ end
 
 -- Command Parsing
 
+local function signature_argument_parser(configuration)
+    return object_argument_parser({
+        {"index", argument_parser(validate_value)},
+        {"frequencies", frequencies_argument_parser(configuration)},
+    })
+end
+
+local function record_signatures(configuration, key, signatures)
+    return table_imap(
+        signatures,
+        function (signature)
+            set_frequencies(configuration, signature.index, key, signature.frequencies)
+            for band, buckets in ipairs(signature.frequencies) do
+                for bucket in pairs(buckets) do
+                    get_bucket_membership_set(configuration, signature.index, band, bucket):add(key)
+                end
+            end
+        end
+    )
+end
+
 local commands = {
     RECORD = function (configuration, cursor, arguments)
         local cursor, key, signatures = multiple_argument_parser(
             argument_parser(validate_value),
-            variadic_argument_parser(
-                object_argument_parser({
-                    {"index", argument_parser(validate_value)},
-                    {"frequencies", frequencies_argument_parser(configuration)},
-                })
-            )
+            variadic_argument_parser(signature_argument_parser(configuration))
+        )(cursor, arguments)
+
+        return record_signatures(configuration, key, signatures)
+    end,
+    RECORD_MANY = function (configuration, cursor, arguments)
+        local cursor, items = variadic_argument_parser(
+            object_argument_parser({
+                {"key", argument_parser(validate_value)},
+                {"timestamp", argument_parser(validate_number)},
+                {"signatures", repeated_argument_parser(signature_argument_parser(configuration))},
+            })
         )(cursor, arguments)
 
         return table_imap(
-            signatures,
-            function (signature)
-                set_frequencies(configuration, signature.index, key, signature.frequencies)
-                for band, buckets in ipairs(signature.frequencies) do
-                    for bucket in pairs(buckets) do
-                        get_bucket_membership_set(configuration, signature.index, band, bucket):add(key)
-                    end
-                end
+            items,
+            function (item)
+                -- Each key is recorded in the interval of its own timestamp.
+                local item_configuration = setmetatable(
+                    {timestamp = item.timestamp},
+                    {__index = configuration}
+                )
+                return record_signatures(item_configuration, item.key, item.signatures)
             end
         )
     end,
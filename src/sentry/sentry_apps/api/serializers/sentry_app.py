@@ -10,6 +10,7 @@ from sentry.app import env
 from sentry.auth.staff import is_active_staff
 from sentry.auth.superuser import is_active_superuser
 from sentry.constants import SentryAppStatus
+from sentry.hybridcloud.rpc.service import RpcBatch
 from sentry.hybridcloud.services.organization_mapping import organization_mapping_service
 from sentry.integrations.models.integration_feature import IntegrationFeature, IntegrationTypes
 from sentry.models.apiapplication import ApiApplication
@@ -109,13 +110,19 @@ class SentryAppSerializer(Serializer):
         # Fetch organization contexts for unique owner_ids where user is a member.
         # This deduplicates the calls - typically all items share the same owner_id
         # (e.g., OrganizationSentryAppsEndpoint filters by single org), so this
-        # reduces N calls to 1.
-        owner_contexts: dict[int, RpcUserOrganizationContext] = {}
-        unique_owner_ids = {i.owner_id for i in item_list if i.owner_id in user_org_ids}
-        for owner_id in unique_owner_ids:
-            owner_context = organization_service.get_organization_by_id(
-                id=owner_id, user_id=user.id
+        # reduces N calls to 1. The remaining calls are batched, one request per cell.
+        batch = RpcBatch()
+        owner_context_futures = {
+            owner_id: batch.add(
+                organization_service, "get_organization_by_id", id=owner_id, user_id=user.id
             )
+            for owner_id in {i.owner_id for i in item_list if i.owner_id in user_org_ids}
+        }
+        batch.dispatch()
+
+        owner_contexts: dict[int, RpcUserOrganizationContext] = {}
+        for owner_id, future in owner_context_futures.items():
+            owner_context = future.result()
             if owner_context:
                 owner_contexts[owner_id] = owner_context
 
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import os
+import threading
+from collections.abc import Callable, Mapping
 from datetime import datetime, timedelta
 from threading import local
-from typing import Any
+from typing import Any, TypeVar
 
 from django.core.cache import BaseCache, InvalidCacheBackendError, caches
 from django.utils.functional import cached_property
 
 from sentry import options
+from sentry.services.nodestore import indexed
+from sentry.services.nodestore.process_cache import get_process_cache
 from sentry.utils import json, metrics
+from sentry.utils.concurrent import ContextPropagatingThreadPoolExecutor
 from sentry.utils.services import Service
 from sentry.utils.tracing import set_span_tag, start_span, trace
 
@@ -28,6 +33,41 @@ json_dumps = json.JSONEncoder(
 
 json_loads = json.loads
 
+T = TypeVar("T")
+
+
+# Runs the single-item operations of multi-item calls for backends without
+# native batching. It is shared by every call of the process, and replaced
+# when `nodestore.multi-max-concurrency` changes.
+_executor: ContextPropagatingThreadPoolExecutor | None = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> ContextPropagatingThreadPoolExecutor:
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != max_workers:
+            # The replaced executor is not shut down, other threads may still be
+            # submitting to it. It finishes their work and its idle threads exit
+            # once it is garbage collected.
+            _executor = ContextPropagatingThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="nodestore"
+            )
+            _executor_workers = max_workers
+        return _executor
+
+
+def _reset_executor() -> None:
+    # Worker threads do not survive a fork, the child starts its own pool.
+    global _executor, _executor_workers, _executor_lock
+    _executor = None
+    _executor_workers = 0
+    _executor_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_executor)
+
 
 class NodeStorage(local, Service):
     """
@@ -62,8 +102,19 @@ class NodeStorage(local, Service):
 
     This is used in reprocessing to store a snapshot of the event from multiple
     stages of the pipeline.
+
+    Every backend supports bulk reads, writes and deletes (`get_multi`,
+    `set_subkeys_multi`, `set_bytes_multi`, `delete_multi`). Backends with
+    native batching override `_get_bytes_multi`, `_set_bytes_multi` and
+    `delete_multi`; all others fall back to fanning out the single-item
+    operations over a process-wide pool of `nodestore.multi-max-concurrency`
+    threads.
     """
 
+    # Backends that compress the payloads they store set this, so that
+    # indexed nodes are not compressed a second time.
+    compresses_payloads = False
+
     __all__ = (
         "delete",
         "delete_multi",
@@ -72,7 +123,9 @@ class NodeStorage(local, Service):
         "get_multi",
         "set",
         "set_bytes",
+        "set_bytes_multi",
         "set_subkeys",
+        "set_subkeys_multi",
         "cleanup",
         "validate",
         "bootstrap",
@@ -93,13 +146,32 @@ class NodeStorage(local, Service):
 
         >>> delete_multi(['key1', 'key2'])
         """
-        for id in id_list:
-            self.delete(id)
+        self._fan_out(self.delete, id_list)
+
+    def _fan_out(self, func: Callable[[str], T], id_list: list[str]) -> dict[str, T]:
+        """
+        Run a single-item operation for every id. Used by backends without
+        native batching, the operations run on a process-wide executor of
+        `nodestore.multi-max-concurrency` threads.
+
+        Note: `NodeStorage` subclasses `threading.local`, so the attributes of
+        the backend, such as its clients, are set up once per worker thread.
+        The workers are long-lived and keep them across calls.
+        """
+        max_workers = options.get("nodestore.multi-max-concurrency")
+        if max_workers <= 1 or len(id_list) <= 1:
+            return {id: func(id) for id in id_list}
+
+        executor = _get_executor(max_workers)
+        return dict(zip(id_list, executor.map(func, id_list)))
 
     def _decode(self, value: None | bytes, subkey: str | None) -> Any | None:
         if value is None:
             return None
 
+        if indexed.is_indexed(value):
+            return indexed.decode(value, subkey)
+
         lines_iter = iter(value.splitlines())
         try:
             if subkey is not None:
@@ -139,11 +211,19 @@ class NodeStorage(local, Service):
         with start_span(op="nodestore.get", name="nodestore.get") as span:
             set_span_tag(span, "node_id", id)
             if subkey is None:
+                process_cache_items = self._get_process_cache_items([id])
+                if id in process_cache_items:
+                    metrics.incr("nodestore.get", tags={"cache": "hit", "tier": "process"})
+                    set_span_tag(span, "origin", "from_process_cache")
+                    set_span_tag(span, "found", bool(process_cache_items[id]))
+                    return process_cache_items[id]
+
                 item_from_cache = self._get_cache_item(id)
                 if item_from_cache:
-                    metrics.incr("nodestore.get", tags={"cache": "hit"})
+                    metrics.incr("nodestore.get", tags={"cache": "hit", "tier": "shared"})
                     set_span_tag(span, "origin", "from_cache")
                     set_span_tag(span, "found", bool(item_from_cache))
+                    self._set_process_cache_items({id: item_from_cache})
                     return item_from_cache
 
             set_span_tag(span, "subkey", str(subkey))
@@ -152,6 +232,7 @@ class NodeStorage(local, Service):
             if subkey is None:
                 # set cache item only after we know decoding did not fail
                 self._set_cache_item(id, rv)
+                self._set_process_cache_items({id: rv})
 
             set_span_tag(span, "result", "from_service")
             if bytes_data:
@@ -169,7 +250,7 @@ class NodeStorage(local, Service):
             "key2": b'{"message": "hello world"}'
         }
         """
-        return {id: self._get_bytes(id) for id in id_list}
+        return self._fan_out(self._get_bytes, id_list)
 
     def get_multi(self, id_list: list[str], subkey: str | None = None) -> dict[str, Any | None]:
         """
@@ -186,14 +267,31 @@ class NodeStorage(local, Service):
             set_span_tag(span, "num_ids", len(id_list))
 
             if subkey is None:
-                cache_items = self._get_cache_items(id_list)
+                cache_items = self._get_process_cache_items(id_list)
+                metrics.incr(
+                    "nodestore.get_multi",
+                    amount=len(cache_items),
+                    tags={"cache": "hit", "tier": "process"},
+                )
+                if len(cache_items) == len(id_list):
+                    set_span_tag(span, "result", "from_process_cache")
+                    return cache_items
+
+                shared_cache_items = self._get_cache_items(
+                    [id for id in id_list if id not in cache_items]
+                )
+                metrics.incr(
+                    "nodestore.get_multi",
+                    amount=len(shared_cache_items),
+                    tags={"cache": "hit", "tier": "shared"},
+                )
+                self._set_process_cache_items(shared_cache_items)
+                cache_items.update(shared_cache_items)
                 if len(cache_items) == len(id_list):
-                    metrics.incr("nodestore.get_multi", amount=len(id_list), tags={"cache": "hit"})
                     set_span_tag(span, "result", "from_cache")
                     return cache_items
 
                 uncached_ids = [id for id in id_list if id not in cache_items]
-                metrics.incr("nodestore.get_multi", amount=len(cache_items), tags={"cache": "hit"})
                 metrics.incr(
                     "nodestore.get_multi", amount=len(uncached_ids), tags={"cache": "miss"}
                 )
@@ -210,6 +308,8 @@ class NodeStorage(local, Service):
                 }
             if subkey is None:
                 self._set_cache_items(items)
+                # Ids missing from the backend are remembered as missing too.
+                self._set_process_cache_items({id: items.get(id) for id in uncached_ids})
                 items.update(cache_items)
 
             set_span_tag(span, "result", "from_service")
@@ -225,7 +325,19 @@ class NodeStorage(local, Service):
 
         >>> _encode({"unprocessed": {}, None: {"stacktrace": {}}})
         b'{"stacktrace": {}}\nunprocessed\n{}'
+
+        With the `nodestore.write-indexed-format` option enabled, the indexed
+        format from `sentry.services.nodestore.indexed` is written instead,
+        with uncompressed sections if the backend compresses payloads itself.
+        Both formats can be read at all times.
         """
+        if options.get("nodestore.write-indexed-format"):
+            sections = {None: json_dumps(data.pop(None)).encode("utf8")}
+            for key, value in data.items():
+                if key is not None:
+                    sections[key] = json_dumps(value).encode("utf8")
+            return indexed.encode(sections, compress=not self.compresses_payloads)
+
         lines = [json_dumps(data.pop(None)).encode("utf8")]
         for key, value in data.items():
             if key is not None:
@@ -244,6 +356,22 @@ class NodeStorage(local, Service):
     def _set_bytes(self, item_id: str, data: bytes, ttl: timedelta | None = None) -> None:
         raise NotImplementedError
 
+    def set_bytes_multi(self, items: Mapping[str, bytes], ttl: timedelta | None = None) -> None:
+        """
+        Write multiple nodes at once.
+
+        Note: This is not guaranteed to be atomic and may result in a partial
+        write.
+
+        >>> nodestore.set_bytes_multi({'key1': b"{'foo': 'bar'}", 'key2': b"{'foo': 'baz'}"})
+        """
+        for data in items.values():
+            metrics.distribution("nodestore.set_bytes", len(data))
+        return self._set_bytes_multi(items, ttl)
+
+    def _set_bytes_multi(self, items: Mapping[str, bytes], ttl: timedelta | None = None) -> None:
+        self._fan_out(lambda item_id: self._set_bytes(item_id, items[item_id], ttl), list(items))
+
     def set(self, item_id: str, data: Mapping[str, Any], ttl: timedelta | None = None) -> None:
         """
         Set value for `item_id`. Note that this deletes existing subkeys for `item_id` as
@@ -273,10 +401,33 @@ class NodeStorage(local, Service):
         cache_item = data.get(None)
         bytes_data = self._encode(data)
         self.set_bytes(item_id, bytes_data, ttl=ttl)
+        self._delete_process_cache_items([item_id])
         # set cache only after encoding and write to nodestore has succeeded
         if options.get("nodestore.set-subkeys.enable-set-cache-item"):
             self._set_cache_item(item_id, cache_item)
 
+    @trace
+    def set_subkeys_multi(
+        self,
+        items: Mapping[str, dict[str | None, Mapping[str, Any]]],
+        ttl: timedelta | None = None,
+    ) -> None:
+        """
+        Set values and subkeys for multiple nodes at once, see `set_subkeys`.
+
+        >>> nodestore.set_subkeys_multi({
+        ...    'key1': {None: {'foo': 'bar'}},
+        ...    'key2': {None: {'foo': 'baz'}, "reprocessing": {'foo': 'bam'}},
+        ... })
+        """
+        cache_items = {item_id: data.get(None) for item_id, data in items.items()}
+        bytes_data = {item_id: self._encode(data) for item_id, data in items.items()}
+        self.set_bytes_multi(bytes_data, ttl=ttl)
+        self._delete_process_cache_items(list(items))
+        # set cache only after encoding and write to nodestore has succeeded
+        if options.get("nodestore.set-subkeys.enable-set-cache-item"):
+            self._set_cache_items({id: value for id, value in cache_items.items() if value})
+
     def cleanup(self, cutoff_timestamp: datetime) -> None:
         raise NotImplementedError
 
@@ -304,13 +455,39 @@ class NodeStorage(local, Service):
             self.cache.set_many(items, timeout=options.get("nodestore.cache-ttl"))
 
     def _delete_cache_item(self, item_id: str) -> None:
+        self._delete_process_cache_items([item_id])
         if self.cache:
             self.cache.delete(item_id)
 
     def _delete_cache_items(self, id_list: list[str]) -> None:
+        self._delete_process_cache_items(id_list)
         if self.cache:
             self.cache.delete_many([item_id for item_id in id_list])
 
+    def _get_process_cache_items(self, id_list: list[str]) -> dict[str, Any | None]:
+        process_cache = get_process_cache()
+        if process_cache is None:
+            return {}
+        return {
+            id: json_loads(payload) if payload is not None else None
+            for id, payload in process_cache.get_many(id_list).items()
+        }
+
+    def _set_process_cache_items(self, items: Mapping[str, Any | None]) -> None:
+        process_cache = get_process_cache()
+        if process_cache is not None:
+            process_cache.set_many(
+                {
+                    id: json_dumps(value).encode("utf8") if value is not None else None
+                    for id, value in items.items()
+                }
+            )
+
+    def _delete_process_cache_items(self, id_list: list[str]) -> None:
+        process_cache = get_process_cache()
+        if process_cache is not None:
+            process_cache.delete_many(id_list)
+
     @cached_property
     def cache(self) -> BaseCache | None:
         try:
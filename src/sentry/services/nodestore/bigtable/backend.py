@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
 from datetime import timedelta
 from typing import Any
 
@@ -51,6 +52,7 @@ class BigtableNodeStorage(NodeStorage):
             _compression = None
         else:
             _compression = compression
+        self.compresses_payloads = _compression is not None
 
         self.store = self.store_class(
             project=project,
@@ -88,6 +90,18 @@ class BigtableNodeStorage(NodeStorage):
         with measure_storage_operation("put", "nodestore", len(data)):
             self.store.set(id, data, ttl)
 
+    def _set_bytes_multi(self, items: Mapping[str, bytes], ttl: timedelta | None = None) -> None:
+        if len(items) == 1:
+            ((id, data),) = items.items()
+            self._set_bytes(id, data, ttl)
+            return
+
+        # Note: This metric encapsulates any compression performed by `self.store.set_many()`.
+        with measure_storage_operation(
+            "put-multi", "nodestore", sum(len(data) for data in items.values())
+        ):
+            self.store.set_many(items, ttl)
+
     def delete(self, id: str) -> None:
         if self.skip_deletes:
             return
@@ -3,11 +3,13 @@ from __future__ import annotations
 import logging
 import math
 import pickle
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 from typing import Any
 
 from django.utils import timezone
 
+from sentry.services.nodestore import indexed
 from sentry.services.nodestore.base import NodeStorage
 from sentry.utils.strings import compress, decompress
 
@@ -17,6 +19,9 @@ logger = logging.getLogger("sentry")
 
 
 class DjangoNodeStorage(NodeStorage):
+    # Node data is zlib-compressed by `_set_bytes`.
+    compresses_payloads = True
+
     def delete(self, id: str) -> None:
         Node.objects.filter(id=id).delete()
         self._delete_cache_item(id)
@@ -26,7 +31,7 @@ class DjangoNodeStorage(NodeStorage):
             return None
 
         try:
-            if value.startswith(b"{"):
+            if value.startswith(b"{") or indexed.is_indexed(value):
                 return NodeStorage._decode(self, value, subkey=subkey)
 
             if subkey is None:
@@ -56,6 +61,15 @@ class DjangoNodeStorage(NodeStorage):
             id=id, defaults={"data": compress(data), "timestamp": timezone.now()}
         )
 
+    def _set_bytes_multi(self, items: Mapping[str, bytes], ttl: timedelta | None = None) -> None:
+        timestamp = timezone.now()
+        Node.objects.bulk_create(
+            [Node(id=id, data=compress(data), timestamp=timestamp) for id, data in items.items()],
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=["data", "timestamp"],
+        )
+
     def cleanup(self, cutoff_timestamp: datetime) -> None:
         from sentry.db.deletion import BulkDeleteQuery
 
@@ -0,0 +1,115 @@
+"""
+Indexed node format.
+
+The legacy node format stores the main payload and its subkeys as
+newline-separated JSON documents, so reading a single subkey means splitting
+the whole payload. The indexed format instead starts with a small header
+listing every subkey with the offset and length of its section, and every
+section is an independently zstd-compressed JSON document. Readers only slice
+out, decompress and parse the section they ask for.
+
+Backends that compress whole payloads themselves write the sections
+uncompressed instead, compressing them twice costs CPU and gains nothing.
+The version byte tells the two apart.
+
+Layout (all integers little-endian)::
+
+    magic      4 bytes   b"\\x00nsi"
+    version    uint8     1: zstd-compressed sections, 2: uncompressed sections
+    count      uint16
+    count times:
+        name_len   uint16
+        name       name_len bytes (ASCII, empty for the main payload)
+        offset     uint32 (relative to the end of the header)
+        length     uint32
+    sections   concatenated zstd frames or JSON documents
+
+The magic starts with a NUL byte, so it can be told apart from legacy
+payloads (which start with `{`) and from pickled payloads in the Django
+backend.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Mapping
+from typing import Any
+
+import zstandard
+
+from sentry.utils import json
+
+MAGIC = b"\x00nsi"
+VERSION = 1
+VERSION_UNCOMPRESSED = 2
+
+_header = struct.Struct("<4sBH")
+_name_len = struct.Struct("<H")
+_section = struct.Struct("<II")
+
+
+def is_indexed(value: bytes) -> bool:
+    return value[: len(MAGIC)] == MAGIC
+
+
+def encode(sections: Mapping[str | None, bytes], compress: bool = True) -> bytes:
+    """
+    Encode already JSON-serialized sections. The `None` key is the main
+    payload.
+    """
+    compressor = zstandard.ZstdCompressor() if compress else None
+    version = VERSION if compress else VERSION_UNCOMPRESSED
+
+    header = [_header.pack(MAGIC, version, len(sections))]
+    frames = []
+    offset = 0
+    for key, value in sections.items():
+        name = b"" if key is None else key.encode("ascii")
+        frame = compressor.compress(value) if compressor is not None else value
+        header.append(_name_len.pack(len(name)))
+        header.append(name)
+        header.append(_section.pack(offset, len(frame)))
+        frames.append(frame)
+        offset += len(frame)
+
+    return b"".join(header + frames)
+
+
+def read_section(value: bytes, subkey: str | None) -> memoryview | None:
+    """
+    Return the section for `subkey`, still compressed unless the node was
+    written uncompressed, as a view into `value`, without copying or
+    decompressing anything else.
+    """
+    view = memoryview(value)
+    magic, version, count = _header.unpack_from(view)
+    if magic != MAGIC or version not in (VERSION, VERSION_UNCOMPRESSED):
+        raise ValueError(f"Unsupported node format version: {version}")
+
+    wanted = b"" if subkey is None else subkey.encode("ascii")
+    position = _header.size
+    found = None
+    for _ in range(count):
+        (name_len,) = _name_len.unpack_from(view, position)
+        position += _name_len.size
+        name = view[position : position + name_len]
+        position += name_len
+        offset, length = _section.unpack_from(view, position)
+        position += _section.size
+        if found is None and name == wanted:
+            found = (offset, length)
+
+    if found is None:
+        return None
+
+    offset, length = found
+    return view[position + offset : position + offset + length]
+
+
+def decode(value: bytes, subkey: str | None) -> Any | None:
+    section = read_section(value, subkey)
+    if section is None:
+        return None
+    if value[len(MAGIC)] == VERSION_UNCOMPRESSED:
+        return json.loads(bytes(section))
+    return json.loads(zstandard.ZstdDecompressor().decompress(section))
@@ -0,0 +1,94 @@
+"""
+Process-local cache tier for nodestore reads.
+
+Sits in front of the shared `nodedata` cache, so hot nodes which are read
+several times within seconds (post-process, similarity, Seer tooling) are
+served from memory. Nodes are kept serialized, so that every read produces a
+fresh copy that callers are free to mutate, and the byte size of the cache can
+be bounded exactly. Missing nodes are cached as well, with a shorter TTL.
+
+The tier is disabled unless `nodestore.process-cache.max-bytes` is set.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Mapping
+from typing import NamedTuple
+
+from sentry import options
+from sentry.utils.local_cache import SizedLRUCache, ThreadSafeCache
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    # `None` for nodes which do not exist
+    payload: bytes | None
+
+
+def _sizeof(entry: _Entry) -> int:
+    return len(entry.payload) if entry.payload is not None else 0
+
+
+class NodeProcessCache:
+    def __init__(self, max_bytes: int, max_items: int, ttl: float, negative_ttl: float) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.cache: ThreadSafeCache[str, _Entry] = ThreadSafeCache(
+            SizedLRUCache(maxlen=max_items, maxsize=max_bytes, sizeof=_sizeof)
+        )
+
+    def get_many(self, id_list: Iterable[str]) -> dict[str, bytes | None]:
+        """
+        Return the cached, serialized nodes. Nodes known not to exist are
+        returned as `None`, nodes which are not cached are omitted.
+        """
+        now = time.monotonic()
+        rv = {}
+        for id in id_list:
+            entry = self.cache.get(id)
+            if entry is None:
+                continue
+            if entry.expires_at < now:
+                self.cache.pop(id)
+                continue
+            rv[id] = entry.payload
+        return rv
+
+    def set_many(self, items: Mapping[str, bytes | None]) -> None:
+        now = time.monotonic()
+        for id, payload in items.items():
+            if payload is None:
+                if self.negative_ttl > 0:
+                    self.cache[id] = _Entry(now + self.negative_ttl, None)
+            else:
+                self.cache[id] = _Entry(now + self.ttl, payload)
+
+    def delete_many(self, id_list: Iterable[str]) -> None:
+        for id in id_list:
+            self.cache.pop(id)
+
+
+_process_cache: tuple[tuple[int, int, float, float], NodeProcessCache] | None = None
+
+
+def get_process_cache() -> NodeProcessCache | None:
+    """
+    Return the process-wide cache, or `None` if the tier is disabled. The
+    cache is rebuilt (and thereby emptied) whenever its options change.
+    """
+    global _process_cache
+
+    max_bytes = options.get("nodestore.process-cache.max-bytes")
+    if max_bytes <= 0:
+        return None
+
+    config = (
+        max_bytes,
+        options.get("nodestore.process-cache.max-items"),
+        options.get("nodestore.process-cache.ttl"),
+        options.get("nodestore.process-cache.negative-ttl"),
+    )
+    if _process_cache is None or _process_cache[0] != config:
+        _process_cache = (config, NodeProcessCache(*config))
+    return _process_cache[1]
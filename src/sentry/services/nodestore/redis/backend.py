@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from typing import Any
+
+from django.utils.functional import cached_property
+from redis import StrictRedis
+from sentry_redis_tools.clients import RedisCluster
+
+from sentry.services.nodestore.base import NodeStorage
+from sentry.utils.codecs import ZstdCodec
+from sentry.utils.redis import redis_clusters
+from sentry.utils.tracing import set_span_tag, start_span, trace
+
+# Every zstd frame starts with this magic number, node payloads (JSON) never do.
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class RedisNodeStorage(NodeStorage):
+    """
+    A Redis (or Valkey) based backend for storing node data. Multi-item
+    operations are sent as a single non-transactional pipeline, which the
+    cluster client splits up per node.
+
+    Redis keeps everything in memory, so this backend is meant for local
+    development and for deployments with a short retention, where every node
+    should carry a TTL.
+
+    :param cluster: Name of the Redis cluster from `SENTRY_REDIS_CLUSTERS`.
+    :param default_ttl: TTL for nodes which are written without an explicit
+        TTL. `None` stores nodes without expiry.
+    :param compression: Whether to zstd-compress payloads. Reads detect
+        compressed payloads, so this can be toggled on a live store.
+    :param key_prefix: Prefix for all keys written by this backend.
+
+    >>> from datetime import timedelta
+    >>> RedisNodeStorage(
+    ...     cluster='default',
+    ...     default_ttl=timedelta(days=30),
+    ...     compression=True,
+    ... )
+    """
+
+    def __init__(
+        self,
+        cluster: str = "default",
+        default_ttl: timedelta | None = None,
+        compression: bool = True,
+        key_prefix: str = "ns:",
+    ):
+        self.cluster_name = cluster
+        self.default_ttl = default_ttl
+        self.compression = compression
+        self.compresses_payloads = compression
+        self.key_prefix = key_prefix
+        self.codec = ZstdCodec()
+
+    @cached_property
+    def client(self) -> RedisCluster[bytes] | StrictRedis[bytes]:
+        return redis_clusters.get_binary(self.cluster_name)
+
+    def _make_key(self, id: str) -> bytes:
+        return f"{self.key_prefix}{id}".encode()
+
+    def _encode_value(self, data: bytes) -> bytes:
+        if self.compression:
+            return self.codec.encode(data)
+        return data
+
+    def _decode_value(self, value: bytes | None) -> bytes | None:
+        if value is not None and value.startswith(ZSTD_MAGIC):
+            return self.codec.decode(value)
+        return value
+
+    @trace
+    def _get_bytes(self, id: str) -> bytes | None:
+        return self._decode_value(self.client.get(self._make_key(id)))
+
+    @trace
+    def _get_bytes_multi(self, id_list: list[str]) -> dict[str, bytes | None]:
+        with self.client.pipeline(transaction=False) as pipeline:
+            for id in id_list:
+                pipeline.get(self._make_key(id))
+            values = pipeline.execute()
+
+        return {id: self._decode_value(value) for id, value in zip(id_list, values)}
+
+    def _set_bytes(self, id: str, data: Any, ttl: timedelta | None = None) -> None:
+        self.client.set(self._make_key(id), self._encode_value(data), ex=ttl or self.default_ttl)
+
+    @trace
+    def _set_bytes_multi(self, items: Mapping[str, bytes], ttl: timedelta | None = None) -> None:
+        ex = ttl or self.default_ttl
+        with self.client.pipeline(transaction=False) as pipeline:
+            for id, data in items.items():
+                pipeline.set(self._make_key(id), self._encode_value(data), ex=ex)
+            pipeline.execute()
+
+    def delete(self, id: str) -> None:
+        try:
+            self.client.delete(self._make_key(id))
+        finally:
+            self._delete_cache_item(id)
+
+    def delete_multi(self, id_list: list[str]) -> None:
+        with start_span(
+            op="nodestore.redis.delete_multi", name="nodestore.redis.delete_multi"
+        ) as span:
+            set_span_tag(span, "num_ids", len(id_list))
+
+            try:
+                # A multi-key DEL is not allowed across slots in cluster mode,
+                # so delete every key separately within one pipeline.
+                with self.client.pipeline(transaction=False) as pipeline:
+                    for id in id_list:
+                        pipeline.delete(self._make_key(id))
+                    pipeline.execute()
+            finally:
+                self._delete_cache_items(id_list)
+
+    def cleanup(self, cutoff_timestamp: datetime) -> None:
+        # Expiry is handled by Redis through the TTL of every node.
+        pass
+
+    def bootstrap(self) -> None:
+        # Nothing for Redis backend to do during bootstrap
+        pass
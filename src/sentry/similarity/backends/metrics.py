@@ -22,6 +22,9 @@ class MetricsWrapper(AbstractIndexBackend):
     def record(self, *args, **kwargs):
         return self.__instrumented_method_call("record", *args, **kwargs)
 
+    def record_many(self, *args, **kwargs):
+        return self.__instrumented_method_call("record_many", *args, **kwargs)
+
     def classify(self, *args, **kwargs):
         return self.__instrumented_method_call("classify", *args, **kwargs)
 
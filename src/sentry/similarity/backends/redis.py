@@ -142,6 +142,40 @@ class RedisScriptMinHashIndexBackend(AbstractIndexBackend):
 
         return self.__index(scope, arguments)
 
+    def record_many(self, scope, items, timestamp=None):
+        """
+        Record the features of many keys in a single script call. ``items`` is
+        a sequence of ``(key, timestamp, [(idx, features), ...])`` tuples, and
+        each key is recorded at its own timestamp (or ``timestamp``, if None.)
+        """
+        items = [item for item in items if item[2]]
+        if not items:
+            return  # nothing to do
+
+        if timestamp is None:
+            timestamp = int(time.time())
+
+        arguments = [
+            "RECORD_MANY",
+            timestamp,
+            self.namespace,
+            self.bands,
+            self.interval,
+            self.retention,
+            self.candidate_set_limit,
+            scope,
+        ]
+
+        for key, key_timestamp, key_items in items:
+            arguments.extend(
+                [key, key_timestamp if key_timestamp is not None else timestamp, len(key_items)]
+            )
+            for idx, features in key_items:
+                arguments.append(idx)
+                arguments.extend(self._build_signature_arguments(features))
+
+        return self.__index(scope, arguments)
+
     def merge(self, scope, destination, items, timestamp=None):
         if timestamp is None:
             timestamp = int(time.time())
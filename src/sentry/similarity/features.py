@@ -91,6 +91,24 @@ class FeatureSet:
                 )
         return results
 
+    def __encode(self, event, label, features):
+        try:
+            return [self.encoder.dumps(feature) for feature in features]
+        except Exception as error:
+            log = (
+                logger.debug
+                if isinstance(error, self.expected_encoding_errors)
+                else logger.warning
+            )
+            log(
+                "Could not encode features from %r for %r due to error: %r",
+                event,
+                label,
+                error,
+                exc_info=True,
+            )
+            return None
+
     def record(self, events):
         if not events:
             return []
@@ -117,27 +135,45 @@ class FeatureSet:
                         "all events must be associated with the same group"
                     )
 
-                try:
-                    features = [self.encoder.dumps(feature) for feature in features]
-                except Exception as error:
-                    log = (
-                        logger.debug
-                        if isinstance(error, self.expected_encoding_errors)
-                        else logger.warning
-                    )
-                    log(
-                        "Could not encode features from %r for %r due to error: %r",
-                        event,
-                        label,
-                        error,
-                        exc_info=True,
-                    )
-                else:
-                    if features:
-                        items.append((self.aliases[label], features))
+                features = self.__encode(event, label, features)
+                if features:
+                    items.append((self.aliases[label], features))
 
         return self.index.record(scope, key, items, timestamp=int(event.datetime.timestamp()))
 
+    def record_many(self, events):
+        """\
+        Record events which may belong to many different groups (of the same
+        project) with a single index call, rather than calling ``record`` once
+        per group. Each event is recorded at its own timestamp.
+        """
+        scope: str | None = None
+
+        items_by_key: dict[tuple[str, int], list] = {}
+        for event in events:
+            if not event.group_id:
+                continue
+            for label, features in self.extract(event).items():
+                if scope is None:
+                    scope = self.__get_scope(event.project)
+                else:
+                    assert self.__get_scope(event.project) == scope, (
+                        "all events must be associated with the same project"
+                    )
+
+                features = self.__encode(event, label, features)
+                if features:
+                    key = (self.__get_key(event.group), int(event.datetime.timestamp()))
+                    items_by_key.setdefault(key, []).append((self.aliases[label], features))
+
+        if not items_by_key:
+            return []
+
+        return self.index.record_many(
+            scope,
+            [(key, timestamp, items) for (key, timestamp), items in items_by_key.items()],
+        )
+
     def classify(self, events, limit=None, thresholds=None):
         if not events:
             return []
@@ -158,25 +194,10 @@ class FeatureSet:
                         "all events must be associated with the same project"
                     )
 
-                try:
-                    features = [self.encoder.dumps(feature) for feature in features]
-                except Exception as error:
-                    log = (
-                        logger.debug
-                        if isinstance(error, self.expected_encoding_errors)
-                        else logger.warning
-                    )
-                    log(
-                        "Could not encode features from %r for %r due to error: %r",
-                        event,
-                        label,
-                        error,
-                        exc_info=True,
-                    )
-                else:
-                    if features:
-                        items.append((self.aliases[label], thresholds.get(label, 0), features))
-                        labels.append(label)
+                features = self.__encode(event, label, features)
+                if features:
+                    items.append((self.aliases[label], thresholds.get(label, 0), features))
+                    labels.append(label)
 
         return [
             (int(key), dict(zip(labels, scores)))
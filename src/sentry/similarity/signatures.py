@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from itertools import repeat
 
 import mmh3
 
@@ -11,7 +12,15 @@ class MinHashSignatureBuilder:
         self.rows = rows
 
     def __call__(self, features: Iterable[str]) -> list[int]:
+        # Duplicate features can't change the minimum, and shingles of long messages repeat a lot,
+        # so only hash each distinct feature once per column. (This also means `features` only
+        # needs to be iterated over once.)
+        distinct_features = set(features)
+        if not distinct_features:
+            raise ValueError("Cannot build a signature without any features")
+
+        rows = self.rows
         return [
-            min(mmh3.hash(feature, column) % self.rows for feature in features)
+            min([value % rows for value in map(mmh3.hash, distinct_features, repeat(column))])
             for column in range(self.columns)
         ]
@@ -0,0 +1,167 @@
+"""
+Result cache for Snuba queries.
+
+Results are stored zstd-compressed in the default Django cache, together with
+the time they were stored at, and are kept around for a grace period after
+they expire (`snuba.query-cache.stale-ttl`). Within that period a single
+caller refreshes the result while everybody else is served the stale one.
+
+Misses for the same query are coalesced across threads and processes: the
+first caller takes a short lock and runs the query, all other callers wait up
+to `snuba.query-cache.wait-timeout` seconds for its result before running the
+query themselves.
+
+The TTL of a result can be configured per referrer with
+`snuba.query-cache.referrer-ttls`, and defaults to
+`SENTRY_SNUBA_CACHE_TTL_SECONDS`.
+
+Cache keys carry a format version (`sqc2:`, see `get_cache_key`), so that
+processes still writing and reading the uncompressed `sqc:` entries never see
+entries of this format, and vice versa.
+"""
+
+from __future__ import annotations
+
+import enum
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import zstandard
+from django.conf import settings
+from django.core.cache import cache
+
+from sentry import options
+from sentry.utils import json, metrics
+
+_WAIT_INITIAL_INTERVAL = 0.01
+_WAIT_MAX_INTERVAL = 0.2
+
+
+class CacheStatus(enum.Enum):
+    # A fresh result, or a stale one which somebody else is refreshing.
+    HIT = "hit"
+    # The caller has to run the query and `store` its result.
+    QUERY = "query"
+    # Somebody else is running the query, `wait_for` its result.
+    WAIT = "wait"
+
+
+@dataclass(frozen=True)
+class CacheLookup:
+    cache_key: str
+    referrer: str | None
+    status: CacheStatus
+    result: Any = None
+    # Whether the caller holds the lock for running the query.
+    locked: bool = False
+
+
+def _lock_key(cache_key: str) -> str:
+    return f"{cache_key}:l"
+
+
+def get_ttl(referrer: str | None) -> int:
+    referrer_ttls: Mapping[str, int] = options.get("snuba.query-cache.referrer-ttls")
+    if referrer is not None and referrer in referrer_ttls:
+        return int(referrer_ttls[referrer])
+    return settings.SENTRY_SNUBA_CACHE_TTL_SECONDS
+
+
+def encode(result: Any, stored_at: float) -> bytes:
+    return zstandard.ZstdCompressor().compress(json.dumps({"t": stored_at, "r": result}).encode())
+
+
+def decode(value: bytes) -> tuple[Any, float]:
+    """
+    Return the cached result and the time it was stored at.
+    """
+    data = json.loads(zstandard.ZstdDecompressor().decompress(value))
+    return data["r"], data["t"]
+
+
+def lookup(requests: Sequence[tuple[str, str | None]]) -> list[CacheLookup]:
+    """
+    Look up the `(cache_key, referrer)` pairs with a single cache round-trip.
+    """
+    wait_timeout = options.get("snuba.query-cache.wait-timeout")
+    now = time.time()
+
+    cached = cache.get_many([cache_key for cache_key, _ in requests])
+    lookups = []
+    for cache_key, referrer in requests:
+        metric_tags = {"referrer": referrer} if referrer else None
+        value = cached.get(cache_key)
+
+        if value is not None:
+            result, stored_at = decode(value)
+            if now - stored_at < get_ttl(referrer):
+                metrics.incr("snuba.query_cache.hit", tags=metric_tags)
+                lookups.append(CacheLookup(cache_key, referrer, CacheStatus.HIT, result))
+            elif _acquire_lock(cache_key):
+                metrics.incr("snuba.query_cache.refresh", tags=metric_tags)
+                lookups.append(CacheLookup(cache_key, referrer, CacheStatus.QUERY, locked=True))
+            else:
+                metrics.incr("snuba.query_cache.stale_hit", tags=metric_tags)
+                lookups.append(CacheLookup(cache_key, referrer, CacheStatus.HIT, result))
+            continue
+
+        metrics.incr("snuba.query_cache.miss", tags=metric_tags)
+        if wait_timeout <= 0:
+            lookups.append(CacheLookup(cache_key, referrer, CacheStatus.QUERY))
+        elif _acquire_lock(cache_key):
+            lookups.append(CacheLookup(cache_key, referrer, CacheStatus.QUERY, locked=True))
+        else:
+            metrics.incr("snuba.query_cache.coalesced", tags=metric_tags)
+            lookups.append(CacheLookup(cache_key, referrer, CacheStatus.WAIT))
+
+    return lookups
+
+
+def store(lookup: CacheLookup, result: Any) -> None:
+    """
+    Store the result of a query, and let everybody waiting for it know.
+    """
+    cache.set(
+        lookup.cache_key,
+        encode(result, time.time()),
+        get_ttl(lookup.referrer) + options.get("snuba.query-cache.stale-ttl"),
+    )
+    release(lookup)
+
+
+def release(lookup: CacheLookup) -> None:
+    """
+    Release the lock for a query without storing a result, e.g. because it
+    failed, so that the next caller runs it.
+    """
+    if lookup.locked:
+        cache.delete(_lock_key(lookup.cache_key))
+
+
+def wait_for(lookup: CacheLookup) -> Any | None:
+    """
+    Wait for the result of a query which somebody else is running. Returns
+    `None` if the result did not show up in time, or the query failed.
+    """
+    deadline = time.monotonic() + options.get("snuba.query-cache.wait-timeout")
+    interval = _WAIT_INITIAL_INTERVAL
+    with metrics.timer("snuba.query_cache.wait"):
+        while True:
+            value = cache.get(lookup.cache_key)
+            if value is not None:
+                return decode(value)[0]
+            if cache.get(_lock_key(lookup.cache_key)) is None:
+                # The query finished without a result.
+                return None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                metrics.incr("snuba.query_cache.wait_timeout")
+                return None
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, _WAIT_MAX_INTERVAL)
+
+
+def _acquire_lock(cache_key: str) -> bool:
+    return cache.add(_lock_key(cache_key), 1, options.get("snuba.query-cache.lock-ttl"))
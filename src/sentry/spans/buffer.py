@@ -126,6 +126,7 @@ from sentry.spans.buffer_logger import (
 from sentry.spans.buffer_store import SpansBufferStore
 from sentry.spans.buffer_store import add_buffer_script as add_buffer_script
 from sentry.spans.buffer_types import (
+    FlushCandidate,
     FlushedSegment,
     InsertedSubsegment,
     LoadedSegment,
@@ -135,6 +136,7 @@ from sentry.spans.buffer_types import (
 )
 from sentry.spans.consumers.process_segments.types import attribute_value
 from sentry.spans.debug_trace_logger import DebugTraceLogger
+from sentry.spans.segment_assembler import group_by_parent
 from sentry.spans.segment_key import (
     SegmentKey,
     parse_segment_key,
@@ -162,6 +164,9 @@ class SpansBuffer:
         self.assigned_shards = list(assigned_shards)
         self.slice_id = slice_id
         self.any_shard_at_limit = False
+        # Seconds the oldest ready segment of each shard is past its deadline,
+        # as of the last `flush_segments` call.
+        self.shard_lags: dict[int, int] = {}
         self._zstd_decompressor = zstandard.ZstdDecompressor()
         self._buffer_logger = BufferLogger()
         self._flusher_logger = FlusherLogger()
@@ -277,7 +282,10 @@ class SpansBuffer:
         Sequence[Sequence[Subsegment]],
     ]:
         with metrics.timer("spans.buffer.process_spans.push_payloads"):
-            trees = self._group_by_parent(spans)
+            if options.get("spans.buffer.columnar-grouping"):
+                trees = group_by_parent(spans)
+            else:
+                trees = self._group_by_parent(spans)
             subsegments = self._build_subsegments(trees, max_spans_per_evalsha)
             subsegment_batches = self._batch_subsegments(subsegments, pipeline_batch_size)
             self.store.store_payloads(
@@ -423,7 +431,7 @@ class SpansBuffer:
     def get_memory_info(self) -> Generator[ServiceMemory]:
         return iter_cluster_memory_usage(self.client)
 
-    def flush_segments(self, now: int) -> dict[SegmentKey, FlushedSegment]:
+    def flush_segments(self, now: int, offset: int = 0) -> dict[SegmentKey, FlushedSegment]:
         """
         Select queued segments and prepare them for Kafka production.
 
@@ -431,6 +439,9 @@ class SpansBuffer:
         per-segment locks, load payload data, emit loss/flush observability, and
         return producer-ready FlushedSegment objects. SpanFlusher produces those
         objects to Kafka and calls done_flush_segments after successful delivery.
+
+        :param offset: The number of ready segments to skip per shard, used
+            when helping out with shards another flusher is working on.
         """
         shard_factor = max(1, len(self.assigned_shards))
         max_flush_segments = options.get("spans.buffer.max-flush-segments")
@@ -439,7 +450,10 @@ class SpansBuffer:
         flush_candidates, load_ids_latency_ms = self.store.load_flush_candidates(
             now,
             max_segments_per_shard,
+            offset,
         )
+        if offset == 0:
+            self._record_shard_lags(flush_candidates, now)
 
         flush_candidates = self.store.acquire_flush_locks(flush_candidates)
 
@@ -469,6 +483,18 @@ class SpansBuffer:
         self.any_shard_at_limit = any_shard_at_limit
         return flushed_segments
 
+    def _record_shard_lags(self, flush_candidates: Sequence[FlushCandidate], now: int) -> None:
+        shard_lags = dict.fromkeys(self.assigned_shards, 0)
+        for flush_candidate in flush_candidates:
+            # Candidates are sorted by deadline, the first one of a shard is
+            # its oldest.
+            if shard_lags.get(flush_candidate.shard) == 0:
+                shard_lags[flush_candidate.shard] = max(0, now - int(flush_candidate.score))
+
+        for shard, lag in shard_lags.items():
+            metrics.timing("spans.buffer.flush_segments.lag", lag, tags={"shard_i": shard})
+        self.shard_lags = shard_lags
+
     def _build_flushed_segments(
         self,
         loaded_segments: Sequence[LoadedSegment],
@@ -300,9 +300,11 @@ class SpansBufferStore:
         self,
         cutoff: int,
         max_segments_per_shard: int,
+        offset: int = 0,
     ) -> tuple[list[FlushCandidate], int]:
         """
-        Read queued segments whose deadline is at or before the cutoff.
+        Read queued segments whose deadline is at or before the cutoff,
+        skipping the `offset` oldest ones of every shard.
 
         Returns flush candidates paired with the total Redis read latency.
         """
@@ -314,7 +316,12 @@ class SpansBufferStore:
                 for shard in self.assigned_shards:
                     key = self.get_queue_key(shard)
                     p.zrangebyscore(
-                        key, 0, cutoff, start=0, num=max_segments_per_shard, withscores=True
+                        key,
+                        0,
+                        cutoff,
+                        start=offset,
+                        num=max_segments_per_shard,
+                        withscores=True,
                     )
                     queue_keys.append(key)
 
@@ -4,7 +4,7 @@ import multiprocessing.context
 import multiprocessing.process
 import threading
 import time
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Collection, Mapping
 from concurrent.futures import Future
 from functools import partial
 from typing import Any
@@ -122,6 +122,39 @@ class MultiProducer:
             producer.close()
 
 
+class ShardBacklog:
+    """
+    The flush lag of every shard of a consumer, shared between its flusher
+    processes.
+
+    Every process publishes the lag of its own shards after each flush. A
+    process which has nothing to flush itself can then help out with the
+    shard which is furthest behind, by flushing the segments after the page
+    its owner is working on. Per-segment flush locks keep both processes from
+    producing the same segment.
+    """
+
+    def __init__(self, mp_context: multiprocessing.context.SpawnContext, shards: list[int]):
+        self.shards = list(shards)
+        self.lags = mp_context.Array("i", len(self.shards), lock=False)
+
+    def update(self, shard_lags: Mapping[int, int]) -> None:
+        for shard, lag in shard_lags.items():
+            self.lags[self.shards.index(shard)] = lag
+
+    def most_behind(self, exclude: Collection[int], min_lag: int) -> int | None:
+        """
+        Return the shard with the highest lag of at least `min_lag` seconds,
+        other than the excluded ones.
+        """
+        candidates = [
+            (lag, shard)
+            for shard, lag in zip(self.shards, self.lags)
+            if shard not in exclude and lag >= min_lag
+        ]
+        return max(candidates)[1] if candidates else None
+
+
 class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
     """
     A background multiprocessing manager that polls Redis for new segments to flush and to produce to Kafka.
@@ -171,6 +204,7 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
         }
         self.process_restarts = {process_index: 0 for process_index in range(self.num_processes)}
         self.buffers: dict[int, SpansBuffer] = {}
+        self.shard_backlog = ShardBacklog(mp_context, buffer.assigned_shards)
 
         self._create_processes()
 
@@ -245,6 +279,7 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
                 self.process_backpressure_since[process_index],
                 self.process_healthy_since[process_index],
                 self.produce_to_pipe,
+                self.shard_backlog,
             ),
             daemon=True,
         )
@@ -271,6 +306,7 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
         backpressure_since,
         healthy_since,
         produce_to_pipe: ProduceToPipe | None,
+        shard_backlog: ShardBacklog | None = None,
     ) -> None:
         logger.info("Flusher process main started for shards %s", shards)
 
@@ -307,11 +343,18 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
                         (project_id, producer_manager.produce(payload), dropped)
                     )
 
+            # Buffers for shards of other processes, see `ShardBacklog`
+            assist_buffers: dict[int, SpansBuffer] = {}
+
             first_iteration = True
             while not stopped.value:
                 system_now = int(time.time())
                 now = system_now + current_drift.value
                 flushed_segments = buffer.flush_segments(now=now)
+                flush_buffer = buffer
+
+                if shard_backlog is not None:
+                    shard_backlog.update(buffer.shard_lags)
 
                 if first_iteration:
                     logger.info("Flusher first flush_segments completed for shards %s", shard_tag)
@@ -330,6 +373,22 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
                     logger.info("Flusher process healthy for shards %s", shard_tag)
                     first_iteration = False
 
+                if not flushed_segments and shard_backlog is not None:
+                    assist_shard = SpanFlusher._get_assist_shard(shard_backlog, shards)
+                    if assist_shard is not None:
+                        flush_buffer = assist_buffers.get(assist_shard)
+                        if flush_buffer is None:
+                            flush_buffer = assist_buffers[assist_shard] = SpansBuffer(
+                                [assist_shard], slice_id=buffer.slice_id
+                            )
+                        flushed_segments = flush_buffer.flush_segments(
+                            now=now, offset=options.get("spans.buffer.max-flush-segments")
+                        )
+                        metrics.incr(
+                            "spans.buffer.flusher.assist",
+                            tags={"shard": shard_tag, "assist_shard": assist_shard},
+                        )
+
                 if not flushed_segments:
                     time.sleep(1)
                     continue
@@ -412,7 +471,12 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
 
                 producer_futures.clear()
 
-                buffer.done_flush_segments(flushed_segments)
+                flush_buffer.done_flush_segments(flushed_segments)
+                metrics.incr(
+                    "spans.buffer.flusher.flushed_segments",
+                    amount=len(flushed_segments),
+                    tags={"shard": shard_tag, "assist": flush_buffer is not buffer},
+                )
 
             if producer_manager is not None:
                 producer_manager.close()
@@ -426,6 +490,14 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
 
             connections.close_all()
 
+    @staticmethod
+    def _get_assist_shard(shard_backlog: ShardBacklog, shards: list[int]) -> int | None:
+        # Without flush locks, two processes could produce the same segment.
+        assist_lag = options.get("spans.buffer.flusher.assist-lag-seconds")
+        if assist_lag <= 0 or options.get("spans.buffer.flusher.flush-lock-ttl") <= 0:
+            return None
+        return shard_backlog.most_behind(exclude=shards, min_lag=assist_lag)
+
     def poll(self) -> None:
         self.next_step.poll()
 
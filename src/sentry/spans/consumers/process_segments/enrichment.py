@@ -55,6 +55,7 @@ SHARED_SENTRY_ATTRIBUTES = (
     "sentry.user.geo.subdivision",
     "sentry.user.geo.subregion",
 )
+_SHARED_SENTRY_ATTRIBUTES_SET = frozenset(SHARED_SENTRY_ATTRIBUTES)
 
 # The name of the main thread used to infer the `main_thread` flag in spans from
 # mobile applications.
@@ -97,6 +98,19 @@ class TreeEnricher:
         self._ttid_ts = _timestamp_by_op(spans, "ui.load.initial_display")
         self._ttfd_ts = _timestamp_by_op(spans, "ui.load.full_display")
 
+        # Everything derived from the segment span is the same for all spans,
+        # so it is computed once per segment rather than once per span.
+        self._shared_attrs: dict[str, Any] = {}
+        self._is_mobile = False
+        self._mobile_start_type: str | None = None
+        if self._segment_span is not None:
+            segment_attrs = self._segment_span.get("attributes") or {}
+            self._shared_attrs = {
+                k: v for k, v in segment_attrs.items() if k in _SHARED_SENTRY_ATTRIBUTES_SET
+            }
+            self._is_mobile = attribute_value(self._segment_span, "sentry.mobile") == "true"
+            self._mobile_start_type = _get_mobile_start_type(self._segment_span)
+
         self._span_intervals: dict[str, list[tuple[int, int]]] = {}
         self._spans_by_id: dict[str, SpanEvent] = {}
         for span in spans:
@@ -106,6 +120,10 @@ class TreeEnricher:
                 interval = _span_interval(span)
                 self._span_intervals.setdefault(parent_span_id, []).append(interval)
 
+        # Sort by start ASC, end DESC to skip over nested intervals efficiently
+        for intervals in self._span_intervals.values():
+            intervals.sort(key=_interval_sort_key)
+
     def _attributes(self, span: SpanEvent) -> dict[str, Any]:
         attributes: dict[str, Any] = {**(span.get("attributes") or {})}
 
@@ -117,22 +135,16 @@ class TreeEnricher:
             # Assume that Relay has extracted the shared tags into `data` on the
             # root span. Once `sentry_tags` is removed, the logic from
             # `extract_shared_tags` should be moved here.
-            segment_attrs = self._segment_span.get("attributes") or {}
-            shared_attrs = {k: v for k, v in segment_attrs.items() if k in SHARED_SENTRY_ATTRIBUTES}
-
-            is_mobile = attribute_value(self._segment_span, "sentry.mobile") == "true"
-            mobile_start_type = _get_mobile_start_type(self._segment_span)
-
-            if is_mobile:
+            if self._is_mobile:
                 # NOTE: Like in Relay's implementation, shared tags are added at the
                 # very end. This does not have access to the shared tag value. We
                 # keep behavior consistent, although this should be revisited.
                 if get_value("sentry.thread.name") == MOBILE_MAIN_THREAD_NAME:
                     attributes["sentry.main_thread"] = {"type": "string", "value": "true"}
-                if not get_value("sentry.app_start_type") and mobile_start_type:
+                if not get_value("sentry.app_start_type") and self._mobile_start_type:
                     attributes["sentry.app_start_type"] = {
                         "type": "string",
-                        "value": mobile_start_type,
+                        "value": self._mobile_start_type,
                     }
 
             if self._ttid_ts is not None and span["end_timestamp"] <= self._ttid_ts:
@@ -140,7 +152,7 @@ class TreeEnricher:
             if self._ttfd_ts is not None and span["end_timestamp"] <= self._ttfd_ts:
                 attributes["sentry.ttfd"] = {"type": "string", "value": "ttfd"}
 
-            for key, value in shared_attrs.items():
+            for key, value in self._shared_attrs.items():
                 if attributes.get(key) is None:
                     attributes[key] = value
 
@@ -196,9 +208,7 @@ class TreeEnricher:
         of all time intervals where no child span was active.
         """
 
-        intervals = self._span_intervals.get(span["span_id"], [])
-        # Sort by start ASC, end DESC to skip over nested intervals efficiently
-        intervals.sort(key=lambda x: (x[0], -x[1]))
+        intervals = self._span_intervals.get(span["span_id"], ())
 
         exclusive_time_us: int = 0  # microseconds to prevent rounding issues
         start, end = _span_interval(span)
@@ -266,6 +276,10 @@ def _span_interval(span: SpanEvent) -> tuple[int, int]:
     return _us(span["start_timestamp"]), _us(span["end_timestamp"])
 
 
+def _interval_sort_key(interval: tuple[int, int]) -> tuple[int, int]:
+    return interval[0], -interval[1]
+
+
 def _us(timestamp: float) -> int:
     """Convert the floating point duration or timestamp to integer microsecond
     precision."""
@@ -307,10 +321,18 @@ def _compute_span_ops(spans: Sequence[SpanEvent], config: Any) -> dict[str, floa
     if not matches:
         return {}
 
+    # Segments contain few distinct ops, so matches are resolved once per op.
+    operation_names: dict[str, str | None] = {}
     intervals_by_op = defaultdict(list)
     for span in spans:
         op = get_span_op(span)
-        if operation_name := next(filter(lambda m: op.startswith(m), matches), None):
+        try:
+            operation_name = operation_names[op]
+        except KeyError:
+            operation_name = operation_names[op] = next(
+                (m for m in matches if op.startswith(m)), None
+            )
+        if operation_name:
             intervals_by_op[operation_name].append(_span_interval(span))
 
     ret: dict[str, float] = {}
@@ -331,11 +353,12 @@ def _get_duration_us(intervals: list[tuple[int, int]]) -> int:
     duration = 0
     last_end = 0
 
-    intervals.sort(key=lambda x: (x[0], -x[1]))
+    intervals.sort(key=_interval_sort_key)
     for start, end in intervals:
-        # Ensure the current interval doesn't overlap with the last one
+        # Ensure the current interval doesn't overlap with the ones before. An
+        # interval nested in an earlier one must not move `last_end` back.
         start = max(start, last_end)
         duration += max(end - start, 0)
-        last_end = end
+        last_end = max(last_end, end)
 
     return duration
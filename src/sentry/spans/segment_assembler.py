@@ -0,0 +1,111 @@
+"""
+Columnar assembly of subsegments from a batch of spans.
+
+`SpansBuffer._group_by_parent` keeps one list per partial tree and merges
+those lists whenever a parent shows up after its children, so a deep tree
+which arrives bottom-up is copied over and over again.
+
+Here the batch is staged as parallel columns instead -- an interned
+`project_id:trace_id` index, the span ID and the effective parent ID per row --
+and every row is linked to the row of its parent within the batch. Following
+those links (with path compression) resolves the top-most known parent of
+every span while touching each row a constant number of times, regardless of
+the order spans arrive in. Subsegments keep their spans in arrival order.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+
+from sentry.spans.buffer_types import Span
+
+_UNRESOLVED = -1
+_ON_PATH = -2
+
+
+class SpanColumns:
+    """
+    A batch of spans, stored column by column.
+    """
+
+    __slots__ = ("spans", "traces", "trace_index", "span_ids", "parent_ids")
+
+    def __init__(self, spans: Sequence[Span]) -> None:
+        self.spans = spans
+        # Distinct `project_id:trace_id` strings, referenced by `trace_index`
+        self.traces: list[str] = []
+        self.trace_index = array("l")
+        self.span_ids: list[str] = []
+        self.parent_ids: list[str] = []
+
+        interned: dict[tuple[int, str], int] = {}
+        for span in spans:
+            trace_key = (span.project_id, span.trace_id)
+            index = interned.get(trace_key)
+            if index is None:
+                index = interned[trace_key] = len(self.traces)
+                self.traces.append(f"{span.project_id}:{span.trace_id}")
+            self.trace_index.append(index)
+            self.span_ids.append(span.span_id)
+            self.parent_ids.append(span.effective_parent_id())
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def parent_rows(self) -> array[int]:
+        """
+        The row of every span's parent within the batch, or the span's own row
+        if its parent is not part of the batch or it is a segment span.
+        """
+        rows: dict[tuple[int, str], int] = {}
+        for row, span_id in enumerate(self.span_ids):
+            rows.setdefault((self.trace_index[row], span_id), row)
+
+        links = array("l", range(len(self)))
+        for row, parent_id in enumerate(self.parent_ids):
+            if parent_id != self.span_ids[row]:
+                links[row] = rows.get((self.trace_index[row], parent_id), row)
+        return links
+
+    def root_rows(self) -> array[int]:
+        """
+        The row of every span's top-most ancestor within the batch.
+        """
+        links = self.parent_rows()
+        roots = array("l", [_UNRESOLVED]) * len(self)
+
+        path: list[int] = []
+        for row in range(len(self)):
+            current = row
+            while roots[current] == _UNRESOLVED:
+                roots[current] = _ON_PATH
+                path.append(current)
+                if links[current] == current:
+                    break
+                current = links[current]
+
+            # `current` either has been resolved before, is a root, or closes a
+            # cycle of spans which are each other's parents.
+            root = roots[current] if roots[current] >= 0 else current
+            for visited in path:
+                roots[visited] = root
+            path.clear()
+
+        return roots
+
+
+def group_by_parent(spans: Sequence[Span]) -> dict[tuple[str, str], list[Span]]:
+    """
+    Same as `SpansBuffer._group_by_parent`: groups spans by their top-most
+    known parent span ID, keyed by `(project_and_trace, parent_span_id)`.
+    """
+    columns = SpanColumns(spans)
+    trees: dict[tuple[str, str], list[Span]] = {}
+    for span, root in zip(spans, columns.root_rows()):
+        key = (columns.traces[columns.trace_index[root]], columns.parent_ids[root])
+        subsegment = trees.get(key)
+        if subsegment is None:
+            subsegment = trees[key] = []
+        subsegment.append(span)
+    return trees
@@ -127,9 +127,13 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
     """
     from sentry.models.project import Project
     from sentry.models.projectkey import ProjectKey
+    from sentry.relay.config import ConfigSectionCache
 
     validate_args(organization_id, project_id, public_key)
     configs = {}
+    # Keys of the same project, and projects of the same organization, share
+    # most of their config, which only has to be computed once.
+    section_cache = ConfigSectionCache()
 
     if organization_id:
         # We want to re-compute all projects in an organization, instead of simply
@@ -147,7 +151,7 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
                     # recalculate it.  If the config was not there at all, we leave it and avoid the
                     # cost of re-computation.
                     if projectconfig_cache.backend.get(key.public_key) is not None:
-                        configs[key.public_key] = compute_projectkey_config(key)
+                        configs[key.public_key] = compute_projectkey_config(key, section_cache)
                         action = "recompute"
                     else:
                         action = "not-cached"
@@ -163,7 +167,7 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
                 # recalculate it.  If the config was not there at all, we leave it and avoid the
                 # cost of re-computation.
                 if projectconfig_cache.backend.get(key.public_key) is not None:
-                    configs[key.public_key] = compute_projectkey_config(key)
+                    configs[key.public_key] = compute_projectkey_config(key, section_cache)
                     action = "recompute"
                 else:
                     action = "not-cached"
@@ -193,9 +197,11 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
     return configs
 
 
-def compute_projectkey_config(key):
+def compute_projectkey_config(key, section_cache=None):
     """Computes a single config for the given :class:`ProjectKey`.
 
+    :param section_cache: A :class:`ConfigSectionCache` shared by all configs computed
+       together.
     :returns: A dict with the project config.
     """
     from sentry.models.projectkey import ProjectKeyStatus
@@ -207,7 +213,9 @@ def compute_projectkey_config(key):
         # Clear the local options cache; if any of them changed, we may need to get the latest values,
         OrganizationOption.objects.reload_task_local_cache(key.project.organization_id)
 
-        return get_project_config(key.project, project_keys=[key]).to_dict()
+        return get_project_config(
+            key.project, project_keys=[key], section_cache=section_cache
+        ).to_dict()
 
 
 @instrumented_task(
@@ -474,8 +474,7 @@ def repair_denormalizations(
 
     # Don't do MinHash work if we use embeddings-based similarity.
     if not project.get_option("sentry:similarity_backfill_completed"):
-        for event in events:
-            similarity.record(project, [event])
+        similarity.record_many(project, events)
 
 
 def lock_hashes(project_id: int, source_id: int, fingerprints: Sequence[str]) -> list[str]:
@@ -47,6 +47,8 @@ class RateLimitMeta:
         limit (int): max number of requests per window
         window (int): window size in seconds
         reset_time (int): UTC Epoch time in seconds when the current window expires
+        combined_limiter (bool): the limits were checked with the combined limiter, which then
+            also has to give back the concurrent request slot
     """
 
     rate_limit_type: RateLimitType
@@ -58,6 +60,7 @@ class RateLimitMeta:
     reset_time: int
     concurrent_limit: int | None
     concurrent_requests: int | None
+    combined_limiter: bool = False
 
     @property
     def concurrent_remaining(self) -> int | None:
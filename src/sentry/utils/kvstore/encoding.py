@@ -1,4 +1,4 @@
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from datetime import timedelta
 
 from sentry.utils.codecs import Codec, TDecoded, TEncoded
@@ -34,6 +34,11 @@ class KVStorageCodecWrapper(KVStorage[K, TDecoded]):
     def set(self, key: K, value: TDecoded, ttl: timedelta | None = None) -> None:
         return self.store.set(key, self.value_codec.encode(value), ttl)
 
+    def set_many(self, items: Mapping[K, TDecoded], ttl: timedelta | None = None) -> None:
+        return self.store.set_many(
+            {key: self.value_codec.encode(value) for key, value in items.items()}, ttl
+        )
+
     def delete(self, key: K) -> None:
         return self.store.delete(key)
 
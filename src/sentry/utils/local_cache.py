@@ -1,9 +1,14 @@
 import hashlib
 import threading
 from collections import OrderedDict
-from collections.abc import Iterator
+from collections.abc import Callable, Generator, Iterator
+from contextlib import contextmanager
 from typing import Protocol
 
+import cachetools
+
+from sentry import options
+
 
 class Cache[K, V](Protocol):
     def __contains__(self, key: K) -> bool: ...
@@ -61,6 +66,44 @@ class LRUCache[K, V]:
         yield from self.cache.items()
 
 
+class SizedLRUCache[K, V](LRUCache[K, V]):
+    """
+    An LRU cache which, next to the number of entries, bounds the total size
+    of its values as reported by `sizeof`. Values larger than `maxsize` are
+    not stored at all, rather than flushing the whole cache.
+    """
+
+    def __init__(self, maxlen: int, maxsize: int, sizeof: Callable[[V], int]) -> None:
+        super().__init__(maxlen)
+        self.maxsize = maxsize
+        self.sizeof = sizeof
+        self.sizes: dict[K, int] = {}
+        self.size = 0
+
+    def __delitem__(self, key: K) -> None:
+        super().__delitem__(key)
+        self.size -= self.sizes.pop(key)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.pop(key)
+
+        size = self.sizeof(value)
+        if size > self.maxsize:
+            return
+
+        self.cache[key] = value
+        self.sizes[key] = size
+        self.size += size
+        while len(self.cache) > self.maxlen or self.size > self.maxsize:
+            evicted, _ = self.cache.popitem(last=False)
+            self.size -= self.sizes.pop(evicted)
+
+    def pop(self, key: K) -> V | None:
+        if key in self.sizes:
+            self.size -= self.sizes.pop(key)
+        return super().pop(key)
+
+
 class ThreadSafeCache[K, V]:
     def __init__(self, cache: Cache[K, V]) -> None:
         self.cache = cache
@@ -166,3 +209,39 @@ class SizedKeyCache[V]:
         """
         digest = hashlib.blake2b(key.encode(), digest_size=15).digest()
         return int.from_bytes(digest, "big")
+
+
+class OptionSizedCache[K, V]:
+    """
+    A process-local cache whose maximum size is read from an option, so that it can be resized, or
+    disabled by setting the option to 0, at runtime. Resizing starts over with an empty cache.
+
+    Processes can't see each other's invalidations, so entries which can go stale should be given
+    a `ttl` bounding how long they're used for.
+    """
+
+    def __init__(self, size_option: str, ttl: float | None = None) -> None:
+        self.size_option = size_option
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._cache: cachetools.Cache[K, V] | None = None
+
+    @contextmanager
+    def locked(self) -> Generator[cachetools.Cache[K, V] | None]:
+        """
+        Hold the lock and yield the cache, or None if it's disabled.
+        """
+        size = options.get(self.size_option)
+        with self._lock:
+            if size <= 0:
+                self._cache = None
+            elif self._cache is None or self._cache.maxsize != size:
+                if self.ttl is None:
+                    self._cache = cachetools.LRUCache(maxsize=size)
+                else:
+                    self._cache = cachetools.TTLCache(maxsize=size, ttl=self.ttl)
+            yield self._cache
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache = None
@@ -6,8 +6,10 @@ import logging
 import math
 import os
 import re
+import threading
+import uuid
 from collections import namedtuple
-from collections.abc import Callable, Collection, Mapping, MutableMapping, Sequence
+from collections.abc import Callable, Collection, Generator, Mapping, MutableMapping, Sequence
 from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
@@ -20,7 +22,6 @@ import sentry_sdk.scope
 import urllib3
 from dateutil.parser import parse as parse_datetime
 from django.conf import settings
-from django.core.cache import cache
 from sentry_sdk.traces import StreamedSpan
 from sentry_sdk.tracing_utils import has_span_streaming_enabled
 from snuba_sdk import Column, DeleteQuery, Function, MetricsQuery, Request
@@ -40,7 +41,9 @@ from sentry.models.projectkey import ProjectKey
 from sentry.models.release import Release
 from sentry.models.releases.release_project import ReleaseProject
 from sentry.net.http import connection_from_url
+from sentry.ratelimits.concurrent import ConcurrentRateLimiter
 from sentry.services.eventstore.query_preprocessing import get_all_merged_group_ids
+from sentry.snuba import query_cache
 from sentry.snuba.dataset import Dataset
 from sentry.snuba.events import Columns
 from sentry.snuba.query_sources import QuerySource
@@ -581,9 +584,75 @@ _snuba_pool = connection_from_url(
         allowed_methods={"GET", "POST", "DELETE"},
     ),
     timeout=settings.SENTRY_SNUBA_TIMEOUT,
-    maxsize=10,
+    maxsize=settings.SENTRY_SNUBA_POOL_SIZE,
 )
 
+# Runs the queries of bulk requests concurrently. It is shared by all requests
+# of a process instead of being spun up per bulk request, and is sized like
+# the connection pool, so that queries never wait for a connection.
+_query_executor: ContextPropagatingThreadPoolExecutor | None = None
+_query_executor_lock = threading.Lock()
+
+
+def _get_query_executor() -> ContextPropagatingThreadPoolExecutor:
+    global _query_executor
+    if _query_executor is None:
+        with _query_executor_lock:
+            if _query_executor is None:
+                _query_executor = ContextPropagatingThreadPoolExecutor(
+                    thread_name_prefix=__name__,
+                    max_workers=settings.SENTRY_SNUBA_POOL_SIZE,
+                )
+    return _query_executor
+
+
+def _reset_query_executor() -> None:
+    # Worker threads do not survive a fork, the child starts its own pool.
+    global _query_executor, _query_executor_lock
+    _query_executor = None
+    _query_executor_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_query_executor)
+
+_concurrent_limiter: ConcurrentRateLimiter | None = None
+
+
+def _get_concurrent_limiter() -> ConcurrentRateLimiter:
+    global _concurrent_limiter
+    if _concurrent_limiter is None:
+        _concurrent_limiter = ConcurrentRateLimiter()
+    return _concurrent_limiter
+
+
+@contextmanager
+def _referrer_concurrency_limit(referrer: str) -> Generator[None]:
+    """
+    Enforce `SENTRY_SNUBA_REFERRER_CONCURRENCY_LIMITS` across all processes,
+    so that a single referrer cannot use up the concurrent queries Snuba allows.
+    """
+    limit = settings.SENTRY_SNUBA_REFERRER_CONCURRENCY_LIMITS.get(referrer)
+    if limit is None:
+        yield
+        return
+
+    limiter = _get_concurrent_limiter()
+    key = f"snuba:{referrer}"
+    request_uid = uuid.uuid4().hex
+    limit_info = limiter.start_request(key, limit, request_uid)
+    if limit_info.limit_exceeded:
+        metrics.incr("snuba.client.referrer_concurrency_limited", tags={"referrer": referrer})
+        raise RateLimitExceeded(
+            f"Too many concurrent queries for referrer {referrer}",
+            policy="referrer_concurrency_limit",
+            rejection_threshold=limit,
+            quota_used=limit_info.current_executions,
+        )
+    try:
+        yield
+    finally:
+        limiter.finish_request(key, request_uid)
+
 
 epoch_naive = datetime(1970, 1, 1, tzinfo=None)
 
@@ -1177,8 +1246,9 @@ def get_cache_key(query: Request) -> str:
     else:
         hashable = json.dumps(query)
 
-    # sqc - Snuba Query Cache
-    return f"sqc:{sha1(hashable.encode('utf-8')).hexdigest()}"
+    # sqc - Snuba Query Cache. Version 2 entries are zstd-compressed, which
+    # version 1 readers cannot decode.
+    return f"sqc2:{sha1(hashable.encode('utf-8')).hexdigest()}"
 
 
 def _apply_cache_and_build_results(
@@ -1204,35 +1274,52 @@ def _apply_cache_and_build_results(
 
     results = []
 
-    to_query: list[tuple[int, SnubaRequest, str | None]] = []
+    to_query: list[tuple[int, SnubaRequest, query_cache.CacheLookup | None]] = []
+    to_wait: list[tuple[int, SnubaRequest, query_cache.CacheLookup]] = []
 
     if use_cache:
-        cache_keys = [
-            get_cache_key(snuba_request.request) for _, snuba_request in snuba_requests_list
-        ]
-        cache_data = cache.get_many(cache_keys)
-        for (query_pos, snuba_request), cache_key in zip(snuba_requests_list, cache_keys):
-            cached_result = cache_data.get(cache_key)
-            metric_tags = {"referrer": snuba_request.referrer} if snuba_request.referrer else None
-            if cached_result is None:
-                metrics.incr("snuba.query_cache.miss", tags=metric_tags)
-                to_query.append((query_pos, snuba_request, cache_key))
+        lookups = query_cache.lookup(
+            [
+                (get_cache_key(snuba_request.request), snuba_request.referrer)
+                for _, snuba_request in snuba_requests_list
+            ]
+        )
+        for (query_pos, snuba_request), lookup in zip(snuba_requests_list, lookups):
+            if lookup.status is query_cache.CacheStatus.HIT:
+                results.append((query_pos, lookup.result))
+            elif lookup.status is query_cache.CacheStatus.WAIT:
+                to_wait.append((query_pos, snuba_request, lookup))
             else:
-                metrics.incr("snuba.query_cache.hit", tags=metric_tags)
-                results.append((query_pos, json.loads(cached_result)))
+                to_query.append((query_pos, snuba_request, lookup))
     else:
         for query_pos, snuba_request in snuba_requests_list:
             to_query.append((query_pos, snuba_request, None))
 
     if to_query:
-        query_results = _bulk_snuba_query([item[1] for item in to_query])
-        for result, (query_pos, _, opt_cache_key) in zip(query_results, to_query):
-            if opt_cache_key:
-                cache.set(
-                    opt_cache_key,
-                    json.dumps(result),
-                    settings.SENTRY_SNUBA_CACHE_TTL_SECONDS,
-                )
+        try:
+            query_results = _bulk_snuba_query([item[1] for item in to_query])
+        except Exception:
+            for _, _, opt_lookup in to_query:
+                if opt_lookup:
+                    query_cache.release(opt_lookup)
+            raise
+        for result, (query_pos, _, opt_lookup) in zip(query_results, to_query):
+            if opt_lookup:
+                query_cache.store(opt_lookup, result)
+            results.append((query_pos, result))
+
+    # Identical queries which somebody else is already running. Only if their
+    # result does not show up in time, they are run here.
+    not_coalesced = []
+    for query_pos, snuba_request, lookup in to_wait:
+        result = query_cache.wait_for(lookup)
+        if result is None:
+            not_coalesced.append((query_pos, snuba_request))
+        else:
+            results.append((query_pos, result))
+    if not_coalesced:
+        query_results = _bulk_snuba_query([item[1] for item in not_coalesced])
+        for result, (query_pos, _) in zip(query_results, not_coalesced):
             results.append((query_pos, result))
 
     # Sort so that we get the results back in the original param list order
@@ -1256,23 +1343,19 @@ def _bulk_snuba_query(snuba_requests: Sequence[SnubaRequest]) -> ResultSet:
         set_span_tag(span, "snuba.num_queries", len(snuba_requests_list))
 
         if len(snuba_requests_list) > 1:
-            with ContextPropagatingThreadPoolExecutor(
-                thread_name_prefix=__name__,
-                max_workers=10,
-            ) as query_thread_pool:
-                query_results = list(
-                    query_thread_pool.map(
-                        _snuba_query,
-                        [
-                            (
-                                sentry_sdk.get_isolation_scope(),
-                                sentry_sdk.get_current_scope(),
-                                snuba_request,
-                            )
-                            for snuba_request in snuba_requests_list
-                        ],
-                    )
+            query_results = list(
+                _get_query_executor().map(
+                    _snuba_query,
+                    [
+                        (
+                            sentry_sdk.get_isolation_scope(),
+                            sentry_sdk.get_current_scope(),
+                            snuba_request,
+                        )
+                        for snuba_request in snuba_requests_list
+                    ],
                 )
+            )
         else:
             # No need to submit to the thread pool if we're just performing a single query
             query_results = [
@@ -1451,27 +1534,28 @@ def _snuba_query(
                 # Whether client asked snuba to zstd-compress the resp.
                 sentry_sdk.set_attribute("snuba.request_compressed", should_compress)
 
-                if isinstance(request.query, MetricsQuery):
-                    return (
-                        referrer,
-                        _raw_mql_query(request, headers),
-                        snuba_request.forward,
-                        snuba_request.reverse,
-                    )
-                elif isinstance(request.query, DeleteQuery):
+                with _referrer_concurrency_limit(referrer):
+                    if isinstance(request.query, MetricsQuery):
+                        return (
+                            referrer,
+                            _raw_mql_query(request, headers),
+                            snuba_request.forward,
+                            snuba_request.reverse,
+                        )
+                    elif isinstance(request.query, DeleteQuery):
+                        return (
+                            referrer,
+                            _raw_delete_query(request, headers),
+                            snuba_request.forward,
+                            snuba_request.reverse,
+                        )
+
                     return (
                         referrer,
-                        _raw_delete_query(request, headers),
+                        _raw_snql_query(request, headers),
                         snuba_request.forward,
                         snuba_request.reverse,
                     )
-
-                return (
-                    referrer,
-                    _raw_snql_query(request, headers),
-                    snuba_request.forward,
-                    snuba_request.reverse,
-                )
             except urllib3.exceptions.HTTPError as err:
                 raise SnubaError(err)
 
@@ -0,0 +1,75 @@
+"""
+A process-local cache of the DataConditions making up each DataConditionGroup.
+
+Workflow trigger and action filter evaluation look these up for every event, and the shared cache
+behind `get_data_conditions_for_group` costs a round trip (and an unpickle per condition) each
+time. Condition groups change rarely, so each process keeps its own copy for a short while.
+"""
+
+from collections.abc import Callable, Collection, Iterable, Mapping
+
+from sentry.utils.local_cache import OptionSizedCache
+from sentry.workflow_engine.models.data_condition import DataCondition
+from sentry.workflow_engine.utils.metrics import metrics_incr
+
+CACHE_TTL = 10
+METRIC_PREFIX = "workflow_engine.cache.condition_plans"
+
+_cache: OptionSizedCache[int, tuple[DataCondition, ...]] = OptionSizedCache(
+    "workflow_engine.condition_plan_cache_size", ttl=CACHE_TTL
+)
+# Bumped on every invalidation, so results fetched while an invalidation happened aren't cached.
+_version = 0
+
+
+def get_conditions_by_condition_group(
+    dcg_ids: Collection[int],
+    fetch: Callable[[list[int]], Mapping[int, list[DataCondition]]],
+) -> dict[int, list[DataCondition]]:
+    """
+    Return the DataConditions for each of the given DataConditionGroup ids, using `fetch` to look
+    up the ones that aren't cached in this process.
+    """
+    result: dict[int, list[DataCondition]] = {}
+    with _cache.locked() as local_cache:
+        version = _version
+        if local_cache is not None:
+            for dcg_id in dcg_ids:
+                conditions = local_cache.get(dcg_id)
+                if conditions is not None:
+                    result[dcg_id] = list(conditions)
+
+    missed_ids = [dcg_id for dcg_id in dcg_ids if dcg_id not in result]
+    if local_cache is not None:
+        metrics_incr(f"{METRIC_PREFIX}.hit", len(result))
+        metrics_incr(f"{METRIC_PREFIX}.miss", len(missed_ids))
+    if not missed_ids:
+        return result
+
+    fetched = fetch(missed_ids)
+    result.update(fetched)
+
+    with _cache.locked() as local_cache:
+        if local_cache is not None and version == _version:
+            for dcg_id, conditions in fetched.items():
+                local_cache[dcg_id] = tuple(conditions)
+
+    return result
+
+
+def invalidate_condition_plans(dcg_ids: Iterable[int]) -> None:
+    global _version
+
+    with _cache.locked() as local_cache:
+        _version += 1
+        if local_cache is not None:
+            for dcg_id in dcg_ids:
+                local_cache.pop(dcg_id, None)
+
+
+def clear_condition_plans() -> None:
+    global _version
+
+    with _cache.locked():
+        _version += 1
+    _cache.clear()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from collections import defaultdict
 from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
@@ -429,6 +430,17 @@ def get_condition_query_groups(
     return condition_groups
 
 
+def _split_groups_by_organization(groups: list[GroupValues]) -> list[list[GroupValues]]:
+    """
+    Split the given groups into one list per organization. (If there are no groups at all, there's
+    still a single, empty list, so that queries for them behave the same as before.)
+    """
+    groups_by_org: dict[int, list[GroupValues]] = defaultdict(list)
+    for group in groups:
+        groups_by_org[group["project__organization_id"]].append(group)
+    return list(groups_by_org.values()) or [groups]
+
+
 @metrics.wraps(
     "workflow_engine.delayed_workflow.get_condition_group_results",
     # We want this to be accurate enough for alerting, so sample 100%
@@ -446,11 +458,12 @@ def get_condition_group_results(
     for time_and_groups in queries_to_groups.values():
         all_group_ids.update(time_and_groups.group_ids)
 
-    all_groups: list[GroupValues] = list(
-        Group.objects.filter(id__in=all_group_ids).values(
+    groups_by_id: dict[GroupId, GroupValues] = {
+        group["id"]: group
+        for group in Group.objects.filter(id__in=all_group_ids).values(
             "id", "type", "project_id", "project__organization_id"
         )
-    )
+    }
 
     last_try = False
     if task := current_task():
@@ -459,7 +472,9 @@ def get_condition_group_results(
     for unique_condition, time_and_groups in queries_to_groups.items():
         handler = unique_condition.handler()
         group_ids = time_and_groups.group_ids
-        groups_to_query = [group for group in all_groups if group["id"] in group_ids]
+        groups_to_query = [
+            groups_by_id[group_id] for group_id in sorted(group_ids) if group_id in groups_by_id
+        ]
         time = time_and_groups.timestamp or current_time
 
         _, duration = handler.intervals[unique_condition.interval]
@@ -470,30 +485,42 @@ def get_condition_group_results(
                 unique_condition.comparison_interval
             )
 
-        try:
-            result = handler.get_rate_bulk(
-                duration=duration,
-                groups=groups_to_query,
-                environment_id=unique_condition.environment_id,
-                current_time=time,
-                comparison_interval=comparison_interval,
-                filters=unique_condition.filters,
-            )
-            absent_group_ids = group_ids - set(result.keys())
-            if absent_group_ids:
-                logger.warning(
-                    "workflow_engine.delayed_workflow.absent_group_ids",
-                    extra={"group_ids": absent_group_ids, "unique_condition": unique_condition},
+        # Snuba queries are scoped to a single organization, so queries shared by groups from
+        # several organizations (when processing many projects at once) are split up here.
+        result: QueryResult = {}
+        rate_limited = False
+        for org_groups in _split_groups_by_organization(groups_to_query):
+            try:
+                result.update(
+                    handler.get_rate_bulk(
+                        duration=duration,
+                        groups=org_groups,
+                        environment_id=unique_condition.environment_id,
+                        current_time=time,
+                        comparison_interval=comparison_interval,
+                        filters=unique_condition.filters,
+                    )
                 )
-            condition_group_results[unique_condition] = result
-        except RateLimitExceeded as e:
-            # If we're on our final attempt and encounter a rate limit error, we log it and continue.
-            # The condition will evaluate as false, which may be wrong, but this is better for users
-            # than allowing the whole task to fail.
-            if last_try:
-                logger.info("delayed_workflow.snuba_rate_limit_exceeded", extra={"error": e})
-            else:
-                raise
+            except RateLimitExceeded as e:
+                # If we're on our final attempt and encounter a rate limit error, we log it and
+                # continue. The condition will evaluate as false, which may be wrong, but this is
+                # better for users than allowing the whole task to fail.
+                if last_try:
+                    logger.info("delayed_workflow.snuba_rate_limit_exceeded", extra={"error": e})
+                    rate_limited = True
+                else:
+                    raise
+
+        if not result and rate_limited:
+            continue
+
+        absent_group_ids = group_ids - set(result.keys())
+        if absent_group_ids:
+            logger.warning(
+                "workflow_engine.delayed_workflow.absent_group_ids",
+                extra={"group_ids": absent_group_ids, "unique_condition": unique_condition},
+            )
+        condition_group_results[unique_condition] = result
 
     return condition_group_results
 
@@ -733,10 +760,23 @@ def get_groups_to_fire(
 
 @trace
 def bulk_fetch_events(event_ids: list[str], project: Project) -> dict[str, Event]:
-    node_id_to_event_id = {
-        Event.generate_node_id(project.id, event_id=event_id): event_id for event_id in event_ids
+    return bulk_fetch_events_for_projects([(project, event_ids)]).get(project.id, {})
+
+
+@trace
+def bulk_fetch_events_for_projects(
+    project_event_ids: Sequence[tuple[Project, list[str]]],
+) -> dict[int, dict[str, Event]]:
+    """
+    Fetch the events for many projects from nodestore with as few `get_multi` calls as possible,
+    returning them keyed by project ID and then by event ID.
+    """
+    node_id_to_event: dict[str, tuple[Project, str]] = {
+        Event.generate_node_id(project.id, event_id=event_id): (project, event_id)
+        for project, event_ids in project_event_ids
+        for event_id in event_ids
     }
-    node_ids = list(node_id_to_event_id.keys())
+    node_ids = list(node_id_to_event.keys())
     fetch_retry_policy = ConditionalRetryPolicy(should_retry_fetch, exponential_delay(1.00))
 
     bulk_data = {}
@@ -745,14 +785,15 @@ def bulk_fetch_events(event_ids: list[str], project: Project) -> dict[str, Event
             bulk_results = fetch_retry_policy(lambda: nodestore.backend.get_multi(node_id_chunk))
         bulk_data.update(bulk_results)
 
-    result: dict[str, Event] = {}
+    result: dict[int, dict[str, Event]] = defaultdict(dict)
     for node_id, data in bulk_data.items():
         if data is not None:
-            event = Event(event_id=node_id_to_event_id[node_id], project_id=project.id, data=data)
+            project, event_id = node_id_to_event[node_id]
+            event = Event(event_id=event_id, project_id=project.id, data=data)
             # By setting a shared Project, we can ensure that the common pattern of retrieving
             # the project (and fields thereof) from individual events doesn't duplicate work.
             event.project = project
-            result[event.event_id] = event
+            result[project.id][event.event_id] = event
     return result
 
 
@@ -765,11 +806,17 @@ def get_group_to_groupevent(
     event_data: EventRedisData,
     groups_to_dcgs: dict[GroupId, set[DataConditionGroup]],
     project: Project,
+    bulk_event_id_to_events: dict[str, Event] | None = None,
 ) -> dict[Group, tuple[GroupEvent, datetime | None]]:
+    """
+    Map the groups to fire to the events which triggered them. Events are fetched from nodestore
+    unless they've already been fetched (as `bulk_event_id_to_events`).
+    """
     groups = Group.objects.get_many_from_cache(event_data.group_ids)
     group_id_to_group = {group.id: group for group in groups}
 
-    bulk_event_id_to_events = bulk_fetch_events(list(event_data.event_ids), project)
+    if bulk_event_id_to_events is None:
+        bulk_event_id_to_events = bulk_fetch_events(list(event_data.event_ids), project)
     bulk_occurrences: list[IssueOccurrence | None] = []
     if event_data.occurrence_ids:
         bulk_occurrences = IssueOccurrence.fetch_multi(
@@ -912,8 +959,28 @@ def _summarize_by_first[T1, T2: int | str](it: Iterable[tuple[T1, T2]]) -> dict[
     return {key: sorted(values) for key, values in result.items()}
 
 
-def _process_workflows_for_project(project: Project, event_data: EventRedisData) -> None:
-    """Process workflows for a project - evaluate conditions and fire actions."""
+@dataclass(frozen=True)
+class _ProjectEvaluationPlan:
+    """
+    Everything needed to evaluate the slow conditions of a project's buffered events, once the
+    results of the Snuba queries in `condition_groups` are in.
+    """
+
+    project: Project
+    event_data: EventRedisData
+    workflows_to_envs: Mapping[WorkflowId, int | None]
+    data_condition_groups: list[DataConditionGroup]
+    dcg_to_slow_conditions: dict[DataConditionGroupId, list[DataCondition]]
+    condition_groups: dict[UniqueConditionQuery, GroupQueryParams]
+
+
+def _plan_project_evaluation(
+    project: Project, event_data: EventRedisData
+) -> _ProjectEvaluationPlan | None:
+    """
+    Gather the workflows, data condition groups, and unique Snuba queries needed to evaluate a
+    project's buffered events, or return None if there's nothing to evaluate.
+    """
     with start_span(op="delayed_workflow.prepare_data", name="delayed_workflow.prepare_data"):
         if features.has(
             "organizations:workflow-engine-process-workflows-logs", project.organization
@@ -933,7 +1000,7 @@ def _process_workflows_for_project(project: Project, event_data: EventRedisData)
             )
 
         if not event_data.events:
-            return
+            return None
 
         data_condition_groups = fetch_data_condition_groups(list(event_data.dcg_ids))
         dcg_to_slow_conditions = get_slow_conditions_for_groups(list(event_data.dcg_ids))
@@ -963,7 +1030,7 @@ def _process_workflows_for_project(project: Project, event_data: EventRedisData)
         data_condition_groups, event_data, workflows_to_envs, dcg_to_slow_conditions
     )
     if not condition_groups:
-        return
+        return None
     logger.debug(
         "delayed_workflow.condition_query_groups",
         extra={
@@ -972,6 +1039,19 @@ def _process_workflows_for_project(project: Project, event_data: EventRedisData)
         },
     )
 
+    return _ProjectEvaluationPlan(
+        project=project,
+        event_data=event_data,
+        workflows_to_envs=workflows_to_envs,
+        data_condition_groups=data_condition_groups,
+        dcg_to_slow_conditions=dcg_to_slow_conditions,
+        condition_groups=condition_groups,
+    )
+
+
+def _fetch_condition_group_results(
+    condition_groups: dict[UniqueConditionQuery, GroupQueryParams],
+) -> dict[UniqueConditionQuery, QueryResult]:
     try:
         condition_group_results = get_condition_group_results(condition_groups)
     except SnubaError:
@@ -985,14 +1065,25 @@ def _process_workflows_for_project(project: Project, event_data: EventRedisData)
             "condition_group_results": repr_keys(condition_group_results),
         },
     )
+    return condition_group_results
+
+
+def _evaluate_project_plan(
+    plan: _ProjectEvaluationPlan,
+    condition_group_results: dict[UniqueConditionQuery, QueryResult],
+    bulk_event_id_to_events: dict[str, Event] | None = None,
+) -> None:
+    """Evaluate a project's data condition groups against the query results and fire actions."""
+    project = plan.project
+    event_data = plan.event_data
 
     # Evaluate DCGs
     evaluation = get_groups_to_fire(
-        data_condition_groups,
-        workflows_to_envs,
+        plan.data_condition_groups,
+        plan.workflows_to_envs,
         event_data,
         condition_group_results,
-        dcg_to_slow_conditions,
+        plan.dcg_to_slow_conditions,
     )
     metrics.incr(
         "workflow_engine.delayed_workflow.workflow_if_conditions_evaluated",
@@ -1020,6 +1111,7 @@ def _process_workflows_for_project(project: Project, event_data: EventRedisData)
         event_data,
         evaluation.groups_to_fire,
         project,
+        bulk_event_id_to_events,
     )
 
     if evaluation.groups_to_fire and group_to_groupevent:
@@ -1034,6 +1126,16 @@ def _process_workflows_for_project(project: Project, event_data: EventRedisData)
         )
 
 
+def _process_workflows_for_project(project: Project, event_data: EventRedisData) -> None:
+    """Process workflows for a project - evaluate conditions and fire actions."""
+    plan = _plan_project_evaluation(project, event_data)
+    if plan is None:
+        return
+
+    condition_group_results = _fetch_condition_group_results(plan.condition_groups)
+    _evaluate_project_plan(plan, condition_group_results)
+
+
 @trace
 def process_delayed_workflows(
     batch_client: DelayedWorkflowClient, project_id: int, batch_key: str | None = None
@@ -1062,3 +1164,132 @@ def process_delayed_workflows(
     # redis data and can delete it. If we fail, it'll raise and we'll either
     # read it again on retry or let it ttl out.
     cleanup_redis_buffer(project_client, event_keys, batch_key)
+
+
+# Fraction of a condition's interval that the point in time it queries back from may be moved by.
+QUERY_TIMESTAMP_RESOLUTION = 60
+
+
+def _bucket_query_timestamp(
+    query: UniqueConditionQuery, timestamp: datetime | None
+) -> datetime | None:
+    """
+    Round the point in time a query looks back from up to a multiple of 1/60th of the condition's
+    interval (but at least a second), so the same query from projects whose latest events are a
+    few seconds apart can be shared.
+
+    The window of each project is therefore shifted up to 1/60th of the interval (a minute for
+    "1h") later than it would be on its own. Its latest events are still inside the window, but
+    events from the very start of it may fall out.
+    """
+    if timestamp is None:
+        return None
+
+    _, duration = query.handler.intervals[query.interval]
+    resolution = max(duration.total_seconds() / QUERY_TIMESTAMP_RESOLUTION, 1.0)
+    return datetime.fromtimestamp(
+        math.ceil(timestamp.timestamp() / resolution) * resolution, tz=timestamp.tzinfo
+    )
+
+
+@trace
+def process_delayed_workflows_for_projects(
+    batch_client: DelayedWorkflowClient, project_ids: Sequence[int]
+) -> None:
+    """
+    Like `process_delayed_workflows`, but for many projects at once: the unique Snuba queries of
+    all of the projects are merged (so identical queries are only made once, and compatible ones
+    share a request per organization), and all of their events are fetched from nodestore together.
+
+    Nothing is retried once the first project has fired actions. Each project is evaluated on its
+    own, and its buffer is cleaned up as soon as it's done, so a failing project doesn't affect the
+    others. Projects which fail before anything was evaluated are handed to
+    `process_delayed_workflows`, which retries them on their own.
+    """
+    from sentry.workflow_engine.tasks.delayed_workflows import (
+        process_delayed_workflows as process_delayed_workflows_task,
+    )
+
+    plans: list[tuple[ProjectDelayedWorkflowClient, set[EventKey], _ProjectEvaluationPlan]] = []
+
+    for project_id in project_ids:
+        project_client = batch_client.for_project(project_id)
+        with log_context.new_context(project_id=project_id):
+            try:
+                redis_data = project_client.get_hash_data(None)
+                event_data = EventRedisData.from_redis_data(redis_data, continue_on_error=True)
+                event_keys = set(event_data.events.keys())
+
+                metrics.incr(
+                    "workflow_engine.delayed_workflow",
+                    amount=len(event_data.events),
+                )
+
+                project = fetch_project(project_id)
+                plan = _plan_project_evaluation(project, event_data) if project else None
+            except Exception:
+                logger.exception("delayed_workflow.plan_project_failed")
+                process_delayed_workflows_task.apply_async(
+                    kwargs={"project_id": project_id},
+                    headers={"sentry-propagate-traces": False},
+                )
+                continue
+
+        if plan is None:
+            # Either the project is gone or there's nothing to evaluate, so we're done here, but
+            # let's not leave a mess.
+            cleanup_redis_buffer(project_client, event_keys, None)
+        else:
+            plans.append((project_client, event_keys, plan))
+
+    if not plans:
+        return
+
+    # Queries are shared between projects that query back from the same bucketed point in time,
+    # see `_bucket_query_timestamp`.
+    queries_by_timestamp: dict[datetime | None, dict[UniqueConditionQuery, GroupQueryParams]] = (
+        defaultdict(lambda: defaultdict(GroupQueryParams))
+    )
+    for _, _, plan in plans:
+        for query, params in plan.condition_groups.items():
+            timestamp = _bucket_query_timestamp(query, params.timestamp)
+            queries_by_timestamp[timestamp][query].update(params.group_ids, timestamp)
+
+    metrics.incr(
+        "workflow_engine.delayed_workflow.merged_condition_queries",
+        amount=sum(len(plan.condition_groups) for _, _, plan in plans)
+        - sum(len(condition_groups) for condition_groups in queries_by_timestamp.values()),
+    )
+
+    # Nothing has fired yet, so any failure up to here can safely retry the whole task.
+    results_by_timestamp = {
+        timestamp: _fetch_condition_group_results(condition_groups)
+        for timestamp, condition_groups in queries_by_timestamp.items()
+    }
+    try:
+        project_events = bulk_fetch_events_for_projects(
+            [(plan.project, list(plan.event_data.event_ids)) for _, _, plan in plans]
+        )
+    except Exception:
+        sentry_sdk.capture_exception(level="info")
+        retry_task()
+
+    for project_client, event_keys, plan in plans:
+        condition_group_results = {}
+        for query, params in plan.condition_groups.items():
+            timestamp = _bucket_query_timestamp(query, params.timestamp)
+            timestamp_results = results_by_timestamp[timestamp]
+            if query in timestamp_results:
+                condition_group_results[query] = timestamp_results[query]
+        with log_context.new_context(project_id=plan.project.id):
+            try:
+                _evaluate_project_plan(
+                    plan, condition_group_results, project_events.get(plan.project.id, {})
+                )
+            except Exception:
+                # Retrying would fire actions again for the projects that have already been
+                # processed, so the buffered data of this project is left to expire instead.
+                logger.exception("delayed_workflow.evaluate_project_failed")
+                continue
+
+        cleanup_redis_buffer(project_client, event_keys, None)
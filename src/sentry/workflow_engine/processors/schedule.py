@@ -15,7 +15,11 @@ from sentry.workflow_engine.buffer.batch_client import (
     DelayedWorkflowClient,
     ProjectDelayedWorkflowClient,
 )
-from sentry.workflow_engine.tasks.delayed_workflows import process_delayed_workflows
+from sentry.workflow_engine.tasks.delayed_workflows import (
+    MAX_PROJECTS_PER_TASK,
+    process_delayed_workflows,
+    process_delayed_workflows_for_projects,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,10 +31,15 @@ def bucket_num_groups(num_groups: int) -> str:
     return "1"
 
 
-def process_in_batches(client: ProjectDelayedWorkflowClient) -> None:
+def process_in_batches(
+    client: ProjectDelayedWorkflowClient, small_project_ids: list[int] | None = None
+) -> None:
     """
     This will check the number of alertgroup_to_event_data items in the Redis buffer for a project.
 
+    If the number is smaller than the batch size and `small_project_ids` is given, the project is
+    added to it, to be processed together with other small projects, rather than on its own.
+
     If the number is larger than the batch size, it will chunk the items and process them in batches.
 
     The batches are replicated into a new redis hash with a unique filter (a uuid) to identify the batch.
@@ -51,6 +60,9 @@ def process_in_batches(client: ProjectDelayedWorkflowClient) -> None:
     metrics.distribution("workflow_engine.schedule.event_count", event_count)
 
     if event_count < batch_size:
+        if small_project_ids is not None:
+            small_project_ids.append(client.project_id)
+            return None
         return process_delayed_workflows.apply_async(
             kwargs={"project_id": client.project_id},
             headers={"sentry-propagate-traces": False},
@@ -238,8 +250,20 @@ def process_buffered_workflows(buffer_client: DelayedWorkflowClient) -> None:
                 extra={"project_ids": sorted(project_ids_to_process)},
             )
 
+            projects_per_task = min(
+                options.get("workflow_engine.schedule.projects_per_task"), MAX_PROJECTS_PER_TASK
+            )
+            small_project_ids: list[int] | None = [] if projects_per_task > 1 else None
+
             for project_id in project_ids_to_process:
-                process_in_batches(buffer_client.for_project(project_id))
+                process_in_batches(buffer_client.for_project(project_id), small_project_ids)
+
+            if small_project_ids:
+                for project_ids_chunk in chunked(small_project_ids, projects_per_task):
+                    process_delayed_workflows_for_projects.apply_async(
+                        kwargs={"project_ids": project_ids_chunk},
+                        headers={"sentry-propagate-traces": False},
+                    )
 
             mark_projects_processed(
                 buffer_client, project_ids_to_process, all_project_ids_and_timestamps
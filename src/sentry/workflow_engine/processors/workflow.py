@@ -14,6 +14,7 @@ from sentry.services.eventstore.models import GroupEvent
 from sentry.utils.tracing import trace
 from sentry.workflow_engine.buffer.batch_client import DelayedWorkflowClient, DelayedWorkflowItem
 from sentry.workflow_engine.caches.action_filters import get_action_filters_by_workflows
+from sentry.workflow_engine.caches.condition_plans import get_conditions_by_condition_group
 from sentry.workflow_engine.caches.workflow import get_workflows_by_detectors
 from sentry.workflow_engine.models import Action, DataConditionGroup, Detector, Workflow
 from sentry.workflow_engine.models.data_condition import DataCondition
@@ -129,10 +130,17 @@ def _get_data_conditions_for_group_by_dcg(dcg_ids: Sequence[int]) -> dict[int, l
     """
     if not dcg_ids:
         return {}
-    # `batch` wants param tuples and associates return results by index.
-    return dict(
-        zip(dcg_ids, get_data_conditions_for_group.batch([(dcg_id,) for dcg_id in dcg_ids]))
-    )
+
+    def fetch(missed_dcg_ids: list[int]) -> dict[int, list[DataCondition]]:
+        # `batch` wants param tuples and associates return results by index.
+        return dict(
+            zip(
+                missed_dcg_ids,
+                get_data_conditions_for_group.batch([(dcg_id,) for dcg_id in missed_dcg_ids]),
+            )
+        )
+
+    return get_conditions_by_condition_group(dcg_ids, fetch)
 
 
 @trace
@@ -7,6 +7,7 @@ from django.dispatch import receiver
 from sentry.workflow_engine.caches.action_filters import (
     invalidate_action_filter_cache_by_workflow_ids,
 )
+from sentry.workflow_engine.caches.condition_plans import invalidate_condition_plans
 from sentry.workflow_engine.models import WorkflowDataConditionGroup
 from sentry.workflow_engine.models.data_condition import (
     DataCondition,
@@ -48,3 +49,21 @@ def invalidate_action_filter_cache_by_data_condition(
             execute_invalidation,
             router.db_for_write(DataCondition),
         )
+
+
+@receiver(pre_delete, sender=DataCondition)
+@receiver(post_save, sender=DataCondition)
+def invalidate_condition_plans_by_data_condition(
+    sender: type[DataCondition],
+    instance: DataCondition,
+    **kwargs: Any,
+) -> None:
+    condition_group_id = instance.condition_group_id
+
+    def execute_invalidation() -> None:
+        invalidate_condition_plans([condition_group_id])
+
+    transaction.on_commit(
+        execute_invalidation,
+        router.db_for_write(DataCondition),
+    )
@@ -1,8 +1,9 @@
 __all__ = [
     "process_delayed_workflows",
+    "process_delayed_workflows_for_projects",
     "process_workflow_activity",
     "process_workflows_event",
 ]
 
-from .delayed_workflows import process_delayed_workflows
+from .delayed_workflows import process_delayed_workflows, process_delayed_workflows_for_projects
 from .workflows import process_workflow_activity, process_workflows_event
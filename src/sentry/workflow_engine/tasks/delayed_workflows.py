@@ -12,6 +12,11 @@ from sentry.workflow_engine.utils import log_context
 
 logger = log_context.get_logger("sentry.workflow_engine.tasks.delayed_workflows")
 
+# The most projects `process_delayed_workflows_for_projects` is given at once, regardless of the
+# `workflow_engine.schedule.projects_per_task` option, and how long it gets for each of them.
+MAX_PROJECTS_PER_TASK = 10
+PROCESSING_DEADLINE_PER_PROJECT = 60
+
 
 @instrumented_task(
     name="sentry.workflow_engine.tasks.delayed_workflows",
@@ -41,3 +46,34 @@ def process_delayed_workflows(
 
     with quiet_retriable_timeouts(), quiet_redis_noise():
         _process_delayed_workflows(batch_client, project_id, batch_key)
+
+
+@instrumented_task(
+    name="sentry.workflow_engine.tasks.delayed_workflows_for_projects",
+    namespace=workflow_engine_tasks,
+    processing_deadline_duration=MAX_PROJECTS_PER_TASK * PROCESSING_DEADLINE_PER_PROJECT,
+    # Only retried before any project has been evaluated, see the processor.
+    retry=Retry(
+        times=5,
+        delay=5,
+    ),
+    silo_mode=SiloMode.CELL,
+)
+@log_context.root()
+def process_delayed_workflows_for_projects(
+    project_ids: list[int], *args: Any, **kwargs: Any
+) -> None:
+    """
+    Process the buffered workflows of many (small) projects together, sharing Snuba queries and
+    nodestore fetches between them.
+    """
+    from sentry.workflow_engine.buffer.batch_client import DelayedWorkflowClient
+    from sentry.workflow_engine.processors.delayed_workflow import (
+        process_delayed_workflows_for_projects as _process_delayed_workflows_for_projects,
+    )
+
+    log_context.add_extras(project_ids=project_ids)
+    batch_client = DelayedWorkflowClient()
+
+    with quiet_retriable_timeouts(), quiet_redis_noise():
+        _process_delayed_workflows_for_projects(batch_client, project_ids)
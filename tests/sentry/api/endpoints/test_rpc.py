@@ -248,3 +248,82 @@ class RpcServiceEndpointTest(APITestCase):
         assert restored.organization_id == ctx.organization_id
         assert restored.user_id == ctx.user_id
         assert restored.actor_type == ctx.actor_type
+
+
+@override_settings(RPC_SHARED_SECRET=["a-long-value-that-is-hard-to-guess"])
+class RpcBatchEndpointTest(APITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.login_as(user=self.user, superuser=True)
+        self.path = reverse("sentry-api-0-rpc-batch")
+
+    def _send_post_request(self, data: dict[str, Any]) -> Any:
+        body = orjson.dumps(data).decode()
+        signature = generate_request_signature(self.path, body.encode())
+        return self.client.post(
+            self.path, data=data, HTTP_AUTHORIZATION=f"rpcsignature {signature}"
+        )
+
+    def test_missing_authentication(self) -> None:
+        data: dict[str, Any] = {"meta": {}, "calls": []}
+        response = self.client.post(self.path, data=data)
+        assert response.status_code == 403
+
+    def test_malformed_calls(self) -> None:
+        for calls in [None, {}, [{"service": "organization", "args": {}}], [[]]]:
+            response = self._send_post_request({"meta": {}, "calls": calls})
+            assert response.status_code == 400
+
+    def test_results_in_call_order(self) -> None:
+        organization = self.create_organization()
+
+        response = self._send_post_request(
+            {
+                "meta": {},
+                "calls": [
+                    {
+                        "service": "organization",
+                        "method": "get_organization_by_id",
+                        "args": {"id": organization.id},
+                    },
+                    {
+                        "service": "organization",
+                        "method": "get_organization_by_id",
+                        "args": {"id": 0},
+                    },
+                ],
+            }
+        )
+
+        assert response.status_code == 200
+        first, second = response.data["results"]
+        response_obj = RpcUserOrganizationContext.parse_obj(first["value"])
+        assert response_obj.organization.id == organization.id
+        assert second["value"] is None
+
+    def test_failed_calls_do_not_fail_the_batch(self) -> None:
+        response = self._send_post_request(
+            {
+                "meta": {},
+                "calls": [
+                    {"service": "not_a_service", "method": "not_a_method", "args": {}},
+                    {
+                        "service": "organization",
+                        "method": "get_organization_by_id",
+                        "args": {"id": "invalid type"},
+                    },
+                    {
+                        "service": "organization",
+                        "method": "get_organization_by_id",
+                        "args": {"id": 0},
+                    },
+                ],
+            }
+        )
+
+        assert response.status_code == 200
+        assert response.data["results"] == [
+            {"error": {"status": 404}},
+            {"error": {"status": 400}},
+            {"meta": {}, "value": None},
+        ]
@@ -0,0 +1,58 @@
+from typing import Any
+
+import pytest
+
+from sentry.api.serializers.prefetch import SerializerPrefetch, run_prefetches
+from sentry.testutils.cases import TestCase
+
+
+class RunPrefetchesTest(TestCase):
+    def test_passes_dependencies(self) -> None:
+        calls: list[str] = []
+
+        def fetch(name: str, value: Any) -> Any:
+            calls.append(name)
+            return value
+
+        results = run_prefetches(
+            "TestSerializer",
+            [
+                SerializerPrefetch("a", lambda: fetch("a", 1)),
+                SerializerPrefetch("b", lambda a: fetch("b", a + 1), depends_on=("a",)),
+                SerializerPrefetch("c", lambda a, b: fetch("c", a + b), depends_on=("a", "b")),
+            ],
+        )
+
+        assert results == {"a": 1, "b": 2, "c": 3}
+        assert calls == ["a", "b", "c"]
+
+    def test_runs_after_dependencies_declared_later(self) -> None:
+        results = run_prefetches(
+            "TestSerializer",
+            [
+                SerializerPrefetch("b", lambda a: a + 1, depends_on=("a",)),
+                SerializerPrefetch("a", lambda: 1),
+            ],
+        )
+        assert results == {"a": 1, "b": 2}
+
+    def test_invalid_prefetches(self) -> None:
+        with pytest.raises(ValueError):
+            run_prefetches(
+                "TestSerializer",
+                [SerializerPrefetch("a", lambda: 1), SerializerPrefetch("a", lambda: 2)],
+            )
+
+        with pytest.raises(ValueError):
+            run_prefetches(
+                "TestSerializer", [SerializerPrefetch("a", lambda b: 1, depends_on=("b",))]
+            )
+
+        with pytest.raises(ValueError):
+            run_prefetches(
+                "TestSerializer",
+                [
+                    SerializerPrefetch("a", lambda b: 1, depends_on=("b",)),
+                    SerializerPrefetch("b", lambda a: 1, depends_on=("a",)),
+                ],
+            )
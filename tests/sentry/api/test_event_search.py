@@ -8,6 +8,7 @@ from django.test import SimpleTestCase
 from django.utils import timezone
 
 from sentry.api.event_search import (
+    PARSE_TREE_CACHE_MAX_QUERY_LENGTH,
     AggregateFilter,
     AggregateKey,
     ParenExpression,
@@ -22,6 +23,7 @@ from sentry.api.event_search import (
     flatten,
     gen_wildcard_value,
     parse_search_query,
+    parse_search_tree,
     translate_wildcard_as_clickhouse_pattern,
 )
 from sentry.constants import MODULE_ROOT
@@ -1662,3 +1664,40 @@ def test_array_includes_filter_rejects_invalid_input(query) -> None:
 )
 def test_array_includes_filter_passes_through_comparison_operators(query, expected) -> None:
     assert parse_search_query(query) == expected
+
+
+def test_parse_search_tree_is_cached() -> None:
+    assert parse_search_tree("user.email:foo@example.com") is parse_search_tree(
+        "user.email:foo@example.com"
+    )
+    assert parse_search_tree("a:b") is not parse_search_tree("a:c")
+
+    long_query = "a:" + "b" * PARSE_TREE_CACHE_MAX_QUERY_LENGTH
+    assert parse_search_tree(long_query) is not parse_search_tree(long_query)
+
+
+def test_cached_parse_tree_with_relative_dates() -> None:
+    now = timezone.now()
+    with freeze_time(now):
+        assert parse_search_query("time:-2w") == [
+            SearchFilter(
+                key=SearchKey(name="time"),
+                operator=">=",
+                value=SearchValue(raw_value=now - timedelta(days=14)),
+            )
+        ]
+    # The parse tree is cached, the relative date is computed again.
+    with freeze_time(now + timedelta(days=1)):
+        assert parse_search_query("time:-2w") == [
+            SearchFilter(
+                key=SearchKey(name="time"),
+                operator=">=",
+                value=SearchValue(raw_value=now - timedelta(days=13)),
+            )
+        ]
+
+
+def test_parse_errors_are_not_cached() -> None:
+    for _ in range(2):
+        with pytest.raises(InvalidSearchQuery):
+            parse_search_query("(a:b")
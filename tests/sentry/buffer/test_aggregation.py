@@ -0,0 +1,91 @@
+from unittest import mock
+
+from sentry.buffer.aggregation import MAX_FLUSH_ATTEMPTS, IncrAggregator
+from sentry.models.group import Group
+
+
+def test_merges_increments_per_key() -> None:
+    flush_func = mock.Mock(return_value=[])
+    aggregator = IncrAggregator(flush_func, max_latency=60, max_keys=10)
+
+    aggregator.add("a", Group, {"times_seen": 1}, {"pk": 1}, {"last_seen": 1})
+    aggregator.add("a", Group, {"times_seen": 2}, {"pk": 1}, {"last_seen": 2}, signal_only=True)
+    aggregator.add("b", Group, {"times_seen": 5}, {"pk": 2})
+
+    assert aggregator.get_pending_columns("a", ["times_seen", "other"]) == {"times_seen": 3}
+    assert aggregator.get_pending_columns("c", ["times_seen"]) == {}
+
+    aggregator.flush()
+    (incrs,) = flush_func.call_args[0]
+    by_key = {incr.key: incr for incr in incrs}
+    assert by_key["a"].columns == {"times_seen": 3}
+    assert by_key["a"].extra == {"last_seen": 2}
+    assert by_key["a"].signal_only is True
+    assert by_key["a"].count == 2
+    assert by_key["b"].columns == {"times_seen": 5}
+    assert by_key["b"].signal_only is False
+
+    # Nothing left to flush
+    flush_func.reset_mock()
+    aggregator.flush()
+    assert not flush_func.called
+    assert aggregator.get_pending_columns("a", ["times_seen"]) == {}
+
+
+def test_flushes_at_max_keys() -> None:
+    flush_func = mock.Mock(return_value=[])
+    aggregator = IncrAggregator(flush_func, max_latency=60, max_keys=2)
+
+    aggregator.add("a", Group, {"times_seen": 1}, {"pk": 1})
+    aggregator.add("a", Group, {"times_seen": 1}, {"pk": 1})
+    assert not flush_func.called
+
+    aggregator.add("b", Group, {"times_seen": 1}, {"pk": 2})
+    assert flush_func.call_count == 1
+    assert [incr.key for incr in flush_func.call_args[0][0]] == ["a", "b"]
+
+
+def test_flushes_after_max_latency() -> None:
+    flushed = mock.Mock(return_value=[])
+    aggregator = IncrAggregator(flushed, max_latency=0.01, max_keys=10)
+
+    with mock.patch("threading.Timer") as timer:
+        aggregator.add("a", Group, {"times_seen": 1}, {"pk": 1})
+        aggregator.add("a", Group, {"times_seen": 1}, {"pk": 1})
+
+    # One timer per window
+    timer.assert_called_once_with(0.01, aggregator.flush)
+    timer.return_value.start.assert_called_once_with()
+
+
+def test_failed_increments_are_kept_for_the_next_flush() -> None:
+    flush_func = mock.Mock(side_effect=Exception("boom"))
+    aggregator = IncrAggregator(flush_func, 60, 10)
+    aggregator.add("a", Group, {"times_seen": 1}, {"pk": 1}, {"last_seen": 1})
+    aggregator.flush()
+    assert aggregator.get_pending_columns("a", ["times_seen"]) == {"times_seen": 1}
+
+    # Increments received in between are merged in and win for `extra`.
+    aggregator.add("a", Group, {"times_seen": 2}, {"pk": 1}, {"last_seen": 2})
+    flush_func.side_effect = None
+    flush_func.return_value = []
+    aggregator.flush()
+    ((incr,),) = flush_func.call_args[0]
+    assert incr.columns == {"times_seen": 3}
+    assert incr.extra == {"last_seen": 2}
+    assert incr.count == 2
+    assert aggregator.get_pending_columns("a", ["times_seen"]) == {}
+
+
+def test_failed_increments_are_dropped_after_max_attempts() -> None:
+    flush_func = mock.Mock(side_effect=lambda incrs: incrs)
+    aggregator = IncrAggregator(flush_func, 60, 10)
+    aggregator.add("a", Group, {"times_seen": 1}, {"pk": 1})
+
+    for _ in range(MAX_FLUSH_ATTEMPTS - 1):
+        aggregator.flush()
+        assert aggregator.get_pending_columns("a", ["times_seen"]) == {"times_seen": 1}
+
+    aggregator.flush()
+    assert aggregator.get_pending_columns("a", ["times_seen"]) == {}
+    assert flush_func.call_count == MAX_FLUSH_ATTEMPTS
@@ -9,8 +9,10 @@ from django.utils import timezone
 
 from sentry import options
 from sentry.buffer.redis import RedisBuffer, _coerce_val, make_key
+from sentry.db.models.fields.bounded import BoundedPositiveIntegerField
 from sentry.models.group import Group
 from sentry.models.project import Project
+from sentry.testutils.helpers import override_options
 from sentry.testutils.helpers.datetime import freeze_time
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.utils import json
@@ -136,6 +138,94 @@ class TestRedisBuffer:
         group = Group.objects.get_from_cache(id=default_group.id)
         assert group.times_seen == orig_times_seen + times_seen_incr
 
+    @django_db_all
+    @freeze_time()
+    def test_process_batched(self, default_project, factories, task_runner) -> None:
+        groups = [factories.create_group(project=default_project) for _ in range(3)]
+        orig_times_seen = {
+            group.id: Group.objects.get_from_cache(id=group.id).times_seen for group in groups
+        }
+        deleted_group_id = groups[2].id
+        groups[2].delete()
+        now = timezone.now()
+
+        for group in groups:
+            self.buf.incr(Group, {"times_seen": 2}, {"id": group.id}, {"last_seen": now})
+        # Not eligible for the bulk update
+        self.buf.incr(Project, {"times_seen": 1}, {"pk": default_project.id}, signal_only=True)
+
+        with (
+            override_options({"buffer.process-batched": True}),
+            mock.patch("sentry.buffer.redis.buffer_incr_complete") as signal,
+            mock.patch("sentry.buffer.base.Buffer.process") as process,
+        ):
+            self.buf.process(
+                batch_keys=[make_key(Group, {"id": group.id}) for group in groups]
+                + [make_key(Project, {"pk": default_project.id})]
+            )
+
+        for group in groups[:2]:
+            cached = Group.objects.get_from_cache(id=group.id)
+            assert cached.times_seen == orig_times_seen[group.id] + 2
+            assert cached.last_seen == now
+            assert Group.objects.get(id=group.id).times_seen == orig_times_seen[group.id] + 2
+        assert not Group.objects.filter(id=deleted_group_id).exists()
+
+        assert signal.send_robust.call_count == 3
+        process.assert_called_once_with(
+            Project, {"times_seen": 1}, {"pk": default_project.id}, {}, True
+        )
+
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        assert client.zrange("b:p", 0, -1) == []
+        assert client.exists(make_key(Group, {"id": groups[0].id})) == 0
+
+    @django_db_all
+    def test_process_batched_restores_failed_keys(self, default_project, factories) -> None:
+        groups = [factories.create_group(project=default_project) for _ in range(2)]
+        for group in groups:
+            self.buf.incr(Group, {"times_seen": 2}, {"id": group.id})
+        self.buf.incr(Project, {"times_seen": 1}, {"pk": default_project.id}, signal_only=True)
+        keys = [make_key(Group, {"id": group.id}) for group in groups]
+        project_key = make_key(Project, {"pk": default_project.id})
+
+        with (
+            override_options({"buffer.process-batched": True}),
+            mock.patch("sentry.buffer.redis.bulk_update", side_effect=Exception("boom")),
+            mock.patch(
+                "sentry.buffer.base.Buffer.process",
+                side_effect=[None, Exception("boom"), Exception("boom")],
+            ) as process,
+        ):
+            self.buf.process(batch_keys=[*keys, project_key])
+
+        # The failed bulk update falls back to one update per row, so only
+        # the increments that failed again are kept in the buffer.
+        assert process.call_count == 3
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        assert client.exists(project_key) == 0
+        assert client.exists(keys[0]) == 1
+        assert client.exists(keys[1]) == 1
+        assert self.buf.get(Group, ["times_seen"], {"id": groups[0].id}) == {"times_seen": 2}
+        assert len(client.zrange("b:p", 0, -1)) == 2
+
+    @django_db_all
+    def test_process_batched_caps_times_seen(self, default_project, factories) -> None:
+        groups = [factories.create_group(project=default_project) for _ in range(2)]
+        Group.objects.filter(id=groups[0].id).update(
+            times_seen=BoundedPositiveIntegerField.MAX_VALUE - 1
+        )
+        for group in groups:
+            self.buf.incr(Group, {"times_seen": 5}, {"id": group.id})
+
+        with override_options({"buffer.process-batched": True}):
+            self.buf.process(batch_keys=[make_key(Group, {"id": group.id}) for group in groups])
+
+        assert (
+            Group.objects.get(id=groups[0].id).times_seen == BoundedPositiveIntegerField.MAX_VALUE
+        )
+        assert Group.objects.get(id=groups[1].id).times_seen == groups[1].times_seen + 5
+
     def test_get(self) -> None:
         model = mock.Mock()
         model.__name__ = "Mock"
@@ -201,6 +291,93 @@ class TestRedisBuffer:
         else:
             assert pending == [key.encode("utf-8")]
 
+    def test_aggregated_incr_saves_to_redis(self) -> None:
+        now = datetime.datetime(2017, 5, 3, 6, 6, 6, tzinfo=datetime.UTC)
+        buf = RedisBuffer(incr_max_latency=60)
+        client = get_cluster_routing_client(buf.cluster, buf.is_redis_cluster)
+        model = mock.Mock()
+        model.__name__ = "Mock"
+        filters = {"pk": 1, "datetime": now}
+        key = make_key(model, filters=filters)
+
+        buf.incr(model, {"times_seen": 1}, filters, extra={"foo": "bar"})
+        buf.incr(model, {"times_seen": 2}, filters, extra={"foo": "baz", "datetime": now})
+
+        # Nothing is written before the aggregator flushes, but reads see the
+        # pending increments.
+        assert client.exists(key) == 0
+        assert buf.get(model, ["times_seen"], filters=filters) == {"times_seen": 3}
+
+        assert buf.aggregator is not None
+        buf.aggregator.flush()
+
+        result = _hgetall_decode_keys(client, key, buf.is_redis_cluster)
+        f = result.pop("f")
+        if buf.is_redis_cluster:
+
+            def load_values(x):
+                return buf._load_values(json.loads(x))
+
+            def load_value(x):
+                return buf._load_value(json.loads(x))
+
+        else:
+            load_value = load_values = pickle.loads
+        assert load_values(f) == {"pk": 1, "datetime": now}
+        assert load_value(result.pop("e+datetime")) == now
+        assert load_value(result.pop("e+foo")) == "baz"
+
+        if buf.is_redis_cluster:
+            assert result == {"i+times_seen": "3", "m": "unittest.mock.Mock"}
+        else:
+            assert result == {"i+times_seen": b"3", "m": b"unittest.mock.Mock"}
+        assert client.ttl(key) > 0
+
+        pending = client.zrange("b:p", 0, -1)
+        if buf.is_redis_cluster:
+            assert pending == [key]
+        else:
+            assert pending == [key.encode("utf-8")]
+        assert buf.get(model, ["times_seen"], filters=filters) == {"times_seen": 3}
+
+    def test_aggregated_incr_kept_when_write_fails(self) -> None:
+        buf = RedisBuffer(incr_max_latency=60)
+        client = get_cluster_routing_client(buf.cluster, buf.is_redis_cluster)
+        model = mock.Mock()
+        model.__name__ = "Mock"
+        filters = {"pk": 1}
+        key = make_key(model, filters=filters)
+
+        buf.incr(model, {"times_seen": 1}, filters)
+        assert buf.aggregator is not None
+        with mock.patch.object(
+            buf, "_pipeline_aggregated_incrs", side_effect=ConnectionError("boom")
+        ):
+            buf.aggregator.flush()
+
+        assert client.exists(key) == 0
+        assert buf.get(model, ["times_seen"], filters=filters) == {"times_seen": 1}
+
+        buf.aggregator.flush()
+        assert client.exists(key) == 1
+        assert buf.get(model, ["times_seen"], filters=filters) == {"times_seen": 1}
+
+    @mock.patch("sentry.buffer.base.Buffer.process")
+    def test_aggregated_incr_process_uses_signal_only(self, process) -> None:
+        buf = RedisBuffer(incr_max_latency=60)
+        model = mock.Mock()
+        model.__name__ = "Mock"
+        filters = {"pk": 1}
+        key = make_key(model, filters=filters)
+
+        buf.incr(model, {"times_seen": 1}, filters)
+        buf.incr(model, {"times_seen": 1}, filters, signal_only=True)
+        assert buf.aggregator is not None
+        buf.aggregator.flush()
+
+        buf.process(key)
+        process.assert_called_once_with(mock.Mock, {"times_seen": 2}, {"pk": 1}, {}, True)
+
     @mock.patch("sentry.buffer.redis.make_key", mock.Mock(return_value="foo"))
     @mock.patch("sentry.buffer.base.Buffer.process")
     def test_process_uses_signal_only(self, process) -> None:
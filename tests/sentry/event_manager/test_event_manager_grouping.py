@@ -16,6 +16,8 @@ from sentry.event_manager import _get_updated_group_title
 from sentry.eventtypes.base import DefaultEvent
 from sentry.exceptions import HashDiscarded
 from sentry.grouping.ingest.caching import (
+    clear_local_grouphash_cache,
+    get_from_local_grouphash_cache,
     get_grouphash_existence_cache_key,
     get_grouphash_object_cache_key,
 )
@@ -456,6 +458,135 @@ class GroupHashCachingTest(TestCase):
             assert not grouphash
 
 
+@override_options({"grouping.ingest_grouphash_local_cache_size": 100})
+class LocalGroupHashCachingTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        clear_local_grouphash_cache()
+        self.addCleanup(clear_local_grouphash_cache)
+        self.project.update_option("sentry:grouping_config", "new_config")
+        self.event = Event(self.project.id, "11212012123120120415201309082013")
+
+    def get_or_create_grouphashes(self, hashes: list[str]) -> list[GroupHash]:
+        with (
+            patch("sentry.grouping.ingest.hashing.create_or_update_grouphash_metadata_if_needed"),
+            patch("sentry.grouping.ingest.hashing.record_grouphash_metadata_metrics"),
+        ):
+            return get_or_create_grouphashes(self.event, self.project, {}, hashes, "new_config")
+
+    def test_local_cache_hit_skips_shared_cache(self) -> None:
+        grouphash = GroupHash.objects.create(
+            project=self.project, hash="dogs_are_great", group=self.group
+        )
+        cache_key = get_grouphash_object_cache_key("dogs_are_great", self.project.id)
+
+        self.get_or_create_grouphashes(["dogs_are_great"])
+        assert get_from_local_grouphash_cache(cache_key) == grouphash
+
+        with patch("sentry.grouping.ingest.hashing.cache.get", wraps=cache.get) as cache_get_spy:
+            (result,) = self.get_or_create_grouphashes(["dogs_are_great"])
+
+        assert result == grouphash
+        assert result.group_id == self.group.id
+        assert cache_get_spy.call_count == 0
+
+    def test_local_cache_invalidated_on_update_and_delete(self) -> None:
+        grouphash = GroupHash.objects.create(
+            project=self.project, hash="dogs_are_great", group=self.group
+        )
+        object_cache_key = get_grouphash_object_cache_key("dogs_are_great", self.project.id)
+
+        self.get_or_create_grouphashes(["dogs_are_great"])
+        assert get_from_local_grouphash_cache(object_cache_key) is not None
+
+        GroupHash.objects.filter(id=grouphash.id).update(group=None)
+        assert get_from_local_grouphash_cache(object_cache_key) is None
+
+        self.get_or_create_grouphashes(["dogs_are_great"])
+        grouphash.refresh_from_db()
+        grouphash.delete()
+        assert get_from_local_grouphash_cache(object_cache_key) is None
+
+    @override_options({"grouping.ingest_grouphash_local_cache_size": 0})
+    def test_local_cache_disabled(self) -> None:
+        GroupHash.objects.create(project=self.project, hash="dogs_are_great", group=self.group)
+        cache_key = get_grouphash_object_cache_key("dogs_are_great", self.project.id)
+
+        self.get_or_create_grouphashes(["dogs_are_great"])
+
+        assert cache_key in cache
+        assert get_from_local_grouphash_cache(cache_key) is None
+
+
+@override_options({"grouping.ingest_grouphash_bulk_lookups": True})
+class BulkGroupHashLookupTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.event = Event(self.project.id, "11212012123120120415201309082013")
+
+    def get_or_create_grouphashes(
+        self, hashes: list[str], grouping_config_id: str
+    ) -> list[GroupHash]:
+        with (
+            patch("sentry.grouping.ingest.hashing.create_or_update_grouphash_metadata_if_needed"),
+            patch("sentry.grouping.ingest.hashing.record_grouphash_metadata_metrics"),
+        ):
+            return get_or_create_grouphashes(
+                self.event, self.project, {}, hashes, grouping_config_id
+            )
+
+    def test_looks_up_existing_grouphashes_in_one_query(self) -> None:
+        self.project.update_option("sentry:grouping_config", "new_config")
+        existing_with_group = GroupHash.objects.create(
+            project=self.project, hash="dogs_are_great", group=self.group
+        )
+        existing_without_group = GroupHash.objects.create(project=self.project, hash="maisey")
+
+        with (
+            patch(
+                "sentry.grouping.ingest.hashing.GroupHash.objects.filter",
+                wraps=GroupHash.objects.filter,
+            ) as filter_spy,
+            patch(
+                "sentry.grouping.ingest.hashing.GroupHash.objects.get_or_create",
+                wraps=GroupHash.objects.get_or_create,
+            ) as get_or_create_spy,
+        ):
+            grouphashes = self.get_or_create_grouphashes(
+                ["dogs_are_great", "maisey", "charlie"], "new_config"
+            )
+
+        assert [grouphash.hash for grouphash in grouphashes] == [
+            "dogs_are_great",
+            "maisey",
+            "charlie",
+        ]
+        assert grouphashes[0] == existing_with_group
+        assert grouphashes[1] == existing_without_group
+        assert filter_spy.call_count == 1
+        # Only the new hash needs to be created
+        assert get_or_create_spy.call_count == 1
+        assert get_or_create_spy.call_args.kwargs == {"project": self.project, "hash": "charlie"}
+
+        # Only the grouphash with a group gets cached
+        assert get_grouphash_object_cache_key("dogs_are_great", self.project.id) in cache
+        assert get_grouphash_object_cache_key("maisey", self.project.id) not in cache
+
+    def test_filters_secondary_hashes_in_one_query(self) -> None:
+        self.project.update_option("sentry:secondary_grouping_config", "old_config")
+        GroupHash.objects.create(project=self.project, hash="dogs_are_great", group=self.group)
+        GroupHash.objects.create(project=self.project, hash="maisey", group=self.group)
+
+        grouphashes = self.get_or_create_grouphashes(
+            ["dogs_are_great", "charlie", "maisey"], "old_config"
+        )
+
+        assert [grouphash.hash for grouphash in grouphashes] == ["dogs_are_great", "maisey"]
+        assert not GroupHash.objects.filter(project=self.project, hash="charlie").exists()
+        assert cache.get(get_grouphash_existence_cache_key("charlie", self.project.id)) is False
+        assert cache.get(get_grouphash_existence_cache_key("maisey", self.project.id)) is True
+
+
 class PlaceholderTitleTest(TestCase):
     """
     Tests for a bug where error events were interpreted as default-type events and therefore all
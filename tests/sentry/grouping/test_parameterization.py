@@ -24,6 +24,14 @@ from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.testutils.pytest.mocking import capture_results, count_matching_calls
 from sentry.utils.http import is_valid_ip
 
+
+@pytest.fixture(autouse=True)
+def clear_parameterizer_caches() -> None:
+    # Some of the tests below look at how results are computed, so they mustn't come from the cache
+    parameterizer.clear_cache()
+    experimental_parameterizer.clear_cache()
+
+
 standard_cases = [
     ("email", "maisey@dogsaregreat.com", "<email>"),
     ("email - with period", "maisey.thedog@dogsaregreat.com", "<email>"),
@@ -876,3 +884,38 @@ def test_parameterization_at_max_length_still_works() -> None:
     result = parameterizer.parameterize(at_limit_input)
     assert result != at_limit_input
     assert "<int>" in result
+
+
+def test_parameterization_results_are_cached() -> None:
+    input_str = "Dog number 1, #1 dog"
+
+    with (
+        patch.object(
+            Parameterizer, "_parameterize", autospec=True, side_effect=Parameterizer._parameterize
+        ) as mock_parameterize,
+        patch("sentry.grouping.parameterization.metrics.incr") as mock_metrics_incr,
+    ):
+        caching_parameterizer = Parameterizer()
+
+        assert caching_parameterizer.parameterize(input_str) == "Dog number <int>, #<int> dog"
+        assert caching_parameterizer.parameterize(input_str) == "Dog number <int>, #<int> dog"
+        assert mock_parameterize.call_count == 1
+
+        # Metrics are emitted for cached results as well
+        assert (
+            count_matching_calls(
+                mock_metrics_incr, "grouping.value_parameterized", amount=2, tags={"key": "int"}
+            )
+            == 2
+        )
+
+        # Long inputs aren't cached
+        long_input = "error code 12345 " * 100
+        assert len(long_input) > Parameterizer.MAX_CACHED_INPUT_LENGTH
+        caching_parameterizer.parameterize(long_input)
+        caching_parameterizer.parameterize(long_input)
+        assert mock_parameterize.call_count == 3
+
+        caching_parameterizer.clear_cache()
+        caching_parameterizer.parameterize(input_str)
+        assert mock_parameterize.call_count == 4
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import copy
+from collections.abc import Generator
+from unittest import mock
+
+import pytest
+
+from sentry.conf.server import DEFAULT_GROUPING_CONFIG
+from sentry.grouping import variant_cache
+from sentry.grouping.api import (
+    _get_variants_from_strategies,
+    get_default_grouping_config_dict,
+    load_grouping_config,
+)
+from sentry.grouping.context import GroupingContext
+from sentry.grouping.variants import BaseVariant
+from sentry.services.eventstore.models import Event
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.pytest.fixtures import django_db_all
+from tests.sentry.grouping import GROUPING_INPUTS_DIR, GroupingInput, with_grouping_inputs
+
+
+@pytest.fixture(autouse=True)
+def clear_variant_cache() -> Generator[None]:
+    variant_cache.clear()
+    yield
+    variant_cache.clear()
+
+
+def _dump_variants(variants: dict[str, BaseVariant]) -> dict[str, dict[str, object]]:
+    return {name: variant.as_dict() for name, variant in variants.items()}
+
+
+def _create_event(grouping_input: GroupingInput) -> Event:
+    return grouping_input.create_event(DEFAULT_GROUPING_CONFIG, use_full_ingest_pipeline=False)
+
+
+@with_grouping_inputs("grouping_input", GROUPING_INPUTS_DIR)
+@mock.patch("sentry.grouping.context.in_rollout_group", return_value=False)
+def test_cached_variants_match_computed_variants(
+    mock_in_rollout_group: mock.MagicMock, grouping_input: GroupingInput
+) -> None:
+    expected_event = _create_event(grouping_input)
+    expected = _dump_variants(expected_event.get_grouping_variants(normalize_stacktraces=True))
+
+    with override_options({"grouping.strategy_variants_cache_size": 10}):
+        for _ in range(2):
+            event = _create_event(grouping_input)
+            event.data.pop("main_exception_id", None)
+            assert _dump_variants(event.get_grouping_variants(normalize_stacktraces=True)) == (
+                expected
+            )
+            assert event.data.get("main_exception_id") == expected_event.data.get(
+                "main_exception_id"
+            )
+
+
+@django_db_all
+@mock.patch("sentry.grouping.context.in_rollout_group", return_value=False)
+def test_cache_hit(mock_in_rollout_group: mock.MagicMock) -> None:
+    data = {
+        "platform": "python",
+        "exception": {
+            "values": [
+                {
+                    "type": "KeyError",
+                    "value": "'dog'",
+                    "stacktrace": {
+                        "frames": [
+                            {
+                                "function": "fetch",
+                                "module": "dogs.views",
+                                "filename": "dogs/views.py",
+                                "context_line": "return DOGS[name]",
+                                "in_app": True,
+                                "vars": {"name": "'maisey'"},
+                            }
+                        ]
+                    },
+                }
+            ]
+        },
+    }
+    other_data = copy.deepcopy(data)
+    # Local variables don't affect grouping, so they're not part of the key
+    other_data["exception"]["values"][0]["stacktrace"]["frames"][0]["vars"] = {"name": "'charlie'"}
+
+    config = load_grouping_config(get_default_grouping_config_dict())
+
+    with (
+        override_options({"grouping.strategy_variants_cache_size": 10}),
+        mock.patch(
+            "sentry.grouping.api._get_variants_from_strategies",
+            wraps=_get_variants_from_strategies,
+        ) as mock_get_variants,
+    ):
+        first = Event(project_id=1, event_id="11211231", data=data)
+        first_variants = first.get_grouping_variants(config)
+        # Mutating the returned variants doesn't affect the cache
+        for variant in first_variants.values():
+            variant.root_component.update(contributes=False, hint="ignored")  # type: ignore[attr-defined]
+
+        second = Event(project_id=1, event_id="11211232", data=other_data)
+        second_variants = second.get_grouping_variants(config)
+
+        assert mock_get_variants.call_count == 1
+        assert any(variant.contributes for variant in second_variants.values())
+
+        assert variant_cache.get_cache_key(
+            first, GroupingContext(config, first)
+        ) == variant_cache.get_cache_key(second, GroupingContext(config, second))
+
+        other_data["exception"]["values"][0]["type"] = "ValueError"
+        third = Event(project_id=1, event_id="11211233", data=other_data)
+        third.get_grouping_variants(config)
+        assert mock_get_variants.call_count == 2
+
+
+@django_db_all
+def test_disabled() -> None:
+    data = {"message": "Dogs are great!"}
+    config = load_grouping_config(get_default_grouping_config_dict())
+
+    with mock.patch(
+        "sentry.grouping.variant_cache.get_cached_variants"
+    ) as mock_get_cached_variants:
+        Event(project_id=1, event_id="11211231", data=data).get_grouping_variants(config)
+
+    mock_get_cached_variants.assert_not_called()
@@ -17,6 +17,7 @@ from sentry.hybridcloud.models.outbox import (
     outbox_context,
 )
 from sentry.hybridcloud.outbox.category import OutboxCategory, OutboxScope
+from sentry.hybridcloud.outbox.signals import process_cell_outbox_bulk
 from sentry.hybridcloud.tasks.deliver_from_outbox import enqueue_outbox_jobs
 from sentry.models.organization import Organization
 from sentry.models.organizationmember import OrganizationMember
@@ -297,6 +298,27 @@ class OutboxDrainTest(TransactionTestCase):
 
         assert mock_process_cell_outbox.call_count == 2
 
+    @patch("sentry.hybridcloud.models.outbox.process_cell_outbox.send")
+    def test_drain_shards_in_parallel(self, mock_process_cell_outbox: Mock) -> None:
+        with outbox_context(flush=False):
+            for org_id in (1, 2, 3):
+                Organization(id=org_id).outbox_for_update().save()
+                Organization(id=org_id).outbox_for_update().save()
+
+        with (
+            self.options({"hybridcloud.outbox.drain_worker_threads": 2}),
+            self.tasks(),
+        ):
+            enqueue_outbox_jobs(concurrency=1, process_outbox_backfills=False)
+
+        assert CellOutbox.objects.count() == 0
+        assert {c.kwargs["object_identifier"] for c in mock_process_cell_outbox.mock_calls} == {
+            1,
+            2,
+            3,
+        }
+        assert mock_process_cell_outbox.call_count == 3
+
 
 class CellOutboxTest(TestCase):
     def test_creating_org_outboxes(self) -> None:
@@ -367,6 +389,65 @@ class CellOutboxTest(TestCase):
             ctx.__exit__(type(e), e, None)
             raise
 
+    def test_prepare_next_from_shards(self) -> None:
+        with outbox_context(flush=False):
+            Organization(id=10001).outbox_for_update().save()
+            Organization(id=10001).outbox_for_update().save()
+            Organization(id=10002).outbox_for_update().save()
+
+        shards = CellOutbox.find_scheduled_shards()
+        assert len(shards) == 2
+
+        claimed = CellOutbox.prepare_next_from_shards(shards)
+        assert [outbox.shard_identifier for outbox in claimed] == [
+            shard["shard_identifier"] for shard in shards
+        ]
+        assert [outbox.id for outbox in claimed] == [
+            CellOutbox.objects.filter(shard_identifier=shard_identifier).order_by("id")[0].id
+            for shard_identifier in (10001, 10002)
+        ]
+
+        # Both shards were rescheduled, but none of their messages processed
+        assert CellOutbox.find_scheduled_shards() == []
+        assert CellOutbox.objects.count() == 3
+        assert CellOutbox.prepare_next_from_shards([]) == []
+
+    @patch("sentry.hybridcloud.models.outbox.process_cell_outbox.send")
+    def test_bulk_receivers(self, mock_process_cell_outbox: Mock) -> None:
+        bulk_calls: list[list[int]] = []
+
+        def receiver(payloads: dict[int, Any], shard_identifier: int, **kwds: Any) -> None:
+            assert shard_identifier == 1
+            bulk_calls.append(list(payloads))
+
+        with outbox_context(flush=False):
+            for member_id in (5, 6, 5, 7):
+                OrganizationMember(id=member_id, organization_id=1).outbox_for_update().save()
+            Organization(id=1).outbox_for_update().save()
+            OrganizationMember(id=8, organization_id=1).outbox_for_update().save()
+
+        process_cell_outbox_bulk.connect(
+            receiver, sender=OutboxCategory.ORGANIZATION_MEMBER_UPDATE, weak=False
+        )
+        try:
+            with self.options({"hybridcloud.outbox.bulk_batch_size": 10}), outbox_runner():
+                pass
+        finally:
+            process_cell_outbox_bulk.disconnect(
+                receiver, sender=OutboxCategory.ORGANIZATION_MEMBER_UPDATE
+            )
+
+        # Member updates are only batched up to the organization update between them
+        assert bulk_calls == [[5, 6, 7], [8]]
+        mock_process_cell_outbox.assert_called_once_with(
+            sender=OutboxCategory.ORGANIZATION_UPDATE,
+            payload=None,
+            object_identifier=1,
+            shard_identifier=1,
+            shard_scope=OutboxScope.ORGANIZATION_SCOPE,
+        )
+        assert CellOutbox.objects.count() == 0
+
     def test_outbox_rescheduling(self) -> None:
         with patch(
             "sentry.hybridcloud.models.outbox.process_cell_outbox.send"
@@ -658,3 +739,20 @@ class OutboxAggregationTest(TestCase):
 
     def test_total_count(self) -> None:
         assert ControlOutbox.get_total_outbox_count() == 7 + 4 + 1
+
+    def test_scheduled_shard_count(self) -> None:
+        assert ControlOutbox.get_scheduled_shard_count() == 3
+
+        ControlOutbox.objects.filter(shard_identifier=1).update(
+            scheduled_for=datetime.now(tz=timezone.utc) + timedelta(hours=1)
+        )
+        assert ControlOutbox.get_scheduled_shard_count() == 2
+
+    def test_oldest_message_age(self) -> None:
+        with freeze_time(datetime.now(tz=timezone.utc) + timedelta(minutes=5)):
+            age = ControlOutbox.get_oldest_message_age()
+        assert age is not None
+        assert age >= timedelta(minutes=5)
+
+        ControlOutbox.objects.all().delete()
+        assert ControlOutbox.get_oldest_message_age() is None
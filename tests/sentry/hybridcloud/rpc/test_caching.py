@@ -10,7 +10,11 @@ from sentry.hybridcloud.rpc.caching import (
     cell_caching_service,
     control_caching_service,
 )
-from sentry.hybridcloud.rpc.caching.impl import CacheBackend, _consume_generator
+from sentry.hybridcloud.rpc.caching.impl import (
+    CacheBackend,
+    _clear_local_cache,
+    _consume_generator,
+)
 from sentry.organizations.services.organization.model import (
     RpcOrganizationMember,
     RpcOrganizationSummary,
@@ -18,6 +22,7 @@ from sentry.organizations.services.organization.model import (
 from sentry.organizations.services.organization.service import organization_service
 from sentry.silo.base import SiloMode
 from sentry.testutils.factories import Factories
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.testutils.silo import assume_test_silo_mode, control_silo_test, no_silo_test
 from sentry.types.cell import get_local_cell
@@ -117,6 +122,43 @@ def test_caching_function_none_value() -> None:
     assert result is None
 
 
+@django_db_all(transaction=True)
+def test_caching_function_local_cache() -> None:
+    cache.clear()
+    _clear_local_cache()
+    calls: list[int] = []
+
+    @back_with_silo_cache(base_key="my-test-key", silo_mode=SiloMode.CELL, t=RpcUser)
+    def get_user(user_id: int) -> RpcUser:
+        calls.append(user_id)
+        return user_service.get_many(filter=dict(user_ids=[user_id]))[0]
+
+    user = Factories.create_user()
+
+    with override_options({"hybridcloud.caching.local-cache-size": 10}):
+        old = get_user(user.id)
+        assert calls == [user.id]
+
+        # Served from the process-local copy even though the shared cache lost it
+        cache.clear()
+        assert get_user(user.id) == old
+        assert calls == [user.id]
+
+        with assume_test_silo_mode(SiloMode.CONTROL):
+            user.update(username=user.username + "moocow")
+        cell_caching_service.clear_key(
+            cell_name=get_local_cell().name, key=get_user.key_from(user.id)
+        )
+
+        # Clearing the key bumps its version, so the local copy isn't used anymore
+        updated = get_user(user.id)
+        assert updated is not None
+        assert updated.username == user.username
+        assert calls == [user.id, user.id]
+
+    _clear_local_cache()
+
+
 @django_db_all(transaction=True)
 @no_silo_test
 def test_cache_versioning() -> None:
@@ -13,8 +13,11 @@ from sentry import options
 from sentry.auth.services.auth import AuthService
 from sentry.hybridcloud.rpc.service import (
     RpcAuthenticationSetupException,
+    RpcBatch,
     RpcDisabledException,
+    RpcValidationException,
     _RemoteSiloCall,
+    _get_connection,
     dispatch_remote_call,
     dispatch_to_local_service,
 )
@@ -34,6 +37,7 @@ from sentry.testutils.silo import assume_test_silo_mode, no_silo_test
 from sentry.types.cell import Cell
 from sentry.users.services.user import RpcUser
 from sentry.users.services.user.serial import serialize_rpc_user
+from sentry.users.services.user.service import user_service
 from sentry.utils import json
 
 _CELLS = [Cell("north_america", 1, "http://na.sentry.io"), Cell("europe", 2, "http://eu.sentry.io")]
@@ -305,3 +309,120 @@ class DispatchRemoteCallTest(TestCase):
         timeout_override_setting = {"organization_service.some_other_method": 20}
         with override_options({"hybridcloud.rpc.method_retry_overrides": timeout_override_setting}):
             assert test_class.get_method_retry_count() == default_value
+
+
+@no_silo_test
+class RpcBatchTest(TestCase):
+    @responses.activate
+    @override_settings(SILO_MODE=SiloMode.CELL)
+    @override_options({"hybridcloud.rpc.batching": True})
+    def test_calls_to_the_same_silo_share_a_request(self) -> None:
+        user = self.create_user()
+        serial = serialize_rpc_user(user)
+        responses.add(
+            responses.POST,
+            f"{settings.SENTRY_CONTROL_ADDRESS}/api/0/internal/rpc/batch/",
+            content_type="json",
+            body=json.dumps(
+                {
+                    "meta": {},
+                    "results": [
+                        {"meta": {}, "value": serial.dict()},
+                        {"meta": {}, "value": [serial.dict()]},
+                        {"error": {"status": 422, "detail": "Bad input", "code": "invalid"}},
+                    ],
+                }
+            ),
+        )
+
+        batch = RpcBatch(use_test_client=False)
+        superuser = batch.add(user_service, "get_first_superuser")
+        users = batch.add(user_service, "get_many", filter={"user_ids": [user.id]})
+        failed = batch.add(user_service, "get_many", filter={})
+        batch.dispatch()
+
+        assert len(responses.calls) == 1
+        request_body = json.loads(responses.calls[0].request.body)
+        assert [(call["service"], call["method"]) for call in request_body["calls"]] == [
+            ("user", "get_first_superuser"),
+            ("user", "get_many"),
+            ("user", "get_many"),
+        ]
+        assert superuser.result() == serial
+        assert users.result() == [serial]
+        with pytest.raises(RpcValidationException):
+            failed.result()
+
+    @responses.activate
+    @override_settings(SILO_MODE=SiloMode.CELL)
+    @override_options({"hybridcloud.rpc.batching": True})
+    def test_failed_request_fails_every_call(self) -> None:
+        responses.add(
+            responses.POST,
+            f"{settings.SENTRY_CONTROL_ADDRESS}/api/0/internal/rpc/batch/",
+            status=500,
+        )
+
+        batch = RpcBatch(use_test_client=False)
+        calls = [batch.add(user_service, "get_first_superuser") for _ in range(2)]
+        batch.dispatch()
+
+        for call in calls:
+            assert call.exception() is not None
+
+    @responses.activate
+    @override_settings(SILO_MODE=SiloMode.CELL)
+    @override_options({"hybridcloud.rpc.batching": True, "hybridcloud.rpc.retries": 5})
+    def test_batch_only_retried_when_every_call_opts_in(self) -> None:
+        responses.add(
+            responses.POST,
+            f"{settings.SENTRY_CONTROL_ADDRESS}/api/0/internal/rpc/batch/",
+            status=500,
+        )
+
+        def dispatch_batch() -> int:
+            with mock.patch(
+                "sentry.hybridcloud.rpc.service._get_connection", wraps=_get_connection
+            ) as mock_get_connection:
+                batch = RpcBatch(use_test_client=False)
+                batch.add(user_service, "get_first_superuser")
+                batch.add(user_service, "get_many", filter={})
+                batch.dispatch()
+            (retry_count,) = mock_get_connection.call_args.args
+            return retry_count
+
+        assert dispatch_batch() == 0
+
+        overrides = {"user.get_first_superuser": 3}
+        with override_options({"hybridcloud.rpc.method_retry_overrides": overrides}):
+            assert dispatch_batch() == 0
+
+        overrides = {"user.get_first_superuser": 3, "user.get_many": 2}
+        with override_options({"hybridcloud.rpc.method_retry_overrides": overrides}):
+            assert dispatch_batch() == 2
+
+    @responses.activate
+    @override_settings(SILO_MODE=SiloMode.CELL)
+    def test_calls_made_in_place_without_option(self) -> None:
+        with mock.patch.object(
+            user_service, "get_first_superuser", return_value=None
+        ) as mock_get_first_superuser:
+            batch = RpcBatch(use_test_client=False)
+            superuser = batch.add(user_service, "get_first_superuser")
+            batch.dispatch()
+
+        assert superuser.result() is None
+        mock_get_first_superuser.assert_called_once_with()
+        assert len(responses.calls) == 0
+
+    @override_options({"hybridcloud.rpc.batching": True})
+    def test_monolith_calls_local_service(self) -> None:
+        self.create_user(is_superuser=True)
+
+        batch = RpcBatch()
+        superuser = batch.add(user_service, "get_first_superuser")
+        batch.dispatch()
+
+        result = superuser.result()
+        assert result is not None
+        assert result.is_superuser
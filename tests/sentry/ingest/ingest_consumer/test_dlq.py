@@ -1,6 +1,6 @@
 import time
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 import msgpack
 import orjson
@@ -88,3 +88,63 @@ def test_dlq_invalid_messages(factories, topic_name: str, consumer_type: Consume
 
         assert exc_info.value.partition == partition
         assert exc_info.value.offset == offset
+
+
+@django_db_all
+def test_dlq_invalid_messages_batched(factories) -> None:
+    organization = factories.create_organization()
+    project = factories.create_project(organization=organization)
+
+    empty_event_payload = msgpack.packb(
+        {
+            "type": "event",
+            "project_id": project.id,
+            "payload": b"{}",
+            "start_time": int(time.time()),
+            "event_id": "aaa",
+        }
+    )
+    unsupported_message_type_payload = msgpack.packb(
+        {
+            "type": "unsupported type",
+            "project_id": project.id,
+            "payload": b"{}",
+            "start_time": int(time.time()),
+            "event_id": "bbb",
+        }
+    )
+
+    partition = Partition(Topic(TopicNames.INGEST_EVENTS.value), 0)
+    factory = IngestStrategyFactory(
+        ConsumerType.Events,
+        reprocess_only_stuck_events=False,
+        reprocess_only_events_not_in_nodestore=False,
+        stop_at_timestamp=False,
+        num_processes=1,
+        max_batch_size=3,
+        max_batch_time=1,
+        input_block_size=None,
+        output_block_size=None,
+        mode="batched",
+    )
+    commit = Mock()
+    strategy = factory.create_with_partitions(commit, Mock())
+
+    for offset, payload in enumerate(
+        [b"bogus message", empty_event_payload, unsupported_message_type_payload], start=5
+    ):
+        strategy.submit(make_message(payload, partition, offset))
+
+    # Every invalid message of the batch is routed to the DLQ, one per poll,
+    # before the offsets of the batch are committed.
+    invalid_offsets = []
+    for _ in range(10):
+        try:
+            strategy.poll()
+        except InvalidMessage as exc:
+            assert exc.partition == partition
+            invalid_offsets.append(exc.offset)
+            assert call({partition: 8}) not in commit.call_args_list
+
+    assert invalid_offsets == [5, 6, 7]
+    commit.assert_any_call({partition: 8})
@@ -14,7 +14,8 @@ import pytest
 from arroyo.backends.kafka.consumer import KafkaPayload
 from arroyo.backends.local.backend import LocalBroker
 from arroyo.backends.local.storages.memory import MemoryMessageStorage
-from arroyo.types import Partition, Topic
+from arroyo.processing.strategies.batching import ValuesBatch
+from arroyo.types import BrokerValue, Message, Partition, Topic
 from django.conf import settings
 
 from sentry.event_manager import EventManager
@@ -22,6 +23,7 @@ from sentry.ingest.consumer.processors import (
     collect_span_metrics,
     process_attachment_chunk,
     process_event,
+    process_events,
     process_individual_attachment,
     process_userreport,
 )
@@ -29,6 +31,7 @@ from sentry.ingest.consumer.simple_event import (
     INLINE_SAVE_EVENT_OPTION,
     INLINE_SAVE_EVENT_TRANSACTION_OPTION,
     process_event_from_kafka,
+    process_simple_event_messages,
 )
 from sentry.ingest.types import ConsumerType
 from sentry.lang.native.utils import STORE_CRASH_REPORTS_ALL
@@ -122,6 +125,141 @@ def test_deduplication_works(default_project, task_runner, preprocess_event) ->
     }
 
 
+@django_db_all
+def test_process_events_deduplicates_within_and_across_batches(
+    default_project, preprocess_event
+) -> None:
+    first = get_normalized_event({"message": "hello world"}, default_project)
+    second = get_normalized_event({"message": "hello again"}, default_project)
+    start_time = time.time() - 3600
+
+    def make_message(payload):
+        return {
+            "payload": orjson.dumps(payload).decode(),
+            "start_time": start_time,
+            "event_id": payload["event_id"],
+            "project_id": default_project.id,
+            "remote_addr": "127.0.0.1",
+        }
+
+    process_events(
+        ConsumerType.Events,
+        [
+            (make_message(first), default_project),
+            (make_message(first), default_project),
+            (make_message(second), default_project),
+        ],
+    )
+    assert [kwargs["event_id"] for kwargs in preprocess_event] == [
+        first["event_id"],
+        second["event_id"],
+    ]
+
+    process_events(ConsumerType.Events, [(make_message(second), default_project)])
+    assert len(preprocess_event) == 2
+
+
+@django_db_all
+def test_process_events_isolates_failing_messages(default_project, preprocess_event) -> None:
+    first = get_normalized_event({"message": "hello world"}, default_project)
+    second = get_normalized_event({"message": "hello again"}, default_project)
+    start_time = time.time() - 3600
+
+    def make_message(event_id, payload):
+        return {
+            "payload": payload,
+            "start_time": start_time,
+            "event_id": event_id,
+            "project_id": default_project.id,
+            "remote_addr": "127.0.0.1",
+        }
+
+    invalid = process_events(
+        ConsumerType.Events,
+        [
+            (make_message(first["event_id"], orjson.dumps(first).decode()), default_project),
+            (make_message(uuid.uuid4().hex, "not json"), default_project),
+            (make_message(second["event_id"], orjson.dumps(second).decode()), default_project),
+        ],
+    )
+
+    assert invalid == [1]
+    assert [kwargs["event_id"] for kwargs in preprocess_event] == [
+        first["event_id"],
+        second["event_id"],
+    ]
+
+
+@django_db_all
+def test_process_simple_event_messages(default_project, preprocess_event) -> None:
+    payload = get_normalized_event({"message": "hello world"}, default_project)
+    event_id = payload["event_id"]
+    project_id = default_project.id
+    start_time = time.time() - 3600
+    partition = Partition(Topic("ingest-events"), 0)
+
+    values = [
+        BrokerValue(
+            KafkaPayload(
+                None,
+                msgpack.packb(
+                    {
+                        "payload": orjson.dumps(payload).decode(),
+                        "start_time": start_time,
+                        "event_id": event_id,
+                        "project_id": project_id,
+                        "remote_addr": "127.0.0.1",
+                        "type": "event",
+                    }
+                ),
+                [],
+            ),
+            partition,
+            0,
+            datetime.datetime.now(),
+        ),
+        BrokerValue(
+            KafkaPayload(
+                None,
+                msgpack.packb(
+                    {
+                        "payload": "{}",
+                        "start_time": start_time,
+                        "event_id": uuid.uuid4().hex,
+                        "project_id": 2**31 - 1,
+                        "remote_addr": "127.0.0.1",
+                        "type": "event",
+                    }
+                ),
+                [],
+            ),
+            partition,
+            1,
+            datetime.datetime.now(),
+        ),
+    ]
+    batch: ValuesBatch[KafkaPayload] = values
+
+    invalid = process_simple_event_messages(
+        Message(BrokerValue(batch, partition, 1, datetime.datetime.now())),
+        consumer_type=ConsumerType.Events,
+        reprocess_only_stuck_events=False,
+        reprocess_only_events_not_in_nodestore=False,
+    )
+
+    # The message for the unknown project is dropped, like in single mode.
+    assert invalid == []
+    (kwargs,) = preprocess_event
+    assert kwargs == {
+        "cache_key": f"e:{event_id}:{project_id}",
+        "data": payload,
+        "event_id": event_id,
+        "project": default_project,
+        "start_time": start_time,
+        "has_attachments": False,
+    }
+
+
 @django_db_all
 def test_process_event_from_kafka(default_project, preprocess_event) -> None:
     payload = get_normalized_event({"message": "hello world"}, default_project)
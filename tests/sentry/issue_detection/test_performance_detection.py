@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, Mock, call, patch
 import pytest
 
 from sentry import projectoptions
-from sentry.issue_detection.base import DetectorType
+from sentry.issue_detection.base import DetectorType, PerformanceDetector
 from sentry.issue_detection.detectors.n_plus_one_db_span_detector import NPlusOneDBSpanDetector
 from sentry.issue_detection.detectors.utils import total_span_time
 from sentry.issue_detection.performance_detection import (
@@ -19,6 +19,7 @@ from sentry.issue_detection.performance_detection import (
     reset_performance_settings,
     reset_wfe_detector_configs,
     run_detector_on_data,
+    run_detectors_on_data,
     sync_project_options_to_wfe_detectors,
     update_performance_settings,
 )
@@ -190,13 +191,13 @@ class PerformanceDetectionTest(TestCase):
         n_plus_one_event = get_event("n-plus-one-db/n-plus-one-in-django-index-view")
 
         with patch(
-            "sentry.issue_detection.performance_detection.run_detector_on_data",
-            wraps=run_detector_on_data,
+            "sentry.issue_detection.performance_detection.run_detectors_on_data",
+            wraps=run_detectors_on_data,
         ) as run_detector_spy:
             detected_problems = detect_performance_problems(n_plus_one_event, self.project)
 
-            detectors_run = [type(call.args[0]) for call in run_detector_spy.call_args_list]
-            assert detectors_run == [
+            (detectors_run,) = (call.args[0] for call in run_detector_spy.call_args_list)
+            assert [type(detector) for detector in detectors_run] == [
                 detector_class
                 for detector_class in DETECTOR_CLASSES
                 if detector_class.is_detection_allowed_for_system()
@@ -208,15 +209,15 @@ class PerformanceDetectionTest(TestCase):
         n_plus_one_event = get_event("n-plus-one-db/n-plus-one-in-django-index-view")
 
         with patch(
-            "sentry.issue_detection.performance_detection.run_detector_on_data",
-            wraps=run_detector_on_data,
+            "sentry.issue_detection.performance_detection.run_detectors_on_data",
+            wraps=run_detectors_on_data,
         ) as run_detector_spy:
             detected_problems = detect_performance_problems(
                 n_plus_one_event, self.project, detector_classes=[NPlusOneDBSpanDetector]
             )
 
-            detectors_run = [type(call.args[0]) for call in run_detector_spy.call_args_list]
-            assert detectors_run == [NPlusOneDBSpanDetector]
+            (detectors_run,) = (call.args[0] for call in run_detector_spy.call_args_list)
+            assert [type(detector) for detector in detectors_run] == [NPlusOneDBSpanDetector]
             # The one detector we asked for still found its problem
             assert_n_plus_one_db_problem(detected_problems)
 
@@ -225,13 +226,14 @@ class PerformanceDetectionTest(TestCase):
         n_plus_one_event = get_event("n-plus-one-db/n-plus-one-in-django-index-view")
 
         with patch(
-            "sentry.issue_detection.performance_detection.run_detector_on_data",
-            wraps=run_detector_on_data,
+            "sentry.issue_detection.performance_detection.run_detectors_on_data",
+            wraps=run_detectors_on_data,
         ) as run_detector_spy:
             detect_performance_problems(n_plus_one_event, self.project, detector_classes=[])
 
             # Passing in an empty list of detectors should result in no detectors running
-            run_detector_spy.assert_not_called()
+            run_detector_spy.assert_called_once()
+            assert run_detector_spy.call_args.args[0] == []
 
     def test_project_options_overrides_default_detection_settings(self) -> None:
         default_settings = get_detection_settings(self.project)
@@ -587,8 +589,8 @@ class PerformanceDetectionTest(TestCase):
                 "sentry.issue_detection.performance_detection.logger.exception"
             ) as logger_exception_mock,
             patch(
-                "sentry.issue_detection.performance_detection.run_detector_on_data",
-                wraps=run_detector_on_data,
+                "sentry.issue_detection.performance_detection.run_detectors_on_data",
+                wraps=run_detectors_on_data,
             ) as run_detector_spy,
         ):
             _detect_performance_problems(n_plus_one_event, sdk_span_mock, self.project)
@@ -611,7 +613,9 @@ class PerformanceDetectionTest(TestCase):
                 ]
             )
             # All of the detectors ran, even though the slow DB detector errored out
-            assert run_detector_spy.call_count == num_enabled_detectors
+            (detectors_run,) = (call.args[0] for call in run_detector_spy.call_args_list)
+            assert len(detectors_run) == num_enabled_detectors
+            assert logger_exception_mock.call_count == 1
 
     def test_each_detector_has_unique_detector_type(self) -> None:
         assert all(type(detector_class.type) is DetectorType for detector_class in DETECTOR_CLASSES)
@@ -740,6 +744,110 @@ def test_total_span_time(spans: list[Span], duration: float) -> None:
     assert total_span_time(spans) == pytest.approx(duration, 0.01)
 
 
+class RecordingDetector(PerformanceDetector):
+    type = DetectorType.SLOW_DB_QUERY
+    settings_key = DetectorType.SLOW_DB_QUERY
+
+    def __init__(self, op_prefixes: tuple[str, ...] | None, fail_on: str | None = None) -> None:
+        super().__init__({}, {})
+        self.op_prefixes = op_prefixes
+        self.fail_on = fail_on
+        self.visited: list[str] = []
+        self.completed = False
+
+    def span_op_prefixes(self) -> tuple[str, ...] | None:
+        return self.op_prefixes
+
+    def visit_span(self, span: Span) -> None:
+        if span.get("op") == self.fail_on:
+            raise ValueError(span["span_id"])
+        self.visited.append(span["span_id"])
+
+    def on_complete(self) -> None:
+        self.completed = True
+
+
+RECORDING_SPANS = [
+    {"span_id": "a", "op": "http.server"},
+    {"span_id": "b", "op": "db.sql.query"},
+    {"span_id": "c", "op": "DB.query"},
+    {"span_id": "d", "op": "http.client"},
+    {"span_id": "e"},
+    {"span_id": "f", "op": "db.sql.query"},
+]
+
+
+def test_run_detectors_on_data_skips_irrelevant_ops() -> None:
+    every_span = RecordingDetector(None)
+    db = RecordingDetector(("db",))
+    http_client = RecordingDetector(("http.client", "resource"))
+    nothing = RecordingDetector(())
+
+    run_detectors_on_data([every_span, db, http_client, nothing], {"spans": RECORDING_SPANS})
+
+    assert every_span.visited == ["a", "b", "c", "d", "e", "f"]
+    # Spans without an op are passed to every detector
+    assert db.visited == ["b", "c", "e", "f"]
+    assert http_client.visited == ["d", "e"]
+    assert nothing.visited == ["e"]
+    assert all(d.completed for d in (every_span, db, http_client, nothing))
+
+
+def test_run_detectors_on_data_skips_failed_detectors() -> None:
+    failing = RecordingDetector(None, fail_on="http.client")
+    other = RecordingDetector(None)
+
+    with patch(
+        "sentry.issue_detection.performance_detection.logger.exception"
+    ) as logger_exception_mock:
+        run_detectors_on_data([failing, other], {"spans": RECORDING_SPANS}, error_extra={"a": 1})
+
+    logger_exception_mock.assert_called_once_with(
+        "Error running issue detector `RecordingDetector`", extra={"a": 1}
+    )
+    assert failing.visited == ["a", "b", "c"]
+    assert not failing.completed
+    assert other.visited == ["a", "b", "c", "d", "e", "f"]
+    assert other.completed
+
+    with pytest.raises(ValueError):
+        run_detector_on_data(
+            RecordingDetector(None, fail_on="http.client"), {"spans": RECORDING_SPANS}
+        )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "event_name",
+    [
+        "consecutive-http/consecutive-http-basic",
+        "file-io-on-main-thread/file-io-on-main-thread",
+        "m-n-plus-one-db/m-n-plus-one-graphql",
+        "n-plus-one-api-calls/n-plus-one-api-calls-in-issue-stream",
+        "n-plus-one-db/n-plus-one-in-django-index-view",
+        "slow-db/solved-n-plus-one-in-django-index-view",
+        "sql-injection/sql-injection-event-body",
+    ],
+)
+def test_run_detectors_on_data_matches_visiting_every_span(event_name: str) -> None:
+    event = get_event(event_name)
+    settings = get_detection_settings()
+
+    expected = [cls(settings[cls.settings_key], event) for cls in DETECTOR_CLASSES]
+    for detector in expected:
+        if detector.is_event_eligible(event):
+            for span in event["spans"]:
+                detector.visit_span(span)
+            detector.on_complete()
+
+    detectors = [cls(settings[cls.settings_key], event) for cls in DETECTOR_CLASSES]
+    run_detectors_on_data(detectors, event)
+
+    assert [detector.stored_problems for detector in detectors] == [
+        detector.stored_problems for detector in expected
+    ]
+
+
 @pytest.mark.django_db
 class WFEDetectorConfigTest(TestCase):
     def setUp(self) -> None:
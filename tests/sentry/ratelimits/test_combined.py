@@ -0,0 +1,79 @@
+from time import time
+from typing import Any
+from unittest import TestCase, mock
+
+from sentry.ratelimits.combined import CombinedRateLimiter
+from sentry.testutils.helpers.datetime import freeze_time
+
+
+class CombinedLimiterTest(TestCase):
+    def setUp(self) -> None:
+        self.backend = CombinedRateLimiter()
+
+    def test_window_limit(self) -> None:
+        with freeze_time("2000-01-01"):
+            for i in range(1, 4):
+                info = self.backend.start_request("foo", 3, 100, None, f"request_id{i}")
+                assert info.current == i
+                assert not info.window_limited
+                assert info.concurrent is None
+
+            info = self.backend.start_request("foo", 3, 100, None, "request_id_over_the_limit")
+            assert info.current == 4
+            assert info.window_limited
+
+    def test_concurrent_limit(self) -> None:
+        with freeze_time("2000-01-01"):
+            for i in range(1, 3):
+                info = self.backend.start_request("bar", 100, 100, 2, f"request_id{i}")
+                assert info.concurrent is not None
+                assert info.concurrent.current_executions == i
+                assert not info.concurrent.limit_exceeded
+
+            info = self.backend.start_request("bar", 100, 100, 2, "request_id_over_the_limit")
+            assert not info.window_limited
+            assert info.concurrent is not None
+            assert info.concurrent.current_executions == 2
+            assert info.concurrent.limit_exceeded
+
+            self.backend.finish_request("bar", "request_id1")
+            info = self.backend.start_request("bar", 100, 100, 2, "request_id3")
+            assert info.concurrent is not None
+            assert not info.concurrent.limit_exceeded
+
+    def test_window_limit_skips_concurrent_limit(self) -> None:
+        info = self.backend.start_request("baz", 0, 100, 0, "request_id")
+        assert info.window_limited
+        assert info.concurrent is None
+        assert self.backend.client.zcard(self.backend.concurrent_key("baz")) == 0
+
+    def test_zero_window_uses_default_window(self) -> None:
+        with freeze_time("2000-01-01"):
+            info = self.backend.start_request("qux", 1, 0, None, "request_id")
+            assert not info.window_limited
+            assert info.reset_time == int(time()) + 60
+
+    def test_keys_share_hash_tag(self) -> None:
+        window_key = self.backend.window_key("foo", 100, 0)
+        concurrent_key = self.backend.concurrent_key("foo")
+        assert window_key.split("{")[1].split("}")[0] == concurrent_key.split("{")[1].split("}")[0]
+
+    def test_fails_open(self) -> None:
+        class FakeClient:
+            def __init__(self, real_client: Any) -> None:
+                self._client = real_client
+
+            def __getattr__(self, name: str) -> Any:
+                def fail(*args: Any, **kwargs: Any) -> Any:
+                    raise Exception("OH NO")
+
+                return fail
+
+        limiter = CombinedRateLimiter()
+        with mock.patch.object(limiter, "client", FakeClient(limiter.client)):
+            info = limiter.start_request("key", 1, 100, 100, "some_uid")
+            assert not info.window_limited
+            assert info.concurrent is not None
+            assert info.concurrent.current_executions == -1
+            assert not info.concurrent.limit_exceeded
+            limiter.finish_request("key", "some_uid")
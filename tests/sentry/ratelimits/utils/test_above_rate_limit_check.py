@@ -7,6 +7,7 @@ from django.conf import settings
 from sentry.ratelimits import above_rate_limit_check, finish_request
 from sentry.ratelimits.config import RateLimitConfig
 from sentry.testutils.helpers.datetime import freeze_time
+from sentry.testutils.helpers.options import override_options
 from sentry.types.ratelimit import RateLimit, RateLimitMeta, RateLimitType
 from sentry.utils.concurrent import ContextPropagatingThreadPoolExecutor
 
@@ -93,3 +94,38 @@ class RatelimitMiddlewareTest(TestCase):
         )
         assert return_val.rate_limit_type == RateLimitType.FIXED_WINDOW
         assert return_val.concurrent_remaining is None
+
+    @override_options({"api.rate-limit.combined-limiter": True})
+    def test_combined_limiter(self) -> None:
+        with freeze_time("2000-01-01"):
+            expected_reset_time = int(time() + 100)
+            for i in range(10):
+                return_val = above_rate_limit_check(
+                    "combined",
+                    RateLimit(limit=10, window=100, concurrent_limit=9),
+                    f"request_uid{i}",
+                    self.group,
+                )
+            assert return_val == RateLimitMeta(
+                rate_limit_type=RateLimitType.CONCURRENT,
+                current=10,
+                limit=10,
+                window=100,
+                group=self.group,
+                reset_time=expected_reset_time,
+                remaining=0,
+                concurrent_limit=9,
+                concurrent_requests=9,
+                combined_limiter=True,
+            )
+
+            finish_request("combined", "request_uid0", combined=True)
+            return_val = above_rate_limit_check(
+                "combined",
+                RateLimit(limit=10, window=100, concurrent_limit=9),
+                "request_uid10",
+                self.group,
+            )
+            assert return_val.rate_limit_type == RateLimitType.FIXED_WINDOW
+            assert return_val.current == 11
+            assert return_val.concurrent_requests is None
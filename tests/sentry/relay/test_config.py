@@ -21,7 +21,14 @@ from sentry.ingest.inbound_filters import CUSTOM_INBOUND_FILTER_ID_PREFIX
 from sentry.models.project import Project
 from sentry.models.projectkey import ProjectKey
 from sentry.models.projectteam import ProjectTeam
-from sentry.relay.config import ProjectConfig, TransactionNameRule, get_project_config
+from sentry.relay.config import (
+    ConfigSectionCache,
+    ProjectConfig,
+    TransactionNameRule,
+    _get_organization_sections,
+    _get_project_sections,
+    get_project_config,
+)
 from sentry.testutils.factories import Factories
 from sentry.testutils.helpers import Feature
 from sentry.testutils.helpers.datetime import freeze_time
@@ -1449,3 +1456,33 @@ def test_project_config_trimming(default_project, trimming_configs):
             assert "trimming" not in cfg
 
         _validate_project_config(cfg)
+
+
+@django_db_all
+@cell_silo_test
+def test_project_config_section_cache(default_project: Project) -> None:
+    other_project = Factories.create_project(organization=default_project.organization)
+    section_cache = ConfigSectionCache()
+
+    with (
+        patch(
+            "sentry.relay.config._get_organization_sections",
+            wraps=_get_organization_sections,
+        ) as get_organization_sections,
+        patch(
+            "sentry.relay.config._get_project_sections", wraps=_get_project_sections
+        ) as get_project_sections,
+        patch("sentry.relay.config.get_quotas", return_value=[]) as get_quotas,
+    ):
+        first = get_project_config(default_project, section_cache=section_cache).to_dict()
+        second = get_project_config(default_project, section_cache=section_cache).to_dict()
+        other = get_project_config(other_project, section_cache=section_cache).to_dict()
+
+    assert get_organization_sections.call_count == 1
+    assert get_project_sections.call_count == 2
+    # Quotas depend on the project keys and are computed for every config.
+    assert get_quotas.call_count == 3
+
+    assert first["config"] == second["config"]
+    assert other["config"]["trustedRelays"] == first["config"]["trustedRelays"]
+    _validate_project_config(other["config"])
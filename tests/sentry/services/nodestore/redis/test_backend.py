@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+from sentry.services.nodestore.base import json_dumps
+from sentry.services.nodestore.redis.backend import ZSTD_MAGIC, RedisNodeStorage
+from sentry.testutils.helpers import override_options
+
+
+@override_options({"nodestore.set-subkeys.enable-set-cache-item": False})
+def test_set_with_ttl() -> None:
+    ns = RedisNodeStorage(default_ttl=timedelta(minutes=5))
+    ns.set("node_1", {"foo": "a"})
+    ns.set("node_2", {"foo": "b"}, ttl=timedelta(seconds=30))
+
+    assert 290 < ns.client.ttl(ns._make_key("node_1")) <= 300
+    assert 0 < ns.client.ttl(ns._make_key("node_2")) <= 30
+
+
+@override_options({"nodestore.set-subkeys.enable-set-cache-item": False})
+def test_set_multi_with_ttl() -> None:
+    ns = RedisNodeStorage()
+    ns.set_bytes_multi({"node_1": b"{}", "node_2": b"{}"}, ttl=timedelta(seconds=30))
+
+    for id in ("node_1", "node_2"):
+        assert 0 < ns.client.ttl(ns._make_key(id)) <= 30
+
+
+@override_options({"nodestore.set-subkeys.enable-set-cache-item": False})
+def test_compression_can_be_toggled() -> None:
+    compressed = RedisNodeStorage(compression=True)
+    uncompressed = RedisNodeStorage(compression=False)
+
+    compressed.set("node_1", {"foo": "a"})
+    uncompressed.set("node_2", {"foo": "b"})
+
+    assert compressed.client.get(compressed._make_key("node_1")).startswith(ZSTD_MAGIC)
+    assert uncompressed.client.get(uncompressed._make_key("node_2")) == json_dumps(
+        {"foo": "b"}
+    ).encode("utf8")
+
+    for ns in (compressed, uncompressed):
+        assert ns.get_multi(["node_1", "node_2", "node_3"]) == {
+            "node_1": {"foo": "a"},
+            "node_2": {"foo": "b"},
+            "node_3": None,
+        }
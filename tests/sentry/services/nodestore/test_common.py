@@ -5,12 +5,16 @@ Testsuite of backend-independent nodestore tests. Add your backend to the
 
 from collections.abc import Callable, Generator
 from contextlib import nullcontext
+from datetime import timedelta
 from typing import ContextManager
+from unittest import mock
 
 import pytest
 
-from sentry.services.nodestore.base import NodeStorage
+from sentry.services.nodestore import indexed
+from sentry.services.nodestore.base import NodeStorage, _get_executor, _reset_executor
 from sentry.services.nodestore.django.backend import DjangoNodeStorage
+from sentry.services.nodestore.redis.backend import RedisNodeStorage
 from sentry.testutils.helpers import override_options
 from tests.sentry.services.nodestore.bigtable.test_backend import (
     MockedBigtableNodeStorage,
@@ -19,7 +23,12 @@ from tests.sentry.services.nodestore.bigtable.test_backend import (
 
 
 @pytest.fixture(
-    params=["bigtable-mocked", "bigtable-real", pytest.param("django", marks=pytest.mark.django_db)]
+    params=[
+        "bigtable-mocked",
+        "bigtable-real",
+        pytest.param("django", marks=pytest.mark.django_db),
+        "redis",
+    ]
 )
 def ns(request: pytest.FixtureRequest) -> Generator[NodeStorage]:
     # backends are returned from context managers to support teardown when required
@@ -27,6 +36,7 @@ def ns(request: pytest.FixtureRequest) -> Generator[NodeStorage]:
         "bigtable-mocked": lambda: nullcontext(MockedBigtableNodeStorage(project="test")),
         "bigtable-real": lambda: get_temporary_bigtable_nodestorage(),
         "django": lambda: nullcontext(DjangoNodeStorage()),
+        "redis": lambda: nullcontext(RedisNodeStorage(default_ttl=timedelta(minutes=5))),
     }
 
     ctx = backends[request.param]()
@@ -127,3 +137,118 @@ def test_set_subkeys(ns: NodeStorage) -> None:
     ns.delete("node_1")
     assert ns.get("node_1") is None
     assert ns.get("node_1", subkey="other") is None
+
+
+@override_options(
+    {"nodestore.set-subkeys.enable-set-cache-item": False, "nodestore.cache-ttl": 300}
+)
+def test_set_subkeys_multi(ns: NodeStorage) -> None:
+    ns.set_subkeys_multi(
+        {
+            "node_1": {None: {"foo": "a"}},
+            "node_2": {None: {"foo": "b"}, "other": {"foo": "c"}},
+        }
+    )
+
+    assert ns.get_multi(["node_1", "node_2"]) == {"node_1": {"foo": "a"}, "node_2": {"foo": "b"}}
+    assert ns.get("node_2", subkey="other") == {"foo": "c"}
+
+    ns.delete_multi(["node_1", "node_2"])
+    assert not ns.get("node_1")
+    assert not ns.get("node_2")
+
+
+@override_options(
+    {
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+        "nodestore.cache-ttl": 300,
+        "nodestore.multi-max-concurrency": 4,
+    }
+)
+def test_multi_with_concurrency(ns: NodeStorage) -> None:
+    nodes = {f"node_{i}": {"foo": i} for i in range(10)}
+
+    ns.set_subkeys_multi({id: {None: data} for id, data in nodes.items()})
+    assert ns.get_multi(list(nodes)) == nodes
+
+    ns.delete_multi(list(nodes))
+    assert not any(ns.get_multi(list(nodes)).values())
+
+
+def test_multi_executor_is_shared() -> None:
+    _reset_executor()
+    assert _get_executor(4) is _get_executor(4)
+    # Changing `nodestore.multi-max-concurrency` replaces the executor.
+    executor = _get_executor(4)
+    assert _get_executor(2) is not executor
+    # Callers that got the replaced executor can still use it.
+    assert list(executor.map(str, [1, 2])) == ["1", "2"]
+
+
+@override_options(
+    {"nodestore.set-subkeys.enable-set-cache-item": False, "nodestore.cache-ttl": 300}
+)
+def test_indexed_and_legacy_format_side_by_side(ns: NodeStorage) -> None:
+    with override_options({"nodestore.write-indexed-format": True}):
+        ns.set_subkeys("node_1", {None: {"foo": "a"}, "other": {"foo": "b"}})
+    ns.set_subkeys("node_2", {None: {"foo": "c"}, "other": {"foo": "d"}})
+
+    assert ns.get_multi(["node_1", "node_2"]) == {"node_1": {"foo": "a"}, "node_2": {"foo": "c"}}
+    assert ns.get("node_1", subkey="other") == {"foo": "b"}
+    assert ns.get("node_2", subkey="other") == {"foo": "d"}
+    assert ns.get("node_1", subkey="missing") is None
+
+
+@override_options(
+    {
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+        "nodestore.cache-ttl": 300,
+        "nodestore.write-indexed-format": True,
+    }
+)
+def test_indexed_format_is_compressed_once(ns: NodeStorage) -> None:
+    ns.set_subkeys("node_1", {None: {"foo": "a"}, "other": {"foo": "b"}})
+
+    value = ns.get_bytes("node_1")
+    assert value is not None
+    expected_version = (
+        indexed.VERSION_UNCOMPRESSED if ns.compresses_payloads else indexed.VERSION
+    )
+    assert value[len(indexed.MAGIC)] == expected_version
+    assert ns.get("node_1", subkey="other") == {"foo": "b"}
+
+
+@override_options(
+    {
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+        "nodestore.cache-ttl": 300,
+        "nodestore.process-cache.max-bytes": 1024 * 1024,
+    }
+)
+def test_process_cache(ns: NodeStorage) -> None:
+    ns.set("node_1", {"foo": "a"})
+
+    assert ns.get("node_1") == {"foo": "a"}
+    result = ns.get_multi(["node_1", "node_2"])
+    assert result["node_1"] == {"foo": "a"}
+    assert not result.get("node_2")
+
+    with (
+        mock.patch.object(ns, "_get_bytes") as get_bytes,
+        mock.patch.object(ns, "_get_bytes_multi") as get_bytes_multi,
+    ):
+        # Reads are served from the process cache, including missing nodes,
+        # and every read returns a fresh copy.
+        node = ns.get("node_1")
+        node["foo"] = "mutated"
+        assert ns.get("node_1") == {"foo": "a"}
+        assert ns.get("node_2") is None
+        assert ns.get_multi(["node_1", "node_2"]) == {"node_1": {"foo": "a"}, "node_2": None}
+        assert get_bytes.call_count == 0
+        assert get_bytes_multi.call_count == 0
+
+    # Writes and deletes invalidate the process cache.
+    ns.set("node_1", {"foo": "b"})
+    assert ns.get("node_1") == {"foo": "b"}
+    ns.delete("node_1")
+    assert ns.get("node_1") is None
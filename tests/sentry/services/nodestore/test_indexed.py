@@ -0,0 +1,44 @@
+import pytest
+import zstandard
+
+from sentry.services.nodestore import indexed
+
+
+def test_roundtrip() -> None:
+    value = indexed.encode({None: b'{"foo":"a"}', "unprocessed": b'{"foo":"b"}'})
+
+    assert indexed.is_indexed(value)
+    assert indexed.decode(value, None) == {"foo": "a"}
+    assert indexed.decode(value, "unprocessed") == {"foo": "b"}
+    assert indexed.decode(value, "missing") is None
+
+
+def test_roundtrip_uncompressed() -> None:
+    value = indexed.encode({None: b'{"foo":"a"}', "unprocessed": b'{"foo":"b"}'}, compress=False)
+
+    assert indexed.is_indexed(value)
+    assert bytes(indexed.read_section(value, "unprocessed") or b"") == b'{"foo":"b"}'
+    assert indexed.decode(value, None) == {"foo": "a"}
+    assert indexed.decode(value, "unprocessed") == {"foo": "b"}
+
+
+def test_read_section_does_not_copy() -> None:
+    value = indexed.encode({None: b'{"foo":"a"}', "unprocessed": b'{"foo":"b"}'})
+
+    section = indexed.read_section(value, "unprocessed")
+    assert isinstance(section, memoryview)
+    assert section.obj is value
+    assert zstandard.ZstdDecompressor().decompress(section) == b'{"foo":"b"}'
+
+
+def test_legacy_payloads_are_not_indexed() -> None:
+    assert not indexed.is_indexed(b'{"foo":"a"}\nunprocessed\n{"foo":"b"}')
+    assert not indexed.is_indexed(b"")
+
+
+def test_unknown_version() -> None:
+    value = bytearray(indexed.encode({None: b"{}"}))
+    value[len(indexed.MAGIC)] = 255
+
+    with pytest.raises(ValueError):
+        indexed.decode(bytes(value), None)
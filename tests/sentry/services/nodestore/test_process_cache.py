@@ -0,0 +1,52 @@
+from unittest import mock
+
+from sentry.services.nodestore.process_cache import NodeProcessCache, get_process_cache
+from sentry.testutils.helpers import override_options
+
+
+def test_get_and_set() -> None:
+    cache = NodeProcessCache(max_bytes=100, max_items=10, ttl=60, negative_ttl=5)
+    cache.set_many({"a": b'{"foo":"a"}', "b": None})
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": b'{"foo":"a"}', "b": None}
+
+    cache.delete_many(["a", "b"])
+    assert cache.get_many(["a", "b"]) == {}
+
+
+def test_expiry() -> None:
+    cache = NodeProcessCache(max_bytes=100, max_items=10, ttl=60, negative_ttl=5)
+
+    with mock.patch("time.monotonic", return_value=1000):
+        cache.set_many({"a": b"{}", "b": None})
+
+    with mock.patch("time.monotonic", return_value=1010):
+        assert cache.get_many(["a", "b"]) == {"a": b"{}"}
+
+    with mock.patch("time.monotonic", return_value=1100):
+        assert cache.get_many(["a", "b"]) == {}
+
+
+def test_negative_caching_disabled() -> None:
+    cache = NodeProcessCache(max_bytes=100, max_items=10, ttl=60, negative_ttl=0)
+    cache.set_many({"a": None})
+    assert cache.get_many(["a"]) == {}
+
+
+def test_size_bound() -> None:
+    cache = NodeProcessCache(max_bytes=10, max_items=10, ttl=60, negative_ttl=5)
+    cache.set_many({"a": b"12345", "b": b"12345", "c": b"12345"})
+    assert cache.get_many(["a", "b", "c"]) == {"b": b"12345", "c": b"12345"}
+
+
+def test_get_process_cache() -> None:
+    with override_options({"nodestore.process-cache.max-bytes": 0}):
+        assert get_process_cache() is None
+
+    with override_options({"nodestore.process-cache.max-bytes": 1024}):
+        cache = get_process_cache()
+        assert cache is not None
+        assert get_process_cache() is cache
+
+    with override_options({"nodestore.process-cache.max-bytes": 2048}):
+        assert get_process_cache() is not cache
@@ -113,6 +113,44 @@ class RedisScriptMinHashIndexBackendTestCase(TestCase):
             "5",
         ]
 
+    def test_record_many(self) -> None:
+        self.index.record_many(
+            "example",
+            [
+                ("1", None, [("index:a", "hello world"), ("index:b", "hello world")]),
+                ("2", None, [("index:a", "hello world")]),
+                ("3", None, []),
+                ("4", None, [("index:b", "pizza world")]),
+            ],
+        )
+
+        results = self.index.compare("example", "1", [("index:a", 0), ("index:b", 0)])
+        assert [key for key, _ in results] == ["1", "2", "4"]
+        assert results[0] == ("1", [1.0, 1.0])
+        assert results[1] == ("2", [1.0, 0.0])
+
+        # Recording keys in bulk produces the same data as recording them one at a time
+        self.index.record("example", "5", [("index:a", "hello world"), ("index:b", "hello world")])
+        timestamp = int(time.time())
+        r1, r5 = self.index.export("example", [("index:a", 1), ("index:a", 5)], timestamp=timestamp)
+        assert msgpack.unpackb(r1)[0] == msgpack.unpackb(r5)[0]
+
+    def test_record_many_timestamps(self) -> None:
+        timestamp = int(time.time())
+        old_timestamp = timestamp - self.index.interval * (self.index.retention + 1)
+        self.index.record_many(
+            "example",
+            [
+                ("1", old_timestamp, [("index", "hello world")]),
+                ("2", timestamp, [("index", "hello world")]),
+            ],
+            timestamp=timestamp,
+        )
+
+        # Only the key recorded in an interval that's still retained is a candidate
+        results = self.index.classify("example", [("index", 0, "hello world")], timestamp=timestamp)
+        assert [key for key, _ in results] == ["2"]
+
     def test_multiple_index(self) -> None:
         self.index.record("example", "1", [("index:a", "hello world"), ("index:b", "hello world")])
         self.index.record("example", "2", [("index:a", "hello world"), ("index:b", "hello world")])
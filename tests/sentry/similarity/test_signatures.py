@@ -1,5 +1,6 @@
 from collections import Counter
 
+import mmh3
 import pytest
 
 from sentry.similarity.signatures import MinHashSignatureBuilder
@@ -24,3 +25,19 @@ def test_signatures() -> None:
     estimation = results[True] / float(sum(results.values()))
 
     assert similarity == pytest.approx(estimation, 0.1)
+
+
+def test_signatures_match_per_column_minimums() -> None:
+    n = 16
+    r = 0xFFFF
+    get_signature = MinHashSignatureBuilder(n, r)
+    features = [b"foo", b"bar", b"baz", b"foo", b"bar"]
+
+    assert get_signature(features) == [
+        min(mmh3.hash(feature, column) % r for feature in features) for column in range(n)
+    ]
+    # Duplicates don't matter, and the features can be a one-shot iterator
+    assert get_signature(iter(features)) == get_signature({b"foo", b"bar", b"baz"})
+
+    with pytest.raises(ValueError):
+        get_signature([])
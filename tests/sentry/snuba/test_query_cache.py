@@ -0,0 +1,95 @@
+import time
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+from sentry.snuba import query_cache
+from sentry.snuba.query_cache import CacheStatus
+from sentry.testutils.helpers import override_options
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+RESULT = {"data": [{"count": 1}], "meta": []}
+
+
+def test_encode_decode() -> None:
+    assert query_cache.decode(query_cache.encode(RESULT, 123.0)) == (RESULT, 123.0)
+
+
+def test_miss_and_hit() -> None:
+    (lookup,) = query_cache.lookup([("sqc2:a", "ref")])
+    assert lookup.status is CacheStatus.QUERY
+    assert not lookup.locked
+
+    query_cache.store(lookup, RESULT)
+
+    (lookup,) = query_cache.lookup([("sqc2:a", "ref")])
+    assert lookup.status is CacheStatus.HIT
+    assert lookup.result == RESULT
+
+
+@override_options({"snuba.query-cache.referrer-ttls": {"short": 5}})
+def test_referrer_ttl() -> None:
+    assert query_cache.get_ttl("short") == 5
+    assert query_cache.get_ttl("other") == 60
+    assert query_cache.get_ttl(None) == 60
+
+    with mock.patch.object(cache, "set") as cache_set:
+        query_cache.store(query_cache.CacheLookup("sqc2:a", "short", CacheStatus.QUERY), RESULT)
+    assert cache_set.call_args[0][2] == 5
+
+
+@override_options({"snuba.query-cache.wait-timeout": 0.2})
+def test_coalesces_misses() -> None:
+    first, second = (query_cache.lookup([("sqc2:a", "ref")])[0] for _ in range(2))
+    assert first.status is CacheStatus.QUERY
+    assert first.locked
+    assert second.status is CacheStatus.WAIT
+
+    query_cache.store(first, RESULT)
+    assert query_cache.wait_for(second) == RESULT
+
+    # The lock is released with the result
+    (third,) = query_cache.lookup([("sqc2:b", "ref")])
+    assert third.status is CacheStatus.QUERY
+
+
+@override_options({"snuba.query-cache.wait-timeout": 0.2})
+def test_wait_for_failed_query() -> None:
+    first, second = (query_cache.lookup([("sqc2:a", "ref")])[0] for _ in range(2))
+    query_cache.release(first)
+    assert query_cache.wait_for(second) is None
+
+
+@override_options({"snuba.query-cache.wait-timeout": 0.05})
+def test_wait_for_timeout() -> None:
+    first, second = (query_cache.lookup([("sqc2:a", "ref")])[0] for _ in range(2))
+    assert first.locked
+    start = time.monotonic()
+    assert query_cache.wait_for(second) is None
+    assert time.monotonic() - start >= 0.05
+
+
+@override_options({"snuba.query-cache.stale-ttl": 60})
+def test_stale_while_revalidate() -> None:
+    cache.set("sqc2:a", query_cache.encode(RESULT, time.time() - 120), 60)
+
+    refreshing, other = (query_cache.lookup([("sqc2:a", "ref")])[0] for _ in range(2))
+    # One caller refreshes the result, everybody else gets the stale one.
+    assert refreshing.status is CacheStatus.QUERY
+    assert refreshing.locked
+    assert other.status is CacheStatus.HIT
+    assert other.result == RESULT
+
+    new_result = {"data": [{"count": 2}], "meta": []}
+    query_cache.store(refreshing, new_result)
+    (lookup,) = query_cache.lookup([("sqc2:a", "ref")])
+    assert lookup.status is CacheStatus.HIT
+    assert lookup.result == new_result
@@ -1,3 +1,4 @@
+import multiprocessing
 import time
 from concurrent.futures import Future
 from time import sleep
@@ -14,7 +15,7 @@ from django.test import override_settings
 from sentry.conf.types.kafka_definition import Topic
 from sentry.spans.buffer import SpansBuffer
 from sentry.spans.buffer_types import Span
-from sentry.spans.consumers.process.flusher import MultiProducer, SpanFlusher
+from sentry.spans.consumers.process.flusher import MultiProducer, ShardBacklog, SpanFlusher
 from sentry.testutils.helpers.options import override_options
 from tests.sentry.spans.test_buffer import DEFAULT_OPTIONS
 
@@ -50,7 +51,14 @@ def _buffer_with_segment(
 
 
 def _blocking_main_for_join_test(
-    buffer, shards, stopped, current_drift, backpressure_since, healthy_since, produce_to_pipe
+    buffer,
+    shards,
+    stopped,
+    current_drift,
+    backpressure_since,
+    healthy_since,
+    produce_to_pipe,
+    shard_backlog,
 ):
     """Module-level function for multiprocessing (must be picklable)."""
     healthy_since.value = int(time.time())
@@ -212,6 +220,56 @@ def test_flusher_produces_flushed_segments_to_process_segment_task() -> None:
     assert buffer.client.zscore(queue_key, segment_key) is None
 
 
+def test_shard_backlog_most_behind() -> None:
+    shard_backlog = ShardBacklog(multiprocessing.get_context("spawn"), [0, 1, 2])
+    shard_backlog.update({0: 3, 1: 30})
+    shard_backlog.update({2: 10})
+
+    assert shard_backlog.most_behind(exclude=[], min_lag=1) == 1
+    assert shard_backlog.most_behind(exclude=[1], min_lag=1) == 2
+    assert shard_backlog.most_behind(exclude=[1, 2], min_lag=5) is None
+
+
+@override_options(
+    {
+        **DEFAULT_OPTIONS,
+        "spans.buffer.max-flush-segments": 1,
+        "spans.buffer.flusher.flush-lock-ttl": 10,
+        "spans.buffer.flusher.assist-lag-seconds": 5,
+    }
+)
+def test_flusher_assists_shard_behind() -> None:
+    slice_id = 999_003
+    owner_buffer = _buffer_with_segment(span_id="b" * 16, slice_id=slice_id)
+    _buffer_with_segment(span_id="c" * 16, slice_id=slice_id)
+    shard_backlog = ShardBacklog(multiprocessing.get_context("spawn"), [0, 1])
+    shard_backlog.update({0: 60})
+    stopped = SimpleNamespace(value=0)
+    produced: list[tuple[int, Any, int]] = []
+
+    def produce_to_pipe(project_id: int, payload: Any, dropped: int) -> None:
+        produced.append((project_id, payload, dropped))
+        stopped.value = 1
+
+    SpanFlusher.main(
+        SpansBuffer(assigned_shards=[1], slice_id=slice_id),
+        shards=[1],
+        stopped=stopped,
+        current_drift=SimpleNamespace(value=0),
+        backpressure_since=SimpleNamespace(value=0),
+        healthy_since=SimpleNamespace(value=0),
+        produce_to_pipe=produce_to_pipe,
+        shard_backlog=shard_backlog,
+    )
+
+    # The oldest segment is left to the process owning the shard.
+    assert len(produced) == 1
+    assert orjson.loads(produced[0][1].value)["spans"][0]["span_id"] == "c" * 16
+    assert list(owner_buffer.flush_segments(now=60)) == [
+        f"span-buf:s:{{999002:{'9' * 32}}}:{'b' * 16}".encode()
+    ]
+
+
 @override_options({**DEFAULT_OPTIONS, "spans.buffer.max-flush-segments": 1})
 def test_backpressure() -> None:
     # Flush very aggressively to make join() faster
@@ -362,7 +420,14 @@ def test_flusher_waits_for_exited_processes_during_startup() -> None:
 
     # exit without setting healthy_since, simulating a process that fails early
     def never_healthy_main(
-        buffer, shards, stopped, current_drift, backpressure_since, healthy_since, produce_to_pipe
+        buffer,
+        shards,
+        stopped,
+        current_drift,
+        backpressure_since,
+        healthy_since,
+        produce_to_pipe,
+        shard_backlog,
     ):
         return
 
@@ -389,7 +454,14 @@ def test_flusher_timeout_waiting_for_processes_startup() -> None:
 
     # block without setting healthy_since, simulating a process that hangs during startup
     def hang_main(
-        buffer, shards, stopped, current_drift, backpressure_since, healthy_since, produce_to_pipe
+        buffer,
+        shards,
+        stopped,
+        current_drift,
+        backpressure_since,
+        healthy_since,
+        produce_to_pipe,
+        shard_backlog,
     ):
         while not stopped.value:
             sleep(0.05)
@@ -441,6 +441,41 @@ def test_ops_breakdown_excludes_segment_span() -> None:
     assert result["span_ops.ops.http"]["value"] == 3600000.0  # 1 hour (child only)
 
 
+def test_ops_breakdown_nested_intervals() -> None:
+    """Intervals nested in an earlier interval of the same op must not cause
+    later overlapping intervals to be counted twice."""
+
+    spans = [
+        build_mock_span(
+            project_id=1,
+            start_timestamp=1577836800.0,
+            end_timestamp=1577836810.0,
+            span_id="aaaaaaaaaaaaaaaa",
+            span_op="db",
+        ),
+        build_mock_span(
+            project_id=1,
+            start_timestamp=1577836802.0,
+            end_timestamp=1577836803.0,
+            span_id="bbbbbbbbbbbbbbbb",
+            span_op="db",
+        ),
+        build_mock_span(
+            project_id=1,
+            start_timestamp=1577836804.0,
+            end_timestamp=1577836812.0,
+            span_id="cccccccccccccccc",
+            span_op="db.postgres",
+        ),
+    ]
+    breakdowns_config = {
+        "span_ops": {"type": "spanOperations", "matches": ["http", "db"]},
+    }
+
+    result = compute_breakdowns(spans, breakdowns_config)
+    assert result == {"span_ops.ops.db": {"value": 12000.0, "type": "double"}}
+
+
 def test_write_tags_for_performance_issue_detection() -> None:
     segment_span = _mock_performance_issue_span(
         is_segment=True,
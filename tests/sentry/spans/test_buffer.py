@@ -588,6 +588,22 @@ def test_basic(buffer: SpansBuffer, spans) -> None:
     assert_clean(buffer.client)
 
 
+def test_flush_segments_shard_lags_and_offset(buffer: SpansBuffer) -> None:
+    process_spans([_span("b" * 16, None, is_segment_span=True)], buffer, now=0)
+
+    # The only ready segment is skipped, and lags are left alone.
+    assert buffer.flush_segments(now=15, offset=1) == {}
+    assert buffer.shard_lags == {}
+
+    rv = buffer.flush_segments(now=15)
+    assert list(rv) == [_segment_id(1, "a" * 32, "b" * 16)]
+    assert buffer.shard_lags[0] == 5
+    assert buffer.shard_lags[1] == 0
+
+    buffer.done_flush_segments(rv)
+    assert_clean(buffer.client)
+
+
 @mock.patch("sentry.spans.buffer_logger.emit_observability_metrics")
 def test_observability_metrics(
     emit_observability_metrics: mock.MagicMock, buffer: SpansBuffer
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from sentry.spans.buffer import SpansBuffer
+from sentry.spans.buffer_types import Span
+from sentry.spans.segment_assembler import SpanColumns, group_by_parent
+
+
+def _span(
+    span_id: str,
+    parent_span_id: str | None,
+    *,
+    trace_id: str = "a" * 32,
+    project_id: int = 1,
+    is_segment_span: bool = False,
+    segment_id: str | None = None,
+) -> Span:
+    return Span(
+        payload=span_id.encode("ascii"),
+        trace_id=trace_id,
+        span_id=span_id,
+        parent_span_id=parent_span_id,
+        segment_id=segment_id,
+        project_id=project_id,
+        is_segment_span=is_segment_span,
+    )
+
+
+def _normalize(trees: dict[tuple[str, str], list[Span]]) -> dict[tuple[str, str], set[str]]:
+    return {key: {span.span_id for span in spans} for key, spans in trees.items()}
+
+
+TREES = [
+    pytest.param(
+        [
+            _span("a" * 16, None, is_segment_span=True),
+            _span("b" * 16, "a" * 16),
+            _span("c" * 16, "b" * 16),
+            _span("d" * 16, "c" * 16),
+        ],
+        id="deep",
+    ),
+    pytest.param(
+        [
+            _span("b" * 16, "a" * 16),
+            _span("c" * 16, "b" * 16),
+            _span("d" * 16, "x" * 16),
+            _span("e" * 16, "d" * 16),
+        ],
+        id="missing-parents",
+    ),
+    pytest.param(
+        [
+            _span("a" * 16, "x" * 16, is_segment_span=True),
+            _span("b" * 16, "a" * 16),
+            _span("x" * 16, None, is_segment_span=True),
+            _span("c" * 16, "x" * 16),
+        ],
+        id="nested-segment-span",
+    ),
+    pytest.param(
+        [
+            _span("a" * 16, None, is_segment_span=True),
+            _span("b" * 16, "a" * 16, project_id=2),
+            _span("c" * 16, "b" * 16, project_id=2),
+            _span("a" * 16, None, trace_id="b" * 32),
+        ],
+        id="other-project-and-trace",
+    ),
+    pytest.param(
+        [
+            _span("b" * 16, "x" * 16, segment_id="a" * 16),
+            _span("c" * 16, "b" * 16),
+            _span("a" * 16, None, is_segment_span=True),
+        ],
+        id="segment-id",
+    ),
+]
+
+
+@pytest.mark.parametrize("spans", TREES)
+def test_group_by_parent_matches_buffer(spans: list[Span]) -> None:
+    buffer = SpansBuffer(assigned_shards=[0])
+    for permutation in itertools.permutations(spans):
+        assert _normalize(group_by_parent(permutation)) == _normalize(
+            buffer._group_by_parent(permutation)
+        )
+
+
+def test_group_by_parent_keeps_arrival_order() -> None:
+    spans = [
+        _span("d" * 16, "c" * 16),
+        _span("c" * 16, "b" * 16),
+        _span("b" * 16, "a" * 16),
+        _span("a" * 16, None, is_segment_span=True),
+    ]
+    assert group_by_parent(spans) == {(f"1:{'a' * 32}", "a" * 16): spans}
+
+
+def test_group_by_parent_cycle() -> None:
+    spans = [_span("a" * 16, "b" * 16), _span("b" * 16, "a" * 16)]
+    trees = group_by_parent(spans)
+    assert len(trees) == 1
+    assert list(trees.values()) == [spans]
+
+
+def test_span_columns() -> None:
+    spans = [
+        _span("a" * 16, None, is_segment_span=True),
+        _span("b" * 16, "a" * 16),
+        _span("a" * 16, None, trace_id="b" * 32),
+        _span("c" * 16, "x" * 16),
+    ]
+    columns = SpanColumns(spans)
+
+    assert columns.traces == [f"1:{'a' * 32}", f"1:{'b' * 32}"]
+    assert list(columns.trace_index) == [0, 0, 1, 0]
+    assert list(columns.parent_rows()) == [0, 0, 2, 3]
+    assert list(columns.root_rows()) == [0, 0, 2, 3]
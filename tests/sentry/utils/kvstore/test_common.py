@@ -114,8 +114,7 @@ def test_multiple_key_operations(properties: Properties) -> None:
     store = properties.store
 
     items = dict(itertools.islice(properties.items, 10))
-    for key, value in items.items():
-        store.set(key, value)
+    store.set_many(items)
 
     missing_keys = set(itertools.islice(properties.keys, 5))
 
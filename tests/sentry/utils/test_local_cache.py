@@ -2,7 +2,14 @@ import threading
 
 import pytest
 
-from sentry.utils.local_cache import LRUCache, SizedKeyCache, ThreadSafeCache
+from sentry.testutils.helpers.options import override_options
+from sentry.utils.local_cache import (
+    LRUCache,
+    OptionSizedCache,
+    SizedKeyCache,
+    SizedLRUCache,
+    ThreadSafeCache,
+)
 
 
 class TestLRUCache:
@@ -110,6 +117,45 @@ class TestLRUCache:
         assert sorted(cache.items()) == [("a", 1), ("b", 2)]
 
 
+class TestSizedLRUCache:
+    def test_evicts_by_size(self) -> None:
+        cache: SizedLRUCache[str, bytes] = SizedLRUCache(maxlen=10, maxsize=5, sizeof=len)
+        cache["a"] = b"aa"
+        cache["b"] = b"bb"
+        assert cache.size == 4
+        cache["c"] = b"cc"
+        assert "a" not in cache
+        assert list(cache.keys()) == ["b", "c"]
+        assert cache.size == 4
+
+    def test_evicts_by_count(self) -> None:
+        cache: SizedLRUCache[str, bytes] = SizedLRUCache(maxlen=1, maxsize=100, sizeof=len)
+        cache["a"] = b"a"
+        cache["b"] = b"b"
+        assert list(cache.keys()) == ["b"]
+        assert cache.size == 1
+
+    def test_oversized_value_is_not_stored(self) -> None:
+        cache: SizedLRUCache[str, bytes] = SizedLRUCache(maxlen=10, maxsize=3, sizeof=len)
+        cache["a"] = b"a"
+        cache["a"] = b"toolarge"
+        cache["b"] = b"toolarge"
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_replace_and_remove_track_size(self) -> None:
+        cache: SizedLRUCache[str, bytes] = SizedLRUCache(maxlen=10, maxsize=100, sizeof=len)
+        cache["a"] = b"a"
+        cache["a"] = b"aaa"
+        assert cache.size == 3
+        cache["b"] = b"bb"
+        del cache["a"]
+        assert cache.size == 2
+        assert cache.pop("b") == b"bb"
+        assert cache.pop("missing") is None
+        assert cache.size == 0
+
+
 class TestThreadSafeCache:
     def test_delegates_set_and_get(self) -> None:
         cache: ThreadSafeCache[str, int] = ThreadSafeCache(LRUCache(maxlen=2))
@@ -310,3 +356,40 @@ class TestSizedKeyCache:
         cache["key"] = 7
         assert cache["key"] == 7
         assert cache.get("key") == 7
+
+
+class TestOptionSizedCache:
+    OPTION = "grouping.strategy_variants_cache_size"
+
+    def test_disabled(self) -> None:
+        cache: OptionSizedCache[str, int] = OptionSizedCache(self.OPTION)
+        with override_options({self.OPTION: 0}):
+            with cache.locked() as local_cache:
+                assert local_cache is None
+
+    def test_resized(self) -> None:
+        cache: OptionSizedCache[str, int] = OptionSizedCache(self.OPTION)
+        with override_options({self.OPTION: 2}):
+            with cache.locked() as local_cache:
+                assert local_cache is not None
+                local_cache["a"] = 1
+            with cache.locked() as local_cache:
+                assert local_cache is not None
+                assert local_cache.get("a") == 1
+
+        with override_options({self.OPTION: 3}):
+            with cache.locked() as local_cache:
+                assert local_cache is not None
+                assert local_cache.maxsize == 3
+                assert "a" not in local_cache
+
+    def test_clear(self) -> None:
+        cache: OptionSizedCache[str, int] = OptionSizedCache(self.OPTION, ttl=60)
+        with override_options({self.OPTION: 2}):
+            with cache.locked() as local_cache:
+                assert local_cache is not None
+                local_cache["a"] = 1
+            cache.clear()
+            with cache.locked() as local_cache:
+                assert local_cache is not None
+                assert "a" not in local_cache
@@ -4,6 +4,7 @@ from unittest import mock
 
 import pytest
 import sentry_sdk
+from django.test import override_settings
 from django.utils import timezone
 from snuba_sdk import Column, Condition, DeleteQuery, Entity, Function, Op, Query, Request
 from urllib3 import HTTPConnectionPool
@@ -14,9 +15,11 @@ from sentry.models.groupredirect import GroupRedirect
 from sentry.models.grouprelease import GroupRelease
 from sentry.models.project import Project
 from sentry.models.release import Release
+from sentry.ratelimits.concurrent import ConcurrentLimitInfo
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.cases import TestCase
 from sentry.utils import json
+from sentry.utils.concurrent import ContextPropagatingThreadPoolExecutor
 from sentry.utils.snuba import (
     ROUND_UP,
     RateLimitExceeded,
@@ -25,7 +28,9 @@ from sentry.utils.snuba import (
     SnubaRequest,
     UnqualifiedQueryError,
     _bulk_snuba_query,
+    _get_query_executor,
     _prepare_query_params,
+    _reset_query_executor,
     _snuba_query,
     get_json_type,
     get_query_params_to_update_for_projects,
@@ -786,3 +791,65 @@ class SnubaResponseCompressionTest(unittest.TestCase):
         self._run_query(mock.Mock(spec=DeleteQuery, storage_name="events"))
         headers = self.mock_pool.urlopen.call_args.kwargs["headers"]
         assert "Accept-Encoding" not in headers
+
+
+class SnubaClientConcurrencyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.mock_pool = mock.patch("sentry.utils.snuba._snuba_pool").start()
+        self.limiter = mock.patch("sentry.utils.snuba._get_concurrent_limiter").start()
+        self.addCleanup(mock.patch.stopall)
+        self.mock_pool.urlopen.return_value = mock.Mock(status=200, data=b'{"data": []}')
+
+    def _make_request(self, referrer: str) -> SnubaRequest:
+        req = mock.Mock(dataset="events", query=mock.Mock(spec=Query))
+        req.serialize.return_value = b"{}"
+        return SnubaRequest(
+            request=req,
+            referrer=referrer,
+            forward=lambda x: x,
+            reverse=lambda x: x,
+        )
+
+    def _run_query(self, referrer: str) -> None:
+        _snuba_query(
+            (
+                sentry_sdk.get_isolation_scope(),
+                sentry_sdk.get_current_scope(),
+                self._make_request(referrer),
+            )
+        )
+
+    def test_query_executor_is_shared(self) -> None:
+        _reset_query_executor()
+        with mock.patch(
+            "sentry.utils.snuba.ContextPropagatingThreadPoolExecutor",
+            wraps=ContextPropagatingThreadPoolExecutor,
+        ) as executor_cls:
+            for _ in range(2):
+                results = _bulk_snuba_query([self._make_request("a"), self._make_request("b")])
+                assert results == [{"data": []}, {"data": []}]
+        assert executor_cls.call_count == 1
+        assert _get_query_executor() is _get_query_executor()
+
+    @override_settings(SENTRY_SNUBA_REFERRER_CONCURRENCY_LIMITS={"limited": 2})
+    def test_referrer_concurrency_limit(self) -> None:
+        self.limiter.return_value.start_request.return_value = ConcurrentLimitInfo(2, 2, True)
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            self._run_query("limited")
+        assert exc_info.value.rejection_threshold == 2
+        assert not self.mock_pool.urlopen.called
+        assert not self.limiter.return_value.finish_request.called
+
+        self.limiter.return_value.start_request.return_value = ConcurrentLimitInfo(2, 1, False)
+        self._run_query("limited")
+        assert self.mock_pool.urlopen.called
+        start_args = self.limiter.return_value.start_request.call_args[0]
+        self.limiter.return_value.finish_request.assert_called_once_with(
+            start_args[0], start_args[2]
+        )
+
+    @override_settings(SENTRY_SNUBA_REFERRER_CONCURRENCY_LIMITS={"limited": 2})
+    def test_referrer_without_concurrency_limit(self) -> None:
+        self._run_query("other")
+        assert self.mock_pool.urlopen.called
+        assert not self.limiter.called
@@ -0,0 +1,91 @@
+from unittest.mock import MagicMock
+
+from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
+from sentry.workflow_engine.caches.condition_plans import (
+    clear_condition_plans,
+    get_conditions_by_condition_group,
+    invalidate_condition_plans,
+)
+from sentry.workflow_engine.models.data_condition import Condition, DataCondition
+
+
+def _fetch_from_db(dcg_ids: list[int]) -> dict[int, list[DataCondition]]:
+    return {
+        dcg_id: list(DataCondition.objects.filter(condition_group_id=dcg_id)) for dcg_id in dcg_ids
+    }
+
+
+@override_options({"workflow_engine.condition_plan_cache_size": 100})
+class TestConditionPlanCache(TestCase):
+    def setUp(self) -> None:
+        clear_condition_plans()
+        self.addCleanup(clear_condition_plans)
+
+        self.dcg = self.create_data_condition_group()
+        self.condition = self.create_data_condition(
+            condition_group=self.dcg, type=Condition.EQUAL, comparison=1
+        )
+        self.fetch = MagicMock(side_effect=_fetch_from_db)
+
+    def test_caches_fetched_conditions(self) -> None:
+        assert get_conditions_by_condition_group([self.dcg.id], self.fetch) == {
+            self.dcg.id: [self.condition]
+        }
+        assert get_conditions_by_condition_group([self.dcg.id], self.fetch) == {
+            self.dcg.id: [self.condition]
+        }
+        self.fetch.assert_called_once_with([self.dcg.id])
+
+    def test_only_fetches_misses(self) -> None:
+        other_dcg = self.create_data_condition_group()
+        get_conditions_by_condition_group([self.dcg.id], self.fetch)
+
+        result = get_conditions_by_condition_group([self.dcg.id, other_dcg.id], self.fetch)
+
+        assert result == {self.dcg.id: [self.condition], other_dcg.id: []}
+        assert self.fetch.call_args.args == ([other_dcg.id],)
+
+    def test_invalidation(self) -> None:
+        get_conditions_by_condition_group([self.dcg.id], self.fetch)
+
+        invalidate_condition_plans([self.dcg.id])
+        get_conditions_by_condition_group([self.dcg.id], self.fetch)
+
+        assert self.fetch.call_count == 2
+
+    def test_invalidation_during_fetch_is_not_overwritten(self) -> None:
+        def fetch_and_invalidate(dcg_ids: list[int]) -> dict[int, list[DataCondition]]:
+            result = _fetch_from_db(dcg_ids)
+            invalidate_condition_plans(dcg_ids)
+            return result
+
+        get_conditions_by_condition_group([self.dcg.id], fetch_and_invalidate)
+        get_conditions_by_condition_group([self.dcg.id], self.fetch)
+
+        self.fetch.assert_called_once_with([self.dcg.id])
+
+    def test_condition_changes_invalidate(self) -> None:
+        get_conditions_by_condition_group([self.dcg.id], self.fetch)
+
+        with self.capture_on_commit_callbacks(execute=True):
+            new_condition = self.create_data_condition(
+                condition_group=self.dcg, type=Condition.EQUAL, comparison=2
+            )
+
+        result = get_conditions_by_condition_group([self.dcg.id], self.fetch)
+        assert sorted(result[self.dcg.id], key=lambda c: c.id) == [self.condition, new_condition]
+
+        with self.capture_on_commit_callbacks(execute=True):
+            new_condition.delete()
+
+        assert get_conditions_by_condition_group([self.dcg.id], self.fetch) == {
+            self.dcg.id: [self.condition]
+        }
+
+    @override_options({"workflow_engine.condition_plan_cache_size": 0})
+    def test_disabled(self) -> None:
+        get_conditions_by_condition_group([self.dcg.id], self.fetch)
+        get_conditions_by_condition_group([self.dcg.id], self.fetch)
+
+        assert self.fetch.call_count == 2
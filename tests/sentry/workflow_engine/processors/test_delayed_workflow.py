@@ -1,5 +1,6 @@
 from dataclasses import asdict
 from datetime import datetime, timedelta
+from typing import Any
 from unittest.mock import ANY, MagicMock, Mock, patch
 
 import pytest
@@ -45,7 +46,9 @@ from sentry.workflow_engine.processors.delayed_workflow import (
     EventRedisData,
     GroupQueryParams,
     UniqueConditionQuery,
+    _bucket_query_timestamp,
     bulk_fetch_events,
+    bulk_fetch_events_for_projects,
     cleanup_redis_buffer,
     fetch_project,
     fetch_workflows_envs,
@@ -55,6 +58,7 @@ from sentry.workflow_engine.processors.delayed_workflow import (
     get_condition_query_groups,
     get_group_to_groupevent,
     get_groups_to_fire,
+    process_delayed_workflows_for_projects,
 )
 from tests.sentry.workflow_engine.test_base import BaseWorkflowTest
 from tests.snuba.rules.conditions.test_event_frequency import BaseEventFrequencyPercentTest
@@ -639,6 +643,38 @@ class TestGetSnubaResults(BaseWorkflowTest):
         result = get_condition_group_results(condition_groups)
         assert result == {}
 
+    def test_get_condition_group_results_splits_queries_by_organization(self) -> None:
+        other_project = self.create_project(organization=self.create_organization())
+        group = self.create_group(project=self.project)
+        other_group = self.create_group(project=other_project)
+
+        mock_handler = Mock(spec=BaseEventFrequencyQueryHandler)
+        mock_handler.get_rate_bulk.side_effect = lambda groups, **kwargs: {
+            group["id"]: 1 for group in groups
+        }
+        mock_handler.intervals = {"1h": ("fake", timedelta(seconds=1))}
+
+        unique_query = UniqueConditionQuery(
+            handler=lambda: mock_handler,  # type: ignore[arg-type]
+            interval="1h",
+            environment_id=None,
+        )
+        condition_groups = {
+            unique_query: GroupQueryParams(group_ids={group.id, other_group.id}, timestamp=None)
+        }
+
+        result = get_condition_group_results(condition_groups)
+
+        assert result == {unique_query: {group.id: 1, other_group.id: 1}}
+        assert mock_handler.get_rate_bulk.call_count == 2
+        queried_org_ids = [
+            {group["project__organization_id"] for group in call.kwargs["groups"]}
+            for call in mock_handler.get_rate_bulk.call_args_list
+        ]
+        assert sorted(queried_org_ids, key=min) == sorted(
+            [{self.project.organization_id}, {other_project.organization_id}], key=min
+        )
+
 
 class TestGetGroupsToFire(TestDelayedWorkflowBase):
     def setUp(self) -> None:
@@ -970,6 +1006,18 @@ class TestFireActionsForGroups(TestDelayedWorkflowBase):
             # For perf reasons, we want to be sure the events have the project cached.
             assert event._project_cache == self.project
 
+    def test_bulk_fetch_events_for_projects(self) -> None:
+        events = bulk_fetch_events_for_projects(
+            [
+                (self.project, [self.event1.event_id, self.event2.event_id]),
+                (self.project2, [self.event3.event_id]),
+            ]
+        )
+
+        assert set(events[self.project.id]) == {self.event1.event_id, self.event2.event_id}
+        assert set(events[self.project2.id]) == {self.event3.event_id}
+        assert events[self.project2.id][self.event3.event_id]._project_cache == self.project2
+
     def test_get_group_to_groupevent(self) -> None:
         self._push_base_events()
         buffer_data = self.batch_client.for_project(self.project.id).get_hash_data(batch_key=None)
@@ -1092,6 +1140,150 @@ class TestFireActionsForGroups(TestDelayedWorkflowBase):
         assert fire_history_uuids == task_uuids
 
 
+class TestProcessDelayedWorkflowsForProjects(TestDelayedWorkflowBase):
+    @patch("sentry.workflow_engine.processors.delayed_workflow.fire_actions_for_groups")
+    @patch("sentry.workflow_engine.processors.delayed_workflow.bulk_fetch_events_for_projects")
+    @patch(
+        "sentry.workflow_engine.processors.delayed_workflow.get_condition_group_results",
+        wraps=get_condition_group_results,
+    )
+    def test_shares_queries_and_event_fetches_between_projects(
+        self,
+        mock_get_results: MagicMock,
+        mock_bulk_fetch: MagicMock,
+        mock_fire: MagicMock,
+    ) -> None:
+        mock_bulk_fetch.return_value = {}
+        self._push_base_events()
+
+        process_delayed_workflows_for_projects(
+            self.batch_client, [self.project.id, self.project2.id]
+        )
+
+        # One call per point in time that queries look back from
+        queried_group_ids: set[int] = set()
+        for call in mock_get_results.call_args_list:
+            (condition_groups,) = call.args
+            assert len({params.timestamp for params in condition_groups.values()}) == 1
+            for params in condition_groups.values():
+                queried_group_ids.update(params.group_ids)
+        assert queried_group_ids == {self.group1.id, self.group2.id, self.group3.id, self.group4.id}
+
+        assert mock_bulk_fetch.call_count == 1
+        (project_event_ids,) = mock_bulk_fetch.call_args.args
+        assert {project.id for project, _ in project_event_ids} == {
+            self.project.id,
+            self.project2.id,
+        }
+
+        for project in (self.project, self.project2):
+            assert self.batch_client.for_project(project.id).get_hash_data(batch_key=None) == {}
+
+    @patch("sentry.workflow_engine.processors.delayed_workflow.fire_actions_for_groups")
+    @patch("sentry.workflow_engine.processors.delayed_workflow.bulk_fetch_events_for_projects")
+    def test_shares_rate_queries_between_projects_with_nearby_timestamps(
+        self, mock_bulk_fetch: MagicMock, mock_fire: MagicMock
+    ) -> None:
+        mock_bulk_fetch.return_value = {}
+        self._push_base_events(timestamp=FROZEN_TIME - timedelta(seconds=10))
+        # The latest events of the second project are a few seconds later
+        for workflow, when_dcg_id, if_dcgs, group, event in (
+            (
+                self.workflow3,
+                self.workflow3.when_condition_group_id,
+                self.workflow3_if_dcgs,
+                self.group3,
+                self.event3,
+            ),
+            (self.workflow4, None, self.workflow4_if_dcgs, self.group4, self.event4),
+        ):
+            self.push_to_hash(
+                project_id=self.project2.id,
+                workflow_id=workflow.id,
+                group_id=group.id,
+                when_dcg_id=when_dcg_id,
+                if_dcgs=[if_dcgs[0]],
+                passing_dcgs=[if_dcgs[1]],
+                event_id=event.event_id,
+                timestamp=FROZEN_TIME - timedelta(seconds=5),
+            )
+
+        with patch.object(
+            BaseEventFrequencyQueryHandler,
+            "get_rate_bulk",
+            autospec=True,
+            side_effect=BaseEventFrequencyQueryHandler.get_rate_bulk,
+        ) as mock_get_rate_bulk:
+            process_delayed_workflows_for_projects(
+                self.batch_client, [self.project.id, self.project2.id]
+            )
+
+        queried_groups = [
+            frozenset(group["id"] for group in call.kwargs["groups"])
+            for call in mock_get_rate_bulk.call_args_list
+        ]
+        # Both projects are in the same organization, so the conditions of the workflows without
+        # an environment are queried once for the groups of both projects.
+        assert frozenset({self.group2.id, self.group4.id}) in queried_groups
+        assert frozenset({self.group2.id}) not in queried_groups
+        assert frozenset({self.group4.id}) not in queried_groups
+        for call in mock_get_rate_bulk.call_args_list:
+            assert call.kwargs["current_time"] == FROZEN_TIME
+
+    def test_bucket_query_timestamp(self) -> None:
+        query = UniqueConditionQuery(
+            handler=EventFrequencyQueryHandler, interval="1h", environment_id=None
+        )
+        assert _bucket_query_timestamp(query, None) is None
+        assert _bucket_query_timestamp(query, FROZEN_TIME) == FROZEN_TIME
+        assert (
+            _bucket_query_timestamp(query, FROZEN_TIME - timedelta(seconds=59)) == FROZEN_TIME
+        )
+        assert _bucket_query_timestamp(query, FROZEN_TIME + timedelta(seconds=1)) == (
+            FROZEN_TIME + timedelta(minutes=1)
+        )
+
+        query = UniqueConditionQuery(
+            handler=EventFrequencyQueryHandler, interval="1m", environment_id=None
+        )
+        timestamp = FROZEN_TIME + timedelta(seconds=1, microseconds=500)
+        assert _bucket_query_timestamp(query, timestamp) == FROZEN_TIME + timedelta(seconds=2)
+
+    @patch("sentry.workflow_engine.processors.delayed_workflow.fire_actions_for_groups")
+    def test_failing_project_does_not_affect_others(self, mock_fire: MagicMock) -> None:
+        self._push_base_events()
+        project_id = self.project.id
+
+        def evaluate(plan: Any, *args: Any, **kwargs: Any) -> None:
+            if plan.project.id == project_id:
+                raise ValueError("nope")
+
+        with patch(
+            "sentry.workflow_engine.processors.delayed_workflow._evaluate_project_plan",
+            side_effect=evaluate,
+        ):
+            process_delayed_workflows_for_projects(
+                self.batch_client, [self.project.id, self.project2.id]
+            )
+
+        # The failing project's data is left in the buffer, the other one is cleaned up
+        assert self.batch_client.for_project(self.project.id).get_hash_data(batch_key=None) != {}
+        assert self.batch_client.for_project(self.project2.id).get_hash_data(batch_key=None) == {}
+
+    def test_deleted_project_is_cleaned_up(self) -> None:
+        self._push_base_events()
+        project2_id = self.project2.id
+        self.project2.delete()
+
+        with patch(
+            "sentry.workflow_engine.processors.delayed_workflow.fire_actions_for_groups"
+        ) as mock_fire:
+            process_delayed_workflows_for_projects(self.batch_client, [project2_id])
+
+        mock_fire.assert_not_called()
+        assert self.batch_client.for_project(project2_id).get_hash_data(batch_key=None) == {}
+
+
 class TestCleanupRedisBuffer(TestDelayedWorkflowBase):
     def test_cleanup_redis(self) -> None:
         self._push_base_events()
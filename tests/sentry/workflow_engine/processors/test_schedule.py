@@ -101,6 +101,31 @@ class ProcessBufferedWorkflowsTest(CreateEventTestCase):
         assert project.id in all_project_ids
 
 
+    @override_options(
+        {"delayed_workflow.rollout": True, "workflow_engine.schedule.projects_per_task": 10}
+    )
+    @patch("sentry.workflow_engine.processors.schedule.process_delayed_workflows.apply_async")
+    @patch(
+        "sentry.workflow_engine.processors.schedule.process_delayed_workflows_for_projects.apply_async"
+    )
+    def test_groups_small_projects_into_one_task(
+        self, mock_apply_for_projects: MagicMock, mock_apply_delayed: MagicMock
+    ) -> None:
+        project = self.create_project()
+        project_two = self.create_project()
+        for p in (project, project_two):
+            self.push_to_hash(p.id, 345, self.create_group(p).id, "event-1")
+        self.batch_client.add_project_ids([project.id, project_two.id])
+
+        process_buffered_workflows(self.batch_client)
+
+        mock_apply_delayed.assert_not_called()
+        mock_apply_for_projects.assert_called_once()
+        assert sorted(mock_apply_for_projects.call_args.kwargs["kwargs"]["project_ids"]) == sorted(
+            [project.id, project_two.id]
+        )
+
+
 class ProcessInBatchesTest(CreateEventTestCase):
     def setUp(self) -> None:
         super().setUp()
@@ -642,7 +642,7 @@ class UnmergeTestCase(TestCase, SnubaTestCase):
 
         repair_denormalizations(get_caches(), project, [event])
 
-        mock_similarity.record.assert_not_called()
+        mock_similarity.record_many.assert_not_called()
 
     @mock.patch("sentry.tasks.unmerge.similarity")
     def test_repair_denormalizations_records_similarity_when_not_backfilled(
@@ -657,7 +657,7 @@ class UnmergeTestCase(TestCase, SnubaTestCase):
 
         repair_denormalizations(get_caches(), project, [event])
 
-        mock_similarity.record.assert_called_once_with(project, [event])
+        mock_similarity.record_many.assert_called_once_with(project, [event])
 
 
 class StartUnmergeTest(TestCase):